@@ -0,0 +1,198 @@
+"""사전 계산 API 이웃 — 임베딩 kNN + 조인 키 그래프를 api_neighbors 테이블에 저장.
+
+카탈로그 갱신 시 catalog_embeddings.npy 전체 쌍 유사도를 배치 행렬곱으로 한 번 계산해
+API마다 유사도 상위 NEIGHBOR_TOP_K개와, 조인 키를 공유하는 API 중 유사도 상위
+NEIGHBOR_JOIN_TOP_K개를 저장한다. Phase 3·대시보드는 모델 추론 없이 인덱스 조회만 한다.
+
+    build_neighbor_table(conn)                     # 갱신 시 (쓰기 연결, api_join_keys 이후)
+    related_apis(["A1", "A2"])                     # Phase 3 확장
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+
+from catalog_db import get_catalog_connections
+from catalog_release import active_release
+from config import (
+    NEIGHBOR_BATCH_SIZE,
+    NEIGHBOR_JOIN_TOP_K,
+    NEIGHBOR_MIN_SCORE,
+    NEIGHBOR_TOP_K,
+)
+from logger import get_logger
+
+logger = get_logger("api_neighbors")
+
+NeighborRow = tuple[str, str, float, str | None]  # (api_id, neighbor_id, score, join_keys)
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """scores에서 값이 큰 k개의 인덱스 (내림차순)."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    k = min(k, scores.size)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+def compute_neighbors(
+    embeddings: np.ndarray,
+    id_map: list[str],
+    *,
+    join_keys: dict[str, set[str]] | None = None,
+    top_k: int = NEIGHBOR_TOP_K,
+    join_top_k: int = NEIGHBOR_JOIN_TOP_K,
+    min_score: float = NEIGHBOR_MIN_SCORE,
+    batch_size: int = NEIGHBOR_BATCH_SIZE,
+) -> Iterator[NeighborRow]:
+    """전체 쌍 kNN — batch_size행씩 (B×D)·(D×N) 행렬곱으로 유사도를 구한다.
+
+    임베딩은 정규화되어 있으므로 내적 = 코사인 유사도 (FAISS IndexFlatIP와 같은 값).
+    조인 이웃은 min_score와 무관하게 유사도 순으로 join_top_k개를 고른다.
+    """
+    matrix = np.ascontiguousarray(embeddings, dtype=np.float32)
+    n = len(id_map)
+    join_keys = join_keys or {}
+
+    # 조인 키 → 임베딩 행 인덱스
+    key_rows: dict[str, list[int]] = {}
+    for i, api_id in enumerate(id_map):
+        for key in join_keys.get(api_id, ()):
+            key_rows.setdefault(key, []).append(i)
+    key_rows_np = {key: np.asarray(rows) for key, rows in key_rows.items()}
+
+    for start in range(0, n, max(1, batch_size)):
+        sims = matrix[start:start + batch_size] @ matrix.T
+        for offset, row in enumerate(sims):
+            i = start + offset
+            row[i] = -np.inf  # 자기 자신 제외
+            api_id = id_map[i]
+            picked: dict[int, None] = {}
+            for j in _top_indices(row, top_k):
+                if row[j] >= min_score:
+                    picked[int(j)] = None
+
+            own_keys = join_keys.get(api_id, set())
+            if own_keys and join_top_k > 0:
+                candidates = np.unique(np.concatenate([key_rows_np[key] for key in own_keys]))
+                candidates = candidates[candidates != i]
+                for j in candidates[_top_indices(row[candidates], join_top_k)]:
+                    picked.setdefault(int(j), None)
+
+            for j in picked:
+                keys = own_keys & join_keys.get(id_map[j], set())
+                yield api_id, id_map[j], float(row[j]), ",".join(sorted(keys)) or None
+
+
+def build_neighbor_table(
+    conn: sqlite3.Connection,
+    *,
+    embeddings_path: Path | str | None = None,
+    id_map_path: Path | str | None = None,
+    **kwargs: Any,
+) -> dict[str, int]:
+    """api_neighbors를 임베딩 파일 + api_join_keys에서 다시 만든다 (한 트랜잭션으로 교체).
+
+    경로를 생략하면 활성 카탈로그 릴리스의 파일. 카탈로그에 없는 id_map 항목(폐지 후 삭제 등)은 건너뛴다.
+    """
+    release = active_release()
+    embeddings_path = embeddings_path or release.embeddings_path
+    id_map_path = id_map_path or release.id_map_path
+    embeddings = np.load(str(embeddings_path))
+    with open(id_map_path, "r", encoding="utf-8") as f:
+        id_map: list[str] = json.load(f)
+
+    known = {row[0] for row in conn.execute("SELECT api_id FROM apis")}
+    keep = [i for i, api_id in enumerate(id_map) if api_id in known]
+    if len(keep) < len(id_map):
+        logger.warning(f"{len(id_map) - len(keep)} id_map entries not in catalog — skipped")
+    embeddings = embeddings[keep]
+    id_map = [id_map[i] for i in keep]
+
+    join_keys: dict[str, set[str]] = {}
+    for api_id, key in conn.execute("SELECT api_id, join_key FROM api_join_keys"):
+        join_keys.setdefault(api_id, set()).add(key)
+
+    rows = compute_neighbors(embeddings, id_map, join_keys=join_keys, **kwargs)
+    written = 0
+    with conn:
+        conn.execute("DELETE FROM api_neighbors")
+        for chunk in _chunks(rows, 5000):
+            conn.executemany(
+                "INSERT INTO api_neighbors (api_id, neighbor_id, score, join_keys) VALUES (?, ?, ?, ?)", chunk,
+            )
+            written += len(chunk)
+    stats = {"apis": len(id_map), "rows": written}
+    logger.info(f"Neighbor table built: {stats}")
+    return stats
+
+
+def _chunks(rows: Iterable[NeighborRow], size: int) -> Iterator[list[NeighborRow]]:
+    chunk: list[NeighborRow] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def get_neighbors(
+    api_id: str, *, limit: int = NEIGHBOR_TOP_K, joinable_only: bool = False,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict[str, Any]]:
+    """api_id의 사전 계산 이웃 (유사도 내림차순).
+
+    Returns:
+        [{"api_id": ..., "name": ..., "score": float, "join_keys": [...]}, ...]
+    """
+    conn = conn or get_catalog_connections().reader()
+    rows = conn.execute(
+        "SELECT n.neighbor_id, a.name, n.score, n.join_keys FROM api_neighbors n"
+        " JOIN apis a ON a.api_id = n.neighbor_id"
+        " WHERE n.api_id = ? AND a.is_active = 1"
+        + (" AND n.join_keys IS NOT NULL" if joinable_only else "")
+        + " ORDER BY n.score DESC LIMIT ?",
+        (api_id, limit),
+    ).fetchall()
+    return [
+        {"api_id": r[0], "name": r[1], "score": r[2], "join_keys": r[3].split(",") if r[3] else []}
+        for r in rows
+    ]
+
+
+def related_apis(
+    api_ids: Iterable[str], *, per_api: int = 3, conn: sqlite3.Connection | None = None,
+) -> list[dict[str, Any]]:
+    """매칭된 API들을 사전 계산 이웃으로 확장한다 — 입력에 없는 API만, 조인 가능한 것 우선.
+
+    카탈로그/테이블이 없으면 빈 목록 (확장은 부가 정보라 실패해도 매칭을 막지 않는다).
+
+    Returns:
+        [{"api_id": ..., "name": ..., "score": float, "join_keys": [...], "via": 원래 API}, ...]
+    """
+    ids = list(dict.fromkeys(api_ids))
+    seen = set(ids)
+    related: list[dict[str, Any]] = []
+    try:
+        for api_id in ids:
+            neighbors = get_neighbors(api_id, limit=per_api * 3, conn=conn)
+            neighbors.sort(key=lambda n: (not n["join_keys"], -n["score"]))
+            added = 0
+            for n in neighbors:
+                if added >= per_api:
+                    break
+                if n["api_id"] not in seen:
+                    seen.add(n["api_id"])
+                    related.append({**n, "via": api_id})
+                    added += 1
+    except sqlite3.Error as e:
+        logger.debug(f"Neighbor expansion unavailable: {e}")
+    return related
@@ -0,0 +1,267 @@
+"""공유 Playwright 브라우저 풀 — 웜 Chromium 1개 + 제한된 컨텍스트/페이지.
+
+Phase 1 크롤러, Phase 4 경쟁사 검색, 카탈로그 스캔이 브라우저를 각자 띄우지 않고
+프로세스당 하나의 Chromium을 나눠 쓴다. Playwright 객체는 생성된 이벤트 루프에 묶이므로
+풀은 전용 루프 스레드에서 돌고, 호출자는 페이지를 받는 코루틴 함수를 넘긴다.
+
+    pool = get_browser_pool()
+    html = pool.run(lambda page: fetch_html(page, url))          # 동기 코드
+    html = await pool.arun(lambda page: fetch_html(page, url))   # 다른 루프의 async 코드
+
+- 페이지(전용 컨텍스트 포함)는 BROWSER_PAGE_MAX_USES회 사용 후 닫고 새로 만든다.
+- 1회 사용(작업 함수 실행)은 BROWSER_PAGE_TIMEOUT_SEC을 넘으면 취소되고 페이지를 폐기한다.
+- 브라우저는 프로세스 간 Playwright 슬롯(resource_guard)을 잡은 동안만 떠 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable
+
+from config import (
+    BROWSER_CONTEXT_OPTIONS,
+    BROWSER_NAV_TIMEOUT_MS,
+    BROWSER_PAGE_MAX_USES,
+    BROWSER_PAGE_TIMEOUT_SEC,
+    BROWSER_POOL_MAX_PAGES,
+)
+from logger import get_logger
+from resource_guard import Lease, ResourceSemaphore, get_resource_guard
+
+logger = get_logger("browser_pool")
+
+PageTask = Callable[[Any], Awaitable[Any]]
+
+
+async def _launch_chromium() -> tuple[Any, Callable[[], Awaitable[None]]]:
+    """headless Chromium을 띄워 (browser, 종료 코루틴 함수)를 반환한다."""
+    from playwright.async_api import async_playwright
+
+    playwright = await async_playwright().start()
+    try:
+        browser = await playwright.chromium.launch(headless=True)
+    except Exception:
+        await playwright.stop()
+        raise
+
+    async def stop() -> None:
+        try:
+            await browser.close()
+        finally:
+            await playwright.stop()
+
+    return browser, stop
+
+
+class _PooledPage:
+    __slots__ = ("context", "page", "uses")
+
+    def __init__(self, context: Any, page: Any) -> None:
+        self.context = context
+        self.page = page
+        self.uses = 0
+
+
+class BrowserPool:
+    """프로세스 공유 브라우저 풀. 전용 이벤트 루프 스레드에서 Playwright를 구동한다."""
+
+    def __init__(
+        self,
+        *,
+        max_pages: int = BROWSER_POOL_MAX_PAGES,
+        max_uses: int = BROWSER_PAGE_MAX_USES,
+        page_timeout_sec: float = BROWSER_PAGE_TIMEOUT_SEC,
+        launcher: Callable[[], Awaitable[tuple[Any, Callable[[], Awaitable[None]]]]] = _launch_chromium,
+        semaphore: ResourceSemaphore | None = None,
+    ) -> None:
+        self.max_pages = max_pages
+        self.max_uses = max_uses
+        self.page_timeout_sec = page_timeout_sec
+        self._launcher = launcher
+        self._semaphore = semaphore
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        # 아래는 풀 루프 안에서만 접근
+        self._browser: Any = None
+        self._stop_browser: Callable[[], Awaitable[None]] | None = None
+        self._lease: Lease | None = None
+        self._launching: asyncio.Lock | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._idle: list[_PooledPage] = []
+        self._open_pages = 0
+        self.stats = {"launches": 0, "pages_created": 0, "pages_recycled": 0, "timeouts": 0, "tasks": 0}
+
+    @property
+    def open_pages(self) -> int:
+        """현재 열려 있는 (유휴 + 사용 중) 페이지 수."""
+        return self._open_pages
+
+    # ── 공개 API ──
+
+    def run(self, task: PageTask, *, timeout: float | None = None) -> Any:
+        """동기 호출 — 풀 페이지로 task(page)를 실행하고 결과를 반환한다."""
+        return self._submit(task, timeout).result()
+
+    async def arun(self, task: PageTask, *, timeout: float | None = None) -> Any:
+        """async 호출 — 호출자 루프를 막지 않고 풀 루프에서 task(page)를 실행한다."""
+        return await asyncio.wrap_future(self._submit(task, timeout))
+
+    def close(self) -> None:
+        """페이지·브라우저를 닫고 루프 스레드를 멈춘다. 다시 쓰면 새로 띄운다."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            if loop is None or thread is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"Browser pool shutdown error: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=10)
+            self._loop = None
+            self._thread = None
+
+    # ── 루프 스레드 ──
+
+    def _submit(self, task: PageTask, timeout: float | None) -> Future:
+        loop = self._ensure_loop()
+        return asyncio.run_coroutine_threadsafe(self._run_task(task, timeout), loop)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+                    loop.close()
+
+                self._thread = threading.Thread(target=serve, name="browser-pool", daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    async def _run_task(self, task: PageTask, timeout: float | None) -> Any:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pages)
+            self._launching = asyncio.Lock()
+        async with self._slots:
+            pooled = await self._checkout()
+            healthy = False
+            try:
+                async with asyncio.timeout(timeout or self.page_timeout_sec):
+                    result = await task(pooled.page)
+                healthy = True
+                return result
+            except TimeoutError:
+                self.stats["timeouts"] += 1
+                logger.warning(f"Browser page task exceeded {timeout or self.page_timeout_sec:.0f}s — page discarded")
+                raise
+            finally:
+                self.stats["tasks"] += 1
+                await self._checkin(pooled, healthy)
+
+    async def _ensure_browser(self) -> Any:
+        async with self._launching:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+            if self._browser is not None:
+                logger.warning("Browser disconnected — relaunching")
+                await self._discard_browser()
+            if self._lease is None:
+                semaphore = self._semaphore or get_resource_guard().browsers
+                self._lease = await asyncio.to_thread(semaphore.acquire)
+            try:
+                self._browser, self._stop_browser = await self._launcher()
+            except Exception:
+                self._lease.release()
+                self._lease = None
+                raise
+            self.stats["launches"] += 1
+            logger.info(f"Browser pool: Chromium launched (max {self.max_pages} pages)")
+            return self._browser
+
+    async def _checkout(self) -> _PooledPage:
+        browser = await self._ensure_browser()  # 끊긴 브라우저면 유휴 페이지까지 버리고 재기동
+        while self._idle:
+            pooled = self._idle.pop()
+            if not pooled.page.is_closed():
+                return pooled
+            self._open_pages = max(0, self._open_pages - 1)
+        context = await browser.new_context(**BROWSER_CONTEXT_OPTIONS)
+        try:
+            page = await context.new_page()
+        except Exception:
+            await context.close()
+            raise
+        page.set_default_navigation_timeout(BROWSER_NAV_TIMEOUT_MS)
+        page.set_default_timeout(BROWSER_NAV_TIMEOUT_MS)
+        self._open_pages += 1
+        self.stats["pages_created"] += 1
+        return _PooledPage(context, page)
+
+    async def _checkin(self, pooled: _PooledPage, healthy: bool) -> None:
+        pooled.uses += 1
+        if healthy and pooled.uses < self.max_uses and not pooled.page.is_closed():
+            self._idle.append(pooled)
+            return
+        if healthy:
+            self.stats["pages_recycled"] += 1
+        self._open_pages = max(0, self._open_pages - 1)
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    async def _discard_browser(self) -> None:
+        self._idle.clear()
+        self._open_pages = 0
+        stop, self._browser, self._stop_browser = self._stop_browser, None, None
+        if stop is not None:
+            try:
+                await stop()
+            except Exception as e:
+                logger.debug(f"Browser stop error: {e}")
+
+    async def _shutdown(self) -> None:
+        for pooled in self._idle:
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+        await self._discard_browser()
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
+        self._slots = None
+        self._launching = None
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """프로세스 전역 브라우저 풀 (지연 생성, 종료 시 브라우저 정리)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def close_browser_pool() -> None:
+    """전역 풀이 떠 있으면 닫는다 (런 종료 시 — 좀비 Chromium 방지)."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,561 @@
+"""카탈로그 SQLite 공용 계층 — 스키마, 연결 관리, 대량 upsert, 대량 모드 PRAGMA, 전문 검색(FTS5).
+
+스키마는 docs/api_catalog_schema.md 와 같다. 스캔·백필처럼 행을 대량으로 쓰는 경로는
+행마다 커밋(WAL fsync)하지 않고 executemany를 batch_size 단위 트랜잭션으로 묶는다.
+api_fts(FTS5)는 apis / api_parameters 트리거로 동기화되므로 쓰기 경로는 신경 쓸 필요 없다.
+
+프로세스 안에서는 get_catalog_connections()가 연결을 공유한다 — 스레드별 읽기 전용 연결
+(mode=ro + query_only)과 쓰기 연결 하나. 연결이 오래 살아 있으므로 준비된 문장 캐시가 재사용된다.
+
+    db = get_catalog_connections()
+    count = db.reader().execute("SELECT COUNT(*) FROM apis").fetchone()[0]
+    with db.write() as conn:
+        upsert_apis_many(conn, apis, transaction=False)
+
+    with bulk_mode(conn):
+        upsert_apis_many(conn, apis)
+        upsert_parameters_many(conn, [(api_id, params), ...])
+"""
+
+from __future__ import annotations
+
+import atexit
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from config import (
+    CATALOG_BULK_BATCH_SIZE,
+    CATALOG_BULK_CACHE_MB,
+    CATALOG_DB_PATH,
+    CATALOG_FTS_TOKENIZER,
+    CATALOG_FTS_WEIGHTS,
+    CATALOG_MMAP_MB,
+    CATALOG_STATEMENT_CACHE,
+    SCHEMA_VERSION,
+)
+from logger import get_logger
+from utils import kst_now
+
+logger = get_logger("catalog_db")
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS catalog_metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS apis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    api_id TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    description TEXT,
+    category TEXT,
+    provider TEXT,
+    endpoint_url TEXT,
+    data_format TEXT DEFAULT 'JSON',
+    is_active INTEGER DEFAULT 1,
+    last_scanned_at TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_apis_category ON apis(category);
+CREATE INDEX IF NOT EXISTS idx_apis_active ON apis(is_active);
+CREATE TABLE IF NOT EXISTS api_parameters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    api_id TEXT NOT NULL REFERENCES apis(api_id),
+    param_name TEXT NOT NULL,
+    param_type TEXT DEFAULT 'string',
+    description TEXT,
+    required INTEGER DEFAULT 0,
+    UNIQUE(api_id, param_name)
+);
+CREATE INDEX IF NOT EXISTS idx_api_params_api_id ON api_parameters(api_id);
+CREATE TABLE IF NOT EXISTS api_operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    api_id TEXT NOT NULL REFERENCES apis(api_id),
+    operation_name TEXT NOT NULL,
+    http_method TEXT DEFAULT 'GET',
+    path TEXT,
+    description TEXT,
+    UNIQUE(api_id, operation_name)
+);
+CREATE INDEX IF NOT EXISTS idx_api_ops_api_id ON api_operations(api_id);
+CREATE TABLE IF NOT EXISTS api_join_keys (
+    join_key TEXT NOT NULL,
+    api_id TEXT NOT NULL REFERENCES apis(api_id),
+    param_name TEXT NOT NULL,
+    PRIMARY KEY (join_key, api_id, param_name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_join_keys_api_id ON api_join_keys(api_id);
+CREATE TABLE IF NOT EXISTS api_neighbors (
+    api_id TEXT NOT NULL REFERENCES apis(api_id),
+    neighbor_id TEXT NOT NULL REFERENCES apis(api_id),
+    score REAL NOT NULL,
+    join_keys TEXT,
+    PRIMARY KEY (api_id, neighbor_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS api_fingerprints (
+    api_id TEXT PRIMARY KEY REFERENCES apis(api_id),
+    listing_hash TEXT,
+    detail_hash TEXT,
+    source_url TEXT,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_fingerprints_source ON api_fingerprints(source_url);
+CREATE TABLE IF NOT EXISTS api_scan_misses (
+    api_id TEXT PRIMARY KEY REFERENCES apis(api_id),
+    misses INTEGER NOT NULL,
+    first_missed_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS http_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS domain_summary (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT UNIQUE NOT NULL,
+    api_count INTEGER DEFAULT 0,
+    representative_keywords TEXT,
+    summary_text TEXT,
+    updated_at TEXT NOT NULL
+);
+"""
+
+# 도메인 요약 증분 갱신 — API 쓰기마다 해당 카테고리를 dirty로 표시, 갱신 시 그 카테고리만 재계산.
+# 트리거 본문의 OR IGNORE는 바깥 문장(upsert)의 충돌 처리로 덮이므로 NOT EXISTS로 중복을 거른다.
+DOMAIN_DIRTY_SQL = """
+CREATE TABLE IF NOT EXISTS domain_summary_dirty (
+    category TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS trg_apis_domain_insert AFTER INSERT ON apis
+WHEN NEW.category IS NOT NULL BEGIN
+    INSERT INTO domain_summary_dirty (category) SELECT NEW.category
+    WHERE NOT EXISTS (SELECT 1 FROM domain_summary_dirty WHERE category = NEW.category);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_apis_domain_update AFTER UPDATE OF category, is_active, name, description ON apis
+WHEN OLD.category IS NOT NEW.category OR OLD.is_active IS NOT NEW.is_active
+  OR OLD.name IS NOT NEW.name OR OLD.description IS NOT NEW.description BEGIN
+    INSERT INTO domain_summary_dirty (category)
+    SELECT c FROM (SELECT OLD.category AS c UNION SELECT NEW.category)
+    WHERE c IS NOT NULL AND c NOT IN (SELECT category FROM domain_summary_dirty);
+END;
+CREATE TRIGGER IF NOT EXISTS trg_apis_domain_delete AFTER DELETE ON apis
+WHEN OLD.category IS NOT NULL BEGIN
+    INSERT INTO domain_summary_dirty (category) SELECT OLD.category
+    WHERE NOT EXISTS (SELECT 1 FROM domain_summary_dirty WHERE category = OLD.category);
+END;
+"""
+
+# API 1건 = FTS 행 1개 (rowid = apis.id). 파라미터 이름/설명은 공백으로 이어 붙인다.
+_FTS_ROW_SELECT = """
+SELECT a.id, a.name, COALESCE(a.description, ''),
+       COALESCE((SELECT group_concat(p.param_name, ' ') FROM api_parameters p WHERE p.api_id = a.api_id), ''),
+       COALESCE((SELECT group_concat(p.description, ' ') FROM api_parameters p WHERE p.api_id = a.api_id), '')
+FROM apis a
+"""
+
+_FTS_INSERT = "INSERT INTO api_fts (rowid, name, description, param_names, param_descriptions)"
+
+
+def _fts_refresh(api_id_expr: str) -> str:
+    """트리거 본문 — 해당 API의 FTS 행을 지우고 현재 값으로 다시 넣는다."""
+    return (
+        f"DELETE FROM api_fts WHERE rowid = (SELECT id FROM apis WHERE api_id = {api_id_expr});\n"
+        f"    {_FTS_INSERT} {_FTS_ROW_SELECT.strip()} WHERE a.api_id = {api_id_expr};"
+    )
+
+
+FTS_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS api_fts USING fts5(
+    name, description, param_names, param_descriptions,
+    tokenize = '{CATALOG_FTS_TOKENIZER}'
+);
+CREATE TRIGGER IF NOT EXISTS trg_apis_fts_insert AFTER INSERT ON apis BEGIN
+    {_FTS_INSERT} {_FTS_ROW_SELECT.strip()} WHERE a.id = NEW.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_apis_fts_update AFTER UPDATE OF name, description ON apis BEGIN
+    DELETE FROM api_fts WHERE rowid = OLD.id;
+    {_FTS_INSERT} {_FTS_ROW_SELECT.strip()} WHERE a.id = NEW.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_apis_fts_delete AFTER DELETE ON apis BEGIN
+    DELETE FROM api_fts WHERE rowid = OLD.id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_params_fts_insert AFTER INSERT ON api_parameters BEGIN
+    {_fts_refresh("NEW.api_id")}
+END;
+CREATE TRIGGER IF NOT EXISTS trg_params_fts_update AFTER UPDATE ON api_parameters BEGIN
+    {_fts_refresh("OLD.api_id")}
+    {_fts_refresh("NEW.api_id")}
+END;
+CREATE TRIGGER IF NOT EXISTS trg_params_fts_delete AFTER DELETE ON api_parameters BEGIN
+    {_fts_refresh("OLD.api_id")}
+END;
+"""
+
+_FTS_MIN_TERM = 3  # trigram 토크나이저는 3자 미만 MATCH 질의에 결과를 내지 않는다
+_TERM_RE = re.compile(r"\w+")
+# 질의 단어 끝 조사 — "사업자번호로" 처럼 붙어 있으면 부분 문자열로도 맞지 않는다
+_JOSA_SUFFIXES = ("에서", "으로", "까지", "부터", "로", "을", "를", "이", "가", "은", "는", "의", "에", "와", "과", "도", "만")
+
+_UPSERT_API_SQL = """
+INSERT INTO apis (api_id, name, description, category, provider, endpoint_url, data_format,
+                  is_active, last_scanned_at, created_at, updated_at)
+VALUES (:api_id, :name, :description, :category, :provider, :endpoint_url, :data_format,
+        :is_active, :last_scanned_at, :now, :now)
+ON CONFLICT(api_id) DO UPDATE SET
+    name = excluded.name,
+    description = excluded.description,
+    category = excluded.category,
+    provider = excluded.provider,
+    endpoint_url = excluded.endpoint_url,
+    data_format = excluded.data_format,
+    is_active = excluded.is_active,
+    last_scanned_at = COALESCE(excluded.last_scanned_at, apis.last_scanned_at),
+    updated_at = excluded.updated_at
+"""
+
+_UPSERT_PARAM_SQL = """
+INSERT INTO api_parameters (api_id, param_name, param_type, description, required)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(api_id, param_name) DO UPDATE SET
+    param_type = excluded.param_type,
+    description = excluded.description,
+    required = excluded.required
+"""
+
+_UPSERT_OP_SQL = """
+INSERT INTO api_operations (api_id, operation_name, http_method, path, description)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(api_id, operation_name) DO UPDATE SET
+    http_method = excluded.http_method,
+    path = excluded.path,
+    description = excluded.description
+"""
+
+
+def connect(db_path: Path | str = CATALOG_DB_PATH, *, check_same_thread: bool = True) -> sqlite3.Connection:
+    """쓰기용 연결 — WAL, 외래키 활성, 스키마 보장."""
+    conn = sqlite3.connect(
+        str(db_path), check_same_thread=check_same_thread, cached_statements=CATALOG_STATEMENT_CACHE,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute(f"PRAGMA mmap_size={CATALOG_MMAP_MB * 1024 * 1024}")
+    ensure_schema(conn)
+    return conn
+
+
+def connect_readonly(db_path: Path | str = CATALOG_DB_PATH) -> sqlite3.Connection:
+    """읽기 전용 연결 — mode=ro URI + query_only. DB 파일이 없으면 만들지 않고 실패한다."""
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(
+        uri, uri=True, check_same_thread=False, cached_statements=CATALOG_STATEMENT_CACHE,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute(f"PRAGMA mmap_size={CATALOG_MMAP_MB * 1024 * 1024}")
+    return conn
+
+
+class CatalogConnections:
+    """카탈로그 DB 연결 관리자 — 스레드별 읽기 연결 + 단일 쓰기 연결.
+
+    WAL이라 읽기 연결은 쓰기와 서로 막지 않는다. 쓰기 연결은 하나를 공유하므로
+    여러 스레드에서 쓸 때는 write()로 잠금을 잡는다.
+    """
+
+    def __init__(self, db_path: Path | str = CATALOG_DB_PATH) -> None:
+        self.db_path = Path(db_path)
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._writer: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    def reader(self) -> sqlite3.Connection:
+        """현재 스레드의 읽기 전용 연결 (없으면 연다)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_readonly(self.db_path)
+            self._local.conn = conn
+            with self._lock:
+                self._readers.append(conn)
+        return conn
+
+    @property
+    def writer(self) -> sqlite3.Connection:
+        """공유 쓰기 연결 (처음 접근 시 열고 스키마를 보장한다)."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = connect(self.db_path, check_same_thread=False)
+            return self._writer
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금 + 트랜잭션 — 블록이 끝나면 커밋, 예외면 롤백."""
+        with self._lock:
+            conn = self.writer
+            with conn:
+                yield conn
+
+    def close(self) -> None:
+        with self._lock:
+            readers, self._readers = self._readers, []
+            writer, self._writer = self._writer, None
+        for conn in readers:
+            conn.close()
+        if writer is not None:
+            writer.close()
+        self._local = threading.local()
+
+
+_managers: dict[Path, CatalogConnections] = {}
+_managers_lock = threading.Lock()
+
+
+def get_catalog_connections(db_path: Path | str | None = None) -> CatalogConnections:
+    """DB 파일별 프로세스 전역 연결 관리자 (종료 시 연결 정리).
+
+    db_path를 생략하면 이 프로세스에 고정된 카탈로그 릴리스의 DB (catalog_release.active_release).
+    """
+    if db_path is None:
+        from catalog_release import active_release
+
+        db_path = active_release().db_path
+    key = Path(db_path).resolve()
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = CatalogConnections(key)
+            atexit.register(manager.close)
+        return manager
+
+
+def close_catalog_connections(db_path: Path | str | None = None) -> None:
+    """전역 연결을 닫는다 (카탈로그 파일 교체 전, 테스트 정리 등). db_path를 주면 그 DB만."""
+    with _managers_lock:
+        if db_path is None:
+            managers = list(_managers.values())
+            _managers.clear()
+        else:
+            manager = _managers.pop(Path(db_path).resolve(), None)
+            managers = [manager] if manager is not None else []
+    for manager in managers:
+        manager.close()
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    seed_dirty = not _table_exists(conn, "domain_summary_dirty")
+    conn.executescript(SCHEMA_SQL)
+    conn.executescript(DOMAIN_DIRTY_SQL)
+    if seed_dirty:
+        # 기존 카탈로그에 처음 붙이면 모든 카테고리를 한 번 재계산 대상으로
+        conn.execute(
+            "INSERT OR IGNORE INTO domain_summary_dirty (category)"
+            " SELECT DISTINCT category FROM apis WHERE category IS NOT NULL"
+        )
+    conn.execute(
+        "INSERT OR IGNORE INTO catalog_metadata (key, value) VALUES ('schema_version', ?)",
+        (SCHEMA_VERSION,),
+    )
+    conn.commit()
+    _ensure_fts(conn)
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    return _table_exists(conn, "api_fts")
+
+
+def _ensure_fts(conn: sqlite3.Connection) -> None:
+    """api_fts와 동기화 트리거를 만든다. 기존 카탈로그에 처음 붙이면 한 번 전체 색인."""
+    if fts_available(conn):
+        return
+    try:
+        conn.executescript(FTS_SQL)
+    except sqlite3.OperationalError as e:
+        # FTS5/trigram 미지원 SQLite 빌드 — 어휘 검색 없이 벡터 검색만 쓴다
+        logger.warning(f"FTS5 index unavailable ({e}); lexical search disabled")
+        return
+    rebuild_fts(conn)
+
+
+def rebuild_fts(conn: sqlite3.Connection) -> int:
+    """api_fts를 apis / api_parameters에서 다시 채운다. 색인한 API 수를 반환."""
+    with conn:
+        conn.execute("DELETE FROM api_fts")
+        conn.execute(f"{_FTS_INSERT} {_FTS_ROW_SELECT}")
+    count = conn.execute("SELECT COUNT(*) FROM api_fts").fetchone()[0]
+    logger.info(f"FTS index rebuilt: {count} APIs")
+    return count
+
+
+def _strip_josa(term: str) -> str:
+    for suffix in _JOSA_SUFFIXES:
+        if term.endswith(suffix) and len(term) - len(suffix) >= 2:
+            return term[: -len(suffix)]
+    return term
+
+
+def _fts_query(text: str) -> tuple[str | None, list[str]]:
+    """자연어 질의 → (FTS5 MATCH 식, 3자 미만 단어 목록).
+
+    단어마다 따옴표로 감싸 FTS5 연산자/구문 오류를 피하고 OR로 잇는다 (BM25가 많이 맞은 API를 올림).
+    """
+    terms = list(dict.fromkeys(_strip_josa(t) for t in _TERM_RE.findall(text)))
+    long_terms = [t for t in terms if len(t) >= _FTS_MIN_TERM]
+    short_terms = [t for t in terms if len(t) < _FTS_MIN_TERM]
+    match = " OR ".join('"' + t.replace('"', '""') + '"' for t in long_terms) or None
+    return match, short_terms
+
+
+def search_fts(
+    conn: sqlite3.Connection, query: str, *, limit: int = 50, active_only: bool = True,
+) -> list[dict[str, Any]]:
+    """API 이름·설명·파라미터를 전문 검색한다 (BM25 순).
+
+    3자 이상 단어가 없으면 (예: "날짜") 짧은 단어 LIKE 부분 일치로 대신 찾는다.
+
+    Returns:
+        [{"api_id": ..., "name": ..., "bm25": float | None, "rank": int}, ...]
+    """
+    if not fts_available(conn):
+        return []
+    match, short_terms = _fts_query(query)
+    active = "AND a.is_active = 1" if active_only else ""
+    if match:
+        weights = ", ".join(str(w) for w in CATALOG_FTS_WEIGHTS)
+        rows = conn.execute(
+            f"SELECT a.api_id, a.name, bm25(api_fts, {weights}) AS score"
+            f" FROM api_fts JOIN apis a ON a.id = api_fts.rowid"
+            f" WHERE api_fts MATCH ? {active} ORDER BY score LIMIT ?",
+            (match, limit),
+        ).fetchall()
+    elif short_terms:
+        cond = " OR ".join(
+            "(f.name LIKE ? OR f.description LIKE ? OR f.param_names LIKE ? OR f.param_descriptions LIKE ?)"
+            for _ in short_terms
+        )
+        args = [f"%{t}%" for t in short_terms for _ in range(4)]
+        rows = conn.execute(
+            f"SELECT a.api_id, a.name, NULL AS score FROM api_fts f JOIN apis a ON a.id = f.rowid"
+            f" WHERE ({cond}) {active} ORDER BY a.id LIMIT ?",
+            (*args, limit),
+        ).fetchall()
+    else:
+        return []
+    return [
+        {"api_id": row[0], "name": row[1], "bm25": row[2], "rank": rank}
+        for rank, row in enumerate(rows, start=1)
+    ]
+
+
+@contextmanager
+def bulk_mode(conn: sqlite3.Connection, *, cache_mb: int = CATALOG_BULK_CACHE_MB) -> Iterator[sqlite3.Connection]:
+    """대량 쓰기 구간 PRAGMA — synchronous=NORMAL, temp_store=MEMORY, 큰 페이지 캐시.
+
+    WAL + NORMAL은 커밋마다 fsync하지 않지만 체크포인트에서 동기화되므로 DB가 깨지지 않는다
+    (전원 장애 시 마지막 몇 트랜잭션만 잃을 수 있음). 구간이 끝나면 원래 값으로 되돌린다.
+    """
+    saved = {
+        name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+        for name in ("synchronous", "temp_store", "cache_size")
+    }
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute(f"PRAGMA cache_size={-cache_mb * 1024}")  # 음수 = KiB 단위
+    logger.debug(f"Bulk mode on (synchronous=NORMAL, cache {cache_mb}MB)")
+    try:
+        yield conn
+    finally:
+        for name, value in saved.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+
+def _batched(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(rows)
+    while chunk := list(islice(it, max(1, size))):
+        yield chunk
+
+
+def _write(conn: sqlite3.Connection, sql: str, rows: Iterable[Any], batch_size: int, transaction: bool) -> int:
+    written = 0
+    for chunk in _batched(rows, batch_size):
+        if transaction:
+            with conn:
+                conn.executemany(sql, chunk)
+        else:
+            conn.executemany(sql, chunk)
+        written += len(chunk)
+    return written
+
+
+def _param_rows(api_id: str, params: Iterable[dict[str, Any]]) -> Iterator[tuple]:
+    for p in params:
+        if p.get("param_name"):
+            yield (api_id, p["param_name"], p.get("param_type") or "string", p.get("description"),
+                   int(bool(p.get("required"))))
+
+
+def _operation_rows(api_id: str, ops: Iterable[dict[str, Any]]) -> Iterator[tuple]:
+    for o in ops:
+        if o.get("operation_name"):
+            yield (api_id, o["operation_name"], o.get("http_method") or "GET", o.get("path"),
+                   o.get("description"))
+
+
+def upsert_apis_many(
+    conn: sqlite3.Connection, apis: Iterable[dict[str, Any]], *,
+    batch_size: int = CATALOG_BULK_BATCH_SIZE, transaction: bool = True,
+) -> int:
+    """API 메타데이터를 batch_size건씩 한 트랜잭션으로 upsert한다. 기록한 행 수를 반환.
+
+    transaction=False면 호출자가 트랜잭션을 관리한다 (다른 쓰기와 한 번에 커밋할 때).
+    """
+    now = kst_now().isoformat()
+    rows = (
+        {
+            "api_id": api["api_id"],
+            "name": api.get("name") or api["api_id"],
+            "description": api.get("description"),
+            "category": api.get("category"),
+            "provider": api.get("provider"),
+            "endpoint_url": api.get("endpoint_url"),
+            "data_format": api.get("data_format") or "JSON",
+            "is_active": int(api.get("is_active", 1)),
+            "last_scanned_at": api.get("last_scanned_at"),
+            "now": now,
+        }
+        for api in apis
+    )
+    return _write(conn, _UPSERT_API_SQL, rows, batch_size, transaction)
+
+
+def upsert_parameters_many(
+    conn: sqlite3.Connection, items: Iterable[tuple[str, list[dict[str, Any]]]], *,
+    batch_size: int = CATALOG_BULK_BATCH_SIZE, transaction: bool = True,
+) -> int:
+    """(api_id, 파라미터 목록) 묶음을 대량 upsert한다."""
+    rows = (row for api_id, params in items for row in _param_rows(api_id, params))
+    return _write(conn, _UPSERT_PARAM_SQL, rows, batch_size, transaction)
+
+
+def upsert_operations_many(
+    conn: sqlite3.Connection, items: Iterable[tuple[str, list[dict[str, Any]]]], *,
+    batch_size: int = CATALOG_BULK_BATCH_SIZE, transaction: bool = True,
+) -> int:
+    """(api_id, 오퍼레이션 목록) 묶음을 대량 upsert한다."""
+    rows = (row for api_id, ops in items for row in _operation_rows(api_id, ops))
+    return _write(conn, _UPSERT_OP_SQL, rows, batch_size, transaction)
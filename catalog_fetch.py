@@ -0,0 +1,346 @@
+"""조건부 카탈로그 스캔 — HTTP 우선(ETag/Last-Modified) + 콘텐츠 지문으로 바뀐 API만 렌더링.
+
+목록 페이지는 httpx 조건부 GET으로 받는다. 서버가 304를 주거나 정규화한 본문 해시가
+지난번과 같으면 파싱하지 않고, 그 페이지에서 지난번에 본 API를 그대로 '본 것'으로 친다.
+바뀐 목록 페이지는 행마다 목록 지문(listing_hash)을 비교해 새로 생겼거나 바뀐 API만
+상세 페이지를 HTTP로 확인하고, 상세 지문(detail_hash)까지 바뀐 API만 Playwright로
+렌더링한다 (Swagger UI 파라미터는 JS 렌더링이 필요). 전수 스캔도 대부분 조건부 GET으로 끝난다.
+
+페이지 결과는 PageBatch 하나로 모아 sink에 넘긴다. 기본 sink(write_live)는 라이브 테이블에
+한 트랜잭션으로 쓰고, 전수 스캔은 스테이징 sink(catalog_staging)로 모았다가 한 번에 교체한다.
+검증자(ETag 등)는 페이지 결과와 같은 트랜잭션에서 저장한다 — 상세 처리에 실패한
+목록 페이지는 검증자를 남기지 않으므로 다음 실행에서 다시 받는다.
+
+    fetcher = ConditionalFetcher(conn, bucket=TokenBucket(5.0, 5))
+    stats = await conditional_scan(conn, listing_page_urls(50), fetcher=fetcher,
+                                   parse_listing=parse, render_detail=render)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import html
+import json
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterable
+
+import catalog_db
+from config import (
+    CATALOG_HTTP_TIMEOUT_SEC,
+    CATALOG_LISTING_URL,
+    DATA_GO_KR_BASE_URL,
+)
+from join_graph import update_join_graph
+from logger import get_logger
+from utils import TokenBucket, kst_now
+
+logger = get_logger("catalog_fetch")
+
+# 목록 행 지문에 넣는 필드 — 목록에서 바로 보이는 값만 (modified = 목록의 수정일)
+LISTING_FIELDS = ("name", "description", "category", "provider", "endpoint_url", "data_format", "modified")
+
+ListingParser = Callable[[str], list[dict[str, Any]]]
+# 목록 행 → (parameters, operations) — Playwright 렌더링
+DetailRenderer = Callable[[dict[str, Any]], Awaitable[tuple[list[dict[str, Any]], list[dict[str, Any]]]]]
+PageRenderer = Callable[[str], Awaitable[str]]
+
+_INVISIBLE_RE = re.compile(r"<(script|style|noscript)\b.*?</\1\s*>|<!--.*?-->", re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+_UPSERT_VALIDATOR_SQL = """
+INSERT INTO http_validators (url, etag, last_modified, content_hash, checked_at) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(url) DO UPDATE SET
+    etag = excluded.etag,
+    last_modified = excluded.last_modified,
+    content_hash = excluded.content_hash,
+    checked_at = excluded.checked_at
+"""
+
+_UPSERT_FINGERPRINT_SQL = """
+INSERT INTO api_fingerprints (api_id, listing_hash, detail_hash, source_url, updated_at) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(api_id) DO UPDATE SET
+    listing_hash = excluded.listing_hash,
+    detail_hash = COALESCE(excluded.detail_hash, api_fingerprints.detail_hash),
+    source_url = COALESCE(api_fingerprints.source_url, excluded.source_url),
+    updated_at = excluded.updated_at
+"""
+
+
+def normalize_html(text: str) -> str:
+    """스크립트·스타일·주석·태그를 걷어내고 엔티티를 풀고 공백을 합친 본문 텍스트.
+
+    세션 토큰이나 캐시 무효화 쿼리처럼 매 요청 바뀌는 값은 대개 스크립트/속성에 있어 지문에서 빠진다.
+    """
+    text = _INVISIBLE_RE.sub(" ", text)
+    text = _TAG_RE.sub(" ", text)
+    return _WS_RE.sub(" ", html.unescape(text)).strip()
+
+
+def content_fingerprint(text: str) -> str:
+    return hashlib.sha256(normalize_html(text).encode("utf-8")).hexdigest()
+
+
+def listing_fingerprint(row: dict[str, Any]) -> str:
+    """목록 행 지문 — LISTING_FIELDS 값을 공백 정규화해 해시한다."""
+    values = [_WS_RE.sub(" ", str(row.get(f) or "")).strip() for f in LISTING_FIELDS]
+    return hashlib.sha256(json.dumps(values, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def listing_page_urls(max_pages: int, template: str = CATALOG_LISTING_URL) -> list[str]:
+    return [template.format(page=page) for page in range(1, max_pages + 1)]
+
+
+def detail_page_url(api_id: str, base_url: str = DATA_GO_KR_BASE_URL) -> str:
+    """data.go.kr 상세 페이지(Swagger UI) URL."""
+    return f"{base_url}/data/{api_id.replace('DATAGOKR-', '')}/openapi.do"
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    text: str | None          # 304면 None
+    content_hash: str | None
+    etag: str | None
+    last_modified: str | None
+    changed: bool             # 304이거나 지문이 같으면 False
+
+
+class ConditionalFetcher:
+    """조건부 GET — 저장된 ETag/Last-Modified를 보내고, 200이면 정규화 본문 지문을 비교한다.
+
+    client는 httpx.AsyncClient 호환 객체 (get(url, headers=...) 코루틴). 없으면 처음 요청할 때 만든다.
+    여러 샤드 코루틴이 하나를 공유해도 된다 (bucket = 전체 요청률).
+    fetch()는 검증자를 저장하지 않는다 — 결과를 기록할 때 store_validators()로 함께 쓴다.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        client: Any = None,
+        bucket: TokenBucket | None = None,
+        timeout: float = CATALOG_HTTP_TIMEOUT_SEC,
+    ) -> None:
+        self.conn = conn
+        self.bucket = bucket
+        self.timeout = timeout
+        self._client = client
+        self._own_client = client is None
+        self.stats = {"requests": 0, "not_modified": 0, "unchanged": 0, "changed": 0}
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(timeout=self.timeout, follow_redirects=True)
+        return self._client
+
+    async def fetch(self, url: str) -> FetchResult:
+        stored = self.conn.execute(
+            "SELECT etag, last_modified, content_hash FROM http_validators WHERE url = ?", (url,)
+        ).fetchone()
+        headers = {}
+        if stored is not None:
+            if stored[0]:
+                headers["If-None-Match"] = stored[0]
+            if stored[1]:
+                headers["If-Modified-Since"] = stored[1]
+
+        if self.bucket is not None:
+            await self.bucket.acquire()
+        response = await self._get_client().get(url, headers=headers)
+        self.stats["requests"] += 1
+
+        if response.status_code == 304 and stored is not None:
+            self.stats["not_modified"] += 1
+            return FetchResult(url, 304, None, stored[2], stored[0], stored[1], changed=False)
+        response.raise_for_status()
+
+        text = response.text
+        digest = content_fingerprint(text)
+        changed = stored is None or stored[2] != digest
+        self.stats["changed" if changed else "unchanged"] += 1
+        return FetchResult(
+            url, response.status_code, text, digest,
+            response.headers.get("etag"), response.headers.get("last-modified"), changed,
+        )
+
+    async def aclose(self) -> None:
+        if self._own_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+def validator_row(result: FetchResult) -> tuple:
+    """http_validators 행 (url, etag, last_modified, content_hash, checked_at)."""
+    return result.url, result.etag, result.last_modified, result.content_hash, kst_now().isoformat()
+
+
+def store_validators(conn: sqlite3.Connection, results: Iterable[FetchResult]) -> None:
+    """처리를 마친 응답의 검증자를 저장한다 (호출자 트랜잭션 안에서)."""
+    conn.executemany(_UPSERT_VALIDATOR_SQL, [validator_row(r) for r in results])
+
+
+@dataclass
+class PageBatch:
+    """목록 페이지 한 장의 스캔 결과 — sink가 한 번에 기록한다."""
+
+    url: str
+    seen: list[str]                                      # 이 페이지 목록에 있던 api_id
+    apis: list[dict[str, Any]] = field(default_factory=list)   # 바뀐 API 행
+    params: list[tuple[str, list[dict[str, Any]]]] = field(default_factory=list)
+    ops: list[tuple[str, list[dict[str, Any]]]] = field(default_factory=list)
+    fingerprints: list[tuple] = field(default_factory=list)    # api_fingerprints 행
+    validators: list[FetchResult] = field(default_factory=list)
+
+
+PageSink = Callable[[sqlite3.Connection, PageBatch], None]
+
+
+def write_live(conn: sqlite3.Connection, batch: PageBatch) -> None:
+    """페이지 결과를 라이브 테이블에 한 트랜잭션으로 (API·파라미터·오퍼레이션·조인 키·지문·검증자).
+
+    이미 있는 지문의 source_url은 바꾸지 않는다 — 전수 스캔(등록순 목록)이 304 페이지의 API를
+    '본 것'으로 복원하는 기준이라, 증분 스캔(수정순 목록)이 덮어쓰면 폐지로 오판한다.
+    """
+    with conn:
+        catalog_db.upsert_apis_many(conn, batch.apis, transaction=False)
+        catalog_db.upsert_parameters_many(conn, batch.params, transaction=False)
+        catalog_db.upsert_operations_many(conn, batch.ops, transaction=False)
+        update_join_graph(conn, (api_id for api_id, _ in batch.params), transaction=False)
+        conn.executemany(_UPSERT_FINGERPRINT_SQL, batch.fingerprints)
+        conn.executemany(
+            "UPDATE api_fingerprints SET source_url = ? WHERE api_id = ? AND source_url IS NULL",
+            [(batch.url, api_id) for api_id in batch.seen],
+        )
+        store_validators(conn, batch.validators)
+
+
+def changed_listing_rows(
+    conn: sqlite3.Connection, rows: Iterable[dict[str, Any]],
+) -> list[tuple[dict[str, Any], str]]:
+    """저장된 목록 지문과 다른 (또는 처음 보는) 행 → [(행, 새 지문), ...]."""
+    rows = list(rows)
+    ids = [row["api_id"] for row in rows]  # 목록 페이지 한 장 분량 — IN 목록 하나로 충분
+    stored: dict[str, str | None] = dict(conn.execute(
+        f"SELECT api_id, listing_hash FROM api_fingerprints WHERE api_id IN ({','.join('?' * len(ids))})", ids
+    ).fetchall())
+    changed = []
+    for row in rows:
+        digest = listing_fingerprint(row)
+        if stored.get(row["api_id"]) != digest:
+            changed.append((row, digest))
+    return changed
+
+
+async def conditional_scan(
+    conn: sqlite3.Connection,
+    listing_urls: Iterable[str],
+    *,
+    fetcher: ConditionalFetcher,
+    parse_listing: ListingParser,
+    render_detail: DetailRenderer,
+    render_listing: PageRenderer | None = None,
+    detail_url: Callable[[str], str] = detail_page_url,
+    sink: PageSink = write_live,
+) -> dict[str, Any]:
+    """목록 페이지를 차례로 조건부 GET 하고, 바뀐 API만 상세 렌더링해 sink로 기록한다.
+
+    parse_listing은 목록 HTML → [{"api_id", "name", ...}, ...]. 정적 HTML에서 행을 못 찾으면
+    (JS 렌더링 목록) render_listing으로 렌더링한 HTML을 다시 파싱한다.
+    변경 판단은 항상 라이브 테이블의 지문·검증자와 비교한다. 페이지 하나 = sink 호출 하나.
+
+    바뀐 페이지가 행 0개로 파싱되면(점검·오류 페이지 또는 목록 끝) 기록하지 않고 검증자도
+    남기지 않는다 — 목록 중간의 빈 페이지인지는 호출자가 listed_urls로 판단한다.
+
+    Returns:
+        통계 + "seen": 이번 스캔에서 목록에 있던 api_id 집합 (failed_urls가 비어 있을 때만 완전함)
+        + "failed_urls": 목록을 못 받았거나 상세 처리에 실패한 목록 페이지
+        + "empty_urls": 바뀌었는데 행이 없던 페이지, "listed_urls": API가 하나라도 있던 페이지
+    """
+    stats = {
+        "pages": 0, "pages_skipped": 0, "pages_rendered": 0, "pages_failed": 0, "pages_empty": 0,
+        "apis_changed": 0, "details_rendered": 0, "details_failed": 0,
+    }
+    seen: set[str] = set()
+    failed_urls: list[str] = []
+    empty_urls: list[str] = []
+    listed_urls: list[str] = []
+
+    for url in listing_urls:
+        stats["pages"] += 1
+        try:
+            page = await fetcher.fetch(url)
+        except Exception as e:
+            logger.warning(f"Listing fetch failed {url}: {e}")
+            stats["pages_failed"] += 1
+            failed_urls.append(url)
+            continue
+
+        if not page.changed:
+            stats["pages_skipped"] += 1
+            ids = [r[0] for r in conn.execute("SELECT api_id FROM api_fingerprints WHERE source_url = ?", (url,))]
+            sink(conn, PageBatch(url, ids, validators=[page]))
+            seen.update(ids)
+            if ids:
+                listed_urls.append(url)
+            continue
+
+        rows = parse_listing(page.text or "")
+        if not rows and render_listing is not None:
+            try:
+                rows = parse_listing(await render_listing(url))
+            except Exception as e:
+                logger.warning(f"Listing render failed {url}: {e}")
+                stats["pages_failed"] += 1
+                failed_urls.append(url)
+                continue
+            stats["pages_rendered"] += 1
+        if not rows:
+            logger.warning(f"Listing page parsed to no rows: {url}")
+            stats["pages_empty"] += 1
+            empty_urls.append(url)
+            continue
+
+        listed_urls.append(url)
+        now = kst_now().isoformat()
+        batch = PageBatch(url, [row["api_id"] for row in rows])
+        failed = 0
+        for row, listing_hash in changed_listing_rows(conn, rows):
+            api_id = row["api_id"]
+            try:
+                detail = await fetcher.fetch(detail_url(api_id))
+                if detail.changed:
+                    api_params, api_ops = await render_detail(row)
+                    batch.params.append((api_id, api_params))
+                    batch.ops.append((api_id, api_ops))
+                    stats["details_rendered"] += 1
+            except Exception as e:
+                # 지문을 저장하지 않으므로 다음 스캔에서 다시 대상이 된다
+                logger.warning(f"{api_id} detail failed: {e}")
+                failed += 1
+                continue
+            batch.apis.append({**row, "last_scanned_at": now})
+            batch.fingerprints.append((api_id, listing_hash, detail.content_hash, url, now))
+            batch.validators.append(detail)
+
+        if failed:
+            failed_urls.append(url)
+        else:
+            batch.validators.append(page)
+        sink(conn, batch)
+
+        seen.update(batch.seen)
+        stats["apis_changed"] += len(batch.apis)
+        stats["details_failed"] += failed
+
+    logger.info(f"Conditional scan: {stats} (http {fetcher.stats})")
+    return {
+        **stats, "http": dict(fetcher.stats), "seen": seen, "failed_urls": failed_urls,
+        "empty_urls": empty_urls, "listed_urls": listed_urls,
+    }
+
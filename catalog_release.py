@@ -0,0 +1,325 @@
+"""블루/그린 카탈로그 릴리스 — 버전별 스냅샷을 오프라인으로 만들고 포인터 파일 교체로 게시한다.
+
+릴리스 N = catalog_vN.sqlite3 + index_vN.faiss + embeddings_vN.npy + id_map_vN.json
+(CATALOG_RELEASES_DIR). current.json 포인터가 게시된 버전을 가리키며 os.replace로 원자 교체된다.
+
+엔진 런은 카탈로그에 처음 접근할 때 포인터를 읽어 그 버전을 프로세스가 끝날 때까지 고정한다
+(active_release). 갱신이 런 도중에 게시되어도 진행 중인 런은 이전 버전의 DB·인덱스·ID 맵을
+끝까지 함께 쓰고, 다음 런부터 새 버전을 읽는다 — 새 인덱스 + 옛 ID 맵 같은 조합이 생기지 않는다.
+포인터가 없으면 config의 기존 경로(버전 0)를 쓴다. API 서버처럼 오래 떠 있는 프로세스는
+요청마다 refresh_active_release()로 포인터 교체를 확인해 새 버전으로 갈아탄다
+(정리된 옛 버전을 계속 열지 않도록).
+
+config의 기존 경로는 갱신 작업본이다 — 스캐너·인덱서·도메인 요약 생성기(catalog-manager 스킬)가
+그 경로에 쓰므로, 갱신은 작업본에서 끝낸 뒤 그것을 새 버전으로 스냅샷해 게시한다.
+
+    working = sync_working_copy()        # 게시본(백필·마이그레이션 반영)을 작업본으로
+    with use_release(working):           # 이 프로세스의 기본 카탈로그 경로를 작업본으로
+        ...                              # 스캔 · 인덱스 · 파생 테이블
+    release = prepare_release(base=working)  # 작업본을 vN으로 복사 (DB는 backup API)
+    publish_release(release)             # 검증 → 포인터 교체 → 오래된 버전 정리
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from config import (
+    CATALOG_DB_PATH,
+    CATALOG_EMBEDDINGS_PATH,
+    CATALOG_ID_MAP_PATH,
+    CATALOG_INDEX_PATH,
+    CATALOG_KEEP_RELEASES,
+    CATALOG_RELEASES_DIR,
+)
+from logger import get_logger
+from utils import atomic_json_write, kst_now
+
+logger = get_logger("catalog_release")
+
+POINTER_NAME = "current.json"
+_VERSION_RE = re.compile(r"^(?:catalog|index|embeddings|id_map)_v(\d+)\.")
+
+
+class ReleaseValidationError(RuntimeError):
+    """게시하려는 릴리스의 DB·인덱스 파일이 서로 맞지 않거나 손상됨."""
+
+
+@dataclass(frozen=True)
+class CatalogRelease:
+    version: int
+    db_path: Path
+    index_path: Path
+    embeddings_path: Path
+    id_map_path: Path
+
+    @classmethod
+    def legacy(cls) -> CatalogRelease:
+        """포인터가 없을 때 — config의 고정 경로."""
+        return cls(0, CATALOG_DB_PATH, CATALOG_INDEX_PATH, CATALOG_EMBEDDINGS_PATH, CATALOG_ID_MAP_PATH)
+
+    @classmethod
+    def for_version(cls, version: int, releases_dir: Path | str = CATALOG_RELEASES_DIR) -> CatalogRelease:
+        d = Path(releases_dir)
+        return cls(
+            version,
+            d / f"catalog_v{version}.sqlite3",
+            d / f"index_v{version}.faiss",
+            d / f"embeddings_v{version}.npy",
+            d / f"id_map_v{version}.json",
+        )
+
+
+def read_pointer(releases_dir: Path | str | None = None) -> CatalogRelease:
+    """게시된 릴리스 — 포인터가 없거나 읽을 수 없으면 기존 고정 경로."""
+    releases_dir = releases_dir or CATALOG_RELEASES_DIR
+    pointer = Path(releases_dir) / POINTER_NAME
+    try:
+        with open(pointer, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return CatalogRelease.for_version(int(data["version"]), releases_dir)
+    except FileNotFoundError:
+        return CatalogRelease.legacy()
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Catalog pointer unreadable ({pointer}): {e} — using legacy paths")
+        return CatalogRelease.legacy()
+
+
+_active: CatalogRelease | None = None
+_active_stamp: tuple[int, int] | None = None
+_overrides = 0
+_active_lock = threading.Lock()
+
+
+def _pointer_stamp(releases_dir: Path | str) -> tuple[int, int] | None:
+    """포인터 파일 식별값 (inode, mtime) — os.replace로 교체되면 바뀐다."""
+    try:
+        st = (Path(releases_dir) / POINTER_NAME).stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+
+def active_release() -> CatalogRelease:
+    """이 프로세스가 쓰는 릴리스. 처음 부를 때 포인터를 읽어 고정한다."""
+    global _active, _active_stamp
+    with _active_lock:
+        if _active is None:
+            _active_stamp = _pointer_stamp(CATALOG_RELEASES_DIR)
+            _active = read_pointer(CATALOG_RELEASES_DIR)
+            if _active.version:
+                logger.info(f"Catalog release v{_active.version} pinned")
+        return _active
+
+
+def refresh_active_release() -> CatalogRelease:
+    """포인터가 교체됐으면 새 게시 버전으로 갈아타고 이전 버전의 DB 연결을 닫는다.
+
+    API 서버 같은 상주 프로세스가 요청마다 부른다. 엔진 런은 부르지 않는다 (런 단위 고정).
+    use_release 블록 안(갱신 중인 릴리스)에서는 아무것도 바꾸지 않는다.
+    """
+    global _active, _active_stamp
+    with _active_lock:
+        if _overrides or _active is None:
+            previous = None
+        else:
+            stamp = _pointer_stamp(CATALOG_RELEASES_DIR)
+            previous = _active if stamp != _active_stamp else None
+            if previous is not None:
+                _active_stamp = stamp
+                _active = read_pointer(CATALOG_RELEASES_DIR)
+        current = _active
+    if current is None:
+        return active_release()
+    if previous is not None and previous.db_path != current.db_path:
+        import catalog_db
+
+        catalog_db.close_catalog_connections(previous.db_path)
+        logger.info(f"Catalog release switched v{previous.version} → v{current.version}")
+    return current
+
+
+@contextmanager
+def use_release(release: CatalogRelease) -> Iterator[CatalogRelease]:
+    """블록 동안 이 프로세스의 기본 카탈로그 경로를 release로 (게시 전 릴리스를 만들 때)."""
+    global _active, _overrides
+    with _active_lock:
+        previous, _active = _active, release
+        _overrides += 1
+    try:
+        yield release
+    finally:
+        with _active_lock:
+            _active = previous
+            _overrides -= 1
+
+
+def _versions(releases_dir: Path) -> set[int]:
+    if not releases_dir.exists():
+        return set()
+    return {int(m.group(1)) for p in releases_dir.iterdir() if (m := _VERSION_RE.match(p.name))}
+
+
+def _copy_release(src: CatalogRelease, dst: CatalogRelease) -> None:
+    """DB는 sqlite backup API로(다른 런이 읽는 중에도 일관된 스냅샷), 인덱스 파일은 그대로 복사."""
+    if src.db_path.exists():
+        src_conn = sqlite3.connect(f"{src.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        dst_conn = sqlite3.connect(str(dst.db_path))
+        try:
+            src_conn.backup(dst_conn)
+        finally:
+            dst_conn.close()
+            src_conn.close()
+    for src_path, dst_path in (
+        (src.index_path, dst.index_path),
+        (src.embeddings_path, dst.embeddings_path),
+        (src.id_map_path, dst.id_map_path),
+    ):
+        if src_path.exists():
+            shutil.copy2(src_path, dst_path)
+
+
+def sync_working_copy(releases_dir: Path | str | None = None) -> CatalogRelease:
+    """게시된 버전을 작업본(config 기존 경로)으로 되돌려 복사한다. 작업본을 반환.
+
+    백필·마이그레이션은 게시본에 직접 쓰므로, 갱신을 시작하기 전에 그 내용을 작업본에 가져온다.
+    포인터가 없으면 게시본이 곧 작업본이라 아무것도 하지 않는다. 호출자는 카탈로그 쓰기 락을 쥔다.
+    """
+    working = CatalogRelease.legacy()
+    published = read_pointer(releases_dir or CATALOG_RELEASES_DIR)
+    if published.version:
+        working.db_path.parent.mkdir(parents=True, exist_ok=True)
+        working.index_path.parent.mkdir(parents=True, exist_ok=True)
+        _copy_release(published, working)
+        logger.info(f"Catalog working copy synced from v{published.version}")
+    return working
+
+
+def prepare_release(
+    releases_dir: Path | str | None = None, *, base: CatalogRelease | None = None,
+) -> CatalogRelease:
+    """base(기본: 게시된 버전, 갱신 후에는 작업본)를 새 버전 번호로 복사해 릴리스를 만든다.
+
+    번호는 디렉터리에 남은 어떤 버전(중단된 갱신의 잔여물 포함)보다도 크다. 두 갱신이 같은 번호를
+    고르지 않도록 호출자는 게시까지 카탈로그 쓰기 락(ResourceGuard.catalog_writer)을 쥔다.
+    """
+    releases_dir = Path(releases_dir or CATALOG_RELEASES_DIR)
+    base = base or read_pointer(releases_dir)
+    version = max(_versions(releases_dir) | {base.version}) + 1
+    release = CatalogRelease.for_version(version, releases_dir)
+    releases_dir.mkdir(parents=True, exist_ok=True)
+    _copy_release(base, release)
+
+    logger.info(f"Catalog release v{version} prepared from v{base.version}")
+    return release
+
+
+def validate_release(release: CatalogRelease) -> dict[str, int]:
+    """게시 전 검사 — DB 무결성, 활성 API 존재, ID 맵 ↔ 임베딩 행 수, ID 맵 ↔ DB api_id,
+    활성 API가 모두 ID 맵에 있는지 (인덱스가 다시 만들어지지 않은 릴리스를 거른다).
+
+    Raises:
+        ReleaseValidationError
+    """
+    if not release.db_path.exists():
+        raise ReleaseValidationError(f"v{release.version}: DB not found ({release.db_path})")
+    conn = sqlite3.connect(f"{release.db_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        check = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if check != "ok":
+            raise ReleaseValidationError(f"v{release.version}: quick_check failed — {check}")
+        known = {r[0]: r[1] for r in conn.execute("SELECT api_id, is_active FROM apis")}
+        active = sum(1 for is_active in known.values() if is_active == 1)
+        if active == 0:
+            raise ReleaseValidationError(f"v{release.version}: no active APIs")
+    finally:
+        conn.close()
+
+    stats = {"active_apis": active, "index_entries": 0}
+    if release.id_map_path.exists():
+        with open(release.id_map_path, "r", encoding="utf-8") as f:
+            id_map: list[str] = json.load(f)
+        if release.embeddings_path.exists():
+            import numpy as np
+
+            rows = np.load(str(release.embeddings_path), mmap_mode="r").shape[0]
+            if rows != len(id_map):
+                raise ReleaseValidationError(
+                    f"v{release.version}: id_map has {len(id_map)} entries but embeddings have {rows} rows"
+                )
+        missing = sum(1 for api_id in id_map if api_id not in known)
+        if missing:
+            raise ReleaseValidationError(f"v{release.version}: {missing} id_map entries not in catalog DB")
+        indexed = set(id_map)
+        unindexed = sum(
+            1 for api_id, is_active in known.items() if is_active == 1 and api_id not in indexed
+        )
+        if unindexed:
+            raise ReleaseValidationError(
+                f"v{release.version}: {unindexed} active APIs missing from id_map — index not rebuilt"
+            )
+        stats["index_entries"] = len(id_map)
+    return stats
+
+
+def publish_release(
+    release: CatalogRelease,
+    releases_dir: Path | str | None = None,
+    *,
+    keep: int = CATALOG_KEEP_RELEASES,
+) -> dict[str, Any]:
+    """검증 후 WAL을 본 파일에 합치고 포인터를 원자 교체한다. 이전 버전은 keep개까지만 남긴다.
+
+    이미 release를 읽고 있는 다른 프로세스는 없으므로(게시 전) 체크포인트는 바로 끝난다.
+    """
+    releases_dir = Path(releases_dir or CATALOG_RELEASES_DIR)
+    stats = validate_release(release)
+
+    conn = sqlite3.connect(str(release.db_path))
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+
+    previous = read_pointer(releases_dir)
+    atomic_json_write(releases_dir / POINTER_NAME, {
+        "version": release.version,
+        "db": release.db_path.name,
+        "index": release.index_path.name,
+        "embeddings": release.embeddings_path.name,
+        "id_map": release.id_map_path.name,
+        "published_at": kst_now().isoformat(),
+        **stats,
+    })
+    removed = prune_releases(releases_dir, current=release.version, keep=keep)
+    logger.info(f"Catalog release v{release.version} published (was v{previous.version}): {stats}")
+    return {"version": release.version, "previous": previous.version, "removed": removed, **stats}
+
+
+def prune_releases(releases_dir: Path | str, *, current: int, keep: int = CATALOG_KEEP_RELEASES) -> list[int]:
+    """current에서 keep개 이전보다 오래된 버전 파일을 지운다.
+
+    current보다 큰 번호(다른 갱신이 만드는 중일 수 있음)는 건드리지 않는다. 아직 열려 있어
+    지울 수 없는 파일(Windows)은 남겨 두고 다음 게시 때 다시 시도한다.
+    """
+    releases_dir = Path(releases_dir)
+    cutoff = current - max(1, keep) + 1
+    removed: list[int] = []
+    for version in sorted(v for v in _versions(releases_dir) if v < cutoff):
+        try:
+            for path in releases_dir.glob(f"*_v{version}.*"):
+                if _VERSION_RE.match(path.name):
+                    path.unlink()
+        except OSError as e:
+            logger.warning(f"Release v{version} cleanup deferred: {e}")
+            continue
+        removed.append(version)
+    return removed
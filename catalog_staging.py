@@ -0,0 +1,277 @@
+"""샤딩 전수 스캔 + 스테이징 테이블 원자 교체.
+
+목록 페이지 범위를 CATALOG_SHARD_PAGES장씩 샤드로 나누고, CATALOG_SCAN_WORKERS개 코루틴이
+샤드를 하나씩 가져가 conditional_scan을 돌린다. 요청률은 공유 ConditionalFetcher의 토큰 버킷
+하나로 전체를 제한하고, 실패한 목록 페이지는 그 샤드 안에서 백오프 후 다시 시도한다.
+
+결과는 라이브 테이블이 아니라 scan_staging_* 테이블에 쌓이고, 스캔이 끝나면
+publish_staging()이 한 트랜잭션으로 라이브 테이블에 반영한다. WAL 읽기 연결은 커밋 전까지
+이전 스냅샷을 보므로 엔진은 반쯤 갱신된 카탈로그를 읽지 않는다.
+
+목록은 등록순(CATALOG_FULL_LISTING_URL)으로 훑는다 — 스캔 도중 수정된 API가 이미 받은 페이지로
+옮겨 가지 않는다. 그래도 삭제 등으로 행이 밀릴 수 있으므로 폐지는 완전한 스캔에서
+CATALOG_DEACTIVATE_AFTER_MISSES번 연속 목록에 없을 때만 표시한다 (api_scan_misses).
+
+    stats = await sharded_scan(conn, listing_page_urls(1200, CATALOG_FULL_LISTING_URL), fetcher=fetcher,
+                               parse_listing=parse, render_detail=render)
+    publish_staging(conn, deactivate=stats["complete"])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+from typing import Any, Callable, Iterable
+
+import catalog_db
+from catalog_fetch import (
+    ConditionalFetcher,
+    DetailRenderer,
+    ListingParser,
+    PageBatch,
+    PageRenderer,
+    conditional_scan,
+    detail_page_url,
+    validator_row,
+)
+from config import (
+    CATALOG_DEACTIVATE_AFTER_MISSES,
+    CATALOG_SCAN_WORKERS,
+    CATALOG_SHARD_MAX_ATTEMPTS,
+    CATALOG_SHARD_PAGES,
+    CATALOG_SHARD_RETRY_BACKOFF_SEC,
+)
+from join_graph import update_join_graph
+from logger import get_logger
+from utils import kst_now
+
+logger = get_logger("catalog_staging")
+
+# 바뀐 API 1건 = 행 1개 (API 행·파라미터·오퍼레이션은 JSON, 렌더링하지 않았으면 params/ops NULL)
+STAGING_SQL = """
+CREATE TABLE IF NOT EXISTS scan_staging_apis (
+    api_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    params TEXT,
+    ops TEXT,
+    listing_hash TEXT,
+    detail_hash TEXT,
+    source_url TEXT,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scan_staging_seen (
+    api_id TEXT PRIMARY KEY,
+    source_url TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS scan_staging_validators (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT,
+    checked_at TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+_STAGING_TABLES = ("scan_staging_apis", "scan_staging_seen", "scan_staging_validators")
+
+
+def reset_staging(conn: sqlite3.Connection) -> None:
+    """스테이징 테이블을 만들고 비운다 (중단된 이전 스캔의 잔여물 제거)."""
+    conn.executescript(STAGING_SQL)
+    with conn:
+        for table in _STAGING_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+
+def write_staging(conn: sqlite3.Connection, batch: PageBatch) -> None:
+    """conditional_scan sink — 페이지 결과를 스테이징 테이블에 쓴다 (라이브 테이블은 그대로)."""
+    fingerprints = {fp[0]: fp for fp in batch.fingerprints}
+    params = dict(batch.params)
+    ops = dict(batch.ops)
+    rows = []
+    for api in batch.apis:
+        api_id = api["api_id"]
+        _, listing_hash, detail_hash, source_url, updated_at = fingerprints[api_id]
+        rows.append((
+            api_id,
+            json.dumps(api, ensure_ascii=False),
+            json.dumps(params[api_id], ensure_ascii=False) if api_id in params else None,
+            json.dumps(ops[api_id], ensure_ascii=False) if api_id in ops else None,
+            listing_hash, detail_hash, source_url, updated_at,
+        ))
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO scan_staging_apis VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT OR REPLACE INTO scan_staging_seen (api_id, source_url) VALUES (?, ?)",
+            [(api_id, batch.url) for api_id in batch.seen],
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO scan_staging_validators VALUES (?, ?, ?, ?, ?)",
+            [validator_row(r) for r in batch.validators],
+        )
+
+
+def publish_staging(
+    conn: sqlite3.Connection, *, deactivate: bool = False,
+    after_misses: int = CATALOG_DEACTIVATE_AFTER_MISSES,
+) -> dict[str, int]:
+    """스테이징 결과를 라이브 테이블에 한 트랜잭션으로 반영하고 스테이징을 비운다.
+
+    deactivate=True면 이번 스캔 목록에 없던 활성 API의 누락 횟수를 올리고, after_misses번
+    연속 누락된 API를 폐지로 표시한다 — 모든 목록 페이지를 받았을 때(sharded_scan의
+    complete)만 켠다. 목록에서 본 API의 누락 횟수는 항상 지운다.
+    """
+    now = kst_now().isoformat()
+    with conn:
+        rows = conn.execute(
+            "SELECT api_id, data, params, ops, listing_hash, detail_hash, source_url, updated_at"
+            " FROM scan_staging_apis"
+        ).fetchall()
+        params = [(r[0], json.loads(r[2])) for r in rows if r[2] is not None]
+        catalog_db.upsert_apis_many(conn, (json.loads(r[1]) for r in rows), transaction=False)
+        catalog_db.upsert_parameters_many(conn, params, transaction=False)
+        catalog_db.upsert_operations_many(
+            conn, [(r[0], json.loads(r[3])) for r in rows if r[3] is not None], transaction=False,
+        )
+        update_join_graph(conn, (api_id for api_id, _ in params), transaction=False)
+        conn.executemany(
+            "INSERT OR REPLACE INTO api_fingerprints (api_id, listing_hash, detail_hash, source_url, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(r[0], r[4], r[5], r[6], r[7]) for r in rows],
+        )
+        conn.execute(
+            "UPDATE api_fingerprints SET source_url ="
+            " (SELECT s.source_url FROM scan_staging_seen s WHERE s.api_id = api_fingerprints.api_id)"
+            " WHERE api_id IN (SELECT api_id FROM scan_staging_seen)"
+        )
+        # 이번에 받은 페이지에서 빠진 API — 그 페이지가 다음에 304여도 본 것으로 복원하지 않도록
+        conn.execute(
+            "UPDATE api_fingerprints SET source_url = NULL"
+            " WHERE source_url IN (SELECT source_url FROM scan_staging_seen)"
+            " AND api_id NOT IN (SELECT api_id FROM scan_staging_seen)"
+        )
+        conn.execute("DELETE FROM api_scan_misses WHERE api_id IN (SELECT api_id FROM scan_staging_seen)")
+        missing = deactivated = 0
+        if deactivate:
+            missing = conn.execute(
+                "INSERT INTO api_scan_misses (api_id, misses, first_missed_at)"
+                " SELECT api_id, 1, ? FROM apis"
+                " WHERE is_active = 1 AND api_id NOT IN (SELECT api_id FROM scan_staging_seen)"
+                " ON CONFLICT(api_id) DO UPDATE SET misses = misses + 1",
+                (now,),
+            ).rowcount
+            deactivated = conn.execute(
+                "UPDATE apis SET is_active = 0, updated_at = ?"
+                " WHERE api_id IN (SELECT api_id FROM api_scan_misses WHERE misses >= ?)",
+                (now, max(1, after_misses)),
+            ).rowcount
+            conn.execute("DELETE FROM api_scan_misses WHERE misses >= ?", (max(1, after_misses),))
+        conn.execute("INSERT OR REPLACE INTO http_validators SELECT * FROM scan_staging_validators")
+        seen = conn.execute("SELECT COUNT(*) FROM scan_staging_seen").fetchone()[0]
+        for table in _STAGING_TABLES:
+            conn.execute(f"DELETE FROM {table}")
+
+    stats = {"seen": seen, "updated": len(rows), "missing": missing, "deactivated": deactivated}
+    logger.info(f"Staged scan published: {stats}")
+    return stats
+
+
+def shard_urls(urls: list[str], pages_per_shard: int) -> list[list[str]]:
+    size = max(1, pages_per_shard)
+    return [urls[i:i + size] for i in range(0, len(urls), size)]
+
+
+def listing_holes(urls: list[str], empty: Iterable[str], listed: Iterable[str]) -> list[str]:
+    """빈 목록 페이지 중 API가 있던 페이지보다 앞에 있는 것 — 목록 끝이 아니라 점검·오류 페이지."""
+    order = {url: i for i, url in enumerate(urls)}
+    last = max((order[url] for url in listed if url in order), default=-1)
+    return sorted((url for url in empty if order.get(url, last) < last), key=order.__getitem__)
+
+
+async def sharded_scan(
+    conn: sqlite3.Connection,
+    listing_urls: Iterable[str],
+    *,
+    fetcher: ConditionalFetcher,
+    parse_listing: ListingParser,
+    render_detail: DetailRenderer,
+    render_listing: PageRenderer | None = None,
+    detail_url: Callable[[str], str] = detail_page_url,
+    workers: int = CATALOG_SCAN_WORKERS,
+    pages_per_shard: int = CATALOG_SHARD_PAGES,
+    max_attempts: int = CATALOG_SHARD_MAX_ATTEMPTS,
+    retry_backoff_sec: float = CATALOG_SHARD_RETRY_BACKOFF_SEC,
+) -> dict[str, Any]:
+    """목록 페이지를 샤드로 나눠 workers개 동시 처리하고 결과를 스테이징에 모은다.
+
+    샤드 안에서 실패한 페이지만 max_attempts회까지 다시 시도한다. 바뀌었는데 행이 없는 페이지가
+    API가 있는 페이지보다 앞에 있으면(listing_holes) 실패로 보고 다시 받는다 — 점검 페이지 하나가
+    그 페이지의 API를 모두 폐지시키지 않도록. 샤드 경계에 걸쳐 끝까지 비는 페이지는 실패 샤드로
+    남아 complete=False가 된다. 라이브 테이블은 건드리지 않으므로 끝난 뒤 publish_staging()을
+    불러야 반영된다.
+
+    Returns:
+        {"shards", "pages", "pages_skipped", "apis_changed", "details_rendered", "retries",
+         "failed_shards": [{"shard", "failed_urls"}, ...], "complete": bool}
+    """
+    reset_staging(conn)
+    urls = list(listing_urls)
+    shards = shard_urls(urls, pages_per_shard)
+    totals = {"pages": 0, "pages_skipped": 0, "apis_changed": 0, "details_rendered": 0, "retries": 0}
+    failed: dict[int, list[str]] = {}
+    empty: dict[int, set[str]] = {}
+    listed: set[str] = set()
+    queue: asyncio.Queue[tuple[int, list[str]]] = asyncio.Queue()
+    for shard in enumerate(shards):
+        queue.put_nowait(shard)
+
+    async def run_shard(index: int, shard: list[str]) -> None:
+        pending = shard
+        empty[index] = set()
+        for attempt in range(1, max_attempts + 1):
+            if attempt > 1:
+                totals["retries"] += 1
+                await asyncio.sleep(retry_backoff_sec * (attempt - 1))
+            try:
+                result = await conditional_scan(
+                    conn, pending, fetcher=fetcher, parse_listing=parse_listing, render_detail=render_detail,
+                    render_listing=render_listing, detail_url=detail_url, sink=write_staging,
+                )
+            except Exception as e:
+                # sink 기록 실패 등 — 샤드 전체를 다시 (스테이징은 api_id/url 단위라 덮어써도 됨)
+                logger.warning(f"Shard {index} attempt {attempt} failed: {e}")
+                continue
+            for key in ("pages", "pages_skipped", "apis_changed", "details_rendered"):
+                totals[key] += result[key]
+            listed.update(result["listed_urls"])
+            empty[index] = (empty[index] - set(pending)) | set(result["empty_urls"])
+            holes = listing_holes(shard, empty[index], listed)
+            pending = result["failed_urls"] + holes
+            if not pending:
+                return
+            logger.warning(f"Shard {index}: {len(pending)} pages failed (attempt {attempt}/{max_attempts})")
+        failed[index] = pending
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, shard = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await run_shard(index, shard)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(workers, len(shards))))))
+
+    # 샤드 끝에서 빈 페이지 뒤 샤드에 API가 있었으면 목록 끝이 아니었음
+    for index, pages in empty.items():
+        holes = [url for url in listing_holes(urls, pages, listed) if url not in failed.get(index, [])]
+        if holes:
+            failed[index] = failed.get(index, []) + holes
+
+    failed_shards = [{"shard": index, "failed_urls": failed[index]} for index in sorted(failed)]
+    stats = {"shards": len(shards), **totals, "failed_shards": failed_shards, "complete": not failed_shards}
+    logger.info(
+        f"Sharded scan: {len(shards)} shards × {workers} workers, {totals}, "
+        f"{len(failed_shards)} shards incomplete"
+    )
+    return stats
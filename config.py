@@ -10,6 +10,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 LOG_DIR = OUTPUT_DIR / "logs"
+RUNS_DIR = OUTPUT_DIR / "runs"  # Phase별 결과 체크포인트 (runs/{batch_id}/phaseN.json)
+RUNS_KEEP_COMPLETED = 168  # 남길 완료 런 체크포인트 수 (시간당 1회 × 7일, replay/backtest 입력)
 EMBEDDINGS_DIR = DATA_DIR / "embeddings"
 PROMPTS_DIR = PROJECT_ROOT / ".claude" / "prompts"
 
@@ -24,6 +26,9 @@ WEBHOOK_CONFIG_PATH = DATA_DIR / "webhook_config.json"
 CATALOG_EMBEDDINGS_PATH = EMBEDDINGS_DIR / "catalog_embeddings.npy"
 CATALOG_INDEX_PATH = EMBEDDINGS_DIR / "catalog_index.faiss"
 CATALOG_ID_MAP_PATH = EMBEDDINGS_DIR / "id_map.json"
+# 블루/그린 릴리스 — catalog_vN.sqlite3 + index_vN.faiss + embeddings_vN.npy + id_map_vN.json,
+# current.json 포인터가 게시된 버전을 가리킨다 (없으면 위 경로를 그대로 사용)
+CATALOG_RELEASES_DIR = DATA_DIR / "catalog_releases"
 
 # ──────────────────────────── 시간 예산 (초 단위) ────────────────────────────
 TOTAL_BUDGET_SEC = 60 * 60  # 60분
@@ -61,6 +66,27 @@ ADAPTIVE_DEPTH = {
 PHASE4_SIMPLIFY_THRESHOLD_SEC = 10 * 60  # 남은 시간 <10분 → 간소화
 PHASE4_SKIP_THRESHOLD_SEC = 5 * 60       # 남은 시간 <5분 → 스킵, V=3
 
+# 예측형 예산 — 구조화 로그(output/logs/*.jsonl)의 최근 Phase 소요 시간으로 가변 풀 선배정
+BUDGET_HISTORY_DAYS = 7          # 읽을 일별 로그 파일 수
+BUDGET_HISTORY_WINDOW = 50       # Phase별 롤링 표본 수 (최근 N회)
+BUDGET_HISTORY_MIN_SAMPLES = 5   # 이보다 적으면 예측하지 않고 정적 예산 사용
+BUDGET_HISTORY_PERCENTILE = 75   # 예측 소요 시간 = 롤링 p75
+
+# Phase 4 트리아지 — 값싼 사전 점수 상위 가설에 개별(deep) 검증 예산을 먼저 배정
+TRIAGE_WEIGHTS = {
+    "feasibility": 0.5,  # Phase 3 적합도
+    "api_quality": 0.3,  # 매칭 API 상위 3개 평균 유사도
+    "novelty": 0.2,      # 아카이브 서비스명 대비 참신도
+}
+TRIAGE_NOVELTY_LOOKBACK_HOURS = 7 * 24
+
+# ──────────────────────────── 스트리밍 모드 (opt-in) ────────────────────────────
+# Phase 2~4를 가설 단위로 흘려보낼 때 단계별 동시 처리 수
+STREAM_STAGE_CONCURRENCY = {
+    3: 2,  # API 매칭 (임베딩 인코딩)
+    4: 3,  # 시장 검증 (claude -p + 경쟁사 검색)
+}
+
 # ──────────────────────────── 품질 게이트 임계값 ────────────────────────────
 FEASIBILITY_PASS_THRESHOLD = 0.40   # Phase 3: 적합도 ≥ 40%
 VALIDATION_PASS_THRESHOLD = 50      # Phase 4: 검증 점수 ≥ 50
@@ -94,6 +120,36 @@ GRADE_PERCENTILE = {
 # ──────────────────────────── Claude CLI ────────────────────────────
 CLAUDE_CLI_CMD = "claude"
 CLAUDE_CLI_TIMEOUT_SEC = 600  # 10분
+BATCH_SALVAGE_MAX_FOLLOWUPS = 1  # 배치 응답 중 누락/무효 항목만 재요청하는 후속 호출 횟수
+BATCH_CHUNK_SIZE = 8         # Phase 4 light / Phase 5 배치 프롬프트 1회당 최대 항목 수 (앵커 제외)
+BATCH_CHUNK_CONCURRENCY = 3  # 청크 동시 호출 수 (claude -p 병렬 프로세스)
+# 스트리밍 모드 Phase 2: 델타 단위 출력 → 완성된 가설부터 Phase 3로 전달
+CLAUDE_CLI_STREAM_ARGS = ["--output-format", "stream-json", "--verbose", "--include-partial-messages"]
+
+# ──────────────────────────── 프로세스 간 자원 입장 제어 ────────────────────────────
+# 겹쳐 실행되는 런(최대 2개)이 함께 쓰는 한도 — 파일 락 슬롯 (resource_guard.py)
+RESOURCE_LOCK_DIR = OUTPUT_DIR / "locks"
+CLAUDE_CLI_MAX_CONCURRENT = 4     # 모든 런을 합친 claude -p 동시 실행 수
+PLAYWRIGHT_MAX_BROWSERS = 1       # 동시에 띄울 Chromium 수
+MODEL_RAM_BUDGET_MB = 2048        # 임베딩 모델 등 상주 모델 RAM 합계 한도
+RESOURCE_RAM_UNIT_MB = 256        # RAM 슬롯 1개 크기
+EMBEDDING_MODEL_RAM_MB = 1024     # ko-sroberta 로드 시 예약량 (토크나이저·버퍼 포함 근사)
+RESOURCE_WAIT_TIMEOUT_SEC = 10 * 60
+RESOURCE_POLL_SEC = 1.0
+
+# 공유 브라우저 풀 (browser_pool.py) — 프로세스당 웜 Chromium 1개
+BROWSER_POOL_MAX_PAGES = 4          # 동시 페이지(컨텍스트) 수
+BROWSER_PAGE_MAX_USES = 50          # 페이지 재활용 주기 (메모리 누수 차단)
+BROWSER_PAGE_TIMEOUT_SEC = 90       # 페이지 1회 사용(작업 함수) 최대 시간
+BROWSER_NAV_TIMEOUT_MS = 30_000     # goto/wait_for_* 기본 타임아웃
+BROWSER_CONTEXT_OPTIONS = {"locale": "ko-KR"}
+
+# Phase별 프롬프트 토큰 예산 (근사치) — 초과 시 저우선 섹션부터 절삭
+PROMPT_TOKEN_BUDGET = {
+    2: 12_000,
+    4: 6_000,
+    5: 8_000,
+}
 
 # ──────────────────────────── 재시도/백오프 표준 (tenacity) ────────────────────────────
 RETRY_CLAUDE_CLI = {
@@ -137,5 +193,55 @@ SIGNAL_SOURCE_TIMEOUT_SEC = 3 * 60  # 소스별 3분
 EMBEDDING_MODEL_NAME = "jhgan/ko-sroberta-multitask"
 EMBEDDING_TOP_K = 20
 
+# 사전 계산 이웃 — 카탈로그 갱신 시 API별 유사/조인 가능 API를 api_neighbors 테이블에 저장
+NEIGHBOR_TOP_K = 10          # 임베딩 유사도 상위 이웃 수
+NEIGHBOR_JOIN_TOP_K = 5      # 조인 키를 공유하는 API 중 유사도 상위 추가 이웃 수
+NEIGHBOR_MIN_SCORE = 0.3     # 이보다 낮은 유사도 이웃은 저장하지 않음 (조인 이웃 제외)
+NEIGHBOR_BATCH_SIZE = 1024   # 전체 쌍 kNN 행렬곱 배치 (행 수)
+
+# 도메인 요약 — 카테고리별 API 수·대표 키워드 증분 갱신, Phase 2용 직렬화 조각 캐시
+DOMAIN_KEYWORDS_TOP_N = 8    # 카테고리별 대표 키워드 수 (API 이름 빈도 순)
+
+# 하이브리드 검색 — FTS5 BM25 순위 + FAISS 순위를 상호 순위 융합(RRF)으로 합친다
+HYBRID_RRF_K = 60            # RRF 상수 — 점수 = Σ 1 / (k + rank)
+HYBRID_CANDIDATES = 50       # 융합 전 소스별 후보 수
+
+# ──────────────────────────── 카탈로그 파라미터 백필 ────────────────────────────
+DATA_GO_KR_BASE_URL = "https://www.data.go.kr"
+BACKFILL_WORKERS = 4           # 동시 상세 페이지 수 (브라우저 풀 페이지)
+BACKFILL_RATE_PER_SEC = 2.0    # 전체 워커 합산 요청률 (토큰 버킷)
+BACKFILL_BURST = 4
+BACKFILL_WRITE_BATCH = 50      # 결과 N건마다 한 트랜잭션으로 기록
+BACKFILL_MAX_ATTEMPTS = 2      # 실패한 API 재시도 상한 (재개 실행 포함)
+
+# ──────────────────────────── 카탈로그 조건부 스캔 ────────────────────────────
+# 목록·상세 페이지를 HTTP(ETag/Last-Modified) 먼저 받고, 지문이 바뀐 API만 Playwright로 렌더링
+# False이거나 CatalogScanner에 정적 HTML 목록 파서(parse_listing)가 없으면 Playwright 렌더링 스캔
+CATALOG_CONDITIONAL_SCAN = True
+CATALOG_LISTING_URL = DATA_GO_KR_BASE_URL + "/tcs/dss/selectDataSetList.do?dType=API&sort=updtDt&currentPage={page}"
+# 전수 스캔은 등록순 오름차순 — 몇 시간 걸리는 동안 수정된 API가 이미 받은 페이지로 옮겨 가지 않고 신규는 뒤에 붙는다
+CATALOG_FULL_LISTING_URL = (
+    DATA_GO_KR_BASE_URL + "/tcs/dss/selectDataSetList.do?dType=API&sort=regDt&sortOrder=asc&currentPage={page}"
+)
+CATALOG_INCREMENTAL_PAGES = 50     # 증분 스캔 목록 페이지 수 (최근 수정순)
+CATALOG_FULL_PAGES = 1200          # 전수 스캔 목록 페이지 수
+CATALOG_HTTP_TIMEOUT_SEC = 20
+CATALOG_HTTP_RATE_PER_SEC = 5.0    # 조건부 GET 요청률 (토큰 버킷) — 렌더링보다 가벼워 백필보다 높게
+CATALOG_HTTP_BURST = 5
+# 전수 스캔 샤딩 — 목록 페이지 범위를 샤드로 나눠 동시 처리, 결과는 스테이징 후 한 번에 교체
+CATALOG_SCAN_WORKERS = 4           # 동시 샤드 수 (= 브라우저 컨텍스트 수)
+CATALOG_SHARD_PAGES = 50           # 샤드 1개당 목록 페이지 수
+CATALOG_SHARD_MAX_ATTEMPTS = 3     # 샤드별 실패 페이지 재시도 상한 (첫 시도 포함)
+CATALOG_SHARD_RETRY_BACKOFF_SEC = 10.0  # 재시도 대기 (시도 횟수 배)
+CATALOG_DEACTIVATE_AFTER_MISSES = 2     # 완전한 전수 스캔에서 연속 N번 목록에 없어야 폐지 표시
+
 # ──────────────────────────── DB ────────────────────────────
 SCHEMA_VERSION = "1.0"
+CATALOG_BULK_BATCH_SIZE = 500  # 대량 upsert 트랜잭션 1회당 행 수
+CATALOG_BULK_CACHE_MB = 64     # 대량 모드 페이지 캐시 (PRAGMA cache_size)
+CATALOG_MMAP_MB = 256          # 연결별 PRAGMA mmap_size — 읽기 경로 페이지를 OS 캐시에서 바로 매핑
+CATALOG_STATEMENT_CACHE = 256  # 연결별 준비된 문장 캐시 (sqlite3 cached_statements)
+CATALOG_FTS_TOKENIZER = "trigram"  # 한국어 복합어(시군구코드 등) 부분 일치 — 형태소 분석기 불필요
+# bm25 컬럼 가중치: API 이름, 설명, 파라미터 이름, 파라미터 설명
+CATALOG_FTS_WEIGHTS = (3.0, 1.0, 2.0, 0.5)
+CATALOG_KEEP_RELEASES = 3      # 게시 후 남겨 둘 릴리스 수 (현재 + 이전 런이 아직 읽는 버전)
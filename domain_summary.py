@@ -0,0 +1,135 @@
+"""도메인 요약 증분 갱신 — dirty 카테고리만 재계산 + Phase 2용 직렬화 조각 캐시.
+
+apis 쓰기 트리거가 바뀐 카테고리를 domain_summary_dirty에 표시해 두면
+refresh_domain_summaries()가 그 카테고리의 API 수·대표 키워드만 다시 계산하고,
+Phase 2 프롬프트에 넣을 컴팩트 JSON 조각과 버전 해시를 catalog_metadata에 저장한다.
+Phase 2는 메타데이터 한 행을 읽을 뿐 요약을 매번 조회·정렬·직렬화하지 않는다.
+
+    refresh_domain_summaries(conn)      # 카탈로그 갱신 후 (쓰기 연결)
+    items, version = load_domain_fragment()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sqlite3
+from collections import Counter
+from typing import Any, Iterable
+
+from catalog_db import get_catalog_connections
+from config import DOMAIN_KEYWORDS_TOP_N
+from logger import get_logger
+from prompt_builder import compact_json, shorten
+from utils import kst_now
+
+logger = get_logger("domain_summary")
+
+FRAGMENT_KEY = "domain_summary_fragment"
+VERSION_KEY = "domain_summary_version"
+_FRAGMENT_FIELDS = ["category", "api_count", "representative_keywords", "summary_text"]
+
+# API 이름에 흔해서 도메인을 구별하지 못하는 단어
+_STOPWORDS = frozenset({
+    "정보", "조회", "서비스", "목록", "현황", "제공", "데이터", "오픈", "공공", "상세", "검색",
+    "api", "openapi", "open", "service", "info", "list",
+})
+_WORD_RE = re.compile(r"[가-힣]{2,}|[A-Za-z]{3,}")
+
+_parsed: dict[str, list[dict[str, Any]]] = {}  # version → 파싱된 조각 (프로세스 캐시)
+
+
+def representative_keywords(names: Iterable[str], top_n: int = DOMAIN_KEYWORDS_TOP_N) -> list[str]:
+    """API 이름에서 자주 나오는 단어 (불용어 제외, 빈도 → 처음 등장 순)."""
+    counts: Counter[str] = Counter()
+    for name in names:
+        counts.update(dict.fromkeys((w.lower() if w.isascii() else w for w in _WORD_RE.findall(name or "")), 1))
+    return [w for w, _ in counts.most_common() if w not in _STOPWORDS][:top_n]
+
+
+def refresh_domain_summaries(conn: sqlite3.Connection, *, force: bool = False) -> dict[str, Any]:
+    """dirty 카테고리(force면 전체)의 요약을 다시 계산하고 프롬프트 조각을 갱신한다.
+
+    summary_text는 수기·생성 설명문 전용이라 여기서 만들지 않고, 있으면 유지한다. API 수·키워드는
+    api_count / representative_keywords에만 두어 갱신마다 새 값이 프롬프트에 들어간다.
+    활성 API가 0개가 된 카테고리는 요약에서 지운다. 한 트랜잭션.
+
+    Returns:
+        {"refreshed": [...], "removed": [...], "version": str}
+    """
+    now = kst_now().isoformat()
+    refreshed: list[str] = []
+    removed: list[str] = []
+    with conn:
+        if force:
+            categories = [r[0] for r in conn.execute(
+                "SELECT DISTINCT category FROM apis WHERE category IS NOT NULL"
+                " UNION SELECT category FROM domain_summary"
+            )]
+        else:
+            categories = [r[0] for r in conn.execute("SELECT category FROM domain_summary_dirty")]
+
+        for category in categories:
+            names = [r[0] for r in conn.execute(
+                "SELECT name FROM apis WHERE category = ? AND is_active = 1", (category,)
+            )]
+            if not names:
+                conn.execute("DELETE FROM domain_summary WHERE category = ?", (category,))
+                removed.append(category)
+                continue
+            keywords = representative_keywords(names)
+            conn.execute(
+                "INSERT INTO domain_summary (category, api_count, representative_keywords, updated_at)"
+                " VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(category) DO UPDATE SET"
+                " api_count = excluded.api_count,"
+                " representative_keywords = excluded.representative_keywords,"
+                " updated_at = excluded.updated_at",
+                (category, len(names), ",".join(keywords), now),
+            )
+            refreshed.append(category)
+
+        conn.executemany("DELETE FROM domain_summary_dirty WHERE category = ?", [(c,) for c in categories])
+        version = _store_fragment(conn)
+
+    if refreshed or removed:
+        logger.info(
+            f"Domain summaries refreshed: {len(refreshed)} updated, {len(removed)} removed (version {version})"
+        )
+    return {"refreshed": refreshed, "removed": removed, "version": version}
+
+
+def _store_fragment(conn: sqlite3.Connection) -> str:
+    """전체 요약을 API 수 내림차순으로 짧은 키 컴팩트 JSON으로 직렬화해 메타데이터에 저장한다."""
+    rows = conn.execute(
+        "SELECT category, api_count, representative_keywords, summary_text FROM domain_summary"
+        " ORDER BY api_count DESC, category"
+    ).fetchall()
+    items = [shorten(dict(zip(_FRAGMENT_FIELDS, row)), _FRAGMENT_FIELDS) for row in rows]
+    text = compact_json(items)
+    version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+    conn.executemany(
+        "INSERT OR REPLACE INTO catalog_metadata (key, value) VALUES (?, ?)",
+        [(FRAGMENT_KEY, text), (VERSION_KEY, version)],
+    )
+    return version
+
+
+def load_domain_fragment(conn: sqlite3.Connection | None = None) -> tuple[list[dict[str, Any]], str] | None:
+    """캐시된 Phase 2 도메인 요약 조각 → (항목 목록, 버전). 아직 만들어지지 않았으면 None.
+
+    항목은 이미 정렬·단축되어 있어 PromptBuilder 섹션에 그대로 넣는다 (항목 단위 절삭 유지).
+    같은 버전은 프로세스 안에서 한 번만 파싱한다.
+    """
+    conn = conn or get_catalog_connections().reader()
+    row = conn.execute("SELECT value FROM catalog_metadata WHERE key = ?", (VERSION_KEY,)).fetchone()
+    if row is None:
+        return None
+    version = row[0]
+    if version not in _parsed:
+        text = conn.execute("SELECT value FROM catalog_metadata WHERE key = ?", (FRAGMENT_KEY,)).fetchone()
+        if text is None:
+            return None
+        _parsed[version] = json.loads(text[0])
+    return list(_parsed[version]), version
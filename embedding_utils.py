@@ -1,58 +1,183 @@
 """임베딩 서비스 — 모델 로드, 쿼리 인코딩, top-K 검색, 유사도 계산.
 
 sentence-transformers (ko-sroberta-multitask) + FAISS 인덱스.
+hybrid_search는 카탈로그 FTS5(BM25) 순위와 벡터 순위를 RRF로 합쳐 정확한 도메인 용어
+(시군구코드, 사업자번호 등)를 임베딩이 놓쳐도 찾는다.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
+import sqlite3
+import threading
+import weakref
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+from catalog_release import active_release
 from config import (
-    CATALOG_EMBEDDINGS_PATH,
-    CATALOG_ID_MAP_PATH,
-    CATALOG_INDEX_PATH,
     EMBEDDING_MODEL_NAME,
+    EMBEDDING_MODEL_RAM_MB,
     EMBEDDING_TOP_K,
+    HYBRID_CANDIDATES,
+    HYBRID_RRF_K,
 )
 from logger import get_logger
+from resource_guard import get_resource_guard
 
 logger = get_logger("embedding_utils")
 
 
+def reciprocal_rank_fusion(
+    rankings: dict[str, list[str]], *, k: int = HYBRID_RRF_K,
+) -> list[dict[str, Any]]:
+    """소스별 순위 목록을 RRF로 합친다. 점수 = Σ 1 / (k + rank).
+
+    점수 척도가 다른 BM25와 코사인 유사도를 정규화 없이 합칠 수 있다.
+
+    Returns:
+        [{"api_id": ..., "score": float, "ranks": {source: rank}}, ...] (점수 내림차순)
+    """
+    fused: dict[str, dict[str, Any]] = {}
+    for source, ids in rankings.items():
+        for rank, api_id in enumerate(ids, start=1):
+            entry = fused.setdefault(api_id, {"api_id": api_id, "score": 0.0, "ranks": {}})
+            if source in entry["ranks"]:
+                continue
+            entry["ranks"][source] = rank
+            entry["score"] += 1.0 / (k + rank)
+    # 동점이면 더 높은 최고 순위 우선
+    return sorted(fused.values(), key=lambda e: (-e["score"], min(e["ranks"].values())))
+
+
+class _SharedModel:
+    """프로세스 안에서 model_name별로 한 번만 올리는 모델과 그 RAM 예산 — 참조 수로 관리한다."""
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.model: Any = None
+        self.lease: Any = None
+        self.refs = 0
+
+
+_shared: dict[str, _SharedModel] = {}
+_loaded: weakref.WeakSet[EmbeddingService] = weakref.WeakSet()  # 공유 모델을 참조 중인 인스턴스
+_loaded_lock = threading.RLock()
+
+
+def _shared_model(model_name: str) -> _SharedModel:
+    with _loaded_lock:
+        return _shared.setdefault(model_name, _SharedModel())
+
+
+def release_embedding_models() -> int:
+    """이 프로세스에서 로드된 모든 임베딩 모델을 내리고 RAM 예산을 반납한다 (런 종료 시).
+
+    다시 encode하면 필요할 때 다시 로드한다. 내린 인스턴스 수를 반환.
+    """
+    with _loaded_lock:
+        services = list(_loaded)
+    for svc in services:
+        svc.unload_model()
+    return len(services)
+
+
+atexit.register(release_embedding_models)
+
+
 class EmbeddingService:
-    """임베딩 인코딩 + FAISS 인덱스 검색."""
+    """임베딩 인코딩 + FAISS 인덱스 검색.
+
+    모델과 RAM 예산(프로세스 간 락)은 같은 model_name의 인스턴스끼리 빌려 쓴다 — 첫 load_model이
+    예산을 잡아 올리고, 마지막 참조가 unload_model(with 문 종료·GC 포함)하면 반납한다.
+    런 끝의 release_embedding_models()는 남은 참조를 한꺼번에 정리한다.
+    """
 
     def __init__(
         self,
         model_name: str = EMBEDDING_MODEL_NAME,
-        index_path: Path | str = CATALOG_INDEX_PATH,
-        embeddings_path: Path | str = CATALOG_EMBEDDINGS_PATH,
-        id_map_path: Path | str = CATALOG_ID_MAP_PATH,
+        index_path: Path | str | None = None,
+        embeddings_path: Path | str | None = None,
+        id_map_path: Path | str | None = None,
     ) -> None:
+        # 경로를 생략하면 이 프로세스에 고정된 카탈로그 릴리스의 파일 — DB와 같은 버전
+        release = active_release()
         self.model_name = model_name
-        self.index_path = Path(index_path)
-        self.embeddings_path = Path(embeddings_path)
-        self.id_map_path = Path(id_map_path)
+        self.index_path = Path(index_path or release.index_path)
+        self.embeddings_path = Path(embeddings_path or release.embeddings_path)
+        self.id_map_path = Path(id_map_path or release.id_map_path)
         self._model = None
         self._index = None
         self._id_map: list[str] = []
+        self._holds_model = False
 
     def load_model(self) -> None:
-        """sentence-transformers 모델을 로드한다."""
-        try:
-            from sentence_transformers import SentenceTransformer
+        """sentence-transformers 모델을 로드한다 (이 프로세스에 이미 올라가 있으면 빌린다).
 
-            self._model = SentenceTransformer(self.model_name)
-            logger.info(f"Embedding model loaded: {self.model_name}")
-        except ImportError:
-            raise ImportError(
-                "sentence-transformers가 설치되지 않았습니다. "
-                "pip install sentence-transformers 를 실행하세요."
-            )
+        처음 올릴 때 프로세스 간 모델 RAM 예산을 잡는다 — 겹쳐 실행되는 다른 런이 이미
+        모델을 올렸으면 내려갈 때까지 기다린다 (ResourceBusyError 시 로드하지 않음).
+        """
+        if self._holds_model:
+            return
+        shared = _shared_model(self.model_name)
+        with shared.lock:
+            if shared.model is None:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:
+                    raise ImportError(
+                        "sentence-transformers가 설치되지 않았습니다. "
+                        "pip install sentence-transformers 를 실행하세요."
+                    )
+
+                lease = get_resource_guard().reserve_memory(EMBEDDING_MODEL_RAM_MB)
+                try:
+                    shared.model = SentenceTransformer(self.model_name)
+                except Exception:
+                    lease.release()
+                    raise
+                shared.lease = lease
+                logger.info(f"Embedding model loaded: {self.model_name}")
+            shared.refs += 1
+            self._model = shared.model
+            self._holds_model = True
+        with _loaded_lock:
+            _loaded.add(self)
+
+    def unload_model(self) -> None:
+        """이 인스턴스의 참조를 놓는다. 마지막 참조면 모델을 내리고 RAM 예산을 반납한다.
+
+        여러 번 불러도 안전하다.
+        """
+        self._model = None
+        if not self._holds_model:
+            return
+        self._holds_model = False
+        with _loaded_lock:
+            _loaded.discard(self)
+        shared = _shared_model(self.model_name)
+        with shared.lock:
+            shared.refs -= 1
+            if shared.refs > 0:
+                return
+            shared.model = None
+            lease, shared.lease = shared.lease, None
+        if lease is not None:
+            lease.release()
+        logger.info(f"Embedding model unloaded: {self.model_name}")
+
+    def __enter__(self) -> EmbeddingService:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.unload_model()
+
+    def __del__(self) -> None:
+        if getattr(self, "_holds_model", False):
+            self.unload_model()
 
     def load_index(self) -> None:
         """FAISS 인덱스 + ID 맵을 로드한다."""
@@ -100,6 +225,47 @@ class EmbeddingService:
             })
         return results
 
+    def hybrid_search(
+        self,
+        query: str,
+        conn: sqlite3.Connection | None = None,
+        top_k: int = EMBEDDING_TOP_K,
+        *,
+        candidates: int = HYBRID_CANDIDATES,
+        rrf_k: int = HYBRID_RRF_K,
+    ) -> list[dict[str, Any]]:
+        """벡터(FAISS) + 어휘(FTS5 BM25) 검색을 RRF로 융합한 top-K API를 반환한다.
+
+        conn이 없으면 프로세스 공유 읽기 전용 연결을 쓴다. FTS 색인이 없으면 벡터 결과만 남는다.
+
+        Returns:
+            [{"api_id": ..., "score": float(RRF), "rank": int, "similarity": float | None,
+              "vector_rank": int | None, "lexical_rank": int | None}, ...]
+        """
+        import catalog_db
+
+        vector = self.search(query, top_k=candidates)
+        if conn is None:
+            conn = catalog_db.get_catalog_connections().reader()
+        lexical = catalog_db.search_fts(conn, query, limit=candidates)
+
+        similarity = {r["api_id"]: r["score"] for r in vector}
+        fused = reciprocal_rank_fusion(
+            {"vector": [r["api_id"] for r in vector], "lexical": [r["api_id"] for r in lexical]},
+            k=rrf_k,
+        )
+        return [
+            {
+                "api_id": entry["api_id"],
+                "score": entry["score"],
+                "rank": rank,
+                "similarity": similarity.get(entry["api_id"]),
+                "vector_rank": entry["ranks"].get("vector"),
+                "lexical_rank": entry["ranks"].get("lexical"),
+            }
+            for rank, entry in enumerate(fused[:top_k], start=1)
+        ]
+
     def cosine_similarity(self, text_a: str, text_b: str) -> float:
         """두 텍스트의 코사인 유사도를 반환한다."""
         vecs = self.encode([text_a, text_b])
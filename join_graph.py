@@ -0,0 +1,320 @@
+"""조인 키 그래프 — 파라미터 이름 정규화 + API↔조인 키 인접 테이블(api_join_keys).
+
+카탈로그 갱신 시 api_parameters 전체를 한 번 정규화해 저장해 두고, Phase 3 조인 분석은
+가설마다 파라미터를 다시 비교하지 않고 인덱스 조회로 끝낸다.
+
+    rebuild_join_graph(conn)                      # 갱신 시 (쓰기 연결)
+    graph = JoinGraph()
+    graph.analyze_api_pairs([{"api_id": "A1", "params": []}, ...])   # JoinAnalyzer 호환
+    graph.find_path("A1", "A9", max_hops=3)       # 공유 키가 없으면 중간 API를 거쳐 연결
+
+정규화: 소문자 + 영숫자/한글 외 제거 후 동의어 표(JOIN_KEY_SYNONYMS)와 정확히 맞추고,
+아니면 단어 경계에서만 찾는다. 영문은 구분자·camelCase로 나눈 토큰 열이 동의어 토큰 열을
+포함해야 하고("startDate" → 날짜, "validate"·"candidate"는 아님), 한글은 한글 토큰이
+동의어로 끝나거나 동의어 + 조사여야 한다("기준법정동코드" → 시군구코드, "일자리"는 아님).
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections import deque
+from typing import Any, Iterable
+
+from catalog_db import _JOSA_SUFFIXES, CatalogConnections, get_catalog_connections
+from logger import get_logger
+
+logger = get_logger("join_graph")
+
+# 대표 조인 키 → 같은 값을 담는 파라미터 이름들 (정규화 전 표기)
+JOIN_KEY_SYNONYMS: dict[str, tuple[str, ...]] = {
+    # 법정동코드(10자리) 앞 5자리 = 시군구코드 → 같은 키로 묶는다
+    "시군구코드": (
+        "시군구코드", "sigunguCd", "sigungu_cd", "sigunguCode", "signguCd", "sggCd",
+        "법정동코드", "bjdongCd", "LAWD_CD", "ldCode", "legaldongCode",
+        "행정동코드", "행정구역코드", "admCd", "admCode",
+    ),
+    # 날짜 형식 표기(yyyymmdd, 연월일)는 연월(yyyymm)보다 길어 먼저 맞춰진다
+    "날짜": (
+        "날짜", "일자", "기준일자", "기준일", "조회일자", "연월일", "baseDate", "base_date", "stdrDe",
+        "yyyymmdd", "ymd", "date",
+    ),
+    "연월": ("연월", "기준연월", "계약연월", "DEAL_YMD", "dealYmd", "stdrYm", "yyyymm", "ym"),
+    "사업자번호": ("사업자번호", "사업자등록번호", "b_no", "bizno", "bzno", "brno", "bsnmNo", "bizrno"),
+    "법인등록번호": ("법인등록번호", "법인번호", "jurirno", "crno", "corpNo"),
+    "좌표": ("위도", "경도", "위경도", "lat", "lon", "lng", "latitude", "longitude", "mapX", "mapY"),
+    "도로명주소": ("도로명주소", "도로명", "rdnmadr", "roadAddr", "roadNmAddr"),
+}
+
+_TOKEN_MIN_LEN = 4  # 이보다 짧은 한 토큰 영문 동의어(ymd, lat 등)는 정확히 일치할 때만
+_NORMALIZE_RE = re.compile(r"[^0-9a-z가-힣]")
+# 구분자·camelCase·숫자 경계로 나눈 토큰 ("LAWDCd" → LAWD, Cd / "base_date" → base, date)
+_TOKEN_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+|[가-힣]+")
+_HANGUL_RE = re.compile(r"[가-힣]+")
+
+
+def _normalize(text: str) -> str:
+    return _NORMALIZE_RE.sub("", text.lower())
+
+
+def _tokens(text: str) -> tuple[str, ...]:
+    return tuple(t.lower() for t in _TOKEN_RE.findall(text))
+
+
+_EXACT: dict[str, str] = {}
+_TOKEN_SYNONYMS: list[tuple[tuple[str, ...], str]] = []  # 영문 — 토큰 열 포함
+_HANGUL_SYNONYMS: list[tuple[str, str]] = []             # 한글 — 토큰 끝 또는 조사 앞
+for _key, _names in JOIN_KEY_SYNONYMS.items():
+    for _name in _names:
+        _EXACT[_normalize(_name)] = _key
+        if _HANGUL_RE.fullmatch(_name):
+            _HANGUL_SYNONYMS.append((_name, _key))
+        else:
+            _toks = _tokens(_name)
+            if len(_toks) > 1 or len(_toks[0]) >= _TOKEN_MIN_LEN:
+                _TOKEN_SYNONYMS.append((_toks, _key))
+# 긴 동의어 우선
+_TOKEN_SYNONYMS.sort(key=lambda item: len("".join(item[0])), reverse=True)
+_HANGUL_SYNONYMS.sort(key=lambda item: len(item[0]), reverse=True)
+
+
+def _contains_tokens(tokens: tuple[str, ...], synonym: tuple[str, ...]) -> bool:
+    n = len(synonym)
+    return any(tokens[i:i + n] == synonym for i in range(len(tokens) - n + 1))
+
+
+def _hangul_match(token: str, synonym: str) -> bool:
+    return token.endswith(synonym) or (token.startswith(synonym) and token[len(synonym):] in _JOSA_SUFFIXES)
+
+
+def canonical_join_key(param_name: str, description: str | None = None) -> str | None:
+    """파라미터 → 대표 조인 키. 조인에 쓸 수 없는 파라미터(serviceKey, pageNo 등)는 None.
+
+    이름으로 못 찾으면 설명에서 한 번 더 찾는다 (예: LAWD_CD "법정동코드 앞 5자리").
+    """
+    for text in (param_name, description):
+        if not text:
+            continue
+        norm = _normalize(text)
+        if norm in _EXACT:
+            return _EXACT[norm]
+        tokens = _tokens(text)
+        for synonym, key in _TOKEN_SYNONYMS:
+            if _contains_tokens(tokens, synonym):
+                return key
+        hangul = [t for t in tokens if _HANGUL_RE.fullmatch(t)]
+        for synonym, key in _HANGUL_SYNONYMS:
+            if any(_hangul_match(t, synonym) for t in hangul):
+                return key
+    return None
+
+
+def join_key_rows(api_id: str, params: Iterable[dict[str, Any]]) -> list[tuple[str, str, str]]:
+    """(api_id, join_key, param_name) 행 목록."""
+    rows = []
+    for p in params:
+        name = p.get("param_name")
+        key = canonical_join_key(name or "", p.get("description"))
+        if name and key:
+            rows.append((api_id, key, name))
+    return rows
+
+
+def _rows_from_db(conn: sqlite3.Connection, api_ids: list[str] | None) -> list[tuple[str, str, str]]:
+    sql = "SELECT api_id, param_name, description FROM api_parameters"
+    args: list[str] = []
+    if api_ids is not None:
+        sql += f" WHERE api_id IN ({','.join('?' * len(api_ids))})"
+        args = api_ids
+    rows = []
+    for api_id, name, description in conn.execute(sql, args):
+        key = canonical_join_key(name, description)
+        if key:
+            rows.append((api_id, key, name))
+    return rows
+
+
+def rebuild_join_graph(conn: sqlite3.Connection) -> dict[str, int]:
+    """api_join_keys를 api_parameters 전체에서 다시 만든다 (카탈로그 갱신 시 1회)."""
+    rows = _rows_from_db(conn, None)
+    with conn:
+        conn.execute("DELETE FROM api_join_keys")
+        conn.executemany("INSERT OR IGNORE INTO api_join_keys (api_id, join_key, param_name) VALUES (?, ?, ?)", rows)
+    stats = {"apis": len({r[0] for r in rows}), "keys": len({r[1] for r in rows}), "edges": len(rows)}
+    logger.info(f"Join graph rebuilt: {stats}")
+    return stats
+
+
+def update_join_graph(conn: sqlite3.Connection, api_ids: Iterable[str], *, transaction: bool = True) -> int:
+    """지정 API의 조인 키만 다시 계산한다 (백필·증분 스캔). 기록한 행 수를 반환.
+
+    transaction=False면 호출자가 트랜잭션을 관리한다.
+    """
+    ids = list(dict.fromkeys(api_ids))
+    if not ids:
+        return 0
+    rows = _rows_from_db(conn, ids)
+
+    def write() -> None:
+        conn.execute(f"DELETE FROM api_join_keys WHERE api_id IN ({','.join('?' * len(ids))})", ids)
+        conn.executemany("INSERT OR IGNORE INTO api_join_keys (api_id, join_key, param_name) VALUES (?, ?, ?)", rows)
+
+    if transaction:
+        with conn:
+            write()
+    else:
+        write()
+    return len(rows)
+
+
+class JoinGraph:
+    """api_join_keys 조회 — 쌍별 공유 키, 이웃, 다중 홉 조인 경로.
+
+    조회는 호출 스레드의 공유 읽기 연결을 쓰므로 Phase 3 워커 스레드에서 그대로 호출해도 된다.
+    """
+
+    def __init__(self, connections: CatalogConnections | None = None) -> None:
+        self.connections = connections or get_catalog_connections()
+
+    def _conn(self) -> sqlite3.Connection:
+        return self.connections.reader()
+
+    def available(self) -> bool:
+        """그래프가 만들어져 있는지 (카탈로그 없음/미구축이면 False)."""
+        try:
+            return self._conn().execute("SELECT 1 FROM api_join_keys LIMIT 1").fetchone() is not None
+        except sqlite3.Error:
+            return False
+
+    def keys_for(self, api_ids: Iterable[str]) -> dict[str, set[str]]:
+        ids = list(dict.fromkeys(api_ids))
+        keys: dict[str, set[str]] = {api_id: set() for api_id in ids}
+        if ids:
+            rows = self._conn().execute(
+                f"SELECT api_id, join_key FROM api_join_keys WHERE api_id IN ({','.join('?' * len(ids))})", ids,
+            )
+            for api_id, key in rows:
+                keys[api_id].add(key)
+        return keys
+
+    def analyze_api_pairs(self, apis: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """JoinAnalyzer.analyze_api_pairs 호환 — 공유 조인 키가 있는 API 쌍 목록.
+
+        params가 채워진 항목은 그 파라미터로, 비어 있으면 그래프에서 키를 가져온다.
+
+        Returns:
+            [{"api_pair": [a, b], "join_keys": [...]}, ...]
+        """
+        ids = [a["api_id"] for a in apis]
+        keys = self.keys_for(a["api_id"] for a in apis if not a.get("params"))
+        for a in apis:
+            if a.get("params"):
+                keys[a["api_id"]] = {row[1] for row in join_key_rows(a["api_id"], a["params"])}
+
+        pairs = []
+        for i, a in enumerate(ids):
+            for b in ids[i + 1:]:
+                shared = keys.get(a, set()) & keys.get(b, set())
+                if a != b and shared:
+                    pairs.append({"api_pair": [a, b], "join_keys": sorted(shared)})
+        return pairs
+
+    def neighbors(self, api_id: str, *, limit: int = 50) -> list[dict[str, Any]]:
+        """api_id와 조인 키를 공유하는 API (공유 키 많은 순)."""
+        rows = self._conn().execute(
+            "SELECT b.api_id, group_concat(DISTINCT b.join_key) FROM api_join_keys a"
+            " JOIN api_join_keys b ON b.join_key = a.join_key AND b.api_id <> a.api_id"
+            " WHERE a.api_id = ? GROUP BY b.api_id"
+            " ORDER BY COUNT(DISTINCT b.join_key) DESC, b.api_id LIMIT ?",
+            (api_id, limit),
+        ).fetchall()
+        return [{"api_id": row[0], "join_keys": sorted(row[1].split(","))} for row in rows]
+
+    def join_groups(self, api_ids: Iterable[str]) -> list[list[str]]:
+        """주어진 API들을 공유 키로 (다중 홉 포함) 이어지는 묶음으로 나눈다."""
+        ids = list(dict.fromkeys(api_ids))
+        parent = {api_id: api_id for api_id in ids}
+
+        def find(x: str) -> str:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for pair in self.analyze_api_pairs([{"api_id": api_id, "params": []} for api_id in ids]):
+            a, b = pair["api_pair"]
+            parent[find(a)] = find(b)
+
+        groups: dict[str, list[str]] = {}
+        for api_id in ids:
+            groups.setdefault(find(api_id), []).append(api_id)
+        return sorted(groups.values(), key=len, reverse=True)
+
+    def find_path(
+        self, source: str, target: str, *, max_hops: int = 3, via: Iterable[str] | None = None,
+    ) -> list[dict[str, str]] | None:
+        """source → target 조인 경로 (가장 적은 홉). 없으면 None.
+
+        API 수만큼 노드를 펼치지 않고 조인 키 공간에서 BFS한다 — 두 키를 함께 가진 API가
+        키 사이의 다리가 된다. via를 주면 다리 API를 그 안에서만 고른다 (예: 매칭된 API).
+
+        Returns:
+            [{"from": api_id, "to": api_id, "join_key": key}, ...] (홉 순서)
+        """
+        keys = self.keys_for([source, target])
+        src_keys, tgt_keys = keys[source], keys[target]
+        if not src_keys or not tgt_keys:
+            return None
+        shared = src_keys & tgt_keys
+        if shared:
+            return [{"from": source, "to": target, "join_key": min(shared)}]
+
+        bridges = self._key_bridges(exclude=(source, target), via=via)
+        # 키 경로 k0 → k1 → ... → kn (다리 API n개) = 홉 n+1
+        prev: dict[str, tuple[str, str] | None] = {k: None for k in sorted(src_keys)}
+        queue = deque((k, 0) for k in sorted(src_keys))
+        while queue:
+            key, depth = queue.popleft()
+            if key in tgt_keys:
+                return self._path_from(prev, key, source, target)
+            if depth + 2 > max_hops:
+                continue
+            for nxt, bridge in sorted(bridges.get(key, {}).items()):
+                if nxt not in prev:
+                    prev[nxt] = (key, bridge)
+                    queue.append((nxt, depth + 1))
+        return None
+
+    def _key_bridges(self, *, exclude: tuple[str, ...], via: Iterable[str] | None) -> dict[str, dict[str, str]]:
+        sql = (
+            "SELECT a.join_key, b.join_key, MIN(a.api_id) FROM api_join_keys a"
+            " JOIN api_join_keys b ON b.api_id = a.api_id AND b.join_key <> a.join_key"
+            f" WHERE a.api_id NOT IN ({','.join('?' * len(exclude))})"
+        )
+        args = list(exclude)
+        if via is not None:
+            via_ids = list(via)
+            sql += f" AND a.api_id IN ({','.join('?' * len(via_ids))})"
+            args += via_ids
+        bridges: dict[str, dict[str, str]] = {}
+        for k1, k2, api_id in self._conn().execute(sql + " GROUP BY a.join_key, b.join_key", args):
+            bridges.setdefault(k1, {})[k2] = api_id
+        return bridges
+
+    @staticmethod
+    def _path_from(
+        prev: dict[str, tuple[str, str] | None], key: str, source: str, target: str,
+    ) -> list[dict[str, str]]:
+        chain: list[tuple[str, str]] = []  # (다리 API, 다리로 넘어온 키)
+        hop_keys = [key]
+        while prev[key] is not None:
+            key, bridge = prev[key]
+            chain.append((bridge, hop_keys[-1]))
+            hop_keys.append(key)
+        hop_keys.reverse()
+        bridges = [bridge for bridge, _ in reversed(chain)]
+        nodes = [source, *bridges, target]
+        return [
+            {"from": nodes[i], "to": nodes[i + 1], "join_key": hop_keys[i]}
+            for i in range(len(nodes) - 1)
+        ]
@@ -38,7 +38,9 @@ class _JsonlHandler(logging.Handler):
                 entry["exc"] = self.format(record).split("\n")
 
             # 추가 필드 (extra 딕셔너리)
-            for key in ("phase", "batch_id", "duration_sec", "attempt", "trigger"):
+            for key in (
+                "phase", "batch_id", "duration_sec", "attempt", "trigger", "prompt_tokens",
+            ):
                 val = getattr(record, key, None)
                 if val is not None:
                     entry[key] = val
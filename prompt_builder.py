@@ -0,0 +1,268 @@
+"""프롬프트 빌더 — 템플릿 레지스트리, 토큰 추정, Phase별 토큰 예산, 컴팩트 직렬화.
+
+Claude CLI 프롬프트를 섹션 단위로 조립한다. 예산을 초과하면 우선순위가 낮은 섹션의
+뒤쪽 항목(리스트는 중요도 내림차순으로 넣는다)부터 잘라낸다. 항목을 빠뜨릴 수 없는
+배치 섹션은 항목 대신 각 항목의 문자열 필드를 줄인다.
+템플릿(PROMPTS_DIR/*.md)은 1회 로드 후 mtime 변경 시에만 다시 읽는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from config import PROMPT_TOKEN_BUDGET, PROMPTS_DIR
+from logger import get_logger
+
+logger = get_logger("prompt_builder")
+
+# 프롬프트 직렬화용 짧은 키 — 응답 매핑에 쓰이는 "id"는 그대로 둔다
+SHORT_KEYS = {
+    "source": "src",
+    "snippet": "snip",
+    "service_name": "name",
+    "problem": "prob",
+    "solution": "sol",
+    "target_buyer": "buyer",
+    "revenue_model": "rev",
+    "feasibility_pct": "feas",
+    "validation_score": "vscore",
+    "category": "cat",
+    "api_count": "n",
+    "representative_keywords": "kw",
+    "summary_text": "summary",
+}
+
+
+# ──────────────────────────── 템플릿 레지스트리 ────────────────────────────
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    name: str
+    text: str
+    version: str  # 내용 sha256 앞 12자리 (파일 없음 → "missing")
+    mtime_ns: int
+
+
+class PromptTemplateRegistry:
+    """PROMPTS_DIR 템플릿 캐시. get() 시 mtime만 확인하여 변경된 파일만 다시 읽는다."""
+
+    def __init__(self, prompts_dir: Path | str = PROMPTS_DIR) -> None:
+        self.prompts_dir = Path(prompts_dir)
+        self._cache: dict[str, PromptTemplate] = {}
+        self.load_all()
+
+    def load_all(self) -> dict[str, str]:
+        """디렉터리의 모든 .md 템플릿을 로드하고 {name: version}을 반환한다."""
+        if self.prompts_dir.is_dir():
+            for path in sorted(self.prompts_dir.glob("*.md")):
+                self.template(path.name)
+        return self.versions()
+
+    def template(self, name: str) -> PromptTemplate:
+        """템플릿을 반환한다. 파일이 바뀌었으면 다시 읽고, 없으면 빈 템플릿."""
+        path = self.prompts_dir / name
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            cached = PromptTemplate(name, "", "missing", 0)
+            self._cache[name] = cached
+            return cached
+
+        cached = self._cache.get(name)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        text = path.read_text(encoding="utf-8")
+        version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+        if cached is not None and cached.version != version:
+            logger.info(f"Prompt template reloaded: {name} {cached.version} → {version}")
+        loaded = PromptTemplate(name, text, version, mtime_ns)
+        self._cache[name] = loaded
+        return loaded
+
+    def get(self, name: str) -> str:
+        return self.template(name).text
+
+    def version(self, name: str) -> str:
+        return self.template(name).version
+
+    def versions(self) -> dict[str, str]:
+        return {name: t.version for name, t in self._cache.items()}
+
+
+_registry: PromptTemplateRegistry | None = None
+
+
+def get_template_registry() -> PromptTemplateRegistry:
+    """프로세스 전역 템플릿 레지스트리를 반환한다."""
+    global _registry
+    if _registry is None:
+        _registry = PromptTemplateRegistry()
+    return _registry
+
+
+# ──────────────────────────── 토큰 추정 / 직렬화 ────────────────────────────
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수를 근사한다 — ASCII 4자당 1토큰, 한글 등 비ASCII 1자당 1토큰."""
+    n_ascii = len(text.encode("ascii", errors="ignore"))
+    return math.ceil(n_ascii / 4 + (len(text) - n_ascii))
+
+
+def compact_json(data: Any) -> str:
+    """들여쓰기/공백 없는 JSON 직렬화."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def shorten(record: dict[str, Any], fields: list[str], *, max_chars: int | None = None) -> dict[str, Any]:
+    """지정 필드만 짧은 키로 남긴다. 빈 값은 제외, 문자열은 max_chars로 자른다."""
+    out: dict[str, Any] = {}
+    for key in fields:
+        val = record.get(key)
+        if val is None or val == "" or val == []:
+            continue
+        if max_chars and isinstance(val, str) and len(val) > max_chars:
+            val = val[:max_chars] + "…"
+        out[SHORT_KEYS.get(key, key)] = val
+    return out
+
+
+# ──────────────────────────── PromptBuilder ────────────────────────────
+
+
+@dataclass
+class _Section:
+    title: str
+    items: list[Any] | str
+    priority: int | None
+    fence: bool
+    empty: str
+    shrink_to: int | None = None
+    dropped: int = 0
+    clipped_to: int | None = None
+
+    def render(self) -> str:
+        if isinstance(self.items, str):
+            body = self.items or self.empty
+        elif not self.items:
+            body = self.empty
+        else:
+            body = compact_json(self.items)
+        if self.fence and body != self.empty:
+            body = f"```json\n{body}\n```"
+        return f"### {self.title}\n{body}\n" if self.title else f"{body}\n"
+
+
+@dataclass
+class PromptBuilder:
+    """섹션 단위 프롬프트 조립기.
+
+    - priority가 높을수록 나중에 잘린다. None이면 절삭 대상에서 제외.
+    - 리스트 섹션은 뒤에서부터 항목 단위로, 문자열 섹션은 통째로 비운다.
+    - shrink_to를 준 리스트 섹션은 항목을 버리지 않고 항목별 문자열 값("id" 제외)의
+      길이 상한을 절반씩 shrink_to자까지 줄인다 (배치 응답이 항목마다 필요할 때).
+    """
+
+    phase: int | str
+    budget_tokens: int | None = None
+    _sections: list[_Section] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if self.budget_tokens is None:
+            self.budget_tokens = PROMPT_TOKEN_BUDGET.get(self.phase)
+
+    def add_text(self, text: str) -> PromptBuilder:
+        """절삭되지 않는 고정 텍스트(템플릿, 지시문)를 추가한다."""
+        self._sections.append(_Section("", text, None, False, ""))
+        return self
+
+    def add_section(
+        self,
+        title: str,
+        items: list[Any] | str,
+        *,
+        priority: int | None = 0,
+        fence: bool = True,
+        empty: str = "없음",
+        shrink_to: int | None = None,
+    ) -> PromptBuilder:
+        """데이터 섹션을 추가한다. 리스트는 중요한 항목이 앞에 오도록 넣는다."""
+        items = list(items) if not isinstance(items, str) else items
+        self._sections.append(_Section(title, items, priority, fence, empty, shrink_to))
+        return self
+
+    def build(self) -> str:
+        """예산 내로 절삭한 최종 프롬프트를 반환한다."""
+        rendered = [s.render() for s in self._sections]
+        costs = [estimate_tokens(r) for r in rendered]
+        total = sum(costs)
+
+        if self.budget_tokens:
+            trimmable = sorted(
+                (i for i, s in enumerate(self._sections) if s.priority is not None),
+                key=lambda i: self._sections[i].priority,
+            )
+            for i in trimmable:
+                if total <= self.budget_tokens:
+                    break
+                section = self._sections[i]
+                if section.shrink_to is not None and isinstance(section.items, list):
+                    total += self._shrink(section, costs, i, total)
+                    rendered[i] = section.render()
+                    continue
+                while total > self.budget_tokens and section.items:
+                    if isinstance(section.items, str):
+                        section.items = ""
+                    else:
+                        section.items.pop()
+                    section.dropped += 1
+                    new_cost = estimate_tokens(section.render())
+                    total += new_cost - costs[i]
+                    costs[i] = new_cost
+                rendered[i] = section.render()
+
+        prompt = "\n".join(rendered)
+        dropped = {s.title: s.dropped for s in self._sections if s.dropped}
+        clipped = {s.title: s.clipped_to for s in self._sections if s.clipped_to is not None}
+        log = logger.warning if self.budget_tokens and total > self.budget_tokens else logger.info
+        log(
+            f"Phase {self.phase} prompt: ~{total} tokens (budget {self.budget_tokens})"
+            + (f", trimmed {dropped}" if dropped else "")
+            + (f", clipped {clipped}" if clipped else ""),
+            extra={"phase": self.phase, "prompt_tokens": total},
+        )
+        return prompt
+
+    def _shrink(self, section: _Section, costs: list[int], i: int, total: int) -> int:
+        """항목별 문자열 값 상한을 절반씩 줄여 예산에 맞춘다. 토큰 증감분을 반환."""
+        longest = max(
+            (len(v) for it in section.items if isinstance(it, dict)
+             for k, v in it.items() if k != "id" and isinstance(v, str)),
+            default=0,
+        )
+        limit = longest
+        delta = 0
+        while total + delta > self.budget_tokens and limit > section.shrink_to:
+            limit = max(section.shrink_to, limit // 2)
+            section.items = [_clip_item(it, limit) for it in section.items]
+            section.clipped_to = limit
+            new_cost = estimate_tokens(section.render())
+            delta += new_cost - costs[i]
+            costs[i] = new_cost
+        return delta
+
+
+def _clip_item(item: Any, limit: int) -> Any:
+    if not isinstance(item, dict):
+        return item
+    return {
+        k: v[:limit] + "…" if k != "id" and isinstance(v, str) and len(v) > limit + 1 else v
+        for k, v in item.items()
+    }
@@ -0,0 +1,207 @@
+"""프로세스 간 자원 입장 제어 — 파일 락 슬롯 기반 카운팅 세마포어.
+
+겹쳐 실행되는 엔진 런(최대 2개)이 임베딩 모델 RAM, Playwright 브라우저, claude -p 동시
+실행 수를 함께 나눠 쓰도록 한다. 슬롯마다 락 파일을 하나 두고 flock(Windows: msvcrt)으로
+잡으므로, 프로세스가 죽으면 OS가 락을 풀어 누수가 없다.
+
+    with get_resource_guard().claude_cli():
+        subprocess.run(["claude", "-p"], ...)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Iterator
+
+from config import (
+    CLAUDE_CLI_MAX_CONCURRENT,
+    MODEL_RAM_BUDGET_MB,
+    PLAYWRIGHT_MAX_BROWSERS,
+    RESOURCE_LOCK_DIR,
+    RESOURCE_POLL_SEC,
+    RESOURCE_RAM_UNIT_MB,
+    RESOURCE_WAIT_TIMEOUT_SEC,
+)
+from logger import get_logger
+
+logger = get_logger("resource_guard")
+
+# 비차단 배타 락 — 실패 시 OSError
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock_file(fd: IO) -> None:
+        msvcrt.locking(fd.fileno(), msvcrt.LK_NBLCK, 1)
+
+    def _unlock_file(fd: IO) -> None:
+        try:
+            fd.seek(0)
+            msvcrt.locking(fd.fileno(), msvcrt.LK_UNLCK, 1)
+        except Exception:
+            pass
+else:
+    import fcntl
+
+    def _lock_file(fd: IO) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock_file(fd: IO) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class ResourceBusyError(TimeoutError):
+    """대기 시간 안에 자원 슬롯을 얻지 못함."""
+
+
+class Lease:
+    """획득한 슬롯 묶음. release()는 여러 번 호출해도 안전하다."""
+
+    def __init__(self, name: str, fds: list[IO]) -> None:
+        self.name = name
+        self.units = len(fds)
+        self._fds = fds
+
+    def release(self) -> None:
+        for fd in self._fds:
+            try:
+                _unlock_file(fd)
+                fd.close()
+            except Exception:
+                pass
+        if self._fds:
+            logger.debug(f"Released {self.units} unit(s) of {self.name}")
+        self._fds = []
+
+    def __enter__(self) -> "Lease":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.release()
+
+
+class ResourceSemaphore:
+    """capacity개 슬롯의 프로세스 간 카운팅 세마포어 ({name}_{i}.lock).
+
+    같은 프로세스 안의 스레드끼리도 파일 디스크립터가 달라 서로 배타적이다.
+    """
+
+    def __init__(self, name: str, capacity: int, lock_dir: Path | str = RESOURCE_LOCK_DIR) -> None:
+        self.name = name
+        self.capacity = max(1, int(capacity))
+        self.lock_dir = Path(lock_dir)
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    def try_acquire(self, units: int = 1) -> Lease | None:
+        """units개 슬롯을 한 번에 잡는다. 모자라면 잡았던 것도 풀고 None."""
+        units = min(max(1, units), self.capacity)
+        held: list[IO] = []
+        for slot in range(self.capacity):
+            fd = open(self.lock_dir / f"{self.name}_{slot}.lock", "a+")
+            fd.seek(0)
+            try:
+                _lock_file(fd)
+            except OSError:
+                fd.close()
+                continue
+            fd.seek(0)
+            fd.truncate()
+            fd.write(f"{os.getpid()}\n{datetime.now(timezone.utc).isoformat()}\n")
+            fd.flush()
+            held.append(fd)
+            if len(held) == units:
+                return Lease(self.name, held)
+        Lease(self.name, held).release()
+        return None
+
+    def acquire(
+        self, units: int = 1, *, timeout: float | None = RESOURCE_WAIT_TIMEOUT_SEC,
+        poll: float = RESOURCE_POLL_SEC,
+    ) -> Lease:
+        """슬롯이 날 때까지 기다린다. timeout 초과 시 ResourceBusyError (None = 무한 대기)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = False
+        while True:
+            lease = self.try_acquire(units)
+            if lease is not None:
+                if waited:
+                    logger.info(f"Acquired {lease.units} unit(s) of {self.name} after waiting")
+                return lease
+            if deadline is not None and time.monotonic() >= deadline:
+                raise ResourceBusyError(
+                    f"{self.name}: {units} unit(s) unavailable after {timeout:.0f}s "
+                    f"(capacity {self.capacity})"
+                )
+            if not waited:
+                logger.info(f"{self.name} busy — waiting for {units} unit(s)")
+                waited = True
+            time.sleep(poll)
+
+    def in_use(self) -> int:
+        """현재 다른 디스크립터가 잡고 있는 슬롯 수 (진단용)."""
+        busy = 0
+        for slot in range(self.capacity):
+            fd = open(self.lock_dir / f"{self.name}_{slot}.lock", "a+")
+            fd.seek(0)
+            try:
+                _lock_file(fd)
+                _unlock_file(fd)
+            except OSError:
+                busy += 1
+            finally:
+                fd.close()
+        return busy
+
+
+class ResourceGuard:
+    """엔진 런이 공유하는 자원 세트 — 모델 RAM, Playwright 브라우저, Claude CLI, 카탈로그 쓰기."""
+
+    def __init__(self, lock_dir: Path | str = RESOURCE_LOCK_DIR) -> None:
+        self.ram_unit_mb = RESOURCE_RAM_UNIT_MB
+        self.memory = ResourceSemaphore(
+            "model_ram", MODEL_RAM_BUDGET_MB // RESOURCE_RAM_UNIT_MB, lock_dir,
+        )
+        self.browsers = ResourceSemaphore("playwright", PLAYWRIGHT_MAX_BROWSERS, lock_dir)
+        self.cli = ResourceSemaphore("claude_cli", CLAUDE_CLI_MAX_CONCURRENT, lock_dir)
+        self.catalog = ResourceSemaphore("catalog_writer", 1, lock_dir)
+
+    def reserve_memory(self, mb: int, *, timeout: float | None = RESOURCE_WAIT_TIMEOUT_SEC) -> Lease:
+        """모델 로드 전 RAM 예산을 잡는다. 모델을 내릴 때까지 들고 있어야 한다."""
+        units = -(-mb // self.ram_unit_mb)
+        return self.memory.acquire(units, timeout=timeout)
+
+    def catalog_writer(self, *, timeout: float | None = RESOURCE_WAIT_TIMEOUT_SEC) -> Lease:
+        """게시된 카탈로그에 쓰는 작업(릴리스 갱신·백필·마이그레이션)의 배타 락.
+
+        갱신은 시작할 때 게시본을 스냅샷하므로, 그동안 게시본에 쓴 내용은 새 버전 게시와 함께
+        사라진다. 작업이 끝날 때까지 들고 있어야 한다 (with 문 사용 가능).
+        """
+        return self.catalog.acquire(timeout=timeout)
+
+    @contextmanager
+    def browser(self, *, timeout: float | None = RESOURCE_WAIT_TIMEOUT_SEC) -> Iterator[Lease]:
+        with self.browsers.acquire(timeout=timeout) as lease:
+            yield lease
+
+    @contextmanager
+    def claude_cli(self, *, timeout: float | None = RESOURCE_WAIT_TIMEOUT_SEC) -> Iterator[Lease]:
+        with self.cli.acquire(timeout=timeout) as lease:
+            yield lease
+
+
+_guard: ResourceGuard | None = None
+_guard_lock = threading.Lock()
+
+
+def get_resource_guard() -> ResourceGuard:
+    """프로세스 전역 ResourceGuard (지연 생성)."""
+    global _guard
+    with _guard_lock:
+        if _guard is None:
+            _guard = ResourceGuard()
+        return _guard
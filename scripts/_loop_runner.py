@@ -1,5 +1,9 @@
 """매시 정각 루프 러너 — 동시성 제어(최대 2 병렬), 락 파일.
 
+각 정각 슬롯을 서브프로세스로 띄우므로 이전 실행이 끝나지 않아도 다음 정각에 두 번째
+슬롯으로 시작한다. 슬롯이 모두 차 있으면 놓친 정각을 skip_runs.jsonl에 기록하고,
+자리가 나면 최근 놓친 정각을 따라잡아 실행한다.
+
 사용법:
     python _loop_runner.py
     python _loop_runner.py --once   # 1회만 실행
@@ -8,44 +12,32 @@
 from __future__ import annotations
 
 import os
+import random
+import subprocess
 import sys
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Callable, Protocol
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from config import PROJECT_ROOT
+from config import PROJECT_ROOT, SKIP_RUNS_PATH
 from logger import get_logger
+from resource_guard import _lock_file, _unlock_file
+from utils import append_jsonl
 
 logger = get_logger("loop_runner")
 
 LOCK_DIR = PROJECT_ROOT / "output" / "locks"
 MAX_CONCURRENT = 2
-
-# Windows용 파일 락
-if sys.platform == "win32":
-    import msvcrt
-
-    def _lock_file(fd):
-        msvcrt.locking(fd.fileno(), msvcrt.LK_NBLCK, 1)
-
-    def _unlock_file(fd):
-        try:
-            fd.seek(0)
-            msvcrt.locking(fd.fileno(), msvcrt.LK_UNLCK, 1)
-        except Exception:
-            pass
-else:
-    import fcntl
-
-    def _lock_file(fd):
-        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-
-    def _unlock_file(fd):
-        fcntl.flock(fd, fcntl.LOCK_UN)
+START_JITTER_SEC = 30        # 정각 직후 시작을 0~N초 분산 (외부 API 동시 호출 완화)
+CATCHUP_WINDOW_HOURS = 3     # 이보다 오래된 놓친 정각은 따라잡지 않고 폐기
+POLL_SEC = 5                 # 자식 프로세스 종료 확인 주기
+EXIT_NO_SLOT = 75            # --once 실행이 락 슬롯을 얻지 못함 (EX_TEMPFAIL)
 
 
 class RunLock:
@@ -65,7 +57,7 @@ class RunLock:
             try:
                 fd = open(lock_path, "w")
                 _lock_file(fd)
-                fd.write(f"{os.getpid()}\n{datetime.utcnow().isoformat()}\n")
+                fd.write(f"{os.getpid()}\n{datetime.now(timezone.utc).isoformat()}\n")
                 fd.flush()
                 self._lock_file = lock_path
                 self._lock_fd = fd
@@ -94,21 +86,16 @@ class RunLock:
             logger.info("Lock released")
 
 
-def _next_hour_wait() -> float:
-    """다음 정각까지 대기 시간(초)을 반환한다."""
-    now = datetime.utcnow()
-    next_hour = now.replace(minute=0, second=0, microsecond=0)
-    if next_hour <= now:
-        next_hour += timedelta(hours=1)
-    return (next_hour - now).total_seconds()
-
-
 def run_once() -> bool:
     """파이프라인을 1회 실행한다. 락 획득 실패 시 False."""
     lock = RunLock()
     if not lock.acquire():
         return False
+    return _run_locked(lock)
+
 
+def _run_locked(lock: RunLock) -> bool:
+    """락을 쥔 상태에서 파이프라인을 실행하고 락을 해제한다."""
     try:
         from scripts.run_engine import IdeationEngine
 
@@ -123,23 +110,180 @@ def run_once() -> bool:
         lock.release()
 
 
+# ──────────────────────────── 정각 스케줄러 ────────────────────────────
+
+
+class _RunProcess(Protocol):
+    def poll(self) -> int | None: ...
+
+
+def _hour_floor(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _launch_run(slot: datetime) -> subprocess.Popen:
+    """정각 슬롯 1회 실행을 자식 프로세스로 띄운다 (락은 자식이 잡는다)."""
+    return subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "--once", "--slot", slot.isoformat()],
+        cwd=str(PROJECT_ROOT),
+    )
+
+
+class HourlyScheduler:
+    """정각마다 실행을 띄우는 스케줄러 — 최대 max_concurrent개 자식 프로세스 병행.
+
+    - 정각(+지터)이 되면 이전 실행이 끝나지 않았어도 남는 슬롯으로 새 실행을 띄운다.
+    - 슬롯이 없으면 그 정각을 skip_runs.jsonl에 기록하고 백로그에 넣는다.
+    - 자리가 나면 백로그의 최근 정각부터 따라잡는다 (catchup_window_hours 이내만).
+    - 다른 프로세스가 락 슬롯을 쥐고 있어 자식이 EXIT_NO_SLOT으로 끝나면 한 번만 기록하고
+      다음 정각까지 따라잡기를 멈춘다. 따라잡기로 다시 띄운 슬롯이 또 막히면 버린다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = MAX_CONCURRENT,
+        skip_log: Path = SKIP_RUNS_PATH,
+        jitter_sec: float = START_JITTER_SEC,
+        catchup_window_hours: int = CATCHUP_WINDOW_HOURS,
+        launcher: Callable[[datetime], _RunProcess] = _launch_run,
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.skip_log = skip_log
+        self.jitter_sec = jitter_sec
+        self.catchup_window = timedelta(hours=catchup_window_hours)
+        self._launcher = launcher
+        self._running: dict[datetime, _RunProcess] = {}
+        self._backlog: deque[datetime] = deque()
+        self._last_slot: datetime | None = None
+        self._due_at: datetime | None = None
+        self._hold_until: datetime | None = None
+        self._lock_busy: set[datetime] = set()
+
+    @property
+    def running(self) -> list[datetime]:
+        return sorted(self._running)
+
+    @property
+    def backlog(self) -> list[datetime]:
+        return list(self._backlog)
+
+    def tick(self, now: datetime) -> list[datetime]:
+        """현재 시각 기준으로 종료 수거 → 정각 실행 → 백로그 따라잡기. 새로 띄운 슬롯을 반환한다."""
+        self._reap(now)
+        launched: list[datetime] = []
+
+        slot = _hour_floor(now)
+        if self._last_slot is None or slot > self._last_slot:
+            # 루프가 멈춰 있던 사이(슬립 지연 등) 지나간 정각도 놓친 슬롯으로 처리
+            if self._last_slot is not None:
+                missed = self._last_slot + timedelta(hours=1)
+                while missed < slot:
+                    self._miss(missed, now, reason="not_scheduled")
+                    missed += timedelta(hours=1)
+            self._last_slot = slot
+            self._due_at = slot + timedelta(seconds=random.uniform(0, self.jitter_sec))
+
+        if self._due_at is not None and now >= self._due_at:
+            self._due_at = None
+            if len(self._running) < self.max_concurrent:
+                launched.append(self._start(slot))
+            else:
+                self._miss(slot, now, reason="capacity")
+
+        # 정각 실행이 대기 중이면 그 자리를 남겨 둔다
+        while (
+            self._due_at is None and self._backlog and not self._holding(now)
+            and len(self._running) < self.max_concurrent
+        ):
+            missed = self._backlog.pop()  # 가장 최근 놓친 정각부터
+            self._start(missed)
+            append_jsonl(self.skip_log, {
+                "slot": missed.isoformat(), "status": "caught_up", "recorded_at": now.isoformat(),
+            })
+            logger.info(f"Catching up missed slot {missed:%Y-%m-%d %H:00} UTC")
+            launched.append(missed)
+        return launched
+
+    def seconds_until_next_event(self, now: datetime) -> float:
+        """다음 정각(지터 포함) 또는 다음 종료 확인까지의 대기 시간."""
+        if self._due_at is not None:
+            target = self._due_at
+        else:
+            target = _hour_floor(now) + timedelta(hours=1)
+        wait = (target - now).total_seconds()
+        if self._running or (self._backlog and not self._holding(now)):
+            wait = min(wait, POLL_SEC)
+        return max(0.0, wait)
+
+    def _holding(self, now: datetime) -> bool:
+        return self._hold_until is not None and now < self._hold_until
+
+    def _start(self, slot: datetime) -> datetime:
+        self._running[slot] = self._launcher(slot)
+        logger.info(f"Launched run for slot {slot:%Y-%m-%d %H:00} UTC ({len(self._running)}/{self.max_concurrent} slots)")
+        return slot
+
+    def _reap(self, now: datetime) -> None:
+        for slot, proc in list(self._running.items()):
+            code = proc.poll()
+            if code is None:
+                continue
+            del self._running[slot]
+            if code == EXIT_NO_SLOT:
+                # 다른 프로세스(수동 실행 등)가 락 슬롯을 쥐고 있었음 — 다음 정각까지 재시도 안 함
+                self._hold_until = _hour_floor(now) + timedelta(hours=1)
+                if slot in self._lock_busy:
+                    logger.warning(f"Slot {slot:%Y-%m-%d %H:00} UTC lock-busy again — dropped")
+                    continue
+                self._lock_busy.add(slot)
+                self._miss(slot, now, reason="lock_busy")
+            else:
+                logger.info(f"Run for slot {slot:%Y-%m-%d %H:00} UTC exited with {code}")
+        cutoff = _hour_floor(now) - self.catchup_window
+        self._lock_busy = {s for s in self._lock_busy if s >= cutoff}
+        while self._backlog and self._backlog[0] < cutoff:
+            expired = self._backlog.popleft()
+            append_jsonl(self.skip_log, {
+                "slot": expired.isoformat(), "status": "expired", "recorded_at": now.isoformat(),
+            })
+
+    def _miss(self, slot: datetime, now: datetime, *, reason: str) -> None:
+        append_jsonl(self.skip_log, {
+            "slot": slot.isoformat(), "status": "missed", "reason": reason,
+            "running": [s.isoformat() for s in self.running], "recorded_at": now.isoformat(),
+        })
+        logger.warning(f"Missed slot {slot:%Y-%m-%d %H:00} UTC ({reason}) — queued for catch-up")
+        if slot not in self._backlog:
+            self._backlog.append(slot)
+            self._backlog = deque(sorted(self._backlog))
+
+
 def main() -> None:
     import argparse
 
     parser = argparse.ArgumentParser(description="매시 정각 루프 러너")
     parser.add_argument("--once", action="store_true", help="1회만 실행")
+    parser.add_argument("--slot", help="--once 실행이 담당하는 정각 (UTC ISO, 스케줄러가 전달)")
     args = parser.parse_args()
 
     if args.once:
-        success = run_once()
+        lock = RunLock()
+        if not lock.acquire():
+            sys.exit(EXIT_NO_SLOT)
+        if args.slot:
+            logger.info(f"Running slot {args.slot}")
+        success = _run_locked(lock)
         sys.exit(0 if success else 1)
 
     logger.info("Loop runner started — Ctrl+C to stop")
+    scheduler = HourlyScheduler()
     while True:
-        success = run_once()
-        wait = _next_hour_wait()
-        logger.info(f"Next run in {wait:.0f}s")
-        time.sleep(wait)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        scheduler.tick(now)
+        wait = scheduler.seconds_until_next_event(now)
+        logger.debug(f"Next check in {wait:.0f}s")
+        time.sleep(max(wait, 1.0))
 
 
 if __name__ == "__main__":
@@ -1,16 +1,23 @@
 """카탈로그 파라미터 백필 — 상세 페이지 크롤링으로 파라미터/오퍼레이션 수집.
 
+N개 워커가 브라우저 풀 페이지를 나눠 쓰고, 공유 토큰 버킷으로 전체 요청률을 제한한다.
+대상은 SQL 안티조인 한 번으로 고르고, 진행 상황은 backfill_progress 테이블에 남겨
+중단된 실행을 --resume으로 이어 간다. 결과는 BACKFILL_WRITE_BATCH건씩 한 트랜잭션으로 기록.
+
 사용법:
     python scripts/backfill_params.py --limit 50    # 처음 50개만
     python scripts/backfill_params.py --all          # 전체 (시간 소요)
     python scripts/backfill_params.py --missing-only  # 파라미터 없는 것만
+    python scripts/backfill_params.py --resume        # 마지막 실행 이어서
 """
 
 from __future__ import annotations
 
 import asyncio
+import sqlite3
 import sys
 from pathlib import Path
+from typing import Any, Awaitable, Callable
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
@@ -20,90 +27,273 @@ _CATALOG_SCRIPTS = _PROJECT_ROOT / ".claude" / "skills" / "catalog-manager" / "s
 if str(_CATALOG_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(_CATALOG_SCRIPTS))
 
-from catalog_scanner import CatalogScanner
-from catalog_store import CatalogStore
+import catalog_db
+from browser_pool import BrowserPool, close_browser_pool, get_browser_pool
+from catalog_fetch import detail_page_url
+from catalog_release import read_pointer
+from config import (
+    BACKFILL_BURST,
+    BACKFILL_MAX_ATTEMPTS,
+    BACKFILL_RATE_PER_SEC,
+    BACKFILL_WORKERS,
+    BACKFILL_WRITE_BATCH,
+    BROWSER_POOL_MAX_PAGES,
+    DATA_GO_KR_BASE_URL,
+)
+from join_graph import update_join_graph
 from logger import get_logger
+from resource_guard import get_resource_guard
+from utils import TokenBucket, kst_now
 
 logger = get_logger("backfill_params")
 
+# api_id → (parameters, operations)
+Fetcher = Callable[[str], Awaitable[tuple[list[dict[str, Any]], list[dict[str, Any]]]]]
+
+_PROGRESS_DDL = """
+CREATE TABLE IF NOT EXISTS backfill_progress (
+    run_id TEXT NOT NULL,
+    api_id TEXT NOT NULL,
+    status TEXT NOT NULL,              -- done | failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    params_added INTEGER NOT NULL DEFAULT 0,
+    ops_added INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, api_id)
+)
+"""
 
-async def backfill(
-    *, limit: int | None = None, missing_only: bool = True, delay: float = 1.5
-) -> dict[str, int]:
-    """파라미터가 없는 API의 상세 페이지를 크롤링하여 파라미터를 수집한다."""
-    store = CatalogStore()
-    scanner = CatalogScanner()
+_UPSERT_PROGRESS_SQL = """
+INSERT INTO backfill_progress (run_id, api_id, status, attempts, params_added, ops_added, error, updated_at)
+VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+ON CONFLICT(run_id, api_id) DO UPDATE SET
+    status = excluded.status,
+    attempts = backfill_progress.attempts + 1,
+    params_added = excluded.params_added,
+    ops_added = excluded.ops_added,
+    error = excluded.error,
+    updated_at = excluded.updated_at
+"""
 
-    apis = store.list_apis(active_only=True)
-    logger.info(f"Total active APIs: {len(apis)}")
 
-    # 파라미터 없는 API만 필터링
-    if missing_only:
-        targets = []
-        for api in apis:
-            params = store.get_parameters(api["api_id"])
-            if not params:
-                targets.append(api["api_id"])
-        logger.info(f"APIs missing parameters: {len(targets)}")
-    else:
-        targets = [a["api_id"] for a in apis]
+def connect(db_path: Path | str | None = None) -> sqlite3.Connection:
+    """프로세스 공유 쓰기 연결 + 진행 테이블 보장. 연결은 관리자가 닫으므로 close하지 않는다.
 
-    if limit:
-        targets = targets[:limit]
+    db_path를 생략하면 게시된 카탈로그 릴리스의 DB.
+    """
+    conn = catalog_db.get_catalog_connections(db_path).writer
+    conn.execute(_PROGRESS_DDL)
+    return conn
 
-    logger.info(f"Backfilling {len(targets)} APIs (delay={delay}s)")
 
-    stats = {"total": len(targets), "success": 0, "params_added": 0, "ops_added": 0, "failed": 0}
+def latest_run_id(conn: sqlite3.Connection) -> str | None:
+    row = conn.execute(
+        "SELECT run_id FROM backfill_progress ORDER BY updated_at DESC LIMIT 1"
+    ).fetchone()
+    return row["run_id"] if row else None
 
-    from playwright.async_api import async_playwright
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(locale="ko-KR")
-        page = await context.new_page()
+def select_targets(
+    conn: sqlite3.Connection, run_id: str, *, missing_only: bool = True, limit: int | None = None,
+) -> list[str]:
+    """백필 대상 api_id — 활성 API 중 (파라미터 없음) 이면서 이번 실행에서 끝나지 않은 것.
 
+    api_parameters / backfill_progress 와의 NOT EXISTS 안티조인 한 번으로 고른다.
+    실패는 BACKFILL_MAX_ATTEMPTS회까지 다시 대상에 넣는다.
+    """
+    sql = [
+        "SELECT a.api_id FROM apis a",
+        "WHERE a.is_active = 1",
+        "AND NOT EXISTS (SELECT 1 FROM backfill_progress b WHERE b.run_id = ? AND b.api_id = a.api_id"
+        " AND (b.status = 'done' OR b.attempts >= ?))",
+    ]
+    args: list[Any] = [run_id, BACKFILL_MAX_ATTEMPTS]
+    if missing_only:
+        sql.append("AND NOT EXISTS (SELECT 1 FROM api_parameters p WHERE p.api_id = a.api_id)")
+    sql.append("ORDER BY a.id")
+    if limit:
+        sql.append("LIMIT ?")
+        args.append(limit)
+    return [row[0] for row in conn.execute(" ".join(sql), args)]
+
+
+class _BatchWriter:
+    """워커 결과를 모아 한 트랜잭션(executemany)으로 파라미터·오퍼레이션·진행 상황을 기록한다."""
+
+    def __init__(self, conn: sqlite3.Connection, run_id: str, batch_size: int) -> None:
+        self.conn = conn
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self._params: list[tuple[str, list[dict[str, Any]]]] = []
+        self._ops: list[tuple[str, list[dict[str, Any]]]] = []
+        self._progress: list[tuple] = []
+
+    def add_success(self, api_id: str, params: list[dict[str, Any]], ops: list[dict[str, Any]]) -> None:
+        if params:
+            self._params.append((api_id, params))
+        if ops:
+            self._ops.append((api_id, ops))
+        self._progress.append(
+            (self.run_id, api_id, "done", len(params), len(ops), None, kst_now().isoformat())
+        )
+        self._maybe_flush()
+
+    def add_failure(self, api_id: str, error: str) -> None:
+        self._progress.append(
+            (self.run_id, api_id, "failed", 0, 0, error[:500], kst_now().isoformat())
+        )
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._progress) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._progress:
+            return
+        # 파라미터·오퍼레이션·조인 키·진행 기록을 한 트랜잭션으로 — 진행 기록만 남고 결과가 빠지는 일 없음
+        with self.conn:
+            catalog_db.upsert_parameters_many(self.conn, self._params, transaction=False)
+            catalog_db.upsert_operations_many(self.conn, self._ops, transaction=False)
+            update_join_graph(self.conn, (api_id for api_id, _ in self._params), transaction=False)
+            self.conn.executemany(_UPSERT_PROGRESS_SQL, self._progress)
+        self._params.clear()
+        self._ops.clear()
+        self._progress.clear()
+
+
+def detail_page_fetcher(pool: BrowserPool, base_url: str = DATA_GO_KR_BASE_URL) -> Fetcher:
+    """data.go.kr 상세 페이지(Swagger UI)를 브라우저 풀 페이지로 열어 파라미터/오퍼레이션을 뽑는다."""
+    from catalog_scanner import CatalogScanner
+
+    scanner = CatalogScanner()
+
+    async def visit(page: Any, url: str) -> tuple[list, list]:
+        await page.goto(url)
+        await page.wait_for_load_state("networkidle", timeout=15000)
+        # Swagger UI 비동기 렌더링 대기
         try:
-            for i, api_id in enumerate(targets):
-                raw_id = api_id.replace("DATAGOKR-", "")
-                url = f"https://www.data.go.kr/data/{raw_id}/openapi.do"
-
-                try:
-                    await page.goto(url, timeout=30000)
-                    await page.wait_for_load_state("networkidle", timeout=15000)
-                    # Swagger UI 비동기 렌더링 대기
-                    try:
-                        await page.wait_for_selector(
-                            ".opblock-summary-control, .opblock-summary, .opblock",
-                            timeout=10000,
-                        )
-                    except Exception:
-                        logger.debug(f"[{i+1}] {api_id}: Swagger UI not found, skipping params")
-
-                    params = await scanner._extract_params(page)
-                    ops = await scanner._extract_operations(page)
-
-                    if params:
-                        store.upsert_parameters(api_id, params)
-                        stats["params_added"] += len(params)
-                    if ops:
-                        store.upsert_operations(api_id, ops)
-                        stats["ops_added"] += len(ops)
-
-                    stats["success"] += 1
-
-                except Exception as e:
-                    logger.warning(f"[{i+1}/{len(targets)}] {api_id} failed: {e}")
-                    stats["failed"] += 1
-
-                if (i + 1) % 20 == 0:
-                    logger.info(
-                        f"Progress: {i+1}/{len(targets)} "
-                        f"(success={stats['success']}, params={stats['params_added']}, failed={stats['failed']})"
-                    )
-
-                await asyncio.sleep(delay)
-        finally:
-            await browser.close()
+            await page.wait_for_selector(
+                ".opblock-summary-control, .opblock-summary, .opblock",
+                timeout=10000,
+            )
+        except Exception:
+            logger.debug(f"{url}: Swagger UI not found, skipping params")
+        return await scanner._extract_params(page), await scanner._extract_operations(page)
+
+    async def fetch(api_id: str) -> tuple[list, list]:
+        url = detail_page_url(api_id, base_url)
+        return await pool.arun(lambda page: visit(page, url))
+
+    return fetch
+
+
+async def backfill(
+    *,
+    limit: int | None = None,
+    missing_only: bool = True,
+    workers: int = BACKFILL_WORKERS,
+    rate: float = BACKFILL_RATE_PER_SEC,
+    burst: int = BACKFILL_BURST,
+    batch_size: int = BACKFILL_WRITE_BATCH,
+    run_id: str | None = None,
+    resume: bool = False,
+    db_path: Path | str | None = None,
+    fetcher: Fetcher | None = None,
+) -> dict[str, Any]:
+    """파라미터가 없는 API의 상세 페이지를 크롤링하여 파라미터를 수집한다.
+
+    db_path를 생략하면 게시된 릴리스에 직접 쓰므로 카탈로그 쓰기 락을 쥔다 — 갱신이 스냅샷을
+    뜬 뒤 쓴 행은 새 버전 게시와 함께 사라지기 때문. 락을 얻은 뒤의 게시 버전에 쓴다.
+    """
+    options = dict(
+        limit=limit, missing_only=missing_only, workers=workers, rate=rate, burst=burst,
+        batch_size=batch_size, run_id=run_id, resume=resume, fetcher=fetcher,
+    )
+    if db_path is not None:
+        return await _backfill(connect(db_path), **options)
+    with get_resource_guard().catalog_writer():
+        return await _backfill(connect(read_pointer().db_path), **options)
+
+
+async def _backfill(
+    conn: sqlite3.Connection,
+    *,
+    limit: int | None,
+    missing_only: bool,
+    workers: int,
+    rate: float,
+    burst: int,
+    batch_size: int,
+    run_id: str | None,
+    resume: bool,
+    fetcher: Fetcher | None,
+) -> dict[str, Any]:
+    if resume and run_id is None:
+        run_id = latest_run_id(conn)
+        if run_id is None:
+            logger.info("No previous backfill run — starting a new one")
+    run_id = run_id or kst_now().strftime("%Y%m%d-%H%M%S")
+
+    targets = select_targets(conn, run_id, missing_only=missing_only, limit=limit)
+    logger.info(
+        f"Backfill run {run_id}: {len(targets)} targets "
+        f"(workers={workers}, rate={rate}/s, missing_only={missing_only})"
+    )
+    stats = {"run_id": run_id, "total": len(targets), "success": 0,
+             "params_added": 0, "ops_added": 0, "failed": 0}
+    if not targets:
+        return stats
+
+    own_pool = None
+    if fetcher is None:
+        if workers <= BROWSER_POOL_MAX_PAGES:
+            pool = get_browser_pool()
+        else:
+            pool = own_pool = BrowserPool(max_pages=workers)
+        fetcher = detail_page_fetcher(pool)
+
+    bucket = TokenBucket(rate, burst)
+    writer = _BatchWriter(conn, run_id, batch_size)
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for api_id in targets:
+        queue.put_nowait(api_id)
+
+    async def worker() -> None:
+        while True:
+            try:
+                api_id = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await bucket.acquire()
+            try:
+                params, ops = await fetcher(api_id)
+            except Exception as e:
+                logger.warning(f"{api_id} failed: {e}")
+                stats["failed"] += 1
+                writer.add_failure(api_id, f"{type(e).__name__}: {e}")
+            else:
+                stats["success"] += 1
+                stats["params_added"] += len(params)
+                stats["ops_added"] += len(ops)
+                writer.add_success(api_id, params, ops)
+
+            done = stats["success"] + stats["failed"]
+            if done % 20 == 0:
+                logger.info(
+                    f"Progress: {done}/{len(targets)} "
+                    f"(success={stats['success']}, params={stats['params_added']}, failed={stats['failed']})"
+                )
+
+    try:
+        with catalog_db.bulk_mode(conn):
+            await asyncio.gather(*(worker() for _ in range(max(1, min(workers, len(targets))))))
+    finally:
+        # 중단(Ctrl+C 등)되어도 처리한 만큼은 기록 → --resume으로 이어 간다
+        writer.flush()
+        if own_pool is not None:
+            own_pool.close()
 
     logger.info(f"Backfill complete: {stats}")
     return stats
@@ -116,17 +306,26 @@ def main() -> None:
     parser.add_argument("--limit", type=int, default=None, help="처리할 API 수 제한")
     parser.add_argument("--all", action="store_true", help="전체 API 백필")
     parser.add_argument("--missing-only", action="store_true", default=True, help="파라미터 없는 것만")
-    parser.add_argument("--delay", type=float, default=1.5, help="API간 대기 시간(초)")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS, help="동시 페이지 수")
+    parser.add_argument("--rate", type=float, default=BACKFILL_RATE_PER_SEC, help="초당 요청 수 (전체)")
+    parser.add_argument("--run-id", default=None, help="진행 기록 실행 ID (기본: 새로 생성)")
+    parser.add_argument("--resume", action="store_true", help="마지막 실행 ID로 이어서 실행")
     args = parser.parse_args()
 
     if args.all:
         args.missing_only = False
 
-    stats = asyncio.run(backfill(
-        limit=args.limit,
-        missing_only=args.missing_only,
-        delay=args.delay,
-    ))
+    try:
+        stats = asyncio.run(backfill(
+            limit=args.limit,
+            missing_only=args.missing_only,
+            workers=args.workers,
+            rate=args.rate,
+            run_id=args.run_id,
+            resume=args.resume,
+        ))
+    finally:
+        close_browser_pool()
     print(f"\nResults: {stats}")
 
 
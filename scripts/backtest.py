@@ -0,0 +1,355 @@
+"""백테스트 — 과거 배치 수백 건을 여러 설정으로 병렬 리플레이하여 S/A 산출량을 비교.
+
+배치 출처 (같은 batch_id면 앞쪽 우선):
+  1. 체크포인트 (output/runs/{batch_id}) — Phase 3 게이트부터 전체 리플레이
+  2. dashboard_batches.jsonl — 발행된 아이디어 (기록된 검증 점수/NUMR로 재채점·재등급)
+  3. ideas_archive.jsonl — 대시보드에 없는 배치 보충
+
+CPU 코어별 프로세스 풀에서 (설정 × 배치 청크) 단위로 scripts/replay.py의 결정적 단계를
+실행한다. 중복 판정 임계값을 바꾸는 설정은 아이디어 임베딩 행렬(.npy)을 각 워커가
+mmap으로 열어 공유하고(복사 없음), 직전 24시간 아이디어와의 최대 유사도로 다시 판정한다.
+행렬이 없으면 기록된 max_similarity를 사용한다.
+
+사용법:
+    python backtest.py --set 'GRADE_ABSOLUTE={"S":3.8,"A":3.0,"B":2.5,"C":1.5}' --name loose
+    python backtest.py --configs configs.json --workers 8
+    python backtest.py --build-embeddings   # 아이디어 임베딩 행렬 생성 (sentence-transformers 필요)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import (
+    DASHBOARD_BATCHES_PATH,
+    DEDUP_SIMILARITY_THRESHOLD,
+    IDEAS_ARCHIVE_PATH,
+    OUTPUT_DIR,
+    RUNS_DIR,
+    SLO,
+)
+from logger import get_logger
+from scripts.replay import (
+    GRADES,
+    RecordedBatch,
+    ReplayConfig,
+    build_tools,
+    config_overrides,
+    load_recorded_batches,
+    parse_overrides,
+    replay_batch,
+)
+from utils import KST, read_jsonl
+
+logger = get_logger("backtest")
+
+BACKTEST_DIR = OUTPUT_DIR / "backtest"
+IDEA_EMBEDDINGS_PATH = BACKTEST_DIR / "idea_embeddings.npy"  # 행 키: 같은 이름의 .json
+DEDUP_WINDOW = timedelta(hours=24)
+
+
+# ──────────────────────────── 배치 로드 ────────────────────────────
+
+
+def _batch_time(batch_id: str, timestamp: str | None = None) -> datetime:
+    """배치 시각 — 기록된 timestamp, 없으면 batch_id 접두(YYYYMMDD-HHMM)."""
+    if timestamp:
+        try:
+            return datetime.fromisoformat(timestamp)
+        except ValueError:
+            pass
+    try:
+        return datetime.strptime(batch_id[:13], "%Y%m%d-%H%M").replace(tzinfo=KST)
+    except ValueError:
+        return datetime.min.replace(tzinfo=KST)
+
+
+def _published_batch(batch_id: str, ideas: list[dict[str, Any]], timestamp: str | None) -> RecordedBatch:
+    """발행된 아이디어(Phase 5 결과)를 리플레이 가능한 기록 형태로 바꾼다.
+
+    Phase 3/4 입력이 없으므로 기록된 적합도/검증 점수를 그대로 쓰고
+    새 임계값·가중치·등급 기준만 다시 적용된다.
+    """
+    ideas = [dict(i) for i in ideas]
+    return RecordedBatch(batch_id, {
+        2: {"hypotheses": ideas, "timestamp": timestamp},
+        3: {"matches": [
+            {"hypothesis_id": i.get("id", ""), "feasibility_pct": i.get("feasibility_pct"),
+             "passed": True, "matched_apis": i.get("matched_apis", [])}
+            for i in ideas
+        ]},
+        4: {"validations": ideas, "skipped": all(i.get("validation_score") is None for i in ideas)},
+        5: {"numr_scores": {i.get("id", ""): i.get("scores", {}) for i in ideas}, "duplicate_ids": []},
+    })
+
+
+def load_backtest_batches(
+    runs_dir: Path | str = RUNS_DIR,
+    dashboard_path: Path | str = DASHBOARD_BATCHES_PATH,
+    archive_path: Path | str = IDEAS_ARCHIVE_PATH,
+) -> list[RecordedBatch]:
+    """체크포인트 → 대시보드 → 아카이브 순으로 배치를 모아 시간순으로 반환한다."""
+    batches: dict[str, RecordedBatch] = {b.batch_id: b for b in load_recorded_batches(runs_dir)}
+
+    for row in read_jsonl(dashboard_path):
+        bid = row.get("batch_id", "")
+        if bid and bid not in batches and row.get("ideas"):
+            batches[bid] = _published_batch(bid, row["ideas"], row.get("timestamp"))
+
+    archived: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    archived_at: dict[str, str] = {}
+    for row in read_jsonl(archive_path):
+        bid = row.get("batch_id", "")
+        if bid and bid not in batches:
+            archived[bid].append(row)
+            archived_at.setdefault(bid, row.get("archived_at", ""))
+    for bid, ideas in archived.items():
+        batches[bid] = _published_batch(bid, ideas, archived_at.get(bid))
+
+    return sorted(batches.values(), key=lambda b: _batch_time(b.batch_id, b.phases[2].get("timestamp")))
+
+
+# ──────────────────────────── 임베딩 기반 중복 판정 ────────────────────────────
+
+
+def _idea_text(idea: dict[str, Any]) -> str:
+    return f"{idea.get('service_name', '')}: {idea.get('problem', '')} {idea.get('solution', '')}".strip()
+
+
+def _idea_keys(batches: list[RecordedBatch]) -> list[tuple[str, str, str]]:
+    """(batch_id, idea_id, 시각 ISO) — 임베딩 행렬 행 순서."""
+    keys = []
+    for b in batches:
+        when = _batch_time(b.batch_id, b.phases[2].get("timestamp")).isoformat()
+        keys.extend((b.batch_id, h.get("id", ""), when) for h in b.phases[2].get("hypotheses", []))
+    return keys
+
+
+def build_idea_embeddings(batches: list[RecordedBatch], path: Path | str = IDEA_EMBEDDINGS_PATH) -> int:
+    """모든 아이디어를 1회 인코딩하여 정규화 행렬(.npy)과 행 키(.json)를 저장한다."""
+    from embedding_utils import EmbeddingService
+
+    path = Path(path)
+    texts = [_idea_text(h) for b in batches for h in b.phases[2].get("hypotheses", [])]
+    with EmbeddingService() as svc:
+        matrix = svc.encode(texts).astype(np.float32)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.save(path, matrix)
+    path.with_suffix(".json").write_text(json.dumps(_idea_keys(batches), ensure_ascii=False), encoding="utf-8")
+    return len(texts)
+
+
+class MatrixDedup:
+    """임베딩 행렬로 직전 24시간 아이디어와의 최대 유사도를 계산하여 중복을 판정한다.
+
+    행렬이 없거나 행이 없는 아이디어는 기록된 max_similarity를 쓴다.
+    """
+
+    def __init__(self, threshold: float, matrix: np.ndarray | None, keys: list[list[str]]) -> None:
+        self.threshold = threshold
+        self.matrix = matrix
+        self.rows = {(bid, iid): n for n, (bid, iid, _) in enumerate(keys)}
+        self.times = [datetime.fromisoformat(when) for _, _, when in keys]
+        self.batch_id = ""
+
+    def for_batch(self, batch_id: str) -> MatrixDedup:
+        self.batch_id = batch_id
+        return self
+
+    def _max_similarity(self, idea: dict[str, Any]) -> float | None:
+        row = self.rows.get((self.batch_id, idea.get("id", "")))
+        if self.matrix is None or row is None:
+            return None
+        when = self.times[row]
+        window = [
+            n for n, t in enumerate(self.times)
+            if when - DEDUP_WINDOW <= t < when
+        ]
+        if not window:
+            return 0.0
+        return float(np.max(self.matrix[window] @ self.matrix[row]))
+
+    def check_duplicates(self, ideas: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        for idea in ideas:
+            sim = self._max_similarity(idea)
+            if sim is None:
+                sim = float(idea.get("max_similarity") or 0.0)
+            idea["max_similarity"] = sim
+            idea["is_duplicate"] = sim >= self.threshold
+        return ideas
+
+
+# ──────────────────────────── 워커 ────────────────────────────
+
+_worker_matrix: np.ndarray | None = None
+_worker_keys: list[list[str]] = []
+
+
+def _init_worker(embeddings_path: str | None, keys: list[list[str]]) -> None:
+    """워커 초기화 — 임베딩 행렬을 읽기 전용 mmap으로 연다 (프로세스 간 페이지 캐시 공유)."""
+    global _worker_matrix, _worker_keys
+    _worker_matrix = np.load(embeddings_path, mmap_mode="r") if embeddings_path else None
+    _worker_keys = keys
+
+
+def _run_chunk(replay_config: ReplayConfig, batches: list[RecordedBatch]) -> list[dict[str, Any]]:
+    """설정 1개 × 배치 청크 리플레이 (워커 프로세스에서 실행)."""
+    with config_overrides(replay_config.overrides):
+        tools = build_tools({})  # 중복 판정은 아래 MatrixDedup으로 대체
+        dedup = None
+        if "DEDUP_SIMILARITY_THRESHOLD" in replay_config.overrides:
+            dedup = MatrixDedup(
+                replay_config.overrides["DEDUP_SIMILARITY_THRESHOLD"], _worker_matrix, _worker_keys,
+            )
+        results = []
+        for batch in batches:
+            batch_tools = replace(tools, dedup=dedup.for_batch(batch.batch_id)) if dedup else tools
+            result = replay_batch(batch, batch_tools)
+            result["batch_time"] = _batch_time(batch.batch_id, batch.phases[2].get("timestamp")).isoformat()
+            results.append(result)
+        return results
+
+
+# ──────────────────────────── 지표 ────────────────────────────
+
+
+def config_metrics(replay_config: ReplayConfig, results: list[dict[str, Any]]) -> dict[str, Any]:
+    """설정별 지표 — 등급 분포, S/A 비율, 주간 S/A 산출량 대비 SLO."""
+    grades: Counter = Counter()
+    weekly_sa: Counter = Counter()
+    for r in results:
+        grades.update(r["grades"])
+        year, week, _ = datetime.fromisoformat(r["batch_time"]).isocalendar()
+        weekly_sa[f"{year}-W{week:02d}"] += r["grades"].get("S", 0) + r["grades"].get("A", 0)
+
+    ideas = sum(grades.values())
+    sa = grades.get("S", 0) + grades.get("A", 0)
+    target = SLO["weekly_sa_output"]
+    weeks = sorted(weekly_sa)
+    return {
+        "config": replay_config.name,
+        "overrides": replay_config.overrides,
+        "batches": len(results),
+        "ideas": ideas,
+        "grades": {g: grades.get(g, 0) for g in GRADES},
+        "sa_count": sa,
+        "sa_rate": round(sa / ideas, 4) if ideas else 0.0,
+        "weekly_sa": {w: weekly_sa[w] for w in weeks},
+        "weekly_sa_avg": round(sa / len(weeks), 2) if weeks else 0.0,
+        "weekly_sa_target": target,
+        "weeks_meeting_slo": sum(1 for w in weeks if weekly_sa[w] >= target),
+        "weeks": len(weeks),
+    }
+
+
+def run_backtest(
+    batches: list[RecordedBatch],
+    candidates: list[ReplayConfig],
+    *,
+    workers: int | None = None,
+    embeddings_path: Path | str | None = None,
+) -> dict[str, Any]:
+    """baseline + 후보 설정을 프로세스 풀에서 리플레이하고 설정별 지표를 반환한다."""
+    configs = [ReplayConfig("baseline")] + candidates
+    workers = max(1, workers or os.cpu_count() or 1)
+    keys: list[list[str]] = []
+    keys_path = Path(embeddings_path).with_suffix(".json") if embeddings_path else None
+    if embeddings_path and Path(embeddings_path).exists() and keys_path.exists():
+        keys = json.loads(keys_path.read_text(encoding="utf-8"))
+    else:
+        embeddings_path = None
+
+    n_chunks = min(workers, len(batches)) or 1
+    chunks = [batches[i::n_chunks] for i in range(n_chunks)]
+    results: dict[str, list[dict[str, Any]]] = {c.name: [] for c in configs}
+
+    if workers == 1:
+        _init_worker(str(embeddings_path) if embeddings_path else None, keys)
+        for c in configs:
+            for chunk in chunks:
+                results[c.name].extend(_run_chunk(c, chunk))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(str(embeddings_path) if embeddings_path else None, keys),
+        ) as pool:
+            futures = [(c.name, pool.submit(_run_chunk, c, chunk)) for c in configs for chunk in chunks]
+            for name, future in futures:
+                results[name].extend(future.result())
+
+    metrics = [config_metrics(c, results[c.name]) for c in configs]
+    baseline = metrics[0]
+    for m in metrics[1:]:
+        m["delta"] = {g: m["grades"][g] - baseline["grades"][g] for g in GRADES}
+        m["sa_rate_delta"] = round(m["sa_rate"] - baseline["sa_rate"], 4)
+    return {"baseline": baseline, "candidates": metrics[1:]}
+
+
+def _load_configs(path: Path) -> list[ReplayConfig]:
+    """설정 파일 — [{"name": ..., "overrides": {...}}, ...]."""
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return [ReplayConfig(e["name"], e.get("overrides", {})) for e in entries]
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="과거 배치 병렬 백테스트 — 설정별 S/A 산출량 비교")
+    parser.add_argument("--configs", type=Path, help='후보 설정 JSON [{"name": ..., "overrides": {...}}]')
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help="단일 후보 설정 오버라이드 (JSON 값, 반복 가능)")
+    parser.add_argument("--name", default="candidate", help="--set 후보 이름")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--runs-dir", type=Path, default=RUNS_DIR)
+    parser.add_argument("--embeddings", type=Path, default=IDEA_EMBEDDINGS_PATH,
+                        help="아이디어 임베딩 행렬 (.npy, mmap 공유)")
+    parser.add_argument("--build-embeddings", action="store_true", help="아이디어 임베딩 행렬 생성 후 종료")
+    args = parser.parse_args()
+
+    t0 = time.monotonic()
+    batches = load_backtest_batches(args.runs_dir)
+
+    if args.build_embeddings:
+        count = build_idea_embeddings(batches, args.embeddings)
+        logger.info(f"Backtest: encoded {count} ideas → {args.embeddings}")
+        return
+
+    try:
+        candidates = _load_configs(args.configs) if args.configs else []
+        if args.set:
+            candidates.append(ReplayConfig(args.name, parse_overrides(args.set)))
+    except (ValueError, KeyError, json.JSONDecodeError) as e:
+        parser.error(str(e))
+
+    if any("DEDUP_SIMILARITY_THRESHOLD" in c.overrides for c in candidates) and not args.embeddings.exists():
+        logger.warning(
+            "Backtest: no idea embeddings — dedup uses recorded max_similarity "
+            f"(baseline threshold {DEDUP_SIMILARITY_THRESHOLD}); run --build-embeddings for full recompute"
+        )
+
+    report = run_backtest(batches, candidates, workers=args.workers, embeddings_path=args.embeddings)
+    report["duration_sec"] = round(time.monotonic() - t0, 2)
+    logger.info(
+        f"Backtest: {len(batches)} batches × {len(candidates) + 1} configs in {report['duration_sec']}s"
+    )
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@
   - 주간 증분: 매주 일요일 03:00 KST
   - 월간 전수: 첫째 일요일 03:00 KST
 
+갱신은 작업본(config 기존 경로 — 스캐너·인덱서가 쓰는 곳)에서 하고, 끝나면 작업본을 새 카탈로그
+릴리스(catalog_vN + index_vN + id_map_vN)로 스냅샷해 포인터 파일을 원자 교체로 게시한다
+(catalog_release.py). 엔진 런은 게시된 릴리스만 읽는다.
+
 사용법:
     python catalog_refresh.py --mode incremental
     python catalog_refresh.py --mode full
@@ -16,6 +20,7 @@ import asyncio
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Awaitable, Callable
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
@@ -25,6 +30,7 @@ _CATALOG_SCRIPTS = _PROJECT_ROOT / ".claude" / "skills" / "catalog-manager" / "s
 if str(_CATALOG_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(_CATALOG_SCRIPTS))
 
+from config import CATALOG_CONDITIONAL_SCAN, CATALOG_FULL_PAGES, CATALOG_INCREMENTAL_PAGES
 from logger import get_logger
 
 logger = get_logger("catalog_refresh")
@@ -57,7 +63,147 @@ def determine_mode() -> str:
     return "skip"
 
 
+def _refresh_derived_tables() -> dict:
+    """파생 테이블 갱신 — 조인 키 그래프, 도메인 요약(dirty만), 사전 계산 이웃 (임베딩 파일 갱신 이후).
+
+    조인 그래프는 api_parameters 전체를 한 번 정규화하고 (수 초), 이웃은 그 그래프와
+    catalog_embeddings.npy 전체 쌍 kNN으로 만든다.
+    """
+    from api_neighbors import build_neighbor_table
+    from catalog_db import get_catalog_connections
+    from domain_summary import refresh_domain_summaries
+    from join_graph import rebuild_join_graph
+
+    conn = get_catalog_connections().writer
+    result: dict = {"join_graph": rebuild_join_graph(conn)}
+    # 스캔으로 바뀐 카테고리만 재계산 + Phase 2 조각 갱신
+    result["domain_summaries"] = refresh_domain_summaries(conn)
+    try:
+        result["neighbors"] = build_neighbor_table(conn)
+    except FileNotFoundError as e:
+        logger.warning(f"Neighbor table skipped — embeddings not found: {e}")
+    return result
+
+
+def _listing_parser(scanner) -> Callable[[str], list[dict]] | None:
+    """조건부 스캔에 쓸 정적 HTML 목록 파서. 꺼져 있거나 스캐너에 아직 없으면 None (렌더링 스캔)."""
+    if not CATALOG_CONDITIONAL_SCAN:
+        return None
+    parse_listing = getattr(scanner, "parse_listing", None)
+    if parse_listing is None:
+        logger.warning("CatalogScanner has no parse_listing — falling back to the rendered scan")
+    return parse_listing
+
+
+async def _conditional_scan(
+    parse_listing: Callable[[str], list[dict]], max_pages: int, *, full: bool,
+) -> dict:
+    """HTTP 조건부 GET + 콘텐츠 지문 스캔 — 바뀐 API만 브라우저 풀로 상세 렌더링한다.
+
+    증분은 라이브 테이블에 페이지마다 바로 쓴다. 전수는 샤드를 CATALOG_SCAN_WORKERS개 동시에
+    돌려 스테이징에 모은 뒤 한 트랜잭션으로 교체하고, 목록 페이지를 모두 받았을 때만
+    목록에 연속으로 없던 API를 폐지로 표시한다. HTTP·렌더링 모두 토큰 버킷 하나로 전체 요청률을 제한.
+    """
+    from browser_pool import BrowserPool, get_browser_pool
+    from catalog_db import get_catalog_connections
+    from catalog_fetch import ConditionalFetcher, conditional_scan, listing_page_urls
+    from catalog_staging import publish_staging, sharded_scan
+    from config import (
+        BROWSER_POOL_MAX_PAGES,
+        CATALOG_FULL_LISTING_URL,
+        CATALOG_HTTP_BURST,
+        CATALOG_HTTP_RATE_PER_SEC,
+        CATALOG_SCAN_WORKERS,
+    )
+    from scripts.backfill_params import detail_page_fetcher
+    from utils import TokenBucket
+
+    conn = get_catalog_connections().writer
+    own_pool = None
+    if full and CATALOG_SCAN_WORKERS > BROWSER_POOL_MAX_PAGES:
+        pool = own_pool = BrowserPool(max_pages=CATALOG_SCAN_WORKERS)
+    else:
+        pool = get_browser_pool()
+    bucket = TokenBucket(CATALOG_HTTP_RATE_PER_SEC, CATALOG_HTTP_BURST)
+    fetch_detail = detail_page_fetcher(pool)
+
+    async def render_detail(row: dict) -> tuple[list, list]:
+        await bucket.acquire()
+        return await fetch_detail(row["api_id"])
+
+    async def render_listing(url: str) -> str:
+        async def visit(page) -> str:
+            await page.goto(url)
+            await page.wait_for_load_state("networkidle")
+            return await page.content()
+
+        await bucket.acquire()
+        return await pool.arun(visit)
+
+    fetcher = ConditionalFetcher(conn, bucket=bucket)
+    scan_args = dict(
+        fetcher=fetcher,
+        parse_listing=parse_listing,
+        render_detail=render_detail,
+        render_listing=render_listing,
+    )
+    try:
+        if full:
+            urls = listing_page_urls(max_pages, CATALOG_FULL_LISTING_URL)
+            result = await sharded_scan(conn, urls, **scan_args)
+            if not result["complete"]:
+                logger.warning(f"{len(result['failed_shards'])} shards incomplete — skipping deactivation")
+            published = publish_staging(conn, deactivate=result["complete"])
+            result.update(total=published["seen"], updated=published["updated"],
+                          missing=published["missing"], deactivated=published["deactivated"])
+        else:
+            result = await conditional_scan(conn, listing_page_urls(max_pages), **scan_args)
+            result.pop("listed_urls")
+            result.update(total=len(result.pop("seen")), updated=result["apis_changed"])
+    finally:
+        await fetcher.aclose()
+        if own_pool is not None:
+            own_pool.close()
+    return result
+
+
+async def _build_release(refresh: Callable[[], Awaitable[dict]]) -> dict:
+    """작업본에서 갱신하고, 성공하면 작업본을 새 릴리스(vN)로 스냅샷해 게시한다 (블루/그린).
+
+    스캐너·인덱서·도메인 요약 생성기는 config의 기존 경로에 쓰므로, 갱신 중에는 이 프로세스의
+    기본 카탈로그 경로(get_catalog_connections, EmbeddingService)도 같은 작업본을 가리킨다.
+    진행 중인 엔진 런은 이전 버전을 끝까지 읽고 다음 런부터 vN을 쓴다. 실패하면 게시하지 않는다.
+    동기화부터 게시까지 카탈로그 쓰기 락을 쥐므로 백필·마이그레이션·다른 갱신과 겹치지 않는다.
+    """
+    from catalog_db import close_catalog_connections
+    from catalog_release import prepare_release, publish_release, sync_working_copy, use_release
+    from resource_guard import get_resource_guard
+
+    # 백필·마이그레이션이 게시본에 쓰는 동안 동기화하지 않도록, 버전 번호도 겹치지 않도록
+    with get_resource_guard().catalog_writer():
+        working = sync_working_copy()
+        with use_release(working):
+            try:
+                result = await refresh()
+            finally:
+                # 작업본 연결을 닫아야 스냅샷에 WAL 내용까지 담긴다
+                close_catalog_connections()
+        release = prepare_release(base=working)
+        result["release"] = publish_release(release)
+    return result
+
+
 async def run_incremental() -> dict:
+    """증분 스캔 — 최근 변경분만 새 릴리스에 반영해 게시."""
+    return await _build_release(_refresh_incremental)
+
+
+async def run_full() -> dict:
+    """전수 스캔 — 전체 카탈로그를 새 릴리스로 재구축해 게시."""
+    return await _build_release(_refresh_full)
+
+
+async def _refresh_incremental() -> dict:
     """증분 스캔 — 최근 변경분만 갱신."""
     logger.info("Starting incremental catalog refresh")
 
@@ -65,33 +211,44 @@ async def run_incremental() -> dict:
     from catalog_scanner import CatalogScanner
 
     scanner = CatalogScanner()
+    parse_listing = _listing_parser(scanner)
 
-    # 증분 스캔
-    scan_result = await scanner.scan_incremental()
+    # 증분 스캔 (최근 수정순 목록 앞쪽만)
+    if parse_listing is not None:
+        scan_result = await _conditional_scan(parse_listing, CATALOG_INCREMENTAL_PAGES, full=False)
+    else:
+        scan_result = await scanner.scan_incremental()
     logger.info(f"Incremental scan: {scan_result.get('updated', 0)} APIs updated")
 
     # 인덱스 갱신
     index_result = build_incremental_index()
     logger.info(f"Index updated: {index_result.get('total', 0)} entries")
 
+    derived = _refresh_derived_tables()
+
     return {
         "mode": "incremental",
         "scan": scan_result,
         "index": index_result,
+        "derived": derived,
     }
 
 
-async def run_full() -> dict:
+async def _refresh_full() -> dict:
     """전수 스캔 — 전체 카탈로그 재구축."""
-    logger.info("Starting full catalog refresh (this may take 2-4 hours)")
+    logger.info("Starting full catalog refresh")
 
     from catalog_indexer import build_full_index, generate_domain_summaries
     from catalog_scanner import CatalogScanner
 
     scanner = CatalogScanner()
+    parse_listing = _listing_parser(scanner)
 
-    # 전수 스캔
-    scan_result = await scanner.scan_full(max_pages=1200)
+    # 전수 스캔 — 조건부 스캔이면 대부분 304/지문 일치로 끝난다
+    if parse_listing is not None:
+        scan_result = await _conditional_scan(parse_listing, CATALOG_FULL_PAGES, full=True)
+    else:
+        scan_result = await scanner.scan_full(max_pages=CATALOG_FULL_PAGES)
     logger.info(f"Full scan: {scan_result.get('total', 0)} APIs cataloged")
 
     # 전체 인덱스 재생성
@@ -102,11 +259,14 @@ async def run_full() -> dict:
     summaries = generate_domain_summaries()
     logger.info(f"Domain summaries: {len(summaries)} categories")
 
+    derived = _refresh_derived_tables()
+
     return {
         "mode": "full",
         "scan": scan_result,
         "index": index_result,
         "summaries_count": len(summaries),
+        "derived": derived,
     }
 
 
@@ -133,10 +293,15 @@ def main() -> None:
 
     logger.info(f"Catalog refresh mode: {mode}")
 
-    if mode == "incremental":
-        result = asyncio.run(run_incremental())
-    else:
-        result = asyncio.run(run_full())
+    from browser_pool import close_browser_pool
+
+    try:
+        if mode == "incremental":
+            result = asyncio.run(run_incremental())
+        else:
+            result = asyncio.run(run_full())
+    finally:
+        close_browser_pool()
 
     logger.info(f"Catalog refresh completed: {result}")
 
@@ -11,6 +11,7 @@ catalog_metadata 테이블의 schema_version 키를 읽어 현재 버전을 확
 
 from __future__ import annotations
 
+import sqlite3
 import sys
 from pathlib import Path
 from typing import Any, Callable
@@ -23,8 +24,11 @@ _CATALOG_SCRIPTS = _PROJECT_ROOT / ".claude" / "skills" / "catalog-manager" / "s
 if str(_CATALOG_SCRIPTS) not in sys.path:
     sys.path.insert(0, str(_CATALOG_SCRIPTS))
 
-from config import CATALOG_DB_PATH, SCHEMA_VERSION
+from catalog_db import connect_readonly
+from catalog_release import active_release, read_pointer
+from config import SCHEMA_VERSION
 from logger import get_logger
+from resource_guard import get_resource_guard
 
 logger = get_logger("db_migrate")
 
@@ -92,17 +96,25 @@ def get_migration_path(current: str, target: str) -> list[tuple[str, str]]:
 
 
 class DBMigrator:
-    """DB 스키마 마이그레이터."""
+    """DB 스키마 마이그레이터.
 
-    def __init__(self, db_path: Path | None = None) -> None:
-        self.db_path = db_path or CATALOG_DB_PATH
+    db_path를 생략하면 이 프로세스의 활성 릴리스. 게시본을 마이그레이션할 때는 main()처럼
+    카탈로그 쓰기 락을 쥔 뒤 그 시점의 게시 경로(read_pointer)를 넘긴다.
+    catalog_db의 연결(connect, 공유 쓰기 연결)은 ensure_schema가 schema_version을 최신으로 심어
+    적용할 마이그레이션을 가리므로 쓰지 않는다. readonly면 버전 조회만 (DB를 바꾸지 않음).
+    """
+
+    def __init__(self, db_path: Path | None = None, *, readonly: bool = False) -> None:
+        self.db_path = db_path or active_release().db_path  # 게시된 카탈로그 릴리스
+        self.readonly = readonly
         self._conn = None
 
     def _connect(self):
-        import sqlite3
-
         if self._conn is None:
-            self._conn = sqlite3.connect(str(self.db_path))
+            if self.readonly:
+                self._conn = connect_readonly(self.db_path)
+            else:
+                self._conn = sqlite3.connect(str(self.db_path))
         return self._conn
 
     def close(self):
@@ -187,18 +199,22 @@ def main() -> None:
     parser.add_argument("--current", action="store_true", help="현재 버전만 출력")
     args = parser.parse_args()
 
-    migrator = DBMigrator()
-
-    try:
-        if args.current:
-            ver = migrator.get_current_version()
-            print(f"Current schema version: {ver}")
-            return
-
-        result = migrator.migrate(target=args.target)
-        print(f"Migration result: {result}")
-    finally:
-        migrator.close()
+    if args.current:
+        migrator = DBMigrator(readonly=True)
+        try:
+            print(f"Current schema version: {migrator.get_current_version()}")
+        finally:
+            migrator.close()
+        return
+
+    # 게시된 릴리스에 직접 쓴다 — 카탈로그 갱신과 겹치면 새 버전 게시와 함께 사라진다
+    with get_resource_guard().catalog_writer():
+        migrator = DBMigrator(read_pointer().db_path)
+        try:
+            result = migrator.migrate(target=args.target)
+            print(f"Migration result: {result}")
+        finally:
+            migrator.close()
 
 
 if __name__ == "__main__":
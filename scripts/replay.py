@@ -0,0 +1,354 @@
+"""리플레이 — 기록된 배치의 결정적 단계만 대체 설정으로 재실행하여 등급 분포를 비교.
+
+체크포인트(output/runs/{batch_id}/phaseN.json)에 기록된 Phase 1/2 출력과 Claude 응답
+(검증 판단값, NUMR 점수)을 그대로 쓰고, LLM 호출 없이 다음 단계만 다시 계산한다.
+  - Phase 3: FeasibilityCalculator (기록된 매칭 입력으로 적합도 게이트 재계산)
+  - Phase 4: ValidationScorer (기록된 Claude 판단값/경쟁사/프록시 점수)
+  - Phase 5: NUMRVScorer → DedupEngine → GradeClassifier
+
+DedupEngine은 DEDUP_SIMILARITY_THRESHOLD를 바꿀 때만 다시 돌리고(임베딩 필요),
+그 외에는 기록된 중복 판정을 재사용한다.
+
+사용법:
+    python replay.py --set FEASIBILITY_PASS_THRESHOLD=0.35
+    python replay.py --set 'NUMRV_WEIGHTS={"N":0.2,"U":0.2,"M":0.2,"R":0.2,"V":0.2}' --name flat
+    python replay.py --batch 20260301-0900-ab12cd34 --set VALIDATION_PASS_THRESHOLD=45
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import config
+from config import RUNS_DIR
+from logger import get_logger
+from scripts.run_engine import IdeationEngine, RunCheckpoint
+
+logger = get_logger("replay")
+
+# 리플레이로 조정 가능한 설정 — 결정적 단계만 영향을 받는 값
+TUNABLE_SETTINGS = (
+    "FEASIBILITY_PASS_THRESHOLD",
+    "VALIDATION_PASS_THRESHOLD",
+    "DEDUP_SIMILARITY_THRESHOLD",
+    "NUMRV_WEIGHTS",
+    "GRADE_ABSOLUTE",
+    "GRADE_PERCENTILE",
+)
+GRADES = ("S", "A", "B", "C", "D")
+
+# 기록된 가설에서 지우고 다시 계산하는 필드
+_DERIVED_FIELDS = (
+    "validation_score", "validation_passed", "validation_breakdown", "competitors_count",
+    "default_v", "depth_mode", "scores", "weighted_score", "grade", "is_duplicate",
+)
+
+
+# ──────────────────────────── 설정 오버라이드 ────────────────────────────
+
+
+@dataclass
+class ReplayConfig:
+    """리플레이 설정 — 이름 + config 값 오버라이드."""
+
+    name: str
+    overrides: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        unknown = set(self.overrides) - set(TUNABLE_SETTINGS)
+        if unknown:
+            raise ValueError(f"Not replay-tunable: {sorted(unknown)} (allowed: {TUNABLE_SETTINGS})")
+
+
+@contextmanager
+def config_overrides(overrides: dict[str, Any]) -> Iterator[None]:
+    """config 값과, 그 값을 `from config import ...`로 가져간 모듈 전역을 함께 바꾼다.
+
+    스코어러 모듈은 임포트 시점에 config 값을 바인딩하므로 config 모듈만 바꿔서는
+    반영되지 않는다. 원래 값과 같은 객체를 가진 동명 전역만 교체하고 종료 시 복원한다.
+    프로세스 전역 상태를 바꾸므로 스레드 간 공유하지 않는다.
+    """
+    patched: list[tuple[Any, str, Any]] = []
+    try:
+        for name, value in overrides.items():
+            original = getattr(config, name)
+            for module in list(sys.modules.values()):
+                namespace = getattr(module, "__dict__", None)
+                if namespace is not None and namespace.get(name) is original:
+                    patched.append((module, name, original))
+                    setattr(module, name, value)
+        yield
+    finally:
+        for module, name, original in reversed(patched):
+            setattr(module, name, original)
+
+
+# ──────────────────────────── 기록 로드 ────────────────────────────
+
+
+@dataclass
+class RecordedBatch:
+    batch_id: str
+    phases: dict[int, dict[str, Any]]
+
+
+def load_recorded_batches(
+    runs_dir: Path | str = RUNS_DIR, batch_ids: list[str] | None = None
+) -> list[RecordedBatch]:
+    """체크포인트 디렉터리에서 Phase 2~5가 완료된 배치를 읽는다."""
+    runs_dir = Path(runs_dir)
+    if batch_ids is None:
+        batch_ids = sorted(p.name for p in runs_dir.iterdir() if p.is_dir()) if runs_dir.is_dir() else []
+
+    batches: list[RecordedBatch] = []
+    for batch_id in batch_ids:
+        checkpoint = RunCheckpoint(batch_id, runs_dir)
+        phases = {n: checkpoint.load(n) for n in (1, 2, 3, 4, 5)}
+        if any(phases[n] is None for n in (2, 3, 4, 5)):
+            logger.info(f"Replay: skipping incomplete batch {batch_id}")
+            continue
+        batches.append(RecordedBatch(batch_id, {n: p for n, p in phases.items() if p is not None}))
+    return batches
+
+
+# ──────────────────────────── 결정적 단계 재실행 ────────────────────────────
+
+
+@dataclass
+class ReplayTools:
+    feasibility: Any
+    validation: Any
+    numrv: Any
+    grader: Any
+    dedup: Any | None = None  # None → 기록된 중복 판정 재사용
+
+
+def _scorer_classes() -> dict[str, type]:
+    """스코어러 클래스를 임포트한다 (오버라이드 전에 모듈 전역이 존재하도록)."""
+    from dedup_engine import DedupEngine
+    from feasibility import FeasibilityCalculator
+    from grade_classifier import GradeClassifier
+    from numrv_scorer import NUMRVScorer
+    from validation_scorer import ValidationScorer
+
+    return {
+        "feasibility": FeasibilityCalculator,
+        "validation": ValidationScorer,
+        "numrv": NUMRVScorer,
+        "grader": GradeClassifier,
+        "dedup": DedupEngine,
+    }
+
+
+def build_tools(overrides: dict[str, Any]) -> ReplayTools:
+    """현재(오버라이드 적용된) 설정으로 스코어러를 생성한다."""
+    classes = _scorer_classes()
+    dedup = None
+    if "DEDUP_SIMILARITY_THRESHOLD" in overrides:
+        dedup = classes["dedup"](threshold=overrides["DEDUP_SIMILARITY_THRESHOLD"])
+    return ReplayTools(
+        feasibility=classes["feasibility"](),
+        validation=classes["validation"](),
+        numrv=classes["numrv"](),
+        grader=classes["grader"](),
+        dedup=dedup,
+    )
+
+
+def replay_batch(batch: RecordedBatch, tools: ReplayTools) -> dict[str, Any]:
+    """배치 1건을 Phase 3 게이트부터 Phase 5 등급까지 다시 계산한다.
+
+    새 설정에서 처음 Phase 3를 통과한 가설은 Claude 검증 기록이 없으므로
+    unvalidated로 집계하고 제외한다.
+    """
+    p2, p3, p4, p5 = (batch.phases[n] for n in (2, 3, 4, 5))
+    hypotheses = {h.get("id", ""): h for h in p2.get("hypotheses", [])}
+    for h in p3.get("passed_hypotheses", []):
+        hypotheses.setdefault(h.get("id", ""), h)
+
+    # Phase 3: 적합도 게이트
+    passed: list[dict[str, Any]] = []
+    for m in p3.get("matches", []):
+        hid = m.get("hypothesis_id", "")
+        inputs = m.get("feasibility_inputs")
+        if inputs:
+            feasibility = tools.feasibility.calculate(**inputs)
+            ok, pct = feasibility["passed"], feasibility["feasibility_pct"]
+        else:
+            ok, pct = m.get("passed", False), m.get("feasibility_pct")
+        if not ok:
+            continue
+        hyp = {k: v for k, v in hypotheses.get(hid, {"id": hid}).items() if k not in _DERIVED_FIELDS}
+        hyp["feasibility_pct"] = pct
+        hyp["matched_apis"] = m.get("matched_apis", [])
+        passed.append(hyp)
+
+    # Phase 4: 검증 점수
+    is_skipped = p4.get("skipped", False)
+    default_v = p4.get("default_v")
+    inputs_map = p4.get("validation_inputs", {})
+    recorded = {v.get("id", ""): v for v in p4.get("validations", [])}
+    validations: list[dict[str, Any]] = []
+    unvalidated = 0
+    for hyp in passed:
+        hid = hyp.get("id", "")
+        if is_skipped:
+            hyp.update(validation_score=None, validation_passed=True, default_v=default_v or 3)
+        elif hid in inputs_map:
+            inputs = inputs_map[hid]
+            result = tools.validation.calculate(**inputs)
+            hyp["validation_score"] = result["total_score"]
+            hyp["validation_passed"] = result["passed"]
+            hyp["validation_breakdown"] = result["breakdown"]
+            hyp["competitors_count"] = len(inputs.get("competitors", []))
+        elif hid in recorded:
+            # 입력 기록 이전 배치 — 기록된 점수에 새 임계값만 적용
+            score = recorded[hid].get("validation_score")
+            hyp["validation_score"] = score
+            hyp["validation_passed"] = score is None or score >= config.VALIDATION_PASS_THRESHOLD
+            hyp["competitors_count"] = recorded[hid].get("competitors_count", 0)
+            if recorded[hid].get("default_v") is not None:
+                hyp["default_v"] = recorded[hid]["default_v"]
+        else:
+            unvalidated += 1
+            continue
+        if hyp["validation_passed"]:
+            validations.append(hyp)
+
+    # Phase 5: NUMR-V → 중복제거 → 등급
+    numr_scores = dict(p5.get("numr_scores") or {})
+    if not numr_scores:
+        numr_scores = {s.get("id", ""): s.get("scores", {}) for s in p5.get("scored_ideas", [])}
+    for v in validations:
+        numr = numr_scores.get(v.get("id", ""))
+        if numr and all(k in numr for k in ("N", "U", "M", "R")):
+            v["scores"] = {k: float(numr[k]) for k in ("N", "U", "M", "R")}
+            v["scores"]["V"] = IdeationEngine._v_dimension(v, is_skipped, default_v)
+        else:
+            v["scores"] = IdeationEngine._heuristic_numrv(v, is_skipped, default_v)
+
+    scored = tools.numrv.score_batch(validations)
+    if tools.dedup is not None:
+        scored = tools.dedup.check_duplicates(scored)
+        unique = [s for s in scored if not s.get("is_duplicate", False)]
+    else:
+        duplicate_ids = set(p5.get("duplicate_ids", []))
+        unique = [s for s in scored if s.get("id", "") not in duplicate_ids]
+    graded = tools.grader.classify(unique)
+
+    return {
+        "batch_id": batch.batch_id,
+        "phase3_passed": len(passed),
+        "phase4_passed": len(validations),
+        "unvalidated": unvalidated,
+        "grades": dict(Counter(g.get("grade", "D") for g in graded)),
+        "ideas": [
+            {"id": g.get("id", ""), "weighted_score": g.get("weighted_score"), "grade": g.get("grade")}
+            for g in graded
+        ],
+    }
+
+
+def run_config(batches: list[RecordedBatch], replay_config: ReplayConfig) -> list[dict[str, Any]]:
+    """설정 1개로 모든 배치를 리플레이한다."""
+    _scorer_classes()
+    with config_overrides(replay_config.overrides):
+        tools = build_tools(replay_config.overrides)
+        return [replay_batch(b, tools) for b in batches]
+
+
+# ──────────────────────────── 비교 리포트 ────────────────────────────
+
+
+def summarize(replay_config: ReplayConfig, results: list[dict[str, Any]]) -> dict[str, Any]:
+    grades = Counter()
+    for r in results:
+        grades.update(r["grades"])
+    ideas = sum(grades.values())
+    return {
+        "config": replay_config.name,
+        "overrides": replay_config.overrides,
+        "batches": len(results),
+        "ideas": ideas,
+        "grades": {g: grades.get(g, 0) for g in GRADES},
+        "sa_count": grades.get("S", 0) + grades.get("A", 0),
+        "sa_rate": round((grades.get("S", 0) + grades.get("A", 0)) / ideas, 4) if ideas else 0.0,
+        "unvalidated": sum(r["unvalidated"] for r in results),
+    }
+
+
+def grade_changes(baseline: list[dict[str, Any]], candidate: list[dict[str, Any]]) -> int:
+    """기준 대비 등급이 바뀐(또는 새로 생기거나 빠진) 아이디어 수."""
+    def index(results: list[dict[str, Any]]) -> dict[tuple[str, str], str]:
+        return {(r["batch_id"], i["id"]): i["grade"] for r in results for i in r["ideas"]}
+
+    base, cand = index(baseline), index(candidate)
+    return sum(1 for key in base.keys() | cand.keys() if base.get(key) != cand.get(key))
+
+
+def compare_configs(
+    batches: list[RecordedBatch], candidates: list[ReplayConfig]
+) -> dict[str, Any]:
+    """현재 설정(baseline)과 후보 설정들의 등급 분포 및 차이를 계산한다."""
+    baseline_config = ReplayConfig("baseline")
+    baseline = run_config(batches, baseline_config)
+    base_summary = summarize(baseline_config, baseline)
+
+    report: dict[str, Any] = {"baseline": base_summary, "candidates": []}
+    for candidate in candidates:
+        results = run_config(batches, candidate)
+        summary = summarize(candidate, results)
+        summary["delta"] = {g: summary["grades"][g] - base_summary["grades"][g] for g in GRADES}
+        summary["grade_changes"] = grade_changes(baseline, results)
+        report["candidates"].append(summary)
+    return report
+
+
+def parse_overrides(assignments: list[str]) -> dict[str, Any]:
+    """`NAME=VALUE` 목록을 파싱한다. VALUE는 JSON (숫자/객체)."""
+    overrides: dict[str, Any] = {}
+    for assignment in assignments:
+        name, sep, raw = assignment.partition("=")
+        if not sep:
+            raise ValueError(f"Expected NAME=VALUE, got {assignment!r}")
+        overrides[name.strip()] = json.loads(raw)
+    return overrides
+
+
+def main() -> None:
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="기록된 배치 리플레이 — 설정 변경의 등급 분포 영향")
+    parser.add_argument("--runs-dir", type=Path, default=RUNS_DIR, help="체크포인트 디렉터리")
+    parser.add_argument("--batch", action="append", help="리플레이할 batch_id (반복 가능, 기본: 전체)")
+    parser.add_argument("--set", action="append", default=[], metavar="NAME=VALUE",
+                        help=f"설정 오버라이드 (JSON 값, 반복 가능): {', '.join(TUNABLE_SETTINGS)}")
+    parser.add_argument("--name", default="candidate", help="후보 설정 이름")
+    args = parser.parse_args()
+
+    try:
+        candidate = ReplayConfig(args.name, parse_overrides(args.set))
+    except (ValueError, json.JSONDecodeError) as e:
+        parser.error(str(e))
+
+    t0 = time.monotonic()
+    batches = load_recorded_batches(args.runs_dir, args.batch)
+    report = compare_configs(batches, [candidate] if candidate.overrides else [])
+    report["duration_sec"] = round(time.monotonic() - t0, 2)
+    logger.info(f"Replay: {len(batches)} batches in {report['duration_sec']}s")
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,17 @@ import asyncio
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 
 # 프로젝트 루트를 sys.path에 추가 (scripts/ 에서 실행될 때)
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -38,19 +43,42 @@ for p in _SKILL_PATHS:
 from config import (
     ADAPTIVE_DEPTH,
     BASE_BUDGET_SEC,
+    BATCH_CHUNK_CONCURRENCY,
+    BATCH_CHUNK_SIZE,
+    BATCH_SALVAGE_MAX_FOLLOWUPS,
+    BUDGET_HISTORY_DAYS,
+    BUDGET_HISTORY_MIN_SAMPLES,
+    BUDGET_HISTORY_PERCENTILE,
+    BUDGET_HISTORY_WINDOW,
     BUFFER_SEC,
     CLAUDE_CLI_CMD,
+    CLAUDE_CLI_STREAM_ARGS,
     CLAUDE_CLI_TIMEOUT_SEC,
+    LOG_DIR,
     PHASE4_SIMPLIFY_THRESHOLD_SEC,
     PHASE4_SKIP_THRESHOLD_SEC,
-    PROMPTS_DIR,
     RETRY_CLAUDE_CLI,
+    RUNS_DIR,
+    RUNS_KEEP_COMPLETED,
+    STREAM_STAGE_CONCURRENCY,
+    TRIAGE_NOVELTY_LOOKBACK_HOURS,
+    TRIAGE_WEIGHTS,
     TOTAL_BUDGET_SEC,
     VARIABLE_MAX_SEC,
     VARIABLE_POOL_SEC,
 )
+from api_neighbors import related_apis
+from browser_pool import close_browser_pool
+from catalog_db import get_catalog_connections
+from catalog_release import active_release
+from domain_summary import load_domain_fragment
+from embedding_utils import release_embedding_models
 from logger import get_logger
-from utils import generate_batch_id, kst_now, read_jsonl
+from prompt_builder import PromptBuilder, estimate_tokens, get_template_registry, shorten
+from pydantic import BaseModel, ValidationError
+from resource_guard import get_resource_guard
+from server.schemas.api_contracts import NUMRRanking, ValidationJudgement
+from utils import atomic_json_write, generate_batch_id, kst_now, read_jsonl
 
 logger = get_logger("run_engine")
 
@@ -66,6 +94,73 @@ class PhaseResult(Protocol):
     duration_sec: float
 
 
+# ──────────────────────────── Phase 소요 시간 이력 ────────────────────────────
+
+# TimeBudget.end_phase 로그 메시지 (Claude CLI 호출 로그도 phase/duration_sec를 남기므로 구분)
+_PHASE_END_MSG_RE = re.compile(r"^Phase (\d+) (?:used|completed in) ")
+
+
+def _percentile(values: list[float], q: float) -> float:
+    """선형 보간 백분위수 (q: 0~100)."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+class PhaseDurationHistory:
+    """최근 실행의 Phase별 소요 시간 롤링 표본 — 구조화 로그에서 읽는다."""
+
+    def __init__(self, samples: dict[int, list[float]] | None = None, *, window: int = BUDGET_HISTORY_WINDOW) -> None:
+        self._samples: dict[int, deque[float]] = {}
+        self._window = window
+        for phase, values in (samples or {}).items():
+            for v in values:
+                self.add(phase, v)
+
+    @classmethod
+    def from_logs(cls, log_dir: Path | str = LOG_DIR, *, days: int = BUDGET_HISTORY_DAYS) -> "PhaseDurationHistory":
+        """최근 days개 일별 로그에서 end_phase 기록(phase, duration_sec)을 모은다."""
+        history = cls()
+        for path in sorted(Path(log_dir).glob("*.jsonl"))[-days:]:
+            for rec in read_jsonl(path):
+                phase, duration = rec.get("phase"), rec.get("duration_sec")
+                if phase is None or duration is None:
+                    continue
+                if not _PHASE_END_MSG_RE.match(str(rec.get("msg", ""))):
+                    continue
+                try:
+                    history.add(int(phase), float(duration))
+                except (TypeError, ValueError):
+                    continue
+        return history
+
+    def add(self, phase: int, duration_sec: float) -> None:
+        self._samples.setdefault(phase, deque(maxlen=self._window)).append(duration_sec)
+
+    def count(self, phase: int) -> int:
+        return len(self._samples.get(phase, ()))
+
+    def percentile(self, phase: int, q: float = BUDGET_HISTORY_PERCENTILE) -> float | None:
+        """표본이 BUDGET_HISTORY_MIN_SAMPLES 미만이면 None."""
+        values = self._samples.get(phase)
+        if not values or len(values) < BUDGET_HISTORY_MIN_SAMPLES:
+            return None
+        return _percentile(list(values), q)
+
+    def summary(self) -> dict[int, dict[str, float]]:
+        """Phase별 p50/p75/p90과 표본 수."""
+        return {
+            phase: {
+                "n": len(values),
+                **{f"p{q}": round(_percentile(list(values), q), 1) for q in (50, 75, 90)},
+            }
+            for phase, values in sorted(self._samples.items())
+            if values
+        }
+
+
 # ──────────────────────────── TimeBudget ────────────────────────────
 
 
@@ -76,12 +171,21 @@ class TimeBudget:
     - 기본 시간(고정) + 가변 공유 풀(24분) 관리.
     - 매 Phase 시작 시 잔여 풀을 계산하여 할당.
     - 적응형 깊이 판단 (Phase 4).
+    - history가 있으면 plan()에서 예측 소요 시간으로 가변 풀을 Phase별로 선배정하고
+      예상 종료 시각과 Phase 4 깊이 상한을 실행 시작 시점에 정한다.
+    - record_history가 False면(드라이런) end_phase 로그에 duration_sec를 남기지 않아
+      PhaseDurationHistory 표본이 되지 않는다.
     """
 
     total_sec: int = TOTAL_BUDGET_SEC
     variable_pool_remaining: int = VARIABLE_POOL_SEC
+    history: PhaseDurationHistory | None = None
+    record_history: bool = True
     _started_at: float = field(default_factory=time.monotonic)
     _phase_starts: dict[int, float] = field(default_factory=dict)
+    _ended: set[int] = field(default_factory=set)
+    _reserved: dict[int, int] = field(default_factory=dict)
+    _depth_cap: str | None = None
 
     @property
     def elapsed_sec(self) -> float:
@@ -95,9 +199,78 @@ class TimeBudget:
         """Phase에 할당 가능한 최대 시간(초)을 반환한다."""
         base = BASE_BUDGET_SEC.get(phase, 0)
         var_max = VARIABLE_MAX_SEC.get(phase, 0)
-        var_alloc = min(var_max, self.variable_pool_remaining)
+        # 뒤 Phase에 선배정된 풀은 건드리지 않는다
+        held = sum(sec for p, sec in self._reserved.items() if p > phase)
+        var_alloc = min(var_max, max(0, self.variable_pool_remaining - held))
         return float(min(base + var_alloc, self.remaining_sec))
 
+    def predicted_duration(self, phase: int) -> float:
+        """이력 기반 예상 소요 시간(초). 이력이 부족하면 기본 시간."""
+        predicted = self.history.percentile(phase) if self.history else None
+        return float(BASE_BUDGET_SEC.get(phase, 0) if predicted is None else predicted)
+
+    def predicted_finish_sec(self) -> float:
+        """실행 시작부터 예상 종료까지의 초 — 경과 시간 + 남은 Phase 예상 소요 시간."""
+        now = time.monotonic()
+        remaining = 0.0
+        for phase in BASE_BUDGET_SEC:
+            if phase in self._ended:
+                continue
+            expected = self.predicted_duration(phase)
+            start = self._phase_starts.get(phase)
+            remaining += max(0.0, expected - (now - start)) if start is not None else expected
+        return self.elapsed_sec + remaining
+
+    def predicted_finish_at(self) -> datetime:
+        return kst_now() + timedelta(seconds=self.predicted_finish_sec() - self.elapsed_sec)
+
+    def plan(self, completed_phases: list[int] | tuple[int, ...] = ()) -> dict[str, Any]:
+        """실행 시작 시 예산 계획 — 가변 풀 선배정, 예상 종료 시각, Phase 4 깊이 상한.
+
+        예측 소요 시간이 기본 시간을 넘는 Phase마다 초과분(VARIABLE_MAX_SEC 이내)을 풀에서
+        선배정한다. 앞 Phase는 뒤 Phase 몫을 쓸 수 없으므로 Phase 2가 평소 빠르면 남는 풀이
+        Phase 4에 확보된다. 이력이 부족하면 선배정·깊이 상한 없이 정적 예산과 같다.
+        """
+        self._ended.update(completed_phases)
+        self._reserved.clear()
+        self._depth_cap = None
+        pending = [p for p in sorted(BASE_BUDGET_SEC) if p not in self._ended]
+
+        predicted = {p: self.history.percentile(p) if self.history else None for p in pending}
+        pool = self.variable_pool_remaining
+        # 뒤 Phase(검증·스코어링)부터 확보 — 앞 Phase 초과는 end_phase에서 남은 풀로 차감
+        for phase in sorted(pending, key=lambda p: (p != 4, -p)):
+            expected = predicted[phase]
+            if expected is None:
+                continue
+            want = min(VARIABLE_MAX_SEC.get(phase, 0), max(0, int(expected - BASE_BUDGET_SEC[phase])))
+            grant = min(want, pool)
+            if grant > 0:
+                self._reserved[phase] = grant
+                pool -= grant
+
+        phase4_remaining = None
+        if 4 in pending and any(predicted[p] is not None for p in pending if p <= 4):
+            before = sum(self.predicted_duration(p) for p in pending if p < 4)
+            phase4_remaining = max(0.0, self.total_sec - self.elapsed_sec - before)
+            if phase4_remaining < PHASE4_SKIP_THRESHOLD_SEC:
+                self._depth_cap = "skipped"
+            elif phase4_remaining < PHASE4_SIMPLIFY_THRESHOLD_SEC:
+                self._depth_cap = "simplified"
+
+        finish = self.predicted_finish_sec()
+        result = {
+            "predicted_finish_sec": round(finish, 1),
+            "predicted_finish_at": self.predicted_finish_at().isoformat(),
+            "reserved_sec": dict(self._reserved),
+            "phase4_remaining_sec": None if phase4_remaining is None else round(phase4_remaining, 1),
+            "depth_cap": self._depth_cap,
+        }
+        logger.info(
+            f"Budget plan — predicted finish {finish:.0f}s, reserved {self._reserved}, depth cap {self._depth_cap}",
+        )
+        return result
+
     def start_phase(self, phase: int) -> float:
         """Phase 시작을 기록하고 할당된 예산(초)을 반환한다."""
         self._phase_starts[phase] = time.monotonic()
@@ -108,35 +281,73 @@ class TimeBudget:
         )
         return budget
 
-    def end_phase(self, phase: int) -> float:
-        """Phase 종료를 기록하고 소요 시간(초)을 반환한다. 초과분을 풀에서 차감."""
+    def end_phase(self, phase: int, *, overlap_sec: float = 0.0) -> float:
+        """Phase 종료를 기록하고 소요 시간(초)을 반환한다. 초과분을 풀에서 차감.
+
+        overlap_sec: 스트리밍 모드에서 앞 단계와 겹쳐 실행된 시간. 앞 단계가 이미
+        차감했으므로 초과분 계산에서 제외한다 (단계별 차감 합 = 실제 경과 시간).
+        로그의 duration_sec(이력 표본)도 겹친 시간을 뺀 이 단계 몫이다.
+        """
         start = self._phase_starts.get(phase)
         if start is None:
             return 0.0
         elapsed = time.monotonic() - start
+        own = max(0.0, elapsed - overlap_sec)
+        self._ended.add(phase)
+        self._reserved.pop(phase, None)
         base = BASE_BUDGET_SEC.get(phase, 0)
-        overshoot = max(0, elapsed - base)
+        overshoot = max(0, own - base)
+        extra = {"phase": phase, "duration_sec": own} if self.record_history else {"phase": phase}
+        overlapped = f", {overlap_sec:.0f}s overlapped" if overlap_sec else ""
         if overshoot > 0:
             deducted = min(int(overshoot), self.variable_pool_remaining)
             self.variable_pool_remaining -= deducted
             logger.info(
-                f"Phase {phase} used {elapsed:.0f}s (+{overshoot:.0f}s over base), pool deducted {deducted}s → {self.variable_pool_remaining}s left",
-                extra={"phase": phase, "duration_sec": elapsed},
+                f"Phase {phase} used {own:.0f}s (+{overshoot:.0f}s over base{overlapped}), "
+                f"pool deducted {deducted}s → {self.variable_pool_remaining}s left",
+                extra=extra,
             )
         else:
             logger.info(
-                f"Phase {phase} completed in {elapsed:.0f}s (within base {base}s)",
-                extra={"phase": phase, "duration_sec": elapsed},
+                f"Phase {phase} completed in {own:.0f}s (within base {base}s{overlapped})",
+                extra=extra,
             )
         return elapsed
 
+    def deep_quota(self, hypothesis_count: int) -> int:
+        """Phase 4 예산 안에서 개별(deep) 검증할 수 있는 가설 수. 나머지는 배치(light) 검증.
+
+        전원 light 비용을 먼저 확보하고, 남는 시간을 deep 승격 비용(deep - light)으로 나눈다.
+        """
+        deep_sec = ADAPTIVE_DEPTH["deep"]["per_hypothesis_sec"]
+        light_sec = ADAPTIVE_DEPTH["light"]["per_hypothesis_sec"]
+        spare = self.phase_budget(4) - hypothesis_count * light_sec
+        if spare <= 0:
+            return 0
+        return min(hypothesis_count, int(spare // max(deep_sec - light_sec, 1)))
+
+    def snapshot(self) -> dict[str, float]:
+        """체크포인트용 상태 — 경과 시간과 잔여 가변 풀."""
+        return {
+            "elapsed_sec": round(self.elapsed_sec, 3),
+            "variable_pool_remaining": self.variable_pool_remaining,
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        """체크포인트 상태로 복원한다. 완료된 Phase가 쓴 시간만큼 시작 시각을 앞당긴다."""
+        self._started_at = time.monotonic() - float(state.get("elapsed_sec", 0.0))
+        self.variable_pool_remaining = int(
+            state.get("variable_pool_remaining", self.variable_pool_remaining)
+        )
+        self._phase_starts.clear()
+
     def adaptive_depth(self, hypothesis_count: int) -> str:
-        """Phase 4 적응형 깊이 레벨을 결정한다."""
+        """Phase 4 적응형 깊이 레벨을 결정한다. plan()의 깊이 상한이 있으면 그보다 깊어지지 않는다."""
         remaining = self.remaining_sec
 
-        if remaining < PHASE4_SKIP_THRESHOLD_SEC:
+        if remaining < PHASE4_SKIP_THRESHOLD_SEC or self._depth_cap == "skipped":
             return "skipped"
-        if remaining < PHASE4_SIMPLIFY_THRESHOLD_SEC:
+        if remaining < PHASE4_SIMPLIFY_THRESHOLD_SEC or self._depth_cap == "simplified":
             return "simplified"
         if hypothesis_count <= ADAPTIVE_DEPTH["deep"]["max_hypotheses"]:
             return "deep"
@@ -145,6 +356,96 @@ class TimeBudget:
         return "light"
 
 
+# ──────────────────────────── RunCheckpoint ────────────────────────────
+
+
+def _json_default(obj: Any) -> Any:
+    """numpy 스칼라/배열 등 JSON 직렬화 불가 값을 기본 타입으로 바꾼다."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    return str(obj)
+
+
+class RunCheckpoint:
+    """Phase 결과 체크포인트 — RUNS_DIR/{batch_id}/phaseN.json + state.json.
+
+    Phase 파일을 먼저 원자적으로 쓴 뒤 state.json의 completed_phases를 갱신하므로,
+    state.json에 기록된 Phase는 결과 파일이 항상 온전하다.
+    Phase 6까지 끝난 런은 prune()이 최근 RUNS_KEEP_COMPLETED개만 남긴다
+    (미완료 런은 --resume용으로 유지).
+    """
+
+    def __init__(self, batch_id: str, runs_dir: Path | str = RUNS_DIR) -> None:
+        self.batch_id = batch_id
+        self.dir = Path(runs_dir) / batch_id
+
+    @property
+    def state_path(self) -> Path:
+        return self.dir / "state.json"
+
+    def state(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def completed_phases(self) -> list[int]:
+        return list(self.state().get("completed_phases", []))
+
+    def load(self, phase: int) -> dict[str, Any] | None:
+        """완료된 Phase의 결과를 반환한다. 미완료/손상 시 None."""
+        if phase not in self.completed_phases():
+            return None
+        try:
+            return json.loads((self.dir / f"phase{phase}.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Checkpoint phase{phase}.json unreadable ({e}) — re-running phase")
+            return None
+
+    def save(self, phase: int, result: dict[str, Any], budget: TimeBudget) -> None:
+        """Phase 결과와 TimeBudget 상태를 저장한다. 실패해도 파이프라인은 계속한다."""
+        try:
+            atomic_json_write(self.dir / f"phase{phase}.json", result, default=_json_default)
+            completed = sorted(set(self.completed_phases()) | {phase})
+            atomic_json_write(self.state_path, {
+                "batch_id": self.batch_id,
+                "completed_phases": completed,
+                "budget": budget.snapshot(),
+                "updated_at": kst_now().isoformat(),
+            })
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Checkpoint save failed for phase {phase}: {e}")
+
+    @staticmethod
+    def prune(runs_dir: Path | str = RUNS_DIR, keep: int | None = None) -> int:
+        """완료된(Phase 6) 런을 최근 keep개(기본 RUNS_KEEP_COMPLETED)만 남긴다. 삭제 수 반환."""
+        keep = RUNS_KEEP_COMPLETED if keep is None else keep
+        runs_dir = Path(runs_dir)
+        if not runs_dir.is_dir():
+            return 0
+        completed: list[tuple[str, str, Path]] = []
+        for path in runs_dir.iterdir():
+            if not path.is_dir():
+                continue
+            state = RunCheckpoint(path.name, runs_dir).state()
+            if 6 in state.get("completed_phases", []):
+                completed.append((state.get("updated_at", ""), path.name, path))
+        completed.sort(reverse=True)
+
+        removed = 0
+        for _, _, path in completed[max(0, keep):]:
+            try:
+                shutil.rmtree(path)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Checkpoint prune failed for {path.name}: {e}")
+        if removed:
+            logger.info(f"Pruned {removed} completed run checkpoint(s), kept {min(keep, len(completed))}")
+        return removed
+
+
 # ──────────────────────────── ClaudeCLIInvoker ────────────────────────────
 
 
@@ -173,21 +474,32 @@ class ClaudeCLIInvoker:
         모두 실패하면 RuntimeError를 발생시킨다.
         """
         last_error: Exception | None = None
+        prompt_tokens = estimate_tokens(prompt)
 
         for attempt in range(1, self.max_retries + 2):  # 1 + retries
+            t0 = time.monotonic()
             try:
                 result = self._run_subprocess(prompt)
                 parsed = self._extract_json(result)
+                latency = time.monotonic() - t0
                 self._logger.info(
-                    f"Claude CLI succeeded on attempt {attempt}",
-                    extra={"phase": phase, "attempt": attempt},
+                    f"Claude CLI succeeded on attempt {attempt} "
+                    f"({latency:.1f}s, prompt ~{prompt_tokens} tokens)",
+                    extra={
+                        "phase": phase, "attempt": attempt,
+                        "duration_sec": latency, "prompt_tokens": prompt_tokens,
+                    },
                 )
                 return parsed
             except Exception as e:
                 last_error = e
+                latency = time.monotonic() - t0
                 self._logger.warning(
-                    f"Claude CLI attempt {attempt} failed: {e}",
-                    extra={"phase": phase, "attempt": attempt},
+                    f"Claude CLI attempt {attempt} failed after {latency:.1f}s: {e}",
+                    extra={
+                        "phase": phase, "attempt": attempt,
+                        "duration_sec": latency, "prompt_tokens": prompt_tokens,
+                    },
                 )
                 if attempt <= self.max_retries:
                     wait = min(self.wait_base * (2 ** (attempt - 1)), self.wait_max)
@@ -210,85 +522,516 @@ class ClaudeCLIInvoker:
         """
         env = os.environ.copy()
         env.pop("CLAUDECODE", None)  # 중첩 세션 방지 우회
-        proc = subprocess.run(
-            [self.cmd, "-p"],
-            input=prompt.encode("utf-8"),
-            capture_output=True,
-            timeout=self.timeout,
-            shell=(sys.platform == "win32"),  # Windows: .cmd 파일 실행 필요
+        # 겹쳐 실행되는 런과 claude -p 동시 실행 수를 나눠 쓴다
+        with get_resource_guard().claude_cli():
+            proc = subprocess.run(
+                [self.cmd, "-p"],
+                input=prompt.encode("utf-8"),
+                capture_output=True,
+                timeout=self.timeout,
+                shell=(sys.platform == "win32"),  # Windows: .cmd 파일 실행 필요
+                env=env,
+            )
+        stdout = _decode_output(proc.stdout)
+        stderr = _decode_output(proc.stderr)
+        if proc.returncode != 0:
+            raise RuntimeError(f"claude -p exited with code {proc.returncode}: {stderr[:500]}")
+        return stdout
+
+    def invoke_stream(
+        self,
+        prompt: str,
+        on_item: Callable[[dict[str, Any]], None],
+        *,
+        phase: int | None = None,
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """Claude CLI 출력을 읽는 즉시 파싱하여 완성된 항목(가설)을 on_item으로 넘긴다.
+
+        반환: (전달된 항목 목록, 완료 여부). 항목이 하나라도 전달된 뒤의 타임아웃/비정상
+        종료는 재시도하지 않고 이미 도착한 항목만 반환한다 (중복 전달 방지).
+        항목 전달 전 실패는 invoke()와 같은 지수 백오프로 재시도한다.
+        """
+        last_error: Exception | None = None
+        prompt_tokens = estimate_tokens(prompt)
+
+        for attempt in range(1, self.max_retries + 2):
+            t0 = time.monotonic()
+            items: list[dict[str, Any]] = []
+            parser = _IncrementalItemParser()
+
+            def on_text(text: str) -> None:
+                for item in parser.feed(text):
+                    items.append(item)
+                    on_item(item)
+
+            try:
+                full_text = self._run_stream(prompt, on_text)
+                if not items:
+                    # 스트림에서 항목 경계를 못 찾음 → 전체 출력으로 일반 추출
+                    parsed = self._extract_json(full_text)
+                    for item in _result_items(parsed):
+                        items.append(item)
+                        on_item(item)
+                latency = time.monotonic() - t0
+                self._logger.info(
+                    f"Claude CLI stream succeeded on attempt {attempt} "
+                    f"({latency:.1f}s, {len(items)} items, prompt ~{prompt_tokens} tokens)",
+                    extra={
+                        "phase": phase, "attempt": attempt,
+                        "duration_sec": latency, "prompt_tokens": prompt_tokens,
+                    },
+                )
+                return items, True
+            except Exception as e:
+                last_error = e
+                latency = time.monotonic() - t0
+                if items:
+                    self._logger.warning(
+                        f"Claude CLI stream interrupted after {latency:.1f}s: {e} — "
+                        f"keeping {len(items)} items already delivered",
+                        extra={"phase": phase, "attempt": attempt, "duration_sec": latency},
+                    )
+                    return items, False
+                self._logger.warning(
+                    f"Claude CLI stream attempt {attempt} failed after {latency:.1f}s: {e}",
+                    extra={
+                        "phase": phase, "attempt": attempt,
+                        "duration_sec": latency, "prompt_tokens": prompt_tokens,
+                    },
+                )
+                if attempt <= self.max_retries:
+                    wait = min(self.wait_base * (2 ** (attempt - 1)), self.wait_max)
+                    self._logger.info(f"Retrying in {wait}s...")
+                    time.sleep(wait)
+
+        self._logger.error(
+            f"Claude CLI stream exhausted all {self.max_retries + 1} attempts — escalating",
+            extra={"phase": phase, "trigger": "escalation"},
+        )
+        raise RuntimeError(
+            f"Claude CLI failed after {self.max_retries + 1} attempts: {last_error}"
+        )
+
+    def _run_stream(self, prompt: str, on_text: Callable[[str], None]) -> str:
+        """claude -p 를 stream-json 출력으로 실행하며 텍스트 델타를 on_text로 흘려보낸다.
+
+        stream-json 이벤트가 아닌 줄(일반 텍스트, 줄 단위 JSON 가설)은 그대로 넘긴다.
+        전체 텍스트를 반환하며, 타임아웃 시 프로세스를 종료하고 TimeoutError를 발생시킨다.
+        """
+        env = os.environ.copy()
+        env.pop("CLAUDECODE", None)
+        with get_resource_guard().claude_cli():
+            return self._stream_process(prompt, on_text, env)
+
+    def _stream_process(self, prompt: str, on_text: Callable[[str], None], env: dict[str, str]) -> str:
+        proc = subprocess.Popen(
+            [self.cmd, "-p", *CLAUDE_CLI_STREAM_ARGS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            shell=(sys.platform == "win32"),
             env=env,
         )
-        # Windows cp949 / Linux utf-8 안전 디코딩
-        def _decode(data: bytes) -> str:
-            if not data:
-                return ""
-            try:
-                return data.decode("utf-8")
-            except UnicodeDecodeError:
-                return data.decode("cp949", errors="replace")
+        timed_out = threading.Event()
 
-        stdout = _decode(proc.stdout)
-        stderr = _decode(proc.stderr)
+        def kill() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(self.timeout, kill)
+        stderr_chunks: list[bytes] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+        )
+        timer.start()
+        stderr_reader.start()
+
+        fed: list[str] = []
+        final_text = ""
+        try:
+            proc.stdin.write(prompt.encode("utf-8"))
+            proc.stdin.close()
+            for raw_line in proc.stdout:
+                line = _decode_output(raw_line)
+                kind, text = _stream_event_text(line)
+                if kind == "final":
+                    final_text = text
+                elif text:
+                    fed.append(text)
+                    on_text(text)
+            proc.wait()
+        finally:
+            timer.cancel()
+            stderr_reader.join(timeout=5)
+
+        if timed_out.is_set():
+            raise TimeoutError(f"claude -p stream timed out after {self.timeout}s")
         if proc.returncode != 0:
+            stderr = _decode_output(b"".join(stderr_chunks))
             raise RuntimeError(f"claude -p exited with code {proc.returncode}: {stderr[:500]}")
-        return stdout
+        if not fed and final_text:
+            # 부분 메시지 이벤트가 없는 CLI 버전 → 최종 결과를 한 번에 흘려보낸다
+            fed.append(final_text)
+            on_text(final_text)
+        return "".join(fed)
 
     @staticmethod
     def _extract_json(raw: str) -> dict[str, Any] | list:
         """Claude CLI 출력에서 JSON을 추출한다.
 
-        마크다운 펜스 제거 후, 첫 번째 완전한 JSON 객체/배열만 파싱한다.
-        Claude가 JSON 뒤에 설명 텍스트를 붙여도 안전하게 처리.
+        원본 문자열을 복사하지 않고 후보 오프셋(펜스 내부 우선 → `{`/`[` 위치)에서
+        `JSONDecoder.raw_decode`로 바로 파싱한다. 설명 텍스트 속 괄호처럼 첫 토큰에서
+        실패하는 후보는 건너뛰고, 본문까지 파싱하다 실패한 후보는 후행 쉼표 제거 /
+        잘린 배열 닫기 복구를 1회 시도한 뒤 포기한다 (비싼 재호출 감소).
         """
-        # ```json ... ``` 패턴 제거
-        cleaned = re.sub(r"```(?:json)?\s*", "", raw)
-        cleaned = re.sub(r"```\s*$", "", cleaned, flags=re.MULTILINE)
-        cleaned = cleaned.strip()
-
-        # JSON 객체/배열 시작 위치 찾기
-        start = -1
-        for i, ch in enumerate(cleaned):
-            if ch in ("{", "["):
-                start = i
-                break
-        if start == -1:
-            raise ValueError(f"No JSON found in Claude CLI output (first 200 chars): {raw[:200]}")
-
-        # 매칭되는 닫는 괄호까지만 추출 (문자열 내부 괄호 무시)
-        open_ch = cleaned[start]
-        close_ch = "}" if open_ch == "{" else "]"
-        depth = 0
-        in_string = False
-        escape_next = False
-        end = start
-        for j in range(start, len(cleaned)):
-            ch = cleaned[j]
+        for start in _json_candidates(raw):
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(raw, start)
+            except json.JSONDecodeError as e:
+                if e.pos <= _skip_ws(raw, start + 1):
+                    continue  # 설명 텍스트 속 괄호 — 다음 후보로
+                repaired = _repair_json(raw, start)
+                if repaired is not None:
+                    logger.info(f"Claude CLI JSON repaired after parse error: {e.msg} (pos {e.pos})")
+                    return repaired
+                raise ValueError(
+                    f"JSON parse error: {e}\nRaw (first 300 chars): {raw[start:start + 300]}"
+                )
+            if isinstance(obj, (dict, list)):
+                return obj
+
+        raise ValueError(f"No JSON found in Claude CLI output (first 200 chars): {raw[:200]}")
+
+
+# ──────────────────────────── JSON 추출 헬퍼 ────────────────────────────
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_OPEN_RE = re.compile(r"[{\[]")
+_FENCE_OPEN_RE = re.compile(r"```(?:json)?[ \t]*\r?\n")
+_WS_RE = re.compile(r"\s*")
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _skip_ws(raw: str, pos: int) -> int:
+    """pos부터 공백을 건너뛴 첫 위치를 반환한다."""
+    return _WS_RE.match(raw, pos).end()
+
+
+def _json_candidates(raw: str):
+    """JSON 시작 후보 오프셋을 순서대로 yield한다 — 펜스 블록 내부 우선, 이후 전체 스캔."""
+    seen: set[int] = set()
+    for m in _FENCE_OPEN_RE.finditer(raw):
+        pos = _skip_ws(raw, m.end())
+        if pos < len(raw) and raw[pos] in _CLOSERS:
+            seen.add(pos)
+            yield pos
+    for m in _JSON_OPEN_RE.finditer(raw):
+        if m.start() not in seen:
+            yield m.start()
+
+
+def _repair_json(raw: str, start: int) -> dict[str, Any] | list | None:
+    """흔한 결함(후행 쉼표, 출력 잘림)을 복구하여 파싱한다. 실패하면 None.
+
+    한 번의 선형 스캔으로 문자열/괄호 깊이를 추적하며 닫는 괄호 앞 후행 쉼표를 제거한다.
+    출력이 중간에 잘린 경우 마지막으로 완결된 하위 요소까지 자른 뒤 열린 괄호를 닫고,
+    그것도 실패하면 열린 문자열/괄호만 닫아서 재시도한다.
+    """
+    out: list[str] = []
+    stack: list[str] = []
+    in_string = False
+    escape_next = False
+    last_complete: tuple[int, list[str]] | None = None
+
+    for j in range(start, len(raw)):
+        ch = raw[j]
+        if in_string:
+            out.append(ch)
             if escape_next:
                 escape_next = False
-                continue
-            if ch == "\\":
+            elif ch == "\\":
                 escape_next = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif ch in ("}", "]"):
+            if not stack or ch != stack[-1]:
+                return None
+            # 후행 쉼표 제거: `[1, 2,]` → `[1, 2]`
+            k = len(out)
+            while k and out[k - 1].isspace():
+                k -= 1
+            if k and out[k - 1] == ",":
+                del out[k - 1:]
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                return _loads_or_none("".join(out))
+            last_complete = (len(out), list(stack))
+            continue
+        out.append(ch)
+
+    # 출력 잘림 — 마지막 완결 요소까지 자르고 닫기
+    candidates: list[str] = []
+    if last_complete is not None:
+        cut, open_stack = last_complete
+        candidates.append(_close_truncated(out[:cut], open_stack))
+    tail = out + (['"'] if in_string else [])
+    candidates.append(_close_truncated(tail, stack))
+    for text in candidates:
+        parsed = _loads_or_none(text)
+        if parsed is not None:
+            return parsed
+    return None
+
+
+def _close_truncated(chars: list[str], open_stack: list[str]) -> str:
+    """잘린 JSON 조각 끝의 쉼표/콜론을 정리하고 열린 괄호를 역순으로 닫는다."""
+    text = "".join(chars).rstrip()
+    while text and text[-1] in ",:":
+        text = text[:-1].rstrip()
+    return text + "".join(reversed(open_stack))
+
+
+def _loads_or_none(text: str) -> dict[str, Any] | list | None:
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, (dict, list)) else None
+
+
+def _decode_output(data: bytes) -> str:
+    """Windows cp949 / Linux utf-8 안전 디코딩."""
+    if not data:
+        return ""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("cp949", errors="replace")
+
+
+# ──────────────────────────── 스트리밍 출력 파싱 ────────────────────────────
+
+_STREAM_EVENT_TYPES = {"system", "stream_event", "assistant", "user", "result"}
+
+
+def _stream_event_text(line: str) -> tuple[str, str]:
+    """stream-json 한 줄을 (종류, 텍스트)로 해석한다.
+
+    - ("delta", 텍스트): 부분 메시지 text_delta
+    - ("final", 텍스트): result 이벤트의 최종 응답 (델타가 없을 때만 사용)
+    - ("raw", 줄): stream-json 이벤트가 아닌 줄 — 일반 텍스트/줄 단위 JSON
+    - ("", ""): 텍스트 없는 이벤트 (system, tool_use 등)
+    """
+    stripped = line.strip()
+    if not stripped:
+        return "", ""
+    event = _loads_or_none(stripped) if stripped[0] == "{" else None
+    if not isinstance(event, dict) or event.get("type") not in _STREAM_EVENT_TYPES:
+        return "raw", line if line.endswith("\n") else line + "\n"
+    if event["type"] == "stream_event":
+        delta = (event.get("event") or {}).get("delta") or {}
+        if delta.get("type") == "text_delta":
+            return "delta", delta.get("text", "")
+    elif event["type"] == "result" and isinstance(event.get("result"), str):
+        return "final", event["result"]
+    return "", ""
+
+
+def _result_items(parsed: dict[str, Any] | list) -> list[dict[str, Any]]:
+    """일반 추출 결과에서 항목 목록을 꺼낸다 (`[...]` 또는 `{"<key>": [...]}`)."""
+    if isinstance(parsed, list):
+        return [it for it in parsed if isinstance(it, dict)]
+    for val in parsed.values():
+        if isinstance(val, list) and all(isinstance(it, dict) for it in val):
+            return val
+    return []
+
+
+class _IncrementalItemParser:
+    """텍스트 조각을 받아 항목 배열의 원소 객체가 닫히는 즉시 반환한다.
+
+    항목 배열은 최상위 배열(`[{...}, ...]`) 또는 최상위 객체 바로 아래 배열
+    (`{"hypotheses": [{...}, ...]}`)이다. 배열 없이 줄마다 객체가 오는 형식은
+    최상위 객체 자체를 항목으로 본다. 괄호 밖 설명 텍스트/코드 펜스는 무시된다.
+    """
+
+    def __init__(self) -> None:
+        self._value: list[str] = []   # 현재 최상위 값의 문자들
+        self._stack: list[str] = []
+        self._starts: list[int] = []  # 열린 괄호별 _value 오프셋
+        self._in_str = False
+        self._escape = False
+        self._emitted_inside = False
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = []
+        for ch in text:
+            if not self._stack:
+                if ch in _CLOSERS:
+                    self._open(ch)
                 continue
-            if ch == '"':
-                in_string = not in_string
-                continue
-            if in_string:
+            self._value.append(ch)
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch in _CLOSERS:
+                self._stack.append(ch)
+                self._starts.append(len(self._value) - 1)
+            elif ch in "}]":
+                item = self._close()
+                if item is not None:
+                    out.append(item)
+        return out
+
+    def _open(self, ch: str) -> None:
+        self._value = [ch]
+        self._stack = [ch]
+        self._starts = [0]
+        self._emitted_inside = False
+
+    def _close(self) -> dict[str, Any] | None:
+        opener = self._stack.pop()
+        start = self._starts.pop()
+        parent_depth = len(self._stack)
+        is_item = (
+            opener == "{"
+            and parent_depth in (1, 2)
+            and self._stack[-1] == "["
+            and (parent_depth == 1 or self._stack[0] == "{")
+        )
+        is_line_item = opener == "{" and parent_depth == 0 and not self._emitted_inside
+        if not (is_item or is_line_item):
+            return None
+        parsed = _loads_or_none("".join(self._value[start:]))
+        if not isinstance(parsed, dict):
+            return None
+        self._emitted_inside = True
+        if is_line_item and _result_items(parsed):
+            return None  # 항목 배열을 담은 래퍼 객체가 스트림 경계 없이 통째로 온 경우
+        return parsed
+
+
+# ──────────────────────────── 배치 응답 항목별 검증 ────────────────────────────
+
+
+def _validate_batch_items(
+    raw: Any,
+    expected_ids: list[str],
+    model: type[BaseModel],
+    list_key: str,
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """배치 응답을 항목 단위로 Pydantic 검증한다.
+
+    Returns:
+        (id → 검증된 항목 dict, 누락/무효 id 목록 — expected_ids 순서 유지)
+    """
+    if isinstance(raw, dict):
+        raw = raw.get(list_key, [])
+    if not isinstance(raw, list):
+        raw = []
+
+    expected = set(expected_ids)
+    valid: dict[str, dict[str, Any]] = {}
+    for item in raw:
+        if not isinstance(item, dict) or item.get("id") not in expected or item["id"] in valid:
+            continue
+        try:
+            valid[item["id"]] = model.model_validate(item).model_dump()
+        except ValidationError as e:
+            logger.debug(f"Batch item {item['id']} rejected: {e.error_count()} errors")
+
+    missing = [hid for hid in expected_ids if hid not in valid]
+    return valid, missing
+
+
+def _merge_calibrated_chunks(
+    chunk_results: list[dict[str, dict[str, Any]]],
+    anchor_id: str,
+    calibrate_fields: tuple[str, ...],
+) -> dict[str, dict[str, Any]]:
+    """청크별 결과를 병합한다. 앵커가 처음 채점된 청크를 기준으로 다른 청크를 평행 이동."""
+    reference = next((r[anchor_id] for r in chunk_results if anchor_id in r), None)
+    merged: dict[str, dict[str, Any]] = {}
+    for result in chunk_results:
+        anchor = result.get(anchor_id)
+        for hid, item in result.items():
+            if hid in merged:
                 continue
-            if ch == open_ch:
-                depth += 1
-            elif ch == close_ch:
-                depth -= 1
-                if depth == 0:
-                    end = j + 1
-                    break
+            if calibrate_fields and reference is not None and anchor is not None:
+                item = dict(item)
+                for f in calibrate_fields:
+                    shifted = item[f] - (anchor[f] - reference[f])
+                    item[f] = min(5.0, max(1.0, shifted))
+            merged[hid] = item
+    return merged
 
-        if depth != 0:
-            raise ValueError(f"Unbalanced JSON in Claude CLI output (first 300 chars): {cleaned[start:start+300]}")
 
-        try:
-            return json.loads(cleaned[start:end])
-        except json.JSONDecodeError as e:
-            raise ValueError(f"JSON parse error: {e}\nRaw (first 300 chars): {cleaned[start:start+300]}")
+# ──────────────────────────── Phase 4 트리아지 ────────────────────────────
+
+_NAME_CHARS_RE = re.compile(r"[^0-9A-Za-z가-힣]+")
+
+
+def _bigrams(text: str) -> set[str]:
+    compact = _NAME_CHARS_RE.sub("", text.lower())
+    return {compact[i:i + 2] for i in range(len(compact) - 1)} or ({compact} if compact else set())
+
+
+def _novelty(service_name: str, archive_bigrams: list[set[str]]) -> float:
+    """아카이브 서비스명과의 최대 문자 바이그램 Jaccard 유사도의 보수 (1 = 완전히 새로움)."""
+    grams = _bigrams(service_name)
+    if not grams or not archive_bigrams:
+        return 1.0
+    best = max(
+        (len(grams & other) / len(grams | other) for other in archive_bigrams if other), default=0.0,
+    )
+    return 1.0 - best
+
+
+def _triage_score(hyp: dict[str, Any], archive_bigrams: list[set[str]]) -> float:
+    """값싼 사전 점수 (0~1) — 적합도, 매칭 API 품질, 아카이브 대비 참신도 가중합."""
+    feasibility = min(max(float(hyp.get("feasibility_pct") or 0) / 100, 0.0), 1.0)
+    api_scores = sorted(
+        (float(a.get("score") or 0) for a in hyp.get("matched_apis", []) if isinstance(a, dict)),
+        reverse=True,
+    )[:3]
+    api_quality = min(max(sum(api_scores) / len(api_scores), 0.0), 1.0) if api_scores else 0.0
+    novelty = _novelty(hyp.get("service_name", ""), archive_bigrams)
+    return round(
+        TRIAGE_WEIGHTS["feasibility"] * feasibility
+        + TRIAGE_WEIGHTS["api_quality"] * api_quality
+        + TRIAGE_WEIGHTS["novelty"] * novelty,
+        4,
+    )
+
+
+# ──────────────────────────── 스트리밍 단계 헬퍼 ────────────────────────────
+
+_STREAM_DONE = object()  # 단계 종료 센티널 (워커 수만큼 투입)
+
+
+async def _drain_stage(queue: asyncio.Queue, workers: int, handle: Any) -> None:
+    """워커 workers개로 큐를 소비한다. 각 워커는 센티널을 받으면 종료한다."""
+
+    async def worker() -> None:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                return
+            await handle(item)
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
 
 
 # ──────────────────────────── IdeationEngine ────────────────────────────
@@ -342,6 +1085,12 @@ class _DryRunClaude:
             ]
         return {}
 
+    def invoke_stream(self, prompt: str, on_item: Any, *, phase: int | str | None = None) -> tuple[list, bool]:
+        items = _result_items(self.invoke(prompt, phase=phase))
+        for item in items:
+            on_item(item)
+        return items, True
+
 
 class IdeationEngine:
     """6-Phase 파이프라인 오케스트레이터."""
@@ -351,15 +1100,33 @@ class IdeationEngine:
         manual_signals: str | None = None,
         assumptions: str | None = None,
         dry_run: bool = False,
+        streaming: bool = False,
+        resume: str | None = None,
     ) -> None:
-        self.batch_id = generate_batch_id()
-        self.budget = TimeBudget()
+        self.batch_id = resume or generate_batch_id()
+        self.budget = TimeBudget(
+            history=None if dry_run else PhaseDurationHistory.from_logs(),
+            record_history=not dry_run,
+        )
+        self.checkpoint = RunCheckpoint(self.batch_id)
         self.dry_run = dry_run
+        self.streaming = streaming
         self.claude = _DryRunClaude() if dry_run else ClaudeCLIInvoker()
         self._manual_signals = manual_signals
         self._assumptions = assumptions
+        self.templates = get_template_registry()
         self._logger = get_logger("engine")
 
+        if resume:
+            state = self.checkpoint.state()
+            if not state:
+                raise FileNotFoundError(f"No checkpoint found for batch {resume} in {self.checkpoint.dir}")
+            self.budget.restore(state.get("budget", {}))
+            self._logger.info(
+                f"Resuming batch {resume} — completed phases {state.get('completed_phases', [])}, "
+                f"{self.budget.elapsed_sec:.0f}s already used"
+            )
+
     # ── Pre-flight self-diagnostic ──
 
     def _preflight_check(self) -> list[str]:
@@ -367,7 +1134,7 @@ class IdeationEngine:
         failures: list[str] = []
 
         # 1) 필수 디렉터리 존재
-        from config import DATA_DIR, OUTPUT_DIR, LOG_DIR, CATALOG_DB_PATH
+        from config import DATA_DIR, OUTPUT_DIR, LOG_DIR
         for label, p in [("DATA_DIR", DATA_DIR), ("OUTPUT_DIR", OUTPUT_DIR), ("LOG_DIR", LOG_DIR)]:
             if not p.exists():
                 try:
@@ -376,20 +1143,18 @@ class IdeationEngine:
                 except OSError as e:
                     failures.append(f"{label} missing and cannot create: {e}")
 
-        # 2) 카탈로그 DB 존재 + 읽기 가능
-        if not CATALOG_DB_PATH.exists():
-            failures.append(f"Catalog DB not found: {CATALOG_DB_PATH}")
+        # 2) 카탈로그 DB 존재 + 읽기 가능 — 여기서 게시된 릴리스를 이 런 동안 고정한다
+        release = active_release()
+        if not release.db_path.exists():
+            failures.append(f"Catalog DB not found: {release.db_path}")
         else:
             try:
-                import sqlite3
-                conn = sqlite3.connect(str(CATALOG_DB_PATH))
-                cur = conn.execute("SELECT COUNT(*) FROM apis")
-                count = cur.fetchone()[0]
-                conn.close()
+                # 공유 읽기 전용 연결 — 이후 Phase에서 같은 스레드가 그대로 재사용
+                count = get_catalog_connections().reader().execute("SELECT COUNT(*) FROM apis").fetchone()[0]
                 if count == 0:
                     failures.append("Catalog DB is empty (0 APIs)")
                 else:
-                    self._logger.info(f"Preflight: catalog OK ({count} APIs)")
+                    self._logger.info(f"Preflight: catalog v{release.version} OK ({count} APIs)")
             except Exception as e:
                 failures.append(f"Catalog DB unreadable: {e}")
 
@@ -414,7 +1179,6 @@ class IdeationEngine:
 
         # 4) 디스크 여유 공간 (최소 100MB)
         try:
-            import shutil
             usage = shutil.disk_usage(str(_PROJECT_ROOT))
             free_mb = usage.free / (1024 * 1024)
             if free_mb < 100:
@@ -448,6 +1212,104 @@ class IdeationEngine:
         except Exception as e:
             self._logger.warning(f"System alert send failed (non-fatal): {e}")
 
+    # ── Claude 배치 호출 helper ──
+
+    def _invoke_batch(
+        self,
+        build_prompt: Any,
+        items: list[dict[str, Any]],
+        model: type[BaseModel],
+        *,
+        phase: int,
+        list_key: str,
+        calibrate_fields: tuple[str, ...] = (),
+    ) -> dict[str, dict[str, Any]]:
+        """배치 Claude 호출 — 항목 수가 많으면 청크로 나눠 동시 호출 후 병합한다.
+
+        청크 수는 BATCH_CHUNK_SIZE 기준으로 정하고 항목은 청크에 고르게 분배한다.
+        첫 항목을 보정 앵커로 모든 청크에 반복 포함시키고, calibrate_fields(예: NUMR)는
+        청크별 앵커 점수 차이만큼 평행 이동하여 청크 간 상대 점수를 맞춘다 (1~5 클램프).
+        """
+        if len(items) <= BATCH_CHUNK_SIZE + 1:
+            return self._invoke_batch_chunk(
+                build_prompt, items, model, phase=phase, list_key=list_key
+            )
+
+        anchor, rest = items[0], items[1:]
+        n_chunks = -(-len(rest) // BATCH_CHUNK_SIZE)
+        chunks = [[anchor] + rest[i::n_chunks] for i in range(n_chunks)]
+        self._logger.info(
+            f"Phase {phase}: {len(items)} items → {n_chunks} chunks "
+            f"(anchor {anchor['id']}, concurrency {BATCH_CHUNK_CONCURRENCY})",
+            extra={"phase": phase},
+        )
+
+        def run_chunk(chunk: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+            try:
+                return self._invoke_batch_chunk(
+                    build_prompt, chunk, model, phase=phase, list_key=list_key
+                )
+            except Exception as e:
+                self._logger.warning(f"Phase {phase} chunk failed ({len(chunk)} items): {e}")
+                return {}
+
+        with ThreadPoolExecutor(max_workers=BATCH_CHUNK_CONCURRENCY) as pool:
+            chunk_results = list(pool.map(run_chunk, chunks))
+
+        if not any(chunk_results):
+            raise RuntimeError(f"Phase {phase}: all {n_chunks} batch chunks failed")
+
+        return _merge_calibrated_chunks(chunk_results, anchor["id"], calibrate_fields)
+
+    def _invoke_batch_chunk(
+        self,
+        build_prompt: Any,
+        items: list[dict[str, Any]],
+        model: type[BaseModel],
+        *,
+        phase: int,
+        list_key: str,
+    ) -> dict[str, dict[str, Any]]:
+        """단일 배치 Claude 호출 후 항목별로 스키마 검증한다.
+
+        유효 항목은 유지하고, 누락/무효 id만 골라 작은 후속 프롬프트로 재요청한다
+        (최대 BATCH_SALVAGE_MAX_FOLLOWUPS회). 재시도 비용이 실패 항목 수에 비례한다.
+        첫 호출 실패는 그대로 전파한다.
+        """
+        ids = [it["id"] for it in items]
+        raw = self.claude.invoke(build_prompt(items), phase=phase)
+        valid, missing = _validate_batch_items(raw, ids, model, list_key)
+
+        for _ in range(BATCH_SALVAGE_MAX_FOLLOWUPS):
+            if not missing:
+                break
+            self._logger.info(
+                f"Phase {phase}: {len(valid)}/{len(ids)} batch items valid — "
+                f"follow-up for {len(missing)} ids: {missing}",
+                extra={"phase": phase},
+            )
+            missing_set = set(missing)
+            subset = [it for it in items if it["id"] in missing_set]
+            followup_prompt = (
+                build_prompt(subset)
+                + "\n\n※ 이전 응답에서 누락되었거나 형식이 잘못된 항목만 다시 평가합니다. "
+                "위 id 전부에 대해 지정된 JSON 형식을 정확히 지키세요."
+            )
+            try:
+                raw = self.claude.invoke(followup_prompt, phase=phase)
+            except Exception as e:
+                self._logger.warning(f"Phase {phase} follow-up failed: {e}")
+                break
+            recovered, missing = _validate_batch_items(raw, missing, model, list_key)
+            valid.update(recovered)
+
+        if missing:
+            self._logger.warning(
+                f"Phase {phase}: no valid batch result for {missing} — using defaults",
+                extra={"phase": phase},
+            )
+        return valid
+
     def run(self) -> dict[str, Any]:
         """전체 파이프라인을 순차 실행한다."""
         self._logger.info(f"Pipeline started — batch {self.batch_id}")
@@ -474,29 +1336,39 @@ class IdeationEngine:
             )
             return result
 
+        # 이력 기반 예산 계획 — 깊이 상한은 Phase 4 시작이 아니라 여기서 정해진다
+        result["budget_plan"] = self.budget.plan(self.checkpoint.completed_phases())
+
         try:
             # Phase 1: 맥락 수집
-            p1 = self._phase1()
+            p1 = self._checkpointed(1, self._phase1)
             result["phases"]["phase1"] = p1
 
-            # Phase 2: 가설 생성
-            p2 = self._phase2(p1)
-            result["phases"]["phase2"] = p2
+            if self.streaming and self.checkpoint.load(2) is None:
+                # Phase 2~4: 가설 단위 스트리밍 (단계 간 asyncio 큐)
+                p2, p3, p4 = asyncio.run(self._run_streaming(p1))
+                for phase, out in ((2, p2), (3, p3), (4, p4)):
+                    self.checkpoint.save(phase, out, self.budget)
+                result["phases"].update(phase2=p2, phase3=p3, phase4=p4)
+            else:
+                # Phase 2: 가설 생성
+                p2 = self._checkpointed(2, self._phase2, p1)
+                result["phases"]["phase2"] = p2
 
-            # Phase 3: API 매칭
-            p3 = self._phase3(p2)
-            result["phases"]["phase3"] = p3
+                # Phase 3: API 매칭
+                p3 = self._checkpointed(3, self._phase3, p2)
+                result["phases"]["phase3"] = p3
 
-            # Phase 4: 시장 검증
-            p4 = self._phase4(p3)
-            result["phases"]["phase4"] = p4
+                # Phase 4: 시장 검증
+                p4 = self._checkpointed(4, self._phase4, p3)
+                result["phases"]["phase4"] = p4
 
             # Phase 5: 스코어링
-            p5 = self._phase5(p4)
+            p5 = self._checkpointed(5, self._phase5, p4)
             result["phases"]["phase5"] = p5
 
             # Phase 6: 발행
-            p6 = self._phase6(p5)
+            p6 = self._checkpointed(6, self._phase6, p5)
             result["phases"]["phase6"] = p6
 
             result["success"] = True
@@ -511,6 +1383,13 @@ class IdeationEngine:
                 f"Duration: {self.budget.elapsed_sec:.0f}s"
             )
 
+        # Phase 1 크롤러·Phase 4 경쟁사 검색이 공유한 Chromium 정리
+        close_browser_pool()
+        # Phase 3 매칭이 올린 임베딩 모델 — 겹쳐 도는 다음 런이 RAM 예산을 기다리지 않도록
+        release_embedding_models()
+        if result["success"]:
+            RunCheckpoint.prune(self.checkpoint.dir.parent)
+
         result["finished_at"] = kst_now().isoformat()
         result["total_duration_sec"] = self.budget.elapsed_sec
         self._logger.info(
@@ -518,6 +1397,16 @@ class IdeationEngine:
         )
         return result
 
+    def _checkpointed(self, phase: int, run_phase: Callable[..., dict[str, Any]], *args: Any) -> dict[str, Any]:
+        """완료된 Phase는 체크포인트에서 복원하고, 아니면 실행 후 결과를 저장한다."""
+        saved = self.checkpoint.load(phase)
+        if saved is not None:
+            self._logger.info(f"Phase {phase}: restored from checkpoint (batch {self.batch_id})")
+            return saved
+        out = run_phase(*args)
+        self.checkpoint.save(phase, out, self.budget)
+        return out
+
     # ── Phase 1: 맥락 수집 ──
 
     def _phase1(self) -> dict[str, Any]:
@@ -634,37 +1523,63 @@ class IdeationEngine:
 
     # ── Phase 2: 가설 생성 ──
 
-    def _phase2(self, phase1_result: dict) -> dict[str, Any]:
-        """Phase 2: Claude CLI로 가설 생성."""
+    @staticmethod
+    def _load_domain_summaries() -> list[Any]:
+        """캐시 조각이 아직 없는 카탈로그용 — CatalogStore에서 읽어 API 수 많은 도메인 우선 정렬."""
+        try:
+            from catalog_store import CatalogStore
+
+            # 임베딩·이웃과 같은 고정 릴리스의 DB (CatalogStore 기본값은 갱신 작업본)
+            summaries = CatalogStore(db_path=active_release().db_path).get_domain_summaries()
+        except Exception:
+            return []
+        return [
+            shorten(d, ["category", "api_count", "representative_keywords", "summary_text"])
+            if isinstance(d, dict) else d
+            for d in sorted(
+                summaries or [],
+                key=lambda d: d.get("api_count", 0) if isinstance(d, dict) else 0,
+                reverse=True,
+            )
+        ]
+
+    def _phase2(
+        self,
+        phase1_result: dict,
+        on_hypothesis: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Phase 2: Claude CLI로 가설 생성.
+
+        on_hypothesis가 주어지면 출력을 스트리밍으로 읽어 완성된 가설부터 즉시 넘긴다.
+        생성 도중 타임아웃되어도 이미 도착한 가설로 계속 진행한다 (partial=True).
+        """
         self.budget.start_phase(2)
 
         signals = phase1_result.get("signals", [])
 
         # 프롬프트 템플릿 로드
-        prompt_path = PROMPTS_DIR / "phase2_hypothesis.md"
-        prompt_template = prompt_path.read_text(encoding="utf-8") if prompt_path.exists() else ""
+        template = self.templates.template("phase2_hypothesis.md")
+        prompt_template = template.text
 
-        # 도메인 요약 로드 (카탈로그가 있는 경우)
-        domain_summary = ""
+        # 도메인 요약 — 카탈로그 갱신 시 정렬·단축해 둔 조각을 그대로 쓴다 (버전 해시로 식별)
+        domain_summaries: list[Any]
         try:
-            from catalog_store import CatalogStore
-
-            store = CatalogStore()
-            summaries = store.get_domain_summaries()
-            if summaries:
-                domain_summary = json.dumps(summaries, ensure_ascii=False, indent=2)
+            cached = load_domain_fragment()
         except Exception:
-            pass
+            cached = None
+        if cached is not None:
+            domain_summaries, domain_version = cached
+            self._logger.info(f"Phase 2: domain summaries v{domain_version} ({len(domain_summaries)} categories)")
+        else:
+            domain_summaries = self._load_domain_summaries()
 
         # 최근 아카이브 로드 (중복 회피)
-        recent_archive = ""
+        recent_names: list[str] = []
         try:
             from archive_manager import ArchiveManager
 
             mgr = ArchiveManager()
-            recent_names = mgr.get_service_names(hours=24)
-            if recent_names:
-                recent_archive = json.dumps(recent_names, ensure_ascii=False)
+            recent_names = list(mgr.get_service_names(hours=24) or [])
         except Exception:
             pass
 
@@ -680,46 +1595,73 @@ class IdeationEngine:
                 feedback_summary = json.dumps(
                     {"blacklisted": blacklisted[-20:], "liked": liked[-20:]},
                     ensure_ascii=False,
+                    separators=(",", ":"),
                 )
         except Exception:
             pass
 
-        # 프롬프트 조립
-        signals_text = json.dumps(signals[:30], ensure_ascii=False, indent=2)
+        # 프롬프트 조립 — 최신 신호 우선, 예산 초과 시 도메인 → 아카이브 → 신호 순 절삭
+        recent_signals = sorted(
+            signals, key=lambda sig: sig.get("collected_at") or "", reverse=True
+        )[:30]
         full_prompt = (
-            f"{prompt_template}\n\n"
-            f"## 입력 데이터\n\n"
-            f"### 외부 신호 (최근 수집)\n```json\n{signals_text}\n```\n\n"
-            f"### 카탈로그 도메인 요약\n```json\n{domain_summary or '[]'}\n```\n\n"
-            f"### 최근 24h 아카이브 (중복 회피)\n{recent_archive or '없음'}\n\n"
-            f"### 피드백 요약\n{feedback_summary or '없음'}\n"
+            PromptBuilder(2)
+            .add_text(f"{prompt_template}\n\n## 입력 데이터\n")
+            .add_section(
+                "외부 신호 (최근 수집)",
+                [shorten(sig, ["source", "title", "snippet"], max_chars=300) for sig in recent_signals],
+                priority=3, empty="[]",
+            )
+            .add_section("카탈로그 도메인 요약", domain_summaries, priority=1, empty="[]")
+            .add_section("최근 24h 아카이브 (중복 회피)", recent_names, priority=2, fence=False)
+            .add_section("피드백 요약", feedback_summary, priority=4, fence=False)
+            .build()
         )
 
-        # Claude CLI 호출
-        raw_result = self.claude.invoke(full_prompt, phase=2)
+        if on_hypothesis is not None:
+            hypotheses: list[dict[str, Any]] = []
+
+            def deliver(h: dict[str, Any]) -> None:
+                if not h.get("id"):
+                    h["id"] = f"H-{len(hypotheses) + 1:03d}"
+                hypotheses.append(h)
+                on_hypothesis(h)
 
-        # 결과에서 가설 추출 (dict 또는 list 모두 처리)
-        if isinstance(raw_result, list):
-            hypotheses = raw_result
-        elif isinstance(raw_result, dict):
-            hypotheses = raw_result.get("hypotheses", [])
+            _, complete = self.claude.invoke_stream(full_prompt, deliver, phase=2)
         else:
-            hypotheses = []
+            # Claude CLI 호출
+            raw_result = self.claude.invoke(full_prompt, phase=2)
+            complete = True
+
+            # 결과에서 가설 추출 (dict 또는 list 모두 처리)
+            if isinstance(raw_result, list):
+                hypotheses = raw_result
+            elif isinstance(raw_result, dict):
+                hypotheses = raw_result.get("hypotheses", [])
+            else:
+                hypotheses = []
 
-        # 가설 ID 부여
-        for i, h in enumerate(hypotheses):
-            if not h.get("id"):
-                h["id"] = f"H-{i + 1:03d}"
+            # 가설 ID 부여
+            for i, h in enumerate(hypotheses):
+                if not h.get("id"):
+                    h["id"] = f"H-{i + 1:03d}"
 
-        self._logger.info(f"Phase 2: generated {len(hypotheses)} hypotheses")
+        self._logger.info(
+            f"Phase 2: generated {len(hypotheses)} hypotheses"
+            + ("" if complete else " (stream interrupted — partial)")
+        )
 
         elapsed = self.budget.end_phase(2)
-        return {
+        result = {
             "batch_id": self.batch_id,
             "hypotheses": hypotheses,
             "signal_count": len(signals),
+            "prompt_version": template.version,
             "duration_sec": elapsed,
         }
+        if not complete:
+            result["partial"] = True
+        return result
 
     # ── Phase 3: API 매칭 ──
 
@@ -729,56 +1671,16 @@ class IdeationEngine:
 
         hypotheses = phase2_result.get("hypotheses", [])
 
-        from feasibility import FeasibilityCalculator
-        from join_analyzer import JoinAnalyzer
-        from semantic_matcher import SemanticMatcher
-
-        matcher = SemanticMatcher()
-        join_analyzer = JoinAnalyzer()
-        feasibility_calc = FeasibilityCalculator()
+        matcher, join_analyzer, feasibility_calc = self._phase3_tools()
 
         matches = []
         passed_count = 0
 
         for hyp in hypotheses:
-            hyp_id = hyp.get("id", "")
-            data_needs = hyp.get("data_needs", [])
-
-            # 의미적 매칭
-            match_result = matcher.match_hypothesis(hyp)
-            unique_apis = match_result.get("unique_apis", [])
-
-            # 조인 키 분석
-            join_pairs = join_analyzer.analyze_api_pairs(
-                [{"api_id": a["api_id"], "params": []} for a in unique_apis]
-            )
-            join_key_count = sum(len(jp.get("join_keys", [])) for jp in join_pairs)
-
-            # 적합도 계산
-            matched_needs = sum(
-                1 for m in match_result.get("matches_by_need", [])
-                if m.get("matched_apis")
-            )
-            feasibility = feasibility_calc.calculate(
-                total_data_needs=len(data_needs),
-                matched_data_needs=matched_needs,
-                matched_api_count=len(unique_apis),
-                join_key_count=join_key_count,
-            )
-
-            match_entry = {
-                "hypothesis_id": hyp_id,
-                "matched_apis": unique_apis[:10],
-                "join_pairs": join_pairs,
-                "feasibility_pct": feasibility["feasibility_pct"],
-                "passed": feasibility["passed"],
-            }
+            match_entry = self._match_one(hyp, matcher, join_analyzer, feasibility_calc)
             matches.append(match_entry)
-
-            if feasibility["passed"]:
+            if match_entry["passed"]:
                 passed_count += 1
-                hyp["matched_apis"] = unique_apis[:10]
-                hyp["feasibility_pct"] = feasibility["feasibility_pct"]
 
         self._logger.info(
             f"Phase 3: {passed_count}/{len(hypotheses)} hypotheses passed feasibility gate"
@@ -793,6 +1695,71 @@ class IdeationEngine:
             "duration_sec": elapsed,
         }
 
+    @staticmethod
+    def _phase3_tools() -> tuple[Any, Any, Any]:
+        """Phase 3 도구 (의미적 매처, 조인 분석기, 적합도 계산기).
+
+        카탈로그에 조인 키 그래프가 만들어져 있으면 가설마다 파라미터를 비교하는
+        JoinAnalyzer 대신 그래프 조회(JoinGraph)를 쓴다 — 반환 형식은 같다.
+        """
+        from feasibility import FeasibilityCalculator
+        from join_graph import JoinGraph
+        from semantic_matcher import SemanticMatcher
+
+        join_analyzer: Any = JoinGraph()
+        if not join_analyzer.available():
+            from join_analyzer import JoinAnalyzer
+
+            join_analyzer = JoinAnalyzer()
+        return SemanticMatcher(), join_analyzer, FeasibilityCalculator()
+
+    def _match_one(self, hyp: dict, matcher: Any, join_analyzer: Any, feasibility_calc: Any) -> dict[str, Any]:
+        """가설 1건의 의미적 매칭 + 조인 분석 + 적합도. 통과 시 hyp에 매칭 결과를 기록한다."""
+        hyp_id = hyp.get("id", "")
+        data_needs = hyp.get("data_needs", [])
+
+        # 의미적 매칭
+        match_result = matcher.match_hypothesis(hyp)
+        unique_apis = match_result.get("unique_apis", [])
+
+        # 조인 키 분석
+        join_pairs = join_analyzer.analyze_api_pairs(
+            [{"api_id": a["api_id"], "params": []} for a in unique_apis]
+        )
+        join_key_count = sum(len(jp.get("join_keys", [])) for jp in join_pairs)
+
+        # 적합도 계산
+        matched_needs = sum(
+            1 for m in match_result.get("matches_by_need", [])
+            if m.get("matched_apis")
+        )
+        feasibility_inputs = {
+            "total_data_needs": len(data_needs),
+            "matched_data_needs": matched_needs,
+            "matched_api_count": len(unique_apis),
+            "join_key_count": join_key_count,
+        }
+        feasibility = feasibility_calc.calculate(**feasibility_inputs)
+
+        # 사전 계산 이웃으로 확장 — 상위 매칭 API와 유사/조인 가능한 API (모델 추론 없음)
+        related = related_apis([a["api_id"] for a in unique_apis[:3]])
+
+        if feasibility["passed"]:
+            hyp["matched_apis"] = unique_apis[:10]
+            hyp["feasibility_pct"] = feasibility["feasibility_pct"]
+            if related:
+                hyp["related_apis"] = related
+
+        return {
+            "hypothesis_id": hyp_id,
+            "matched_apis": unique_apis[:10],
+            "related_apis": related,
+            "join_pairs": join_pairs,
+            "feasibility_pct": feasibility["feasibility_pct"],
+            "passed": feasibility["passed"],
+            "feasibility_inputs": feasibility_inputs,  # 리플레이 시 매칭 없이 재계산
+        }
+
     # ── Phase 4: 시장 검증 ──
 
     def _phase4(self, phase3_result: dict) -> dict[str, Any]:
@@ -819,156 +1786,342 @@ class IdeationEngine:
                 "duration_sec": elapsed,
             }
 
+        competitor_searcher, proxy_scorer, validation_scorer = self._phase4_tools()
+
+        # Claude CLI 검증 — 트리아지 상위는 개별(deep), 나머지는 배치(light) 호출
+        template = self.templates.template("phase4_validation.md")
+        prompt_template = template.text
+        triage: list[dict[str, Any]] = []
+        if depth != "simplified":
+            ranked = self._triage(passed_hypotheses)
+            quota = self.budget.deep_quota(len(ranked))
+            for rank, hyp in enumerate(ranked):
+                route = "deep" if rank < quota else "light"
+                triage.append({"id": hyp.get("id", ""), "triage_score": hyp["triage_score"], "route": route})
+            self._logger.info(
+                f"Phase 4: triage — {min(quota, len(ranked))} deep, "
+                f"{max(len(ranked) - quota, 0)} light (budget {self.budget.phase_budget(4):.0f}s)"
+            )
+            for hyp in ranked[:quota]:
+                self._claude_validate_one(hyp, prompt_template)
+            if ranked[quota:]:
+                self._claude_validate_batch(ranked[quota:], prompt_template)
+
+        # simplified 모드: Claude CLI 스킵, 기본값 사용
+
+        validations = []
+        validation_inputs: dict[str, dict[str, Any]] = {}
+
+        for hyp in passed_hypotheses:
+            validation_inputs[hyp.get("id", "")] = self._score_validation(
+                hyp, competitor_searcher, proxy_scorer, validation_scorer
+            )
+            validations.append(hyp)
+
+        passed_validations = [v for v in validations if v.get("validation_passed")]
+        self._logger.info(
+            f"Phase 4: {len(passed_validations)}/{len(validations)} passed validation gate"
+        )
+
+        elapsed = self.budget.end_phase(4)
+        return {
+            "batch_id": self.batch_id,
+            "validations": passed_validations,
+            "total_validated": len(validations),
+            "passed_count": len(passed_validations),
+            "skipped": False,
+            "prompt_version": template.version,
+            "triage": triage,
+            "validation_inputs": validation_inputs,
+            "duration_sec": elapsed,
+        }
+
+    @staticmethod
+    def _phase4_tools() -> tuple[Any, Any, Any]:
+        """Phase 4 도구 (경쟁사 검색기, 시장 프록시 스코어러, 검증 스코어러)."""
         from competitor_search import CompetitorSearcher
         from market_proxy_scorer import MarketProxyScorer
         from validation_scorer import ValidationScorer
 
-        competitor_searcher = CompetitorSearcher()
-        proxy_scorer = MarketProxyScorer()
-        validation_scorer = ValidationScorer()
+        return CompetitorSearcher(), MarketProxyScorer(), ValidationScorer()
 
-        # Claude CLI 검증 — depth에 따라 개별/배치 호출
-        if depth in ("deep", "standard"):
-            # 개별 호출: 가설별 상세 검증
-            for hyp in passed_hypotheses:
-                try:
-                    prompt_path = PROMPTS_DIR / "phase4_validation.md"
-                    prompt_template = prompt_path.read_text(encoding="utf-8") if prompt_path.exists() else ""
-                    sn = hyp.get("service_name", "")
-                    validation_prompt = (
-                        f"{prompt_template}\n\n"
-                        f"## 검증 대상\n"
-                        f"- 서비스: {sn}\n"
-                        f"- 문제: {hyp.get('problem', '')}\n"
-                        f"- 솔루션: {hyp.get('solution', '')}\n"
-                        f"- 타깃: {hyp.get('target_buyer', '')}\n"
-                        f"- 수익 모델: {hyp.get('revenue_model', '')}\n"
-                        f"\n응답은 JSON으로: "
-                        f'{{"timing_fit": 0.0~1.0, "revenue_reference": 0.0~1.0, "mvp_difficulty": 0.0~1.0}}'
-                    )
-                    vr = self.claude.invoke(validation_prompt, phase=4)
-                    hyp["_timing_fit"] = float(vr.get("timing_fit", 0.5))
-                    hyp["_revenue_reference"] = float(vr.get("revenue_reference", 0.5))
-                    hyp["_mvp_difficulty"] = float(vr.get("mvp_difficulty", 0.5))
-                except Exception as e:
-                    self._logger.warning(f"Claude validation failed for '{sn}': {e}")
+    def _triage(self, hypotheses: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """사전 점수(triage_score) 내림차순으로 정렬한 가설 목록을 반환한다 (hyp에 점수 기록)."""
+        archive_names: list[str] = []
+        try:
+            from archive_manager import ArchiveManager
 
-        elif depth == "light":
-            # 배치 호출: 전체 가설을 한번에 검증 (시간 절약)
-            try:
-                prompt_path = PROMPTS_DIR / "phase4_validation.md"
-                prompt_template = prompt_path.read_text(encoding="utf-8") if prompt_path.exists() else ""
-                batch_items = []
-                for hyp in passed_hypotheses:
-                    batch_items.append({
-                        "id": hyp.get("id", ""),
-                        "service_name": hyp.get("service_name", ""),
-                        "problem": hyp.get("problem", "")[:80],
-                        "target": hyp.get("target_buyer", ""),
-                        "revenue": hyp.get("revenue_model", ""),
-                    })
-                batch_prompt = (
-                    f"{prompt_template}\n\n"
-                    f"## 배치 검증 대상\n"
-                    f"```json\n{json.dumps(batch_items, ensure_ascii=False, indent=2)}\n```\n\n"
-                    "각 아이디어에 대해 위 평가 기준으로 점수를 부여하세요.\n"
-                    "응답은 JSON 배열로:\n"
-                    '[{"id": "H-001", "timing_fit": 0.7, "revenue_reference": 0.6, "mvp_difficulty": 0.4}, ...]'
-                )
-                batch_raw = self.claude.invoke(batch_prompt, phase=4)
-                if isinstance(batch_raw, list):
-                    vmap = {item["id"]: item for item in batch_raw if isinstance(item, dict)}
-                elif isinstance(batch_raw, dict) and "validations" in batch_raw:
-                    vmap = {item["id"]: item for item in batch_raw["validations"] if isinstance(item, dict)}
-                else:
-                    vmap = {}
+            archive_names = list(
+                ArchiveManager().get_service_names(hours=TRIAGE_NOVELTY_LOOKBACK_HOURS) or []
+            )
+        except Exception:
+            pass
+        archive_bigrams = [_bigrams(name) for name in archive_names]
+        for hyp in hypotheses:
+            hyp["triage_score"] = _triage_score(hyp, archive_bigrams)
+        return sorted(hypotheses, key=lambda h: h["triage_score"], reverse=True)
 
-                for hyp in passed_hypotheses:
-                    hid = hyp.get("id", "")
-                    v = vmap.get(hid, {})
-                    hyp["_timing_fit"] = float(v.get("timing_fit", 0.5))
-                    hyp["_revenue_reference"] = float(v.get("revenue_reference", 0.5))
-                    hyp["_mvp_difficulty"] = float(v.get("mvp_difficulty", 0.5))
+    def _claude_validate_batch(self, hypotheses: list[dict[str, Any]], prompt_template: str) -> None:
+        """가설 여러 건을 Claude CLI 배치 호출로 검증하여 임시 필드에 기록한다 (실패 시 기본값)."""
+        try:
+            batch_items = [
+                {"id": hyp.get("id", ""), **shorten(
+                    hyp, ["service_name", "problem", "target_buyer", "revenue_model"], max_chars=80,
+                )}
+                for hyp in hypotheses
+            ]
 
-                self._logger.info(f"Phase 4: batch validation done for {len(vmap)} hypotheses")
-            except Exception as e:
-                self._logger.warning(f"Phase 4 batch validation failed, using defaults: {e}")
+            def build_batch_prompt(items: list[dict[str, Any]]) -> str:
+                return (
+                    PromptBuilder(4)
+                    .add_text(prompt_template)
+                    .add_section("배치 검증 대상", items, priority=0, shrink_to=40)
+                    .add_text(
+                        "각 아이디어에 대해 위 평가 기준으로 점수를 부여하세요.\n"
+                        "응답은 JSON 배열로:\n"
+                        '[{"id": "H-001", "timing_fit": 0.7, "revenue_reference": 0.6, "mvp_difficulty": 0.4}, ...]'
+                    )
+                    .build()
+                )
 
-        # simplified 모드: Claude CLI 스킵, 기본값 사용
+            vmap = self._invoke_batch(
+                build_batch_prompt, batch_items, ValidationJudgement,
+                phase=4, list_key="validations",
+            )
 
-        validations = []
+            for hyp in hypotheses:
+                v = vmap.get(hyp.get("id", ""), {})
+                hyp["_timing_fit"] = float(v.get("timing_fit", 0.5))
+                hyp["_revenue_reference"] = float(v.get("revenue_reference", 0.5))
+                hyp["_mvp_difficulty"] = float(v.get("mvp_difficulty", 0.5))
 
-        for hyp in passed_hypotheses:
-            service_name = hyp.get("service_name", "")
+            self._logger.info(f"Phase 4: batch validation done for {len(vmap)} hypotheses")
+        except Exception as e:
+            self._logger.warning(f"Phase 4 batch validation failed, using defaults: {e}")
 
-            # 경쟁사 검색 (비동기)
-            try:
-                competitors = asyncio.run(competitor_searcher.search(service_name))
-            except Exception as e:
-                self._logger.warning(f"Competitor search failed for '{service_name}': {e}")
-                competitors = []
-
-            # 시장 프록시 스코어 — 가설 기반 동적 추정
-            target = hyp.get("target_buyer", "")
-            community_size = "large" if any(
-                kw in target for kw in ("공공", "전국", "정부", "지자체", "시민", "국민")
-            ) else "small" if any(
-                kw in target for kw in ("연구", "전문", "특정", "니치")
-            ) else "medium"
-
-            comp_count = len(competitors)
-            search_trend = (
-                "rising" if comp_count >= 5 else
-                "stable" if comp_count >= 2 else
-                "declining"
+    def _claude_validate_one(self, hyp: dict, prompt_template: str) -> None:
+        """가설 1건을 Claude CLI로 개별 검증하여 임시 필드(_timing_fit 등)에 기록한다."""
+        sn = hyp.get("service_name", "")
+        try:
+            validation_prompt = (
+                f"{prompt_template}\n\n"
+                f"## 검증 대상\n"
+                f"- 서비스: {sn}\n"
+                f"- 문제: {hyp.get('problem', '')}\n"
+                f"- 솔루션: {hyp.get('solution', '')}\n"
+                f"- 타깃: {hyp.get('target_buyer', '')}\n"
+                f"- 수익 모델: {hyp.get('revenue_model', '')}\n"
+                f"\n응답은 JSON으로: "
+                f'{{"timing_fit": 0.0~1.0, "revenue_reference": 0.0~1.0, "mvp_difficulty": 0.0~1.0}}'
             )
+            vr = self.claude.invoke(validation_prompt, phase=4)
+            hyp["_timing_fit"] = float(vr.get("timing_fit", 0.5))
+            hyp["_revenue_reference"] = float(vr.get("revenue_reference", 0.5))
+            hyp["_mvp_difficulty"] = float(vr.get("mvp_difficulty", 0.5))
+        except Exception as e:
+            self._logger.warning(f"Claude validation failed for '{sn}': {e}")
 
-            proxy_score = proxy_scorer.score({
-                "similar_services_count": comp_count,
-                "target_community_size": community_size,
-                "search_trend": search_trend,
-            })
+    def _score_validation(
+        self, hyp: dict, competitor_searcher: Any, proxy_scorer: Any, validation_scorer: Any
+    ) -> dict[str, Any]:
+        """경쟁사 검색 + 프록시 스코어 + 종합 검증 점수를 hyp에 기록한다.
 
-            # Claude CLI 검증값 (아래 배치/개별 호출에서 채워짐)
-            timing_fit = hyp.get("_timing_fit", 0.5)
-            revenue_reference = hyp.get("_revenue_reference", 0.5)
-            mvp_difficulty = hyp.get("_mvp_difficulty", 0.5)
-
-            # 종합 검증 점수
-            validation_result = validation_scorer.calculate(
-                hypothesis_data={
-                    "timing_fit": timing_fit,
-                    "revenue_reference": revenue_reference,
-                    "mvp_difficulty": mvp_difficulty,
-                },
-                competitors=competitors,
-                proxy_score=proxy_score,
-            )
+        ValidationScorer 입력(Claude 판단값, 경쟁사, 프록시 점수)을 반환한다 — 리플레이용 기록.
+        """
+        service_name = hyp.get("service_name", "")
 
-            hyp["validation_score"] = validation_result["total_score"]
-            hyp["validation_passed"] = validation_result["passed"]
-            hyp["validation_breakdown"] = validation_result["breakdown"]
-            hyp["competitors_count"] = len(competitors)
-            # 임시 필드 정리
-            hyp.pop("_timing_fit", None)
-            hyp.pop("_revenue_reference", None)
-            hyp.pop("_mvp_difficulty", None)
-            validations.append(hyp)
+        # 경쟁사 검색 (비동기)
+        try:
+            competitors = asyncio.run(competitor_searcher.search(service_name))
+        except Exception as e:
+            self._logger.warning(f"Competitor search failed for '{service_name}': {e}")
+            competitors = []
+
+        # 시장 프록시 스코어 — 가설 기반 동적 추정
+        target = hyp.get("target_buyer", "")
+        community_size = "large" if any(
+            kw in target for kw in ("공공", "전국", "정부", "지자체", "시민", "국민")
+        ) else "small" if any(
+            kw in target for kw in ("연구", "전문", "특정", "니치")
+        ) else "medium"
+
+        comp_count = len(competitors)
+        search_trend = (
+            "rising" if comp_count >= 5 else
+            "stable" if comp_count >= 2 else
+            "declining"
+        )
 
-        passed_validations = [v for v in validations if v.get("validation_passed")]
+        proxy_score = proxy_scorer.score({
+            "similar_services_count": comp_count,
+            "target_community_size": community_size,
+            "search_trend": search_trend,
+        })
+
+        # Claude CLI 검증값 (배치/개별 호출에서 채워짐)
+        timing_fit = hyp.get("_timing_fit", 0.5)
+        revenue_reference = hyp.get("_revenue_reference", 0.5)
+        mvp_difficulty = hyp.get("_mvp_difficulty", 0.5)
+
+        # 종합 검증 점수
+        inputs = {
+            "hypothesis_data": {
+                "timing_fit": timing_fit,
+                "revenue_reference": revenue_reference,
+                "mvp_difficulty": mvp_difficulty,
+            },
+            "competitors": competitors,
+            "proxy_score": proxy_score,
+        }
+        validation_result = validation_scorer.calculate(**inputs)
+
+        hyp["validation_score"] = validation_result["total_score"]
+        hyp["validation_passed"] = validation_result["passed"]
+        hyp["validation_breakdown"] = validation_result["breakdown"]
+        hyp["competitors_count"] = len(competitors)
+        # 임시 필드 정리
+        hyp.pop("_timing_fit", None)
+        hyp.pop("_revenue_reference", None)
+        hyp.pop("_mvp_difficulty", None)
+        return inputs
+
+    # ── 스트리밍 모드: Phase 2 → 3 → 4 ──
+
+    async def _run_streaming(self, phase1_result: dict) -> tuple[dict, dict, dict]:
+        """Phase 2~4를 가설 단위로 흘려보낸다 (opt-in).
+
+        단계 사이는 asyncio 큐로 연결하고, 각 단계는 STREAM_STAGE_CONCURRENCY개 워커가
+        블로킹 작업을 스레드로 처리한다. Phase 3/4는 파이프라인 시작과 함께 시작하고,
+        종료 시 앞 단계와 겹친 시간을 overlap_sec로 넘겨 풀 차감을 실제 경과 시간에 맞춘다.
+        Phase 4 깊이는 가설마다 남은 시간으로 판단한다 (deep → simplified → skipped).
+        """
+        matcher, join_analyzer, feasibility_calc = self._phase3_tools()
+        competitor_searcher, proxy_scorer, validation_scorer = self._phase4_tools()
+        template = self.templates.template("phase4_validation.md")
+
+        n3 = STREAM_STAGE_CONCURRENCY.get(3, 1)
+        n4 = STREAM_STAGE_CONCURRENCY.get(4, 1)
+        q3: asyncio.Queue = asyncio.Queue()
+        q4: asyncio.Queue = asyncio.Queue()
+        stage_ends: dict[int, float] = {}
+        p2: dict[str, Any] = {}
+        matches: list[tuple[int, dict]] = []
+        passed: list[tuple[int, dict]] = []
+        validations: list[tuple[int, dict]] = []
+        validation_inputs: dict[str, dict[str, Any]] = {}
+
+        async def match(item: tuple[int, dict]) -> None:
+            idx, hyp = item
+            try:
+                entry = await asyncio.to_thread(
+                    self._match_one, hyp, matcher, join_analyzer, feasibility_calc
+                )
+            except Exception as e:
+                self._logger.warning(f"Phase 3 (stream): matching failed for {hyp.get('id')}: {e}")
+                return
+            matches.append((idx, entry))
+            if entry["passed"]:
+                passed.append((idx, hyp))
+                await q4.put(item)
+
+        async def validate(item: tuple[int, dict]) -> None:
+            idx, hyp = item
+            depth = self.budget.adaptive_depth(1)
+            if depth == "skipped":
+                hyp["validation_score"] = None
+                hyp["validation_passed"] = True
+                hyp["default_v"] = 3
+            else:
+                if depth != "simplified":
+                    await asyncio.to_thread(self._claude_validate_one, hyp, template.text)
+                try:
+                    inputs = await asyncio.to_thread(
+                        self._score_validation,
+                        hyp, competitor_searcher, proxy_scorer, validation_scorer,
+                    )
+                except Exception as e:
+                    self._logger.warning(f"Phase 4 (stream): scoring failed for {hyp.get('id')}: {e}")
+                    return
+                if inputs:
+                    validation_inputs[hyp.get("id", "")] = inputs
+            hyp["depth_mode"] = depth
+            validations.append((idx, hyp))
+
+        async def stage2() -> None:
+            nonlocal p2
+            loop = asyncio.get_running_loop()
+            delivered: list[dict] = []
+
+            def on_hypothesis(hyp: dict) -> None:
+                # Claude 출력 스레드에서 호출 — 완성된 가설을 바로 Phase 3 큐로
+                idx = len(delivered)
+                delivered.append(hyp)
+                loop.call_soon_threadsafe(q3.put_nowait, (idx, hyp))
+
+            try:
+                p2 = await asyncio.to_thread(self._phase2, phase1_result, on_hypothesis=on_hypothesis)
+                streamed = {id(h) for h in delivered}
+                for hyp in p2.get("hypotheses", []):
+                    if id(hyp) not in streamed:
+                        await q3.put((len(delivered), hyp))
+                        delivered.append(hyp)
+            finally:
+                stage_ends[2] = time.monotonic()
+                for _ in range(n3):
+                    await q3.put(_STREAM_DONE)
+
+        async def stage(phase: int, queue: asyncio.Queue, workers: int, handle: Any,
+                        downstream: tuple[asyncio.Queue, int] | None) -> float:
+            self.budget.start_phase(phase)
+            started = time.monotonic()
+            try:
+                await _drain_stage(queue, workers, handle)
+            finally:
+                stage_ends[phase] = time.monotonic()
+                if downstream is not None:
+                    for _ in range(downstream[1]):
+                        await downstream[0].put(_STREAM_DONE)
+            overlap = max(0.0, stage_ends.get(phase - 1, started) - started)
+            return self.budget.end_phase(phase, overlap_sec=overlap)
+
+        _, elapsed3, elapsed4 = await asyncio.gather(
+            stage2(),
+            stage(3, q3, n3, match, (q4, n4)),
+            stage(4, q4, n4, validate, None),
+        )
+
+        hypotheses = p2.get("hypotheses", [])
         self._logger.info(
-            f"Phase 4: {len(passed_validations)}/{len(validations)} passed validation gate"
+            f"Phase 3 (stream): {len(passed)}/{len(hypotheses)} hypotheses passed feasibility gate"
         )
+        p3 = {
+            "batch_id": self.batch_id,
+            "matches": [m for _, m in sorted(matches, key=lambda x: x[0])],
+            "passed_count": len(passed),
+            "passed_hypotheses": [h for _, h in sorted(passed, key=lambda x: x[0])],
+            "duration_sec": elapsed3,
+        }
 
-        elapsed = self.budget.end_phase(4)
-        return {
+        validated = [h for _, h in sorted(validations, key=lambda x: x[0])]
+        passed_validations = [v for v in validated if v.get("validation_passed")]
+        all_skipped = bool(validated) and all(v.get("depth_mode") == "skipped" for v in validated)
+        self._logger.info(
+            f"Phase 4 (stream): {len(passed_validations)}/{len(validated)} passed validation gate"
+        )
+        p4 = {
             "batch_id": self.batch_id,
             "validations": passed_validations,
-            "total_validated": len(validations),
+            "total_validated": len(validated),
             "passed_count": len(passed_validations),
-            "skipped": False,
-            "duration_sec": elapsed,
+            "skipped": all_skipped,
+            "streaming": True,
+            "prompt_version": template.version,
+            "validation_inputs": validation_inputs,
+            "duration_sec": elapsed4,
         }
+        if all_skipped:
+            p4["default_v"] = 3
+        return p2, p3, p4
 
     # ── Phase 5: 스코어링 ──
 
@@ -987,71 +2140,58 @@ class IdeationEngine:
         scorer = NUMRVScorer()
         dedup = DedupEngine()
         grader = GradeClassifier()
+        # 보낸 프롬프트와 기록하는 버전이 같은 파일 내용이 되도록 한 번만 읽는다
+        template = self.templates.template("phase5_scoring.md")
 
         # Claude CLI로 NUMR 상대 평가 (배치 전체)
+        numr_map: dict[str, dict[str, Any]] = {}
         if validations:
             try:
-                prompt_path = PROMPTS_DIR / "phase5_scoring.md"
-                prompt_template = prompt_path.read_text(encoding="utf-8") if prompt_path.exists() else ""
+                prompt_template = template.text
+
+                ideas_summary = [
+                    {"id": v.get("id", ""), **shorten(v, [
+                        "service_name", "problem", "solution", "target_buyer",
+                        "feasibility_pct", "validation_score",
+                    ], max_chars=200)}
+                    for v in validations
+                ]
 
-                ideas_summary = []
-                for v in validations:
-                    ideas_summary.append({
-                        "id": v.get("id", ""),
-                        "service_name": v.get("service_name", ""),
-                        "problem": v.get("problem", ""),
-                        "solution": v.get("solution", ""),
-                        "target_buyer": v.get("target_buyer", ""),
-                        "feasibility_pct": v.get("feasibility_pct", 0),
-                        "validation_score": v.get("validation_score"),
-                    })
+                def build_scoring_prompt(items: list[dict[str, Any]]) -> str:
+                    return (
+                        PromptBuilder(5)
+                        .add_text(prompt_template)
+                        .add_section("평가 대상 아이디어 배치", items, priority=0, shrink_to=40)
+                        .add_text(
+                            "각 아이디어에 N, U, M, R 점수(1~5)를 JSON 배열로 출력하세요:\n"
+                            '[{"id": "H-001", "N": 3, "U": 4, "M": 3, "R": 4}, ...]'
+                        )
+                        .build()
+                    )
 
-                scoring_prompt = (
-                    f"{prompt_template}\n\n"
-                    f"## 평가 대상 아이디어 배치\n"
-                    f"```json\n{json.dumps(ideas_summary, ensure_ascii=False, indent=2)}\n```\n\n"
-                    f"각 아이디어에 N, U, M, R 점수(1~5)를 JSON 배열로 출력하세요:\n"
-                    f'[{{"id": "H-001", "N": 3, "U": 4, "M": 3, "R": 4}}, ...]'
+                numr_map = self._invoke_batch(
+                    build_scoring_prompt, ideas_summary, NUMRRanking,
+                    phase=5, list_key="scores", calibrate_fields=("N", "U", "M", "R"),
                 )
-                numr_raw = self.claude.invoke(scoring_prompt, phase=5)
-
-                # 결과 매핑
-                if isinstance(numr_raw, list):
-                    numr_map = {item["id"]: item for item in numr_raw if isinstance(item, dict)}
-                elif isinstance(numr_raw, dict) and "scores" in numr_raw:
-                    numr_map = {item["id"]: item for item in numr_raw["scores"] if isinstance(item, dict)}
-                else:
-                    numr_map = {}
 
                 for v in validations:
-                    vid = v.get("id", "")
-                    numr = numr_map.get(vid, {})
-                    v_score = default_v if is_skipped else (v.get("validation_score", 50) / 20)
+                    numr = numr_map.get(v.get("id", ""))
+                    if numr is None:
+                        # 검증 실패 항목만 휴리스틱 점수
+                        v["scores"] = self._heuristic_numrv(v, is_skipped, default_v)
+                        continue
                     v["scores"] = {
-                        "N": float(numr.get("N", 3)),
-                        "U": float(numr.get("U", 3)),
-                        "M": float(numr.get("M", 3)),
-                        "R": float(numr.get("R", 3)),
-                        "V": min(float(v_score), 5.0),
+                        "N": float(numr["N"]),
+                        "U": float(numr["U"]),
+                        "M": float(numr["M"]),
+                        "R": float(numr["R"]),
+                        "V": self._v_dimension(v, is_skipped, default_v),
                     }
 
             except Exception as e:
                 self._logger.warning(f"Phase 5 Claude scoring failed, using heuristic defaults: {e}")
                 for v in validations:
-                    v_score = default_v if is_skipped else (v.get("validation_score", 50) / 20)
-                    # 휴리스틱 기반 점수 — Claude 실패 시에도 차별화
-                    feas = v.get("feasibility_pct", 50)
-                    val = v.get("validation_score", 50)
-                    comp = v.get("competitors_count", 0)
-                    n_score = max(1, min(5, 5 - (comp * 0.5)))           # 경쟁 적을수록 참신
-                    u_score = max(1, min(5, val / 20))                    # 검증 높을수록 긴급
-                    m_score = max(1, min(5, 1 + (comp * 0.6)))           # 경쟁 존재 = 시장 존재
-                    r_score = max(1, min(5, feas / 20))                   # 적합도 높을수록 실현 가능
-                    v["scores"] = {
-                        "N": round(n_score, 1), "U": round(u_score, 1),
-                        "M": round(m_score, 1), "R": round(r_score, 1),
-                        "V": min(float(v_score), 5.0),
-                    }
+                    v["scores"] = self._heuristic_numrv(v, is_skipped, default_v)
 
         # NUMR-V 가중 점수
         scored = scorer.score_batch(validations)
@@ -1059,6 +2199,7 @@ class IdeationEngine:
         # 중복제거 (임베딩이 있는 경우만)
         scored = dedup.check_duplicates(scored)
         unique_ideas = [s for s in scored if not s.get("is_duplicate", False)]
+        duplicate_ids = [s.get("id", "") for s in scored if s.get("is_duplicate", False)]
 
         # 등급 분류
         graded = grader.classify(unique_ideas)
@@ -1074,9 +2215,40 @@ class IdeationEngine:
             "scored_ideas": graded,
             "total_scored": len(scored),
             "duplicates_removed": len(scored) - len(unique_ideas),
+            "prompt_version": template.version,
+            # 리플레이용 기록 — Claude NUMR 응답, 중복 판정
+            "numr_scores": {
+                hid: {k: numr[k] for k in ("N", "U", "M", "R")} for hid, numr in numr_map.items()
+            },
+            "duplicate_ids": duplicate_ids,
             "duration_sec": elapsed,
         }
 
+    @staticmethod
+    def _v_dimension(v: dict[str, Any], is_skipped: bool, default_v: Any) -> float:
+        """V 차원 — Phase 4 점수/20 (최대 5). 스킵(전체 또는 스트리밍 개별)이면 기본 V."""
+        val = v.get("validation_score", 50)
+        if is_skipped or val is None:
+            return float(v.get("default_v") or default_v or 3)
+        return min(float(val) / 20, 5.0)
+
+    @classmethod
+    def _heuristic_numrv(cls, v: dict[str, Any], is_skipped: bool, default_v: Any) -> dict[str, float]:
+        """Claude 점수가 없을 때의 휴리스틱 NUMR-V — 실패 시에도 차별화."""
+        feas = v.get("feasibility_pct", 50)
+        val = v.get("validation_score")
+        val = 50 if val is None else val  # Phase 4 스킵 시 None
+        comp = v.get("competitors_count", 0)
+        n_score = max(1, min(5, 5 - (comp * 0.5)))           # 경쟁 적을수록 참신
+        u_score = max(1, min(5, val / 20))                    # 검증 높을수록 긴급
+        m_score = max(1, min(5, 1 + (comp * 0.6)))           # 경쟁 존재 = 시장 존재
+        r_score = max(1, min(5, feas / 20))                   # 적합도 높을수록 실현 가능
+        return {
+            "N": round(n_score, 1), "U": round(u_score, 1),
+            "M": round(m_score, 1), "R": round(r_score, 1),
+            "V": cls._v_dimension(v, is_skipped, default_v),
+        }
+
     # ── Phase 6: 발행 ──
 
     def _phase6(self, phase5_result: dict) -> dict[str, Any]:
@@ -1135,13 +2307,21 @@ def main() -> None:
     parser.add_argument("--manual-signals", type=str, help="수동 신호 텍스트 (Phase 1 스킵)")
     parser.add_argument("--assumptions", type=str, help="사용자 가정/관찰 → LLM이 키워드 추출")
     parser.add_argument("--dry-run", action="store_true", help="Claude CLI 모킹 (테스트용)")
+    parser.add_argument("--streaming", action="store_true", help="Phase 2~4 가설 단위 스트리밍 실행")
+    parser.add_argument("--resume", type=str, metavar="BATCH_ID",
+                        help="중단된 배치를 체크포인트에서 이어서 실행 (완료된 Phase 스킵)")
     args = parser.parse_args()
 
-    engine = IdeationEngine(
-        manual_signals=args.manual_signals,
-        assumptions=args.assumptions,
-        dry_run=args.dry_run,
-    )
+    try:
+        engine = IdeationEngine(
+            manual_signals=args.manual_signals,
+            assumptions=args.assumptions,
+            dry_run=args.dry_run,
+            streaming=args.streaming,
+            resume=args.resume,
+        )
+    except FileNotFoundError as e:
+        parser.error(str(e))
     result = engine.run()
 
     # 결과 출력
@@ -17,7 +17,7 @@ from fastapi import FastAPI
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
-from server.routers import ideas, feedback, health, curation
+from server.routers import ideas, feedback, health, curation, catalog
 
 _START_TIME = time.monotonic()
 
@@ -28,6 +28,7 @@ app.include_router(ideas.router, prefix="/api")
 app.include_router(feedback.router, prefix="/api")
 app.include_router(health.router, prefix="/api")
 app.include_router(curation.router, prefix="/api")
+app.include_router(catalog.router, prefix="/api")
 
 # 루트 → 대시보드 리다이렉트
 @app.get("/")
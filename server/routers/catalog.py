@@ -0,0 +1,33 @@
+"""카탈로그 API — GET /api/catalog/{api_id}/neighbors (사전 계산 유사·조인 가능 API)."""
+
+from __future__ import annotations
+
+import sqlite3
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from fastapi import APIRouter, HTTPException, Query
+
+from api_neighbors import get_neighbors
+from catalog_release import refresh_active_release
+
+router = APIRouter(tags=["catalog"])
+
+
+@router.get("/catalog/{api_id}/neighbors")
+def list_neighbors(
+    api_id: str,
+    limit: int = Query(10, ge=1, le=50, description="최대 이웃 수"),
+    joinable: bool = Query(False, description="조인 키를 공유하는 API만"),
+):
+    """API의 관련 API 목록을 반환한다 (카탈로그 갱신 시 계산된 값 조회)."""
+    try:
+        refresh_active_release()  # 상주 프로세스 — 새로 게시된 릴리스로 전환
+        neighbors = get_neighbors(api_id, limit=limit, joinable_only=joinable)
+    except sqlite3.Error as e:
+        raise HTTPException(status_code=503, detail=f"Catalog unavailable: {e}")
+    return {"api_id": api_id, "neighbors": neighbors}
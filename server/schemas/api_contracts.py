@@ -131,6 +131,15 @@ class ValidationScores(BaseModel):
         )
 
 
+class ValidationJudgement(BaseModel):
+    """Phase 4 Claude 응답 항목 — ValidationScores의 timing/revenue/mvp 비율 (0~1)."""
+
+    id: str = Field(description="가설 ID")
+    timing_fit: float = Field(ge=0, le=1, description="타이밍 적합성 비율 (×20)")
+    revenue_reference: float = Field(ge=0, le=1, description="수익화 사례 비율 (×15)")
+    mvp_difficulty: float = Field(ge=0, le=1, description="MVP 난이도 비율 (×15)")
+
+
 class HypothesisValidation(BaseModel):
     hypothesis_id: str
     competitors: list[CompetitorInfo] = Field(default_factory=list)
@@ -161,6 +170,16 @@ class NUMRVScores(BaseModel):
     V: float = Field(ge=1, le=5, description="Validation (1~5)")
 
 
+class NUMRRanking(BaseModel):
+    """Phase 5 Claude 응답 항목 — NUMRVScores 중 N/U/M/R (V는 Phase 4 점수에서 산출)."""
+
+    id: str = Field(description="가설 ID")
+    N: float = Field(ge=1, le=5, description="Novelty (1~5)")
+    U: float = Field(ge=1, le=5, description="Urgency (1~5)")
+    M: float = Field(ge=1, le=5, description="Market Demand (1~5)")
+    R: float = Field(ge=1, le=5, description="Revenue (1~5)")
+
+
 class ScoredIdea(BaseModel):
     hypothesis_id: str
     service_name: str
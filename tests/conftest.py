@@ -0,0 +1,37 @@
+"""공용 픽스처 — 자원 락 파일과 구조화 로그를 테스트별 임시 디렉터리에 둔다.
+
+output/locks 오염을 막고, 테스트가 남긴 Phase 소요 시간 기록이 실제 런의 예산 이력
+(PhaseDurationHistory.from_logs)에 섞이지 않게 한다.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import logger as project_logger
+import resource_guard
+
+
+@pytest.fixture(autouse=True)
+def _resource_lock_dir(tmp_path_factory, monkeypatch):
+    lock_dir = tmp_path_factory.mktemp("locks")
+    monkeypatch.setattr(resource_guard, "RESOURCE_LOCK_DIR", lock_dir)
+    monkeypatch.setattr(resource_guard, "_guard", resource_guard.ResourceGuard(lock_dir))
+
+
+@pytest.fixture(autouse=True)
+def log_dir(tmp_path_factory, monkeypatch):
+    """이 테스트의 JSONL 로그 디렉터리 — 이미 만들어진 로거의 파일 핸들러도 옮긴다."""
+    path = tmp_path_factory.mktemp("logs")
+    monkeypatch.setattr(project_logger, "LOG_DIR", path)
+    for lg in list(logging.Logger.manager.loggerDict.values()):
+        for handler in getattr(lg, "handlers", []):
+            if isinstance(handler, project_logger._JsonlHandler):
+                monkeypatch.setattr(handler, "_log_dir", path)
+    return path
@@ -0,0 +1,92 @@
+"""사전 계산 API 이웃 테스트 — 배치 전체 쌍 kNN, 조인 이웃, 테이블 구축, Phase 3 확장."""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from api_neighbors import build_neighbor_table, compute_neighbors, get_neighbors, related_apis
+from join_graph import rebuild_join_graph
+
+
+def _unit(*vecs):
+    m = np.asarray(vecs, dtype=np.float32)
+    return m / np.linalg.norm(m, axis=1, keepdims=True)
+
+
+# A≈B (교통), C≈D (날씨), E는 동떨어짐 — E만 A와 시군구코드 공유
+_EMB = _unit([1, 0.1, 0], [1, 0.2, 0], [0, 1, 0.1], [0, 1, 0.2], [0, 0, 1])
+_IDS = ["A", "B", "C", "D", "E"]
+
+
+class TestComputeNeighbors:
+    def test_matches_brute_force_across_batches(self):
+        rng = np.random.default_rng(0)
+        emb = _unit(*rng.standard_normal((40, 8)))
+        ids = [f"X{i}" for i in range(40)]
+        rows = list(compute_neighbors(emb, ids, top_k=3, join_top_k=0, min_score=-1, batch_size=7))
+
+        sims = emb @ emb.T
+        np.fill_diagonal(sims, -np.inf)
+        for i, api_id in enumerate(ids):
+            mine = [r for r in rows if r[0] == api_id]
+            assert [r[1] for r in mine] == [ids[j] for j in np.argsort(-sims[i])[:3]]
+            assert mine[0][2] == pytest.approx(float(sims[i].max()), abs=1e-5)
+
+    def test_join_neighbors_added_below_min_score(self):
+        rows = list(compute_neighbors(
+            _EMB, _IDS, join_keys={"A": {"시군구코드"}, "E": {"시군구코드"}},
+            top_k=1, join_top_k=2, min_score=0.5,
+        ))
+        a_rows = {r[1]: r for r in rows if r[0] == "A"}
+        assert set(a_rows) == {"B", "E"}
+        assert a_rows["B"][3] is None
+        assert a_rows["E"][3] == "시군구코드"
+        assert not [r for r in rows if r[0] == "E" and r[1] != "A"]  # E는 유사 이웃 없음
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    manager = catalog_db.get_catalog_connections(tmp_path / "catalog.sqlite3")
+    conn = manager.writer
+    catalog_db.upsert_apis_many(conn, [{"api_id": i, "name": f"API {i}"} for i in _IDS])
+    catalog_db.upsert_parameters_many(conn, [("A", [{"param_name": "sigunguCd"}]), ("E", [{"param_name": "LAWD_CD"}])])
+    rebuild_join_graph(conn)
+
+    np.save(tmp_path / "emb.npy", _EMB)
+    (tmp_path / "id_map.json").write_text(json.dumps(_IDS), encoding="utf-8")
+    build_neighbor_table(
+        conn, embeddings_path=tmp_path / "emb.npy", id_map_path=tmp_path / "id_map.json",
+        top_k=1, join_top_k=2, min_score=0.5,
+    )
+    yield manager
+    catalog_db.close_catalog_connections()
+
+
+class TestNeighborTable:
+    def test_get_neighbors(self, catalog):
+        conn = catalog.reader()
+        neighbors = get_neighbors("A", conn=conn)
+        assert [n["api_id"] for n in neighbors] == ["B", "E"]
+        assert neighbors[1]["join_keys"] == ["시군구코드"]
+        assert [n["api_id"] for n in get_neighbors("A", joinable_only=True, conn=conn)] == ["E"]
+
+    def test_inactive_neighbors_hidden(self, catalog):
+        catalog.writer.execute("UPDATE apis SET is_active = 0 WHERE api_id = 'B'")
+        catalog.writer.commit()
+        assert [n["api_id"] for n in get_neighbors("A", conn=catalog.reader())] == ["E"]
+
+    def test_related_apis_prefers_joinable_and_skips_inputs(self, catalog):
+        related = related_apis(["A", "B"], per_api=1, conn=catalog.reader())
+        assert [(r["api_id"], r["via"]) for r in related] == [("E", "A")]
+
+    def test_missing_table_yields_empty(self):
+        assert related_apis(["A"], conn=sqlite3.connect(":memory:")) == []
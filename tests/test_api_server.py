@@ -126,3 +126,18 @@ class TestHealthEndpoint:
         data = resp.json()
         assert data["status"] == "ok"
         assert data["last_batch_id"] == "20260218-1400-abc12345"
+
+
+class TestCatalogEndpoint:
+    def test_neighbors(self, client, monkeypatch):
+        calls = []
+
+        def fake_neighbors(api_id, *, limit, joinable_only):
+            calls.append((api_id, limit, joinable_only))
+            return [{"api_id": "B", "name": "B", "score": 0.9, "join_keys": ["시군구코드"]}]
+
+        monkeypatch.setattr("server.routers.catalog.get_neighbors", fake_neighbors)
+        resp = client.get("/api/catalog/A/neighbors", params={"limit": 5, "joinable": True})
+        assert resp.status_code == 200
+        assert resp.json()["neighbors"][0]["api_id"] == "B"
+        assert calls == [("A", 5, True)]
@@ -0,0 +1,241 @@
+"""파라미터 백필 테스트 — 로컬 HTML 픽스처 서버, 안티조인 대상 선정, 진행 기록 재개, 배치 기록."""
+
+import asyncio
+import re
+import sqlite3
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from scripts.backfill_params import backfill, connect, select_targets
+from utils import TokenBucket
+
+_SCHEMA = """
+CREATE TABLE apis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, api_id TEXT UNIQUE NOT NULL, name TEXT NOT NULL,
+    description TEXT, category TEXT, provider TEXT, endpoint_url TEXT,
+    data_format TEXT DEFAULT 'JSON', is_active INTEGER DEFAULT 1, last_scanned_at TEXT,
+    created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+);
+CREATE TABLE api_parameters (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, api_id TEXT NOT NULL REFERENCES apis(api_id),
+    param_name TEXT NOT NULL, param_type TEXT DEFAULT 'string', description TEXT,
+    required INTEGER DEFAULT 0, UNIQUE(api_id, param_name)
+);
+CREATE TABLE api_operations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT, api_id TEXT NOT NULL REFERENCES apis(api_id),
+    operation_name TEXT NOT NULL, http_method TEXT DEFAULT 'GET', path TEXT, description TEXT,
+    UNIQUE(api_id, operation_name)
+);
+"""
+
+# 상세 페이지 픽스처 — 파라미터 표 + 오퍼레이션 블록 (raw_id 15000 → 파라미터 2개)
+_PAGE = """<html><body>
+<div class="opblock"><span class="opblock-summary-path">/get{raw}</span></div>
+<table class="parameters">
+  <tr><td class="parameter__name">serviceKey</td><td class="parameter__type">string</td><td>required</td></tr>
+  <tr><td class="parameter__name">sigunguCd{raw}</td><td class="parameter__type">string</td><td></td></tr>
+</table></body></html>"""
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    hits: list[float] = []
+
+    def do_GET(self):
+        m = re.fullmatch(r"/data/(\d+)/openapi\.do", self.path)
+        self.hits.append(time.monotonic())
+        if not m or m.group(1) == "99999":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = _PAGE.format(raw=m.group(1)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    _FixtureHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def _extract(html: str) -> tuple[list[dict], list[dict]]:
+    params = [
+        {"param_name": name, "param_type": ptype, "required": req == "required"}
+        for name, ptype, req in re.findall(
+            r'parameter__name">([^<]+)</td><td class="parameter__type">([^<]+)</td><td>([^<]*)</td>', html,
+        )
+    ]
+    ops = [{"operation_name": path.lstrip("/"), "path": path}
+           for path in re.findall(r'opblock-summary-path">([^<]+)<', html)]
+    return params, ops
+
+
+def _http_fetcher(base_url):
+    async def fetch(api_id):
+        url = f"{base_url}/data/{api_id.replace('DATAGOKR-', '')}/openapi.do"
+        html = await asyncio.to_thread(lambda: urllib.request.urlopen(url, timeout=5).read().decode("utf-8"))
+        return _extract(html)
+
+    return fetch
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "catalog.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    now = "2026-03-01T00:00:00+09:00"
+    conn.executemany(
+        "INSERT INTO apis (api_id, name, is_active, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+        [(f"DATAGOKR-{15000 + i}", f"API {i}", 1, now, now) for i in range(6)]
+        + [("DATAGOKR-99999", "깨진 페이지", 1, now, now), ("DATAGOKR-20000", "폐지", 0, now, now)],
+    )
+    conn.execute(
+        "INSERT INTO api_parameters (api_id, param_name) VALUES ('DATAGOKR-15000', 'serviceKey')"
+    )
+    conn.commit()
+    conn.close()
+    yield path
+    catalog_db.close_catalog_connections()
+
+
+def _count(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestSelectTargets:
+    def test_anti_join_skips_existing_params_and_inactive(self, db):
+        conn = connect(db)
+        targets = select_targets(conn, "r1")
+        assert "DATAGOKR-15000" not in targets  # 파라미터 있음
+        assert "DATAGOKR-20000" not in targets  # 비활성
+        assert len(targets) == 6
+        assert len(select_targets(conn, "r1", missing_only=False)) == 7
+        assert select_targets(conn, "r1", limit=2) == ["DATAGOKR-15001", "DATAGOKR-15002"]
+
+
+class TestBackfill:
+    def test_concurrent_backfill_against_fixture_server(self, db, fixture_server):
+        stats = asyncio.run(backfill(
+            db_path=db, run_id="r1", workers=3, rate=100, burst=10, batch_size=2,
+            fetcher=_http_fetcher(fixture_server),
+        ))
+        assert stats["success"] == 5 and stats["failed"] == 1
+        assert _count(db, "api_parameters") == 1 + 5 * 2
+        assert _count(db, "api_operations") == 5
+
+        conn = sqlite3.connect(db)
+        required = conn.execute(
+            "SELECT required FROM api_parameters WHERE api_id='DATAGOKR-15001' AND param_name='serviceKey'"
+        ).fetchone()[0]
+        statuses = dict(conn.execute("SELECT api_id, status FROM backfill_progress WHERE run_id='r1'"))
+        conn.close()
+        assert required == 1
+        assert statuses["DATAGOKR-99999"] == "failed"
+
+    def test_resume_skips_done_and_retries_failed_once(self, db, fixture_server):
+        fetch = _http_fetcher(fixture_server)
+        asyncio.run(backfill(db_path=db, run_id="r1", missing_only=False, limit=3, rate=100, fetcher=fetch))
+        hits_before = len(_FixtureHandler.hits)
+
+        stats = asyncio.run(backfill(db_path=db, resume=True, missing_only=False, rate=100, fetcher=fetch))
+        assert stats["run_id"] == "r1"
+        assert stats["total"] == 4  # 앞선 3건은 완료 기록으로 제외
+        assert len(_FixtureHandler.hits) - hits_before == 4
+
+        # 실패(99999)는 BACKFILL_MAX_ATTEMPTS(2)회까지 재시도
+        assert asyncio.run(backfill(db_path=db, resume=True, missing_only=False, rate=100, fetcher=fetch))["total"] == 1
+        assert asyncio.run(backfill(db_path=db, resume=True, missing_only=False, rate=100, fetcher=fetch))["total"] == 0
+
+    def test_interrupted_run_flushes_partial_batch(self, db, fixture_server):
+        fetch = _http_fetcher(fixture_server)
+        calls = 0
+
+        async def flaky(api_id):
+            nonlocal calls
+            calls += 1
+            if calls == 3:
+                raise KeyboardInterrupt
+            return await fetch(api_id)
+
+        with pytest.raises(KeyboardInterrupt):
+            asyncio.run(backfill(db_path=db, run_id="r1", workers=1, rate=100, batch_size=50, fetcher=flaky))
+        conn = sqlite3.connect(db)
+        done = conn.execute("SELECT COUNT(*) FROM backfill_progress WHERE status='done'").fetchone()[0]
+        conn.close()
+        assert done == 2
+
+    def test_rate_limit_shared_across_workers(self, db, fixture_server):
+        asyncio.run(backfill(
+            db_path=db, run_id="r1", workers=4, rate=20, burst=1, fetcher=_http_fetcher(fixture_server),
+        ))
+        hits = sorted(_FixtureHandler.hits)
+        # 6건, 초당 20건·버스트 1 → 최소 5 간격(0.25s) 이상 소요
+        assert hits[-1] - hits[0] >= 0.2
+
+
+class TestTokenBucket:
+    def test_burst_then_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=50, burst=3)
+            start = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            burst_elapsed = time.monotonic() - start
+            for _ in range(5):
+                await bucket.acquire()
+            return burst_elapsed, time.monotonic() - start
+
+        burst_elapsed, total = asyncio.run(run())
+        assert burst_elapsed < 0.05
+        assert total >= 0.08  # 추가 5개 / 50 per sec
+
+
+@pytest.mark.skipif(
+    not __import__("importlib").util.find_spec("playwright"), reason="playwright 미설치",
+)
+class TestBrowserPoolFetch:
+    def test_pool_pages_against_fixture_server(self, db, fixture_server, tmp_path):
+        from browser_pool import BrowserPool
+        from resource_guard import ResourceSemaphore
+
+        pool = BrowserPool(max_pages=2, semaphore=ResourceSemaphore("playwright", 1, tmp_path))
+
+        async def fetch(api_id):
+            url = f"{fixture_server}/data/{api_id.replace('DATAGOKR-', '')}/openapi.do"
+
+            async def visit(page):
+                await page.goto(url)
+                return _extract(await page.content())
+
+            return await pool.arun(visit)
+
+        try:
+            stats = asyncio.run(backfill(db_path=db, run_id="r1", workers=2, rate=100, fetcher=fetch))
+        finally:
+            pool.close()
+        assert stats["success"] >= 5
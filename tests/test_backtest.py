@@ -0,0 +1,111 @@
+"""백테스트 테스트 — 대시보드/아카이브 배치 로드, mmap 임베딩 중복 판정, 설정별 S/A 지표."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.backtest import MatrixDedup, load_backtest_batches, run_backtest
+from scripts.replay import ReplayConfig
+from tests.test_replay import fake_scorers  # noqa: F401 — fixture
+
+
+def _idea(iid, score_n, v_score=80.0, max_sim=0.0):
+    return {
+        "id": iid, "service_name": f"서비스 {iid}", "feasibility_pct": 60.0,
+        "validation_score": v_score, "validation_passed": True, "competitors_count": 1,
+        "scores": {"N": score_n, "U": 4, "M": 4, "R": 4, "V": 4}, "grade": "B",
+        "max_similarity": max_sim,
+    }
+
+
+def _write_history(tmp_path):
+    dashboard = tmp_path / "dashboard_batches.jsonl"
+    archive = tmp_path / "ideas_archive.jsonl"
+    rows = [
+        {"batch_id": "20260302-0900-aaaa0001", "timestamp": "2026-03-02T09:00:00+09:00",
+         "ideas": [_idea("H-001", 5), _idea("H-002", 1, max_sim=0.8)]},
+        {"batch_id": "20260309-0900-aaaa0002", "timestamp": "2026-03-09T09:00:00+09:00",
+         "ideas": [_idea("H-001", 5)]},
+    ]
+    dashboard.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in rows), encoding="utf-8")
+    archived = [
+        {"batch_id": "20260303-1000-aaaa0003", "archived_at": "2026-03-03T10:00:00+09:00", **_idea("H-001", 3)},
+        {"batch_id": "20260302-0900-aaaa0001", "archived_at": "2026-03-02T09:00:00+09:00", **_idea("H-001", 5)},
+    ]
+    archive.write_text("\n".join(json.dumps(r, ensure_ascii=False) for r in archived), encoding="utf-8")
+    return load_backtest_batches(tmp_path / "runs", dashboard, archive)
+
+
+class TestLoadBatches:
+    def test_dashboard_then_archive_in_time_order(self, tmp_path):
+        batches = _write_history(tmp_path)
+        assert [b.batch_id for b in batches] == [
+            "20260302-0900-aaaa0001", "20260303-1000-aaaa0003", "20260309-0900-aaaa0002",
+        ]
+        assert len(batches[0].phases[2]["hypotheses"]) == 2  # 대시보드 우선, 아카이브 중복 무시
+
+
+class TestRunBacktest:
+    def test_baseline_and_candidate_metrics(self, tmp_path, fake_scorers):  # noqa: F811
+        batches = _write_history(tmp_path)
+        strict = ReplayConfig("strict", {"GRADE_ABSOLUTE": {"S": 4.5, "A": 4.0, "B": 2.5, "C": 1.5}})
+        report = run_backtest(batches, [strict], workers=1)
+
+        base = report["baseline"]
+        assert base["batches"] == 3
+        assert base["ideas"] == 4
+        # V=80/20=4 → N=5: 4.1 (S), N=3: 3.9 (A), N=1: 3.7 (A)
+        assert base["grades"]["S"] == 2 and base["grades"]["A"] == 2
+        assert base["weekly_sa"] == {"2026-W10": 3, "2026-W11": 1}
+        assert base["weeks_meeting_slo"] == 0
+
+        cand = report["candidates"][0]
+        assert cand["grades"]["S"] == 0
+        assert cand["delta"]["S"] == -2
+        assert cand["sa_rate_delta"] == pytest.approx(-0.5)
+
+    def test_dedup_threshold_uses_recorded_similarity_without_matrix(self, tmp_path, fake_scorers):  # noqa: F811
+        batches = _write_history(tmp_path)
+        tight = ReplayConfig("tight", {"DEDUP_SIMILARITY_THRESHOLD": 0.75})
+        report = run_backtest(batches, [tight], workers=1, embeddings_path=tmp_path / "missing.npy")
+        assert report["candidates"][0]["ideas"] == 3  # max_similarity 0.8 아이디어 제거
+
+
+class TestMatrixDedup:
+    def test_mmap_window_similarity(self, tmp_path):
+        matrix = np.array([[1.0, 0.0], [0.96, 0.28], [0.0, 1.0]], dtype=np.float32)
+        path = tmp_path / "emb.npy"
+        np.save(path, matrix)
+        keys = [
+            ["B-1", "H-001", "2026-03-02T09:00:00+09:00"],
+            ["B-2", "H-001", "2026-03-02T10:00:00+09:00"],
+            ["B-3", "H-001", "2026-03-05T10:00:00+09:00"],  # 24h 창 밖
+        ]
+        dedup = MatrixDedup(0.9, np.load(path, mmap_mode="r"), keys)
+
+        [idea] = dedup.for_batch("B-2").check_duplicates([{"id": "H-001"}])
+        assert idea["is_duplicate"] is True
+        assert idea["max_similarity"] == pytest.approx(0.96, abs=1e-5)
+
+        [first] = dedup.for_batch("B-1").check_duplicates([{"id": "H-001"}])
+        assert first["is_duplicate"] is False
+
+        [late] = dedup.for_batch("B-3").check_duplicates([{"id": "H-001"}])
+        assert late["max_similarity"] == 0.0
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="fork 시작 방식에서 가짜 스코어러 모듈 상속")
+class TestProcessPool:
+    def test_pool_matches_inline(self, tmp_path, fake_scorers):  # noqa: F811
+        batches = _write_history(tmp_path)
+        loose = ReplayConfig("loose", {"NUMRV_WEIGHTS": {"N": 0.3, "U": 0.2, "M": 0.2, "R": 0.15, "V": 0.15}})
+        inline = run_backtest(batches, [loose], workers=1)
+        pooled = run_backtest(batches, [loose], workers=2)
+        assert pooled == inline
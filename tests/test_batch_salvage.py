@@ -0,0 +1,190 @@
+"""배치 응답 부분 복구 테스트 — 항목별 스키마 검증 + 누락/무효 id만 후속 호출 + 청크 분할."""
+
+import re
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from scripts.run_engine import IdeationEngine, _merge_calibrated_chunks, _validate_batch_items
+from server.schemas.api_contracts import NUMRRanking, ValidationJudgement
+
+IDEAS = [{"id": f"H-{i:03d}", "service_name": f"서비스 {i}"} for i in range(1, 5)]
+
+
+def _build_prompt(items):
+    return "배치 " + ",".join(it["id"] for it in items)
+
+
+class TestValidateBatchItems:
+    def test_valid_items_kept_invalid_reported(self):
+        raw = [
+            {"id": "H-001", "N": 4, "U": 3, "M": 3, "R": 5},
+            {"id": "H-002", "N": 9, "U": 3, "M": 3, "R": 5},  # 범위 초과
+            {"id": "H-003", "N": 2, "U": 3},                  # 필드 누락
+            "garbage",
+        ]
+        valid, missing = _validate_batch_items(
+            raw, ["H-001", "H-002", "H-003", "H-004"], NUMRRanking, "scores"
+        )
+        assert list(valid) == ["H-001"]
+        assert missing == ["H-002", "H-003", "H-004"]
+
+    def test_dict_wrapper_and_unknown_ids(self):
+        raw = {"validations": [
+            {"id": "H-001", "timing_fit": 0.7, "revenue_reference": 0.6, "mvp_difficulty": 0.4},
+            {"id": "H-999", "timing_fit": 0.7, "revenue_reference": 0.6, "mvp_difficulty": 0.4},
+        ]}
+        valid, missing = _validate_batch_items(raw, ["H-001"], ValidationJudgement, "validations")
+        assert valid["H-001"]["timing_fit"] == 0.7
+        assert missing == []
+
+    @pytest.mark.parametrize("model,fields", [
+        (ValidationJudgement, {"timing_fit": 0.7, "revenue_reference": 0.6, "mvp_difficulty": 0.4}),
+        (NUMRRanking, {"N": 4, "U": 3, "M": 3, "R": 5}),
+    ])
+    def test_id_required_in_both_schemas(self, model, fields):
+        with pytest.raises(ValidationError):
+            model.model_validate(fields)
+
+    def test_non_list_response_all_missing(self):
+        valid, missing = _validate_batch_items("oops", ["H-001"], NUMRRanking, "scores")
+        assert valid == {}
+        assert missing == ["H-001"]
+
+
+class TestInvokeBatchFollowUp:
+    def test_followup_only_for_missing_ids(self):
+        engine = IdeationEngine(dry_run=True)
+        first = [
+            {"id": "H-001", "N": 4, "U": 3, "M": 3, "R": 5},
+            {"id": "H-002", "N": 0, "U": 3, "M": 3, "R": 5},
+            {"id": "H-003", "N": 2, "U": 2, "M": 2, "R": 2},
+        ]
+        second = [
+            {"id": "H-002", "N": 3, "U": 3, "M": 3, "R": 3},
+            {"id": "H-004", "N": 5, "U": 5, "M": 5, "R": 5},
+        ]
+        engine.claude = MagicMock()
+        engine.claude.invoke.side_effect = [first, second]
+
+        result = engine._invoke_batch(_build_prompt, IDEAS, NUMRRanking, phase=5, list_key="scores")
+
+        assert set(result) == {"H-001", "H-002", "H-003", "H-004"}
+        assert engine.claude.invoke.call_count == 2
+        followup_prompt = engine.claude.invoke.call_args_list[1][0][0]
+        assert "H-002" in followup_prompt and "H-004" in followup_prompt
+        assert "H-001" not in followup_prompt
+
+    def test_no_followup_when_all_valid(self):
+        engine = IdeationEngine(dry_run=True)
+        engine.claude = MagicMock()
+        engine.claude.invoke.return_value = [
+            {"id": it["id"], "N": 3, "U": 3, "M": 3, "R": 3} for it in IDEAS
+        ]
+        result = engine._invoke_batch(_build_prompt, IDEAS, NUMRRanking, phase=5, list_key="scores")
+        assert len(result) == 4
+        assert engine.claude.invoke.call_count == 1
+
+    def test_followup_failure_keeps_partial(self):
+        engine = IdeationEngine(dry_run=True)
+        engine.claude = MagicMock()
+        engine.claude.invoke.side_effect = [
+            [{"id": "H-001", "N": 3, "U": 3, "M": 3, "R": 3}],
+            RuntimeError("Claude CLI failed"),
+        ]
+        result = engine._invoke_batch(_build_prompt, IDEAS, NUMRRanking, phase=5, list_key="scores")
+        assert list(result) == ["H-001"]
+
+    def test_first_call_failure_propagates(self):
+        engine = IdeationEngine(dry_run=True)
+        engine.claude = MagicMock()
+        engine.claude.invoke.side_effect = RuntimeError("Claude CLI failed")
+        with pytest.raises(RuntimeError):
+            engine._invoke_batch(_build_prompt, IDEAS, NUMRRanking, phase=5, list_key="scores")
+
+
+class TestChunkedBatch:
+    def _ideas(self, n):
+        return [{"id": f"H-{i:03d}"} for i in range(1, n + 1)]
+
+    def test_small_batch_single_call(self):
+        engine = IdeationEngine(dry_run=True)
+        engine.claude = MagicMock()
+        engine.claude.invoke.return_value = []
+        with patch("scripts.run_engine.BATCH_CHUNK_SIZE", 4):
+            engine._invoke_batch(_build_prompt, self._ideas(5), NUMRRanking,
+                                 phase=5, list_key="scores")
+        # 1회 + 전체 누락 후속 1회
+        assert engine.claude.invoke.call_count == 2
+
+    def test_chunks_include_anchor_and_cover_all(self):
+        engine = IdeationEngine(dry_run=True)
+        prompts = []
+        lock = threading.Lock()
+
+        def fake_invoke(prompt, *, phase=None):
+            with lock:
+                prompts.append(prompt)
+            ids = re.findall(r"H-\d{3}", prompt)
+            return [{"id": hid, "N": 3, "U": 3, "M": 3, "R": 3} for hid in ids]
+
+        engine.claude = MagicMock()
+        engine.claude.invoke.side_effect = fake_invoke
+        ideas = self._ideas(10)
+        with patch("scripts.run_engine.BATCH_CHUNK_SIZE", 4):
+            result = engine._invoke_batch(_build_prompt, ideas, NUMRRanking,
+                                          phase=5, list_key="scores")
+
+        assert set(result) == {it["id"] for it in ideas}
+        assert len(prompts) == 3  # 9개 → 3청크 (3/3/3) + 앵커
+        assert all("H-001" in p for p in prompts)
+        assert all(len(re.findall(r"H-\d{3}", p)) == 4 for p in prompts)
+
+    def test_failed_chunk_does_not_drop_others(self):
+        engine = IdeationEngine(dry_run=True)
+
+        def fake_invoke(prompt, *, phase=None):
+            ids = re.findall(r"H-\d{3}", prompt)
+            if "H-002" in ids:
+                raise RuntimeError("Claude CLI failed")
+            return [{"id": hid, "N": 3, "U": 3, "M": 3, "R": 3} for hid in ids]
+
+        engine.claude = MagicMock()
+        engine.claude.invoke.side_effect = fake_invoke
+        with patch("scripts.run_engine.BATCH_CHUNK_SIZE", 2):
+            result = engine._invoke_batch(_build_prompt, self._ideas(5), NUMRRanking,
+                                          phase=5, list_key="scores")
+        assert "H-002" not in result
+        assert {"H-001", "H-003"} <= set(result)
+
+
+class TestCalibratedMerge:
+    def test_chunk_shifted_by_anchor_offset(self):
+        chunk_a = {
+            "H-001": {"id": "H-001", "N": 3.0},
+            "H-002": {"id": "H-002", "N": 4.0},
+        }
+        chunk_b = {
+            "H-001": {"id": "H-001", "N": 4.0},  # 앵커가 1점 후하게 채점됨
+            "H-003": {"id": "H-003", "N": 5.0},
+            "H-004": {"id": "H-004", "N": 1.5},
+        }
+        merged = _merge_calibrated_chunks([chunk_a, chunk_b], "H-001", ("N",))
+        assert merged["H-001"]["N"] == 3.0
+        assert merged["H-002"]["N"] == 4.0
+        assert merged["H-003"]["N"] == 4.0
+        assert merged["H-004"]["N"] == 1.0  # 하한 클램프
+
+    def test_no_calibration_without_fields(self):
+        chunk_a = {"H-001": {"id": "H-001", "N": 3.0}}
+        chunk_b = {"H-001": {"id": "H-001", "N": 5.0}, "H-002": {"id": "H-002", "N": 5.0}}
+        merged = _merge_calibrated_chunks([chunk_a, chunk_b], "H-001", ())
+        assert merged["H-002"]["N"] == 5.0
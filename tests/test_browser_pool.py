@@ -0,0 +1,140 @@
+"""브라우저 풀 테스트 — 웜 브라우저 재사용, 페이지 재활용, 동시 페이지 상한, 작업 타임아웃."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from browser_pool import BrowserPool
+from resource_guard import ResourceSemaphore
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+        self.timeout_ms = None
+
+    def set_default_navigation_timeout(self, ms):
+        self.timeout_ms = ms
+
+    def set_default_timeout(self, ms):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+
+class _FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.page = None
+
+    async def new_page(self):
+        self.page = _FakePage()
+        return self.page
+
+    async def close(self):
+        self.page.closed = True
+        self.browser.closed_contexts += 1
+
+
+class _FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed_contexts = 0
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        return _FakeContext(self)
+
+
+@pytest.fixture
+def pool(tmp_path):
+    browsers: list[_FakeBrowser] = []
+
+    async def launcher():
+        browser = _FakeBrowser()
+        browsers.append(browser)
+
+        async def stop():
+            browser.connected = False
+
+        return browser, stop
+
+    p = BrowserPool(
+        max_pages=2, max_uses=3, page_timeout_sec=5, launcher=launcher,
+        semaphore=ResourceSemaphore("playwright", 1, tmp_path),
+    )
+    p.browsers = browsers
+    yield p
+    p.close()
+
+
+async def _current_page(page):
+    return page  # id() 비교는 GC 후 재사용될 수 있어 객체로 비교
+
+
+class TestBrowserPool:
+    def test_single_warm_browser_and_page_reuse(self, pool):
+        pages = [pool.run(_current_page) for _ in range(3)]
+        assert len(pool.browsers) == 1
+        assert pages[0] is pages[1] is pages[2]  # 같은 페이지 재사용
+        assert pool.stats["launches"] == 1
+
+    def test_page_recycled_after_max_uses(self, pool):
+        pages = [pool.run(_current_page) for _ in range(4)]
+        assert pages[3] is not pages[0]
+        assert pool.stats["pages_recycled"] == 1
+        assert pool.browsers[0].closed_contexts == 1
+
+    def test_concurrent_pages_bounded(self, pool):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        async def work(page):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.05)
+            with lock:
+                active -= 1
+
+        async def main():
+            await asyncio.gather(*(pool.arun(work) for _ in range(6)))
+
+        asyncio.run(main())
+        assert peak == 2
+        assert pool.open_pages <= 2
+
+    def test_timeout_discards_page(self, pool):
+        first = pool.run(_current_page)
+
+        async def hang(page):
+            await asyncio.sleep(10)
+
+        with pytest.raises(TimeoutError):
+            pool.run(hang, timeout=0.05)
+        assert pool.stats["timeouts"] == 1
+        assert pool.run(_current_page) is not first
+
+    def test_relaunch_after_disconnect(self, pool):
+        pool.run(_current_page)
+        pool.browsers[0].connected = False
+        pool.run(_current_page)
+        assert pool.stats["launches"] == 2
+
+    def test_close_releases_browser_slot(self, pool, tmp_path):
+        pool.run(_current_page)
+        assert ResourceSemaphore("playwright", 1, tmp_path).try_acquire() is None
+        pool.close()
+        assert ResourceSemaphore("playwright", 1, tmp_path).try_acquire() is not None
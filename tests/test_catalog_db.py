@@ -0,0 +1,185 @@
+"""카탈로그 DB 공용 계층 테스트 — 연결 관리, 대량 upsert, 배치 트랜잭션, 대량 모드 PRAGMA, FTS5 검색."""
+
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+
+
+@pytest.fixture
+def conn(tmp_path):
+    c = catalog_db.connect(tmp_path / "catalog.sqlite3")
+    yield c
+    c.close()
+
+
+def _apis(n, **overrides):
+    return [{"api_id": f"API-{i:03d}", "name": f"API {i}", "category": "교통", **overrides} for i in range(n)]
+
+
+class TestBulkUpsert:
+    def test_upsert_apis_many_batches_commits(self, conn):
+        statements = []
+        conn.set_trace_callback(statements.append)
+        written = catalog_db.upsert_apis_many(conn, _apis(25), batch_size=10)
+        conn.set_trace_callback(None)
+
+        assert written == 25
+        assert conn.execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 25
+        assert sum(1 for s in statements if s.strip().upper() == "COMMIT") == 3
+
+    def test_update_keeps_created_at(self, conn):
+        catalog_db.upsert_apis_many(conn, _apis(1))
+        conn.execute("UPDATE apis SET created_at = '2020-01-01'")
+        conn.commit()
+        catalog_db.upsert_apis_many(conn, _apis(1, name="새 이름", is_active=0))
+        row = conn.execute("SELECT name, is_active, created_at FROM apis").fetchone()
+        assert tuple(row) == ("새 이름", 0, "2020-01-01")
+
+    def test_parameters_and_operations_many(self, conn):
+        catalog_db.upsert_apis_many(conn, _apis(2))
+        items = [
+            ("API-000", [{"param_name": "serviceKey", "required": True}, {"param_name": "pageNo"}]),
+            ("API-001", [{"param_name": "sigunguCd", "param_type": "string"}, {"description": "이름 없음"}]),
+        ]
+        assert catalog_db.upsert_parameters_many(conn, items, batch_size=2) == 3
+        catalog_db.upsert_parameters_many(conn, [("API-000", [{"param_name": "pageNo", "param_type": "integer"}])])
+        assert conn.execute(
+            "SELECT param_type FROM api_parameters WHERE api_id='API-000' AND param_name='pageNo'"
+        ).fetchone()[0] == "integer"
+
+        assert catalog_db.upsert_operations_many(conn, [("API-000", [{"operation_name": "getList"}])]) == 1
+
+    def test_caller_managed_transaction_rolls_back_together(self, conn):
+        with pytest.raises(RuntimeError):
+            with conn:
+                catalog_db.upsert_apis_many(conn, _apis(3), transaction=False)
+                raise RuntimeError
+        assert conn.execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 0
+
+
+class TestBulkMode:
+    def test_pragmas_applied_and_restored(self, conn):
+        before = conn.execute("PRAGMA synchronous").fetchone()[0]
+        with catalog_db.bulk_mode(conn, cache_mb=8):
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -8 * 1024
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == before
+
+
+def _ids(results):
+    return [r["api_id"] for r in results]
+
+
+class TestFullTextSearch:
+    @pytest.fixture
+    def catalog(self, conn):
+        catalog_db.upsert_apis_many(conn, [
+            {"api_id": "A1", "name": "건축물대장 조회", "description": "건축물 기본 개요 제공"},
+            {"api_id": "A2", "name": "아파트 실거래가", "description": "국토교통부 매매 신고 자료"},
+            {"api_id": "A3", "name": "사업자등록 상태조회", "description": "휴폐업 여부"},
+        ])
+        catalog_db.upsert_parameters_many(conn, [
+            ("A1", [{"param_name": "sigunguCd", "description": "시군구코드"}]),
+            ("A2", [{"param_name": "LAWD_CD", "description": "법정동코드 앞 5자리"},
+                    {"param_name": "DEAL_YMD", "description": "계약 날짜"}]),
+            ("A3", [{"param_name": "b_no", "description": "사업자번호"}]),
+        ])
+        return conn
+
+    def test_parameter_terms_found_via_triggers(self, catalog):
+        assert _ids(catalog_db.search_fts(catalog, "시군구코드")) == ["A1"]
+        assert _ids(catalog_db.search_fts(catalog, "사업자번호로 폐업 확인")) == ["A3"]
+        assert _ids(catalog_db.search_fts(catalog, "sigunguCd")) == ["A1"]
+
+    def test_bm25_ranks_more_matches_first(self, catalog):
+        results = catalog_db.search_fts(catalog, "법정동코드 실거래가 건축물대장")
+        assert results[0]["api_id"] == "A2"
+        assert set(_ids(results)) == {"A1", "A2"}
+
+    def test_short_term_falls_back_to_like(self, catalog):
+        assert _ids(catalog_db.search_fts(catalog, "날짜")) == ["A2"]
+
+    def test_updates_and_deletes_stay_in_sync(self, catalog):
+        catalog_db.upsert_apis_many(catalog, [{"api_id": "A3", "name": "휴폐업 조회"}])
+        assert catalog_db.search_fts(catalog, "사업자등록") == []
+        catalog.execute("DELETE FROM api_parameters WHERE api_id = 'A3'")
+        assert catalog_db.search_fts(catalog, "사업자번호") == []
+        catalog.execute("UPDATE apis SET is_active = 0 WHERE api_id = 'A1'")
+        assert catalog_db.search_fts(catalog, "시군구코드") == []
+        assert _ids(catalog_db.search_fts(catalog, "시군구코드", active_only=False)) == ["A1"]
+
+    def test_operators_in_query_are_quoted(self, catalog):
+        assert catalog_db.search_fts(catalog, 'NEAR("건축물" AND * -') is not None
+
+    def test_existing_catalog_indexed_on_first_connect(self, tmp_path):
+        path = tmp_path / "legacy.sqlite3"
+        legacy = sqlite3.connect(path)
+        legacy.executescript(catalog_db.SCHEMA_SQL)
+        legacy.execute(
+            "INSERT INTO apis (api_id, name, created_at, updated_at) VALUES ('L1', '주차장 정보', 'x', 'x')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        conn = catalog_db.connect(path)
+        assert _ids(catalog_db.search_fts(conn, "주차장 정보")) == ["L1"]
+        conn.close()
+
+
+class TestCatalogConnections:
+    @pytest.fixture
+    def db(self, tmp_path):
+        catalog_db.connect(tmp_path / "catalog.sqlite3").close()
+        manager = catalog_db.get_catalog_connections(tmp_path / "catalog.sqlite3")
+        yield manager
+        catalog_db.close_catalog_connections()
+
+    def test_shared_manager_per_path(self, db, tmp_path):
+        assert catalog_db.get_catalog_connections(tmp_path / "catalog.sqlite3") is db
+        assert db.writer is db.writer
+
+    def test_reader_is_read_only_and_thread_local(self, db):
+        reader = db.reader()
+        assert db.reader() is reader
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO catalog_metadata (key, value) VALUES ('k', 'v')")
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(db.reader()))
+        t.start()
+        t.join()
+        assert other[0] is not reader
+
+    def test_reader_sees_writer_commits(self, db):
+        reader = db.reader()
+        with db.write() as conn:
+            catalog_db.upsert_apis_many(conn, _apis(2), transaction=False)
+        assert reader.execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 2
+
+    def test_write_rolls_back_on_error(self, db):
+        with pytest.raises(RuntimeError):
+            with db.write() as conn:
+                catalog_db.upsert_apis_many(conn, _apis(1), transaction=False)
+                raise RuntimeError
+        assert db.reader().execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 0
+
+    def test_missing_db_not_created_by_reader(self, tmp_path):
+        manager = catalog_db.CatalogConnections(tmp_path / "missing.sqlite3")
+        with pytest.raises(sqlite3.OperationalError):
+            manager.reader()
+        assert not (tmp_path / "missing.sqlite3").exists()
+
+    def test_close_reopens_on_next_use(self, db):
+        reader = db.reader()
+        db.close()
+        assert db.reader() is not reader
@@ -0,0 +1,237 @@
+"""조건부 카탈로그 스캔 테스트 — 콘텐츠 지문, ETag/Last-Modified 조건부 GET, 바뀐 API만 렌더링."""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from catalog_fetch import (
+    ConditionalFetcher,
+    conditional_scan,
+    content_fingerprint,
+    listing_fingerprint,
+    store_validators,
+)
+
+
+class _Response:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSite:
+    """httpx.AsyncClient 대역 — 페이지별 본문과 ETag, 조건부 요청이면 304."""
+
+    def __init__(self, pages):
+        self.pages = dict(pages)
+        self.requests = []
+
+    def etag(self, url):
+        return f'"{content_fingerprint(self.pages[url])[:8]}"'
+
+    async def get(self, url, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        if url not in self.pages:
+            return _Response(404)
+        if (headers or {}).get("If-None-Match") == self.etag(url):
+            return _Response(304)
+        return _Response(200, self.pages[url], {"etag": self.etag(url)})
+
+
+def _listing(*rows):
+    return "<html><body>" + "".join(
+        f'<tr data-id="{api_id}"><td>{name}</td><td>{modified}</td></tr>' for api_id, name, modified in rows
+    ) + "</body></html>"
+
+
+def _parse(html):
+    return [
+        {"api_id": api_id, "name": name, "modified": modified, "category": "교통"}
+        for api_id, name, modified in re.findall(r'data-id="(\w+)"><td>(.*?)</td><td>(.*?)</td>', html)
+    ]
+
+
+def _detail_url(api_id):
+    return f"https://site/detail/{api_id}"
+
+
+@pytest.fixture
+def conn(tmp_path):
+    c = catalog_db.connect(tmp_path / "catalog.sqlite3")
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def site():
+    return _FakeSite({
+        "https://site/list/1": _listing(("A1", "버스 도착", "2026-01-01"), ("A2", "버스 노선", "2026-01-01")),
+        "https://site/list/2": _listing(("B1", "단기 예보", "2026-01-01")),
+        _detail_url("A1"): "<div>A1 상세</div>",
+        _detail_url("A2"): "<div>A2 상세</div>",
+        _detail_url("B1"): "<div>B1 상세</div>",
+    })
+
+
+class _Renderer:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, row):
+        self.calls.append(row["api_id"])
+        return [{"param_name": "sigunguCd"}], [{"operation_name": "get"}]
+
+
+async def _scan(conn, site, renderer, urls=("https://site/list/1", "https://site/list/2")):
+    fetcher = ConditionalFetcher(conn, client=site)
+    return await conditional_scan(
+        conn, urls, fetcher=fetcher, parse_listing=_parse, render_detail=renderer, detail_url=_detail_url,
+    )
+
+
+class TestFingerprints:
+    def test_content_ignores_scripts_and_whitespace(self):
+        a = "<html><script>var t=1;</script><p>버스  도착</p><!-- x --></html>"
+        b = "<html><script>var t=2;</script>\n<p>버스 도착</p></html>"
+        assert content_fingerprint(a) == content_fingerprint(b)
+        assert content_fingerprint(a) != content_fingerprint("<p>버스 노선</p>")
+
+    def test_listing_uses_visible_fields_only(self):
+        row = {"api_id": "A1", "name": "버스 도착", "modified": "2026-01-01"}
+        assert listing_fingerprint(row) == listing_fingerprint({**row, "name": " 버스  도착", "rank": 3})
+        assert listing_fingerprint(row) != listing_fingerprint({**row, "modified": "2026-02-01"})
+
+
+class TestConditionalFetcher:
+    async def test_validators_sent_after_store(self, conn, site):
+        fetcher = ConditionalFetcher(conn, client=site)
+        first = await fetcher.fetch("https://site/list/1")
+        assert first.changed and site.requests[-1][1] == {}
+
+        # 저장 전에는 검증자를 보내지 않음
+        assert (await fetcher.fetch("https://site/list/1")).changed
+        store_validators(conn, [first])
+
+        again = await fetcher.fetch("https://site/list/1")
+        assert site.requests[-1][1]["If-None-Match"] == site.etag("https://site/list/1")
+        assert again.status == 304 and not again.changed and again.text is None
+        assert fetcher.stats["not_modified"] == 1
+
+    async def test_same_content_without_etag_unchanged(self, conn):
+        class NoEtag(_FakeSite):
+            async def get(self, url, headers=None):
+                return _Response(200, self.pages[url] + "<script>nonce()</script>")
+
+        fetcher = ConditionalFetcher(conn, client=NoEtag({"u": "<p>본문</p>"}))
+        store_validators(conn, [await fetcher.fetch("u")])
+        assert not (await fetcher.fetch("u")).changed
+
+
+class TestConditionalScan:
+    async def test_first_scan_renders_everything(self, conn, site):
+        renderer = _Renderer()
+        stats = await _scan(conn, site, renderer)
+        assert sorted(renderer.calls) == ["A1", "A2", "B1"]
+        assert stats["seen"] == {"A1", "A2", "B1"}
+        assert conn.execute("SELECT COUNT(*) FROM api_parameters").fetchone()[0] == 3
+        assert conn.execute("SELECT COUNT(*) FROM api_join_keys").fetchone()[0] == 3
+
+    async def test_rescan_is_http_only(self, conn, site):
+        await _scan(conn, site, _Renderer())
+        renderer = _Renderer()
+        stats = await _scan(conn, site, renderer)
+        assert renderer.calls == []
+        assert stats["pages_skipped"] == 2
+        assert stats["seen"] == {"A1", "A2", "B1"}  # 304 페이지의 API도 본 것으로
+
+    async def test_only_changed_api_rendered(self, conn, site):
+        await _scan(conn, site, _Renderer())
+        site.pages["https://site/list/1"] = _listing(
+            ("A1", "버스 도착", "2026-03-01"), ("A2", "버스 노선", "2026-01-01"),
+        )
+        site.pages[_detail_url("A1")] = "<div>A1 상세 (개정)</div>"
+        renderer = _Renderer()
+        stats = await _scan(conn, site, renderer)
+        assert renderer.calls == ["A1"]
+        assert stats["apis_changed"] == 1
+
+    async def test_listing_change_with_same_detail_skips_render(self, conn, site):
+        await _scan(conn, site, _Renderer())
+        site.pages["https://site/list/2"] = _listing(("B1", "단기 예보 (수정)", "2026-03-01"))
+        renderer = _Renderer()
+        await _scan(conn, site, renderer)
+        assert renderer.calls == []
+        assert conn.execute("SELECT name FROM apis WHERE api_id = 'B1'").fetchone()[0] == "단기 예보 (수정)"
+
+    async def test_failed_detail_retried_next_run(self, conn, site):
+        del site.pages[_detail_url("A2")]
+        stats = await _scan(conn, site, _Renderer())
+        assert stats["details_failed"] == 1
+
+        site.pages[_detail_url("A2")] = "<div>A2 상세</div>"
+        renderer = _Renderer()
+        await _scan(conn, site, renderer)
+        assert renderer.calls == ["A2"]  # 목록 페이지 검증자를 남기지 않아 다시 파싱
+
+    async def test_js_listing_rendered(self, conn, site):
+        site.pages["https://site/list/3"] = "<div id='app'></div>"
+
+        async def render_listing(url):
+            return _listing(("C1", "주차장", "2026-01-01"))
+
+        fetcher = ConditionalFetcher(conn, client=site)
+        site.pages[_detail_url("C1")] = "<div>C1</div>"
+        stats = await conditional_scan(
+            conn, ["https://site/list/3"], fetcher=fetcher, parse_listing=_parse,
+            render_detail=_Renderer(), render_listing=render_listing, detail_url=_detail_url,
+        )
+        assert stats["pages_rendered"] == 1 and stats["seen"] == {"C1"}
+
+
+    async def test_empty_listing_not_recorded(self, conn, site):
+        await _scan(conn, site, _Renderer())
+        site.pages["https://site/list/1"] = "<p>서비스 점검 중</p>"
+        stats = await _scan(conn, site, _Renderer())
+        assert stats["pages_empty"] == 1 and stats["empty_urls"] == ["https://site/list/1"]
+        assert stats["listed_urls"] == ["https://site/list/2"]
+
+        stored = conn.execute("SELECT content_hash FROM http_validators WHERE url = 'https://site/list/1'")
+        assert stored.fetchone()[0] != content_fingerprint("<p>서비스 점검 중</p>")
+
+    async def test_incremental_keeps_source_url(self, conn, site):
+        await _scan(conn, site, _Renderer())
+        site.pages["https://site/recent/1"] = site.pages["https://site/list/2"]
+        await _scan(conn, site, _Renderer(), urls=("https://site/recent/1",))
+        source = conn.execute("SELECT source_url FROM api_fingerprints WHERE api_id = 'B1'").fetchone()[0]
+        assert source == "https://site/list/2"
+
+
+class TestListingParserFallback:
+    def test_scanner_without_parser_falls_back(self):
+        from scripts import catalog_refresh
+
+        assert catalog_refresh._listing_parser(object()) is None
+
+    def test_scanner_parser_used_when_enabled(self, monkeypatch):
+        from scripts import catalog_refresh
+
+        class Scanner:
+            def parse_listing(self, html):
+                return []
+
+        scanner = Scanner()
+        assert catalog_refresh._listing_parser(scanner) == scanner.parse_listing
+        monkeypatch.setattr(catalog_refresh, "CATALOG_CONDITIONAL_SCAN", False)
+        assert catalog_refresh._listing_parser(scanner) is None
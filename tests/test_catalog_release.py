@@ -0,0 +1,235 @@
+"""블루/그린 카탈로그 릴리스 테스트 — 스냅샷 복사, 검증, 포인터 원자 교체, 런 단위 버전 고정."""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+import catalog_release
+import resource_guard
+from catalog_release import (
+    CatalogRelease,
+    ReleaseValidationError,
+    prepare_release,
+    publish_release,
+    read_pointer,
+    sync_working_copy,
+    use_release,
+)
+from resource_guard import ResourceBusyError, ResourceGuard
+from scripts.backfill_params import backfill
+
+
+def _write_release(release, api_ids, *, id_map=None):
+    conn = catalog_db.connect(release.db_path)
+    catalog_db.upsert_apis_many(conn, [{"api_id": a, "name": a} for a in api_ids])
+    conn.close()
+    id_map = list(api_ids) if id_map is None else id_map
+    np.save(release.embeddings_path, np.ones((len(id_map), 4), dtype=np.float32))
+    release.id_map_path.write_text(json.dumps(id_map), encoding="utf-8")
+    release.index_path.write_bytes(b"faiss")
+
+
+@pytest.fixture
+def releases(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog_release, "_active", None)
+    base = CatalogRelease(0, tmp_path / "legacy.sqlite3", tmp_path / "legacy.faiss",
+                          tmp_path / "legacy.npy", tmp_path / "legacy_id_map.json")
+    monkeypatch.setattr(CatalogRelease, "legacy", classmethod(lambda cls: base))
+    _write_release(base, ["A1", "A2"])
+    yield tmp_path / "releases"
+    catalog_db.close_catalog_connections()
+
+
+class TestPrepareAndPublish:
+    def test_no_pointer_uses_legacy_paths(self, releases):
+        assert read_pointer(releases).version == 0
+
+    def test_prepare_copies_current_release(self, releases):
+        release = prepare_release(releases)
+        assert release.version == 1
+        assert release.db_path.name == "catalog_v1.sqlite3"
+        assert json.loads(release.id_map_path.read_text()) == ["A1", "A2"]
+        conn = catalog_db.connect_readonly(release.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 2
+        conn.close()
+        assert read_pointer(releases).version == 0  # 게시 전
+
+    def test_publish_swaps_pointer(self, releases):
+        v1 = prepare_release(releases)
+        _write_release(v1, ["A1", "A2", "A3"])
+        result = publish_release(v1, releases)
+        assert result["version"] == 1 and result["previous"] == 0
+        assert read_pointer(releases) == v1
+        pointer = json.loads((releases / "current.json").read_text())
+        assert pointer["id_map"] == "id_map_v1.json" and pointer["index_entries"] == 3
+        assert not Path(f"{v1.db_path}-wal").exists() or Path(f"{v1.db_path}-wal").stat().st_size == 0
+
+        v2 = prepare_release(releases)
+        assert v2.version == 2 and json.loads(v2.id_map_path.read_text()) == ["A1", "A2", "A3"]
+
+    def test_mismatched_index_not_published(self, releases):
+        release = prepare_release(releases)
+        np.save(release.embeddings_path, np.ones((5, 4), dtype=np.float32))
+        with pytest.raises(ReleaseValidationError, match="embeddings"):
+            publish_release(release, releases)
+        assert read_pointer(releases).version == 0
+
+    def test_unknown_ids_not_published(self, releases):
+        release = prepare_release(releases)
+        _write_release(release, ["A1"], id_map=["A1", "ZZ"])
+        with pytest.raises(ReleaseValidationError, match="not in catalog"):
+            publish_release(release, releases)
+
+    def test_stale_index_not_published(self, releases):
+        release = prepare_release(releases)
+        conn = catalog_db.connect(release.db_path)
+        catalog_db.upsert_apis_many(conn, [{"api_id": "A3", "name": "A3"}])  # 스캔만 되고 인덱싱 안 됨
+        conn.close()
+        with pytest.raises(ReleaseValidationError, match="index not rebuilt"):
+            publish_release(release, releases)
+
+    def test_old_releases_pruned(self, releases):
+        for _ in range(4):
+            publish_release(prepare_release(releases), releases, keep=2)
+        names = sorted(p.name for p in releases.iterdir() if p.suffix == ".sqlite3")
+        assert names == ["catalog_v3.sqlite3", "catalog_v4.sqlite3"]
+
+    def test_unpublished_leftover_gets_new_number(self, releases):
+        prepare_release(releases)  # 중단된 갱신
+        assert prepare_release(releases).version == 2
+
+
+class TestWorkingCopy:
+    def test_no_pointer_working_copy_is_legacy(self, releases):
+        assert sync_working_copy(releases) == CatalogRelease.legacy()
+
+    def test_published_writes_synced_then_snapshotted(self, releases):
+        v1 = prepare_release(releases)
+        publish_release(v1, releases)
+        conn = catalog_db.connect(v1.db_path)  # 백필이 게시본에 쓴 행
+        catalog_db.upsert_parameters_many(conn, [("A1", [{"param_name": "serviceKey"}])])
+        conn.close()
+
+        working = sync_working_copy(releases)
+        assert working == CatalogRelease.legacy()
+        _write_release(working, ["A1", "A2", "A3"])  # 스캔 + 인덱서가 작업본에 씀
+        v2 = prepare_release(releases, base=working)
+        publish_release(v2, releases)
+
+        assert read_pointer(releases) == v2
+        assert json.loads(v2.id_map_path.read_text()) == ["A1", "A2", "A3"]
+        conn = catalog_db.connect_readonly(v2.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM apis").fetchone()[0] == 3
+        assert conn.execute("SELECT COUNT(*) FROM api_parameters").fetchone()[0] == 1
+        conn.close()
+
+
+    def test_refresh_runs_on_working_copy(self, releases, monkeypatch):
+        from scripts.catalog_refresh import _build_release
+
+        monkeypatch.setattr(catalog_release, "CATALOG_RELEASES_DIR", releases)
+        publish_release(prepare_release(releases), releases)
+        working = CatalogRelease.legacy()
+
+        async def refresh():
+            # 인덱서와 같은 경로 — 이 프로세스의 기본 카탈로그도 작업본
+            assert catalog_db.get_catalog_connections().db_path == working.db_path.resolve()
+            catalog_db.upsert_apis_many(
+                catalog_db.get_catalog_connections().writer, [{"api_id": "A3", "name": "A3"}]
+            )
+            working.id_map_path.write_text(json.dumps(["A1", "A2", "A3"]), encoding="utf-8")
+            np.save(working.embeddings_path, np.ones((3, 4), dtype=np.float32))
+            return {}
+
+        result = asyncio.run(_build_release(refresh))
+        assert result["release"]["version"] == 2
+        assert result["release"]["index_entries"] == 3
+        assert read_pointer(releases).version == 2
+
+
+class TestActiveRelease:
+    def test_pinned_for_process(self, releases, monkeypatch):
+        monkeypatch.setattr(catalog_release, "CATALOG_RELEASES_DIR", releases)
+        v1 = prepare_release(releases)
+        publish_release(v1, releases)
+
+        assert catalog_release.active_release() == v1
+        publish_release(prepare_release(releases), releases)
+        assert catalog_release.active_release() == v1  # 런 도중 게시돼도 그대로
+
+    def test_use_release_redirects_defaults(self, releases):
+        release = prepare_release(releases)
+        with use_release(release):
+            assert catalog_db.get_catalog_connections().db_path == release.db_path.resolve()
+        assert catalog_release._active is None
+
+    def test_refresh_switches_long_lived_process(self, releases, monkeypatch):
+        monkeypatch.setattr(catalog_release, "CATALOG_RELEASES_DIR", releases)
+        publish_release(prepare_release(releases), releases)
+        v1_manager = catalog_db.get_catalog_connections()
+        v1_manager.reader()
+        assert catalog_release.refresh_active_release().version == 1  # 포인터 그대로
+
+        for _ in range(3):  # v1은 정리됨
+            publish_release(prepare_release(releases), releases, keep=2)
+        assert not catalog_release.CatalogRelease.for_version(1, releases).db_path.exists()
+
+        assert catalog_release.refresh_active_release().version == 4
+        assert v1_manager._readers == []  # 이전 버전 연결 닫힘
+        counts = []
+
+        def new_worker():
+            conn = catalog_db.get_catalog_connections().reader()
+            counts.append(conn.execute("SELECT COUNT(*) FROM apis").fetchone()[0])
+
+        worker = threading.Thread(target=new_worker)
+        worker.start()
+        worker.join()
+        assert counts == [2]
+
+    def test_refresh_ignored_while_building(self, releases, monkeypatch):
+        monkeypatch.setattr(catalog_release, "CATALOG_RELEASES_DIR", releases)
+        release = prepare_release(releases)
+        with use_release(release):
+            publish_release(prepare_release(releases), releases)
+            assert catalog_release.refresh_active_release() == release
+
+
+class TestCatalogWriterLock:
+    @pytest.fixture
+    def guard(self, tmp_path, monkeypatch):
+        guard = ResourceGuard(tmp_path / "locks")
+        monkeypatch.setattr(resource_guard, "_guard", guard)
+        return guard
+
+    def test_writer_lock_exclusive(self, guard):
+        with guard.catalog_writer():
+            with pytest.raises(ResourceBusyError):
+                guard.catalog_writer(timeout=0)
+        guard.catalog_writer(timeout=0).release()
+
+    def test_backfill_writes_published_release_under_lock(self, releases, guard, monkeypatch):
+        monkeypatch.setattr(catalog_release, "CATALOG_RELEASES_DIR", releases)
+        v1 = prepare_release(releases)
+        publish_release(v1, releases)
+
+        async def fetch(api_id):
+            assert guard.catalog.in_use() == 1  # 갱신이 끼어들 수 없음
+            return [{"param_name": "serviceKey", "is_required": 1}], []
+
+        stats = asyncio.run(backfill(fetcher=fetch, rate=100))
+        assert stats["success"] == 2 and guard.catalog.in_use() == 0
+        catalog_db.close_catalog_connections()
+        conn = catalog_db.connect_readonly(v1.db_path)
+        assert conn.execute("SELECT COUNT(*) FROM api_parameters").fetchone()[0] == 2
+        conn.close()
@@ -0,0 +1,209 @@
+"""샤딩 전수 스캔 테스트 — 동시 샤드, 샤드별 재시도, 스테이징 후 원자 교체, 폐지 표시."""
+
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from catalog_fetch import ConditionalFetcher, content_fingerprint
+from catalog_staging import publish_staging, shard_urls, sharded_scan
+
+
+class _Response:
+    def __init__(self, status_code, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _FakeSite:
+    """httpx.AsyncClient 대역 — ETag 조건부 요청이면 304, flaky[url]번까지 503."""
+
+    def __init__(self, pages):
+        self.pages = dict(pages)
+        self.flaky: dict[str, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, headers=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if self.flaky.get(url, 0) > 0:
+            self.flaky[url] -= 1
+            return _Response(503)
+        if url not in self.pages:
+            return _Response(404)
+        etag = f'"{content_fingerprint(self.pages[url])[:8]}"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return _Response(304)
+        return _Response(200, self.pages[url], {"etag": etag})
+
+
+def _listing_url(page):
+    return f"https://site/list/{page}"
+
+
+def _detail_url(api_id):
+    return f"https://site/detail/{api_id}"
+
+
+def _parse(html):
+    return [{"api_id": api_id, "name": f"API {api_id}", "category": "교통"} for api_id in re.findall(r"id=(\w+)", html)]
+
+
+async def _render(row):
+    return [{"param_name": "sigunguCd"}], []
+
+
+def _site(pages=8):
+    site = _FakeSite({})
+    for page in range(1, pages + 1):
+        ids = [f"P{page}A", f"P{page}B"]
+        site.pages[_listing_url(page)] = " ".join(f"id={i}" for i in ids)
+        for api_id in ids:
+            site.pages[_detail_url(api_id)] = f"<div>{api_id}</div>"
+    return site
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = catalog_db.get_catalog_connections(tmp_path / "catalog.sqlite3")
+    yield manager
+    catalog_db.close_catalog_connections()
+
+
+async def _scan(conn, site, pages=8, **kwargs):
+    kwargs.setdefault("retry_backoff_sec", 0)
+    return await sharded_scan(
+        conn, [_listing_url(p) for p in range(1, pages + 1)],
+        fetcher=ConditionalFetcher(conn, client=site), parse_listing=_parse, render_detail=_render,
+        detail_url=_detail_url, pages_per_shard=2, workers=4, **kwargs,
+    )
+
+
+def _count(conn, table="apis"):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestShardedScan:
+    def test_shard_urls(self):
+        assert shard_urls(list("abcde"), 2) == [["a", "b"], ["c", "d"], ["e"]]
+
+    async def test_staged_until_publish(self, db):
+        conn = db.writer
+        site = _site()
+        stats = await _scan(conn, site)
+        assert stats["complete"] and stats["shards"] == 4
+        assert site.max_in_flight > 1  # 샤드 동시 처리
+        assert _count(db.reader()) == 0  # 라이브 테이블은 그대로
+        assert _count(conn, "scan_staging_apis") == 16
+
+        published = publish_staging(conn, deactivate=stats["complete"])
+        assert published == {"seen": 16, "updated": 16, "missing": 0, "deactivated": 0}
+        assert _count(db.reader()) == 16
+        assert _count(db.reader(), "api_join_keys") == 16
+        assert _count(conn, "scan_staging_apis") == 0
+
+    async def test_rescan_after_publish_is_http_only(self, db):
+        conn = db.writer
+        site = _site()
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+        stats = await _scan(conn, site)
+        assert stats["pages_skipped"] == 8 and stats["details_rendered"] == 0
+        assert publish_staging(conn, deactivate=True)["seen"] == 16
+
+    async def test_shard_retries_failed_pages(self, db):
+        conn = db.writer
+        site = _site()
+        site.flaky[_listing_url(3)] = 1
+        site.flaky[_detail_url("P6A")] = 1
+        stats = await _scan(conn, site)
+        assert stats["complete"] and stats["retries"] == 2
+        publish_staging(conn, deactivate=True)
+        assert _count(conn) == 16
+
+    async def test_incomplete_scan_skips_deactivation(self, db):
+        conn = db.writer
+        site = _site()
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+
+        del site.pages[_listing_url(8)]  # 계속 404
+        site.pages[_listing_url(1)] = "id=P1A"  # P1B 폐지
+        stats = await _scan(conn, site, max_attempts=2)
+        assert not stats["complete"]
+        assert stats["failed_shards"] == [{"shard": 3, "failed_urls": [_listing_url(8)]}]
+        publish_staging(conn, deactivate=stats["complete"])
+        assert _count(conn, "apis WHERE is_active = 1") == 16
+
+    async def test_deactivated_after_two_complete_misses(self, db):
+        conn = db.writer
+        site = _site()
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+
+        site.pages[_listing_url(1)] = "id=P1A"
+        stats = await _scan(conn, site)
+        assert publish_staging(conn, deactivate=stats["complete"]) == {
+            "seen": 15, "updated": 0, "missing": 1, "deactivated": 0,
+        }
+        assert conn.execute("SELECT is_active FROM apis WHERE api_id = 'P1B'").fetchone()[0] == 1
+
+        stats = await _scan(conn, site)
+        assert publish_staging(conn, deactivate=stats["complete"])["deactivated"] == 1
+        assert conn.execute("SELECT is_active FROM apis WHERE api_id = 'P1B'").fetchone()[0] == 0
+        assert _count(conn, "api_scan_misses") == 0
+
+    async def test_reappearing_api_resets_misses(self, db):
+        conn = db.writer
+        site = _site()
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+
+        original = site.pages[_listing_url(1)]
+        site.pages[_listing_url(1)] = "id=P1A"  # 스캔 중 다른 페이지로 밀려 한 번 못 봄
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+        site.pages[_listing_url(1)] = original
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+        site.pages[_listing_url(1)] = "id=P1A"
+        assert publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])["deactivated"] == 0
+        assert _count(conn, "apis WHERE is_active = 1") == 16
+
+    async def test_empty_page_mid_listing_is_failed(self, db):
+        conn = db.writer
+        site = _site()
+        publish_staging(conn, deactivate=(await _scan(conn, site))["complete"])
+
+        site.pages[_listing_url(2)] = "<p>시스템 점검 중입니다</p>"  # 중간 페이지
+        site.pages[_listing_url(4)] = "<p>시스템 점검 중입니다</p>"  # 샤드 경계
+        stats = await _scan(conn, site, max_attempts=2)
+        assert not stats["complete"]
+        assert stats["failed_shards"] == [
+            {"shard": 0, "failed_urls": [_listing_url(2)]},
+            {"shard": 1, "failed_urls": [_listing_url(4)]},
+        ]
+        assert publish_staging(conn, deactivate=stats["complete"])["deactivated"] == 0
+        # 점검 페이지의 검증자는 저장하지 않음 → 다음 스캔에서 다시 받는다
+        stored = conn.execute("SELECT content_hash FROM http_validators WHERE url = ?", (_listing_url(2),))
+        assert stored.fetchone()[0] == content_fingerprint("id=P2A id=P2B")
+
+    async def test_empty_pages_past_end_complete(self, db):
+        conn = db.writer
+        site = _site(pages=6)
+        stats = await _scan(conn, site)  # 7~8페이지는 목록 끝 (404 대신 빈 목록)
+        assert not stats["complete"]
+        site.pages[_listing_url(7)] = site.pages[_listing_url(8)] = "<p>검색 결과가 없습니다</p>"
+        stats = await _scan(conn, site)
+        assert stats["complete"] and stats["failed_shards"] == []
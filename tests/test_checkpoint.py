@@ -0,0 +1,159 @@
+"""체크포인트/재개 테스트 — Phase 결과 원자적 저장, 완료 Phase 스킵, TimeBudget 복원."""
+
+import json
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import VARIABLE_POOL_SEC
+from scripts.run_engine import IdeationEngine, RunCheckpoint, TimeBudget
+
+
+def _engine(tmp_path, **kwargs):
+    with patch("scripts.run_engine.RunCheckpoint",
+               side_effect=lambda bid: RunCheckpoint(bid, tmp_path)):
+        engine = IdeationEngine(dry_run=True, **kwargs)
+    engine._preflight_check = MagicMock(return_value=[])
+    engine._send_system_alert = MagicMock()
+    for phase in range(1, 7):
+        setattr(engine, f"_phase{phase}", MagicMock(
+            return_value={"batch_id": engine.batch_id, "phase": phase, "duration_sec": 1.0}
+        ))
+    return engine
+
+
+class TestRunCheckpoint:
+    def test_save_and_load(self, tmp_path):
+        cp = RunCheckpoint("B-1", tmp_path)
+        cp.save(1, {"signals": [{"title": "신호"}]}, TimeBudget())
+
+        assert (tmp_path / "B-1" / "phase1.json").exists()
+        assert cp.completed_phases() == [1]
+        assert cp.load(1) == {"signals": [{"title": "신호"}]}
+        assert cp.load(2) is None
+
+    def test_numpy_like_values_serialized(self, tmp_path):
+        class FakeScalar:
+            def item(self):
+                return 0.5
+
+        cp = RunCheckpoint("B-1", tmp_path)
+        cp.save(3, {"feasibility_pct": FakeScalar()}, TimeBudget())
+        assert cp.load(3) == {"feasibility_pct": 0.5}
+
+    def test_corrupt_phase_file_reruns(self, tmp_path):
+        cp = RunCheckpoint("B-1", tmp_path)
+        cp.save(2, {"hypotheses": []}, TimeBudget())
+        (tmp_path / "B-1" / "phase2.json").write_text("{broken", encoding="utf-8")
+        assert cp.load(2) is None
+
+    def test_phase_file_without_state_ignored(self, tmp_path):
+        """state.json 갱신 전에 죽은 경우 — 결과 파일만 있으면 미완료로 본다."""
+        (tmp_path / "B-1").mkdir()
+        (tmp_path / "B-1" / "phase4.json").write_text("{}", encoding="utf-8")
+        assert RunCheckpoint("B-1", tmp_path).load(4) is None
+
+
+class TestPrune:
+    @staticmethod
+    def _run(tmp_path, batch_id, phases, updated_at):
+        (tmp_path / batch_id).mkdir()
+        (tmp_path / batch_id / "state.json").write_text(json.dumps(
+            {"batch_id": batch_id, "completed_phases": phases, "updated_at": updated_at}
+        ))
+
+    def test_keeps_newest_completed_and_unfinished(self, tmp_path):
+        for i in range(4):
+            self._run(tmp_path, f"B-{i}", [1, 2, 3, 4, 5, 6], f"2026-01-01T0{i}:00:00+09:00")
+        self._run(tmp_path, "B-failed", [1, 2], "2025-12-31T00:00:00+09:00")
+
+        assert RunCheckpoint.prune(tmp_path, keep=2) == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["B-2", "B-3", "B-failed"]
+
+    def test_missing_dir(self, tmp_path):
+        assert RunCheckpoint.prune(tmp_path / "none", keep=1) == 0
+
+    def test_successful_run_prunes_old_checkpoints(self, tmp_path):
+        self._run(tmp_path, "B-old", [1, 2, 3, 4, 5, 6], "2000-01-01T00:00:00+09:00")
+        engine = _engine(tmp_path)
+        with patch("scripts.run_engine.RUNS_KEEP_COMPLETED", 1):
+            assert engine.run()["success"]
+        assert [p.name for p in tmp_path.iterdir()] == [engine.batch_id]
+
+
+class TestTimeBudgetSnapshot:
+    def test_restore_elapsed_and_pool(self):
+        tb = TimeBudget()
+        tb.restore({"elapsed_sec": 1200.0, "variable_pool_remaining": 600})
+        assert tb.elapsed_sec == pytest.approx(1200.0, abs=1.0)
+        assert tb.variable_pool_remaining == 600
+
+    def test_snapshot_roundtrip(self):
+        tb = TimeBudget()
+        tb.variable_pool_remaining = VARIABLE_POOL_SEC - 90
+        restored = TimeBudget()
+        restored.restore(json.loads(json.dumps(tb.snapshot())))
+        assert restored.variable_pool_remaining == VARIABLE_POOL_SEC - 90
+
+
+class TestResume:
+    def test_each_phase_checkpointed(self, tmp_path):
+        engine = _engine(tmp_path)
+        result = engine.run()
+
+        assert result["success"] is True
+        cp = RunCheckpoint(engine.batch_id, tmp_path)
+        assert cp.completed_phases() == [1, 2, 3, 4, 5, 6]
+        assert cp.load(4)["phase"] == 4
+
+    def test_resume_skips_completed_phases(self, tmp_path):
+        first = _engine(tmp_path)
+        first._phase5.side_effect = RuntimeError("Claude CLI crashed")
+        assert first.run()["success"] is False
+
+        state = RunCheckpoint(first.batch_id, tmp_path).state()
+        assert state["completed_phases"] == [1, 2, 3, 4]
+
+        resumed = _engine(tmp_path, resume=first.batch_id)
+        result = resumed.run()
+
+        assert result["success"] is True
+        assert result["batch_id"] == first.batch_id
+        for phase in (1, 2, 3, 4):
+            getattr(resumed, f"_phase{phase}").assert_not_called()
+        resumed._phase5.assert_called_once_with({"batch_id": first.batch_id, "phase": 4, "duration_sec": 1.0})
+        assert result["phases"]["phase6"]["phase"] == 6
+
+    def test_resume_restores_budget(self, tmp_path):
+        cp = RunCheckpoint("B-1", tmp_path)
+        tb = TimeBudget()
+        tb._started_at = time.monotonic() - 900
+        tb.variable_pool_remaining = 700
+        cp.save(1, {"signals": []}, tb)
+
+        engine = _engine(tmp_path, resume="B-1")
+        assert engine.batch_id == "B-1"
+        assert engine.budget.elapsed_sec == pytest.approx(900, abs=2)
+        assert engine.budget.variable_pool_remaining == 700
+
+    def test_resume_unknown_batch_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _engine(tmp_path, resume="NOPE")
+
+    def test_streaming_resume_after_phase2_runs_sequential(self, tmp_path):
+        cp = RunCheckpoint("B-1", tmp_path)
+        for phase in (1, 2):
+            cp.save(phase, {"phase": phase}, TimeBudget())
+
+        engine = _engine(tmp_path, resume="B-1", streaming=True)
+        engine._run_streaming = MagicMock()
+        assert engine.run()["success"] is True
+        engine._run_streaming.assert_not_called()
+        engine._phase3.assert_called_once_with({"phase": 2})
@@ -76,3 +76,40 @@ class TestDBMigration:
             assert result["to"] == "1.0"
         finally:
             migrator.close()
+
+    def test_unseeded_db_reads_real_version(self, tmp_path, monkeypatch):
+        """버전 기록이 없는 옛 DB — 마이그레이터 연결이 최신 버전을 심어 1.0 → 1.1을 건너뛰지 않는다."""
+        import catalog_db
+
+        monkeypatch.setattr(catalog_db, "SCHEMA_VERSION", "1.1")  # 스키마 최신 버전이 1.1일 때
+        db_path = tmp_path / "legacy.sqlite3"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE api_operations (api_id TEXT, operation_name TEXT)")
+        conn.execute("CREATE TABLE catalog_metadata (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+        conn.close()
+
+        migrator = DBMigrator(db_path=db_path)
+        try:
+            result = migrator.migrate(target="1.1")
+            assert result["from"] == "1.0" and result["applied"] == 1
+        finally:
+            migrator.close()
+        conn = sqlite3.connect(str(db_path))
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(api_operations)")]
+        conn.close()
+        assert "deprecated" in columns
+
+    def test_current_does_not_write(self, tmp_path):
+        """--current 조회는 테이블·버전 행을 만들지 않는다."""
+        db_path = tmp_path / "empty.sqlite3"
+        sqlite3.connect(str(db_path)).close()
+
+        migrator = DBMigrator(db_path=db_path, readonly=True)
+        try:
+            assert migrator.get_current_version() == "1.0"
+        finally:
+            migrator.close()
+        conn = sqlite3.connect(str(db_path))
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+        conn.close()
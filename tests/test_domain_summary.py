@@ -0,0 +1,137 @@
+"""도메인 요약 증분 갱신 테스트 — dirty 트리거, 카테고리별 재계산, 프롬프트 조각 버전."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from domain_summary import load_domain_fragment, refresh_domain_summaries, representative_keywords
+
+
+@pytest.fixture
+def conn(tmp_path):
+    c = catalog_db.connect(tmp_path / "catalog.sqlite3")
+    catalog_db.upsert_apis_many(c, [
+        {"api_id": "T1", "name": "버스 도착 정보 조회", "category": "교통"},
+        {"api_id": "T2", "name": "버스 노선 정보", "category": "교통"},
+        {"api_id": "T3", "name": "지하철 운행 정보", "category": "교통"},
+        {"api_id": "W1", "name": "단기 예보 조회", "category": "기상"},
+    ])
+    yield c
+    c.close()
+
+
+def _dirty(conn):
+    return {r[0] for r in conn.execute("SELECT category FROM domain_summary_dirty")}
+
+
+def _summary(conn, category):
+    row = conn.execute(
+        "SELECT api_count, representative_keywords, summary_text FROM domain_summary WHERE category = ?",
+        (category,),
+    ).fetchone()
+    return tuple(row) if row else None
+
+
+class TestDirtyTracking:
+    def test_writes_mark_categories(self, conn):
+        assert _dirty(conn) == {"교통", "기상"}
+        refresh_domain_summaries(conn)
+        assert _dirty(conn) == set()
+
+        # 내용이 같은 재스캔 upsert는 표시하지 않음
+        catalog_db.upsert_apis_many(conn, [{"api_id": "W1", "name": "단기 예보 조회", "category": "기상"}])
+        assert _dirty(conn) == set()
+
+        catalog_db.upsert_apis_many(conn, [{"api_id": "W1", "name": "단기 예보 조회", "category": "환경"}])
+        assert _dirty(conn) == {"기상", "환경"}
+
+    def test_deactivate_marks_category(self, conn):
+        refresh_domain_summaries(conn)
+        conn.execute("UPDATE apis SET is_active = 0 WHERE api_id = 'T3'")
+        conn.commit()
+        assert _dirty(conn) == {"교통"}
+
+
+class TestRefresh:
+    def test_only_dirty_categories_recomputed(self, conn):
+        refresh_domain_summaries(conn)
+        assert _summary(conn, "교통")[0] == 3
+        assert _summary(conn, "교통")[1].split(",")[0] == "버스"  # 불용어(정보, 조회) 제외
+
+        conn.execute("UPDATE domain_summary SET updated_at = 'old'")
+        conn.execute("UPDATE apis SET is_active = 0 WHERE api_id = 'T3'")
+        conn.commit()
+        result = refresh_domain_summaries(conn)
+        assert result["refreshed"] == ["교통"]
+        assert _summary(conn, "교통")[0] == 2
+        assert conn.execute("SELECT updated_at FROM domain_summary WHERE category = '기상'").fetchone()[0] == "old"
+
+    def test_empty_category_removed_and_existing_text_kept(self, conn):
+        refresh_domain_summaries(conn)
+        conn.execute("UPDATE domain_summary SET summary_text = '수기 설명' WHERE category = '교통'")
+        conn.execute("UPDATE apis SET is_active = 0 WHERE category = '기상'")
+        conn.execute("UPDATE apis SET name = '버스 위치' WHERE api_id = 'T1'")
+        conn.commit()
+
+        result = refresh_domain_summaries(conn)
+        assert result["removed"] == ["기상"]
+        assert _summary(conn, "기상") is None
+        assert _summary(conn, "교통")[2] == "수기 설명"
+
+    def test_counts_not_baked_into_text(self, conn):
+        refresh_domain_summaries(conn)
+        assert _summary(conn, "교통")[2] is None
+
+        items, _ = load_domain_fragment(conn)
+        traffic = next(i for i in items if i["cat"] == "교통")
+        assert "summary" not in traffic
+
+    def test_force_rebuilds_all(self, conn):
+        refresh_domain_summaries(conn)
+        assert sorted(refresh_domain_summaries(conn, force=True)["refreshed"]) == ["교통", "기상"]
+
+    def test_keywords(self):
+        names = ["Bus Arrival API", "버스 정류소 목록", "버스 노선 조회"]
+        assert representative_keywords(names, top_n=3) == ["버스", "bus", "arrival"]
+
+
+class TestPromptFragment:
+    def test_fragment_sorted_compact_and_versioned(self, conn):
+        assert load_domain_fragment(conn) is None
+        version = refresh_domain_summaries(conn)["version"]
+
+        items, loaded_version = load_domain_fragment(conn)
+        assert loaded_version == version
+        assert [i["cat"] for i in items] == ["교통", "기상"]  # API 수 내림차순
+        assert items[0]["n"] == 3 and "kw" in items[0]  # 짧은 키
+        text = conn.execute("SELECT value FROM catalog_metadata WHERE key = 'domain_summary_fragment'").fetchone()[0]
+        assert json.loads(text) == items and '": ' not in text
+
+    def test_version_changes_only_with_content(self, conn):
+        v1 = refresh_domain_summaries(conn)["version"]
+        assert refresh_domain_summaries(conn)["version"] == v1
+        catalog_db.upsert_apis_many(conn, [{"api_id": "W2", "name": "중기 예보", "category": "기상"}])
+        assert refresh_domain_summaries(conn)["version"] != v1
+
+    def test_existing_catalog_seeded_dirty(self, tmp_path):
+        import sqlite3
+
+        path = tmp_path / "legacy.sqlite3"
+        legacy = sqlite3.connect(path)
+        legacy.executescript(catalog_db.SCHEMA_SQL)
+        legacy.execute(
+            "INSERT INTO apis (api_id, name, category, created_at, updated_at) VALUES ('L1', '주차장', '교통', 'x', 'x')"
+        )
+        legacy.commit()
+        legacy.close()
+
+        conn = catalog_db.connect(path)
+        assert _dirty(conn) == {"교통"}
+        conn.close()
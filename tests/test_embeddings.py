@@ -15,7 +15,9 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from embedding_utils import EmbeddingService
+import catalog_db
+import resource_guard
+from embedding_utils import EmbeddingService, reciprocal_rank_fusion, release_embedding_models
 
 
 def _make_random_embeddings(n: int, dim: int = 128) -> np.ndarray:
@@ -38,6 +40,57 @@ class TestEmbeddingServiceEncode:
         assert result.shape[0] == 2
 
 
+class TestModelRamLease:
+    @pytest.fixture
+    def fake_st(self):
+        module = MagicMock()
+        with patch.dict(sys.modules, {"sentence_transformers": module}):
+            yield module
+
+    def test_context_manager_releases_lease(self, fake_st):
+        """with 블록이 끝나면 모델 RAM 예산을 반납한다."""
+        memory = resource_guard.get_resource_guard().memory
+        with EmbeddingService() as svc:
+            svc.load_model()
+            assert memory.in_use() > 0
+        assert memory.in_use() == 0
+        assert svc._model is None
+
+    def test_release_all_at_end_of_run(self, fake_st):
+        """런 끝의 release_embedding_models()가 살아 있는 모든 모델의 예산을 반납한다."""
+        memory = resource_guard.get_resource_guard().memory
+        services = [EmbeddingService(), EmbeddingService()]
+        services[0].load_model()
+        assert memory.in_use() > 0
+
+        assert release_embedding_models() == 1
+        assert memory.in_use() == 0
+        assert release_embedding_models() == 0
+
+    def test_same_model_borrowed_not_reserved_twice(self, fake_st):
+        """같은 모델의 두 인스턴스는 모델 하나·예산 하나를 나눠 쓰고, 마지막이 놓을 때 반납한다."""
+        memory = resource_guard.get_resource_guard().memory
+        first, second = EmbeddingService(), EmbeddingService()
+        first.load_model()
+        held = memory.in_use()
+        second.load_model()  # 자기 예산을 기다리지 않는다
+        assert memory.in_use() == held
+        assert fake_st.SentenceTransformer.call_count == 1
+        assert second._model is first._model
+
+        first.unload_model()
+        assert memory.in_use() == held
+        second.unload_model()
+        assert memory.in_use() == 0
+
+    def test_garbage_collected_service_releases(self, fake_st):
+        memory = resource_guard.get_resource_guard().memory
+        svc = EmbeddingService()
+        svc.load_model()
+        del svc
+        assert memory.in_use() == 0
+
+
 class TestFaissIndex:
     @pytest.fixture
     def index_files(self, tmp_path):
@@ -152,3 +205,29 @@ class TestIndexMissing:
         )
         with pytest.raises(FileNotFoundError):
             svc.load_index()
+
+
+class TestHybridSearch:
+    def test_rrf_rewards_agreement(self):
+        fused = reciprocal_rank_fusion({"vector": ["A", "B", "C"], "lexical": ["C", "D"]}, k=60)
+        assert fused[0]["api_id"] == "C"  # 양쪽 모두 등장
+        assert fused[0]["ranks"] == {"vector": 3, "lexical": 1}
+        assert fused[0]["score"] == pytest.approx(1 / 63 + 1 / 61)
+        assert [e["api_id"] for e in fused[1:]] == ["A", "B", "D"]
+
+    def test_hybrid_adds_lexical_only_hits(self, tmp_path):
+        conn = catalog_db.connect(tmp_path / "catalog.sqlite3")
+        catalog_db.upsert_apis_many(conn, [
+            {"api_id": "V1", "name": "부동산 시세"},
+            {"api_id": "L1", "name": "사업자등록 상태조회", "description": "사업자번호 진위 확인"},
+        ])
+        svc = EmbeddingService()
+        with patch.object(svc, "search", return_value=[{"api_id": "V1", "score": 0.8, "rank": 1}]):
+            results = svc.hybrid_search("사업자번호 기반 창업 분석", conn=conn, top_k=5)
+        conn.close()
+
+        by_id = {r["api_id"]: r for r in results}
+        assert set(by_id) == {"V1", "L1"}
+        assert by_id["L1"]["lexical_rank"] == 1 and by_id["L1"]["similarity"] is None
+        assert by_id["V1"]["similarity"] == 0.8 and by_id["V1"]["lexical_rank"] is None
+        assert [r["rank"] for r in results] == [1, 2]
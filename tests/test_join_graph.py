@@ -0,0 +1,120 @@
+"""조인 키 그래프 테스트 — 동의어 정규화, 인접 테이블 구축, 쌍별 키, 다중 홉 경로."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import catalog_db
+from join_graph import JoinGraph, canonical_join_key, rebuild_join_graph, update_join_graph
+
+_PARAMS = {
+    "BLD": [{"param_name": "sigunguCd"}, {"param_name": "bjdongCd"}, {"param_name": "serviceKey"}],
+    "APT": [{"param_name": "LAWD_CD", "description": "지역코드"}, {"param_name": "DEAL_YMD"}],
+    "WTH": [{"param_name": "base_date"}, {"param_name": "nx"}],
+    "SALES": [{"param_name": "stdrYm"}, {"param_name": "사업자등록번호"}],
+    "BIZ": [{"param_name": "b_no"}],
+    "LONE": [{"param_name": "pageNo"}],
+}
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "catalog.sqlite3"
+    manager = catalog_db.get_catalog_connections(path)
+    conn = manager.writer
+    catalog_db.upsert_apis_many(conn, [{"api_id": api_id, "name": api_id} for api_id in _PARAMS])
+    catalog_db.upsert_parameters_many(conn, list(_PARAMS.items()))
+    rebuild_join_graph(conn)
+    yield manager
+    catalog_db.close_catalog_connections()
+
+
+class TestCanonicalJoinKey:
+    @pytest.mark.parametrize("name, expected", [
+        ("시군구코드", "시군구코드"),
+        ("sigunguCd", "시군구코드"),
+        ("SIGUNGU_CD", "시군구코드"),
+        ("기준_법정동코드", "시군구코드"),
+        ("baseDate", "날짜"),
+        ("날짜", "날짜"),
+        ("사업자번호", "사업자번호"),
+        ("b_no", "사업자번호"),
+        ("serviceKey", None),
+        ("numOfRows", None),
+        ("ymdFlag", None),  # 짧은 동의어는 부분 일치하지 않음
+        ("startDate", "날짜"),
+        ("yyyymmdd", "날짜"),
+        ("baseYYYYMMDD", "날짜"),
+        ("기준연월일", "날짜"),
+        ("yyyymm", "연월"),
+        ("기준법정동코드", "시군구코드"),
+        ("roadAddrPart1", "도로명주소"),
+        # 단어 경계가 아닌 부분 일치는 조인 키가 아님
+        ("validate", None),
+        ("candidate", None),
+        ("updateYn", None),
+        ("일자리코드", None),
+        ("시군구코드명", None),
+        ("fieldCode", None),
+    ])
+    def test_synonyms(self, name, expected):
+        assert canonical_join_key(name) == expected
+
+    def test_description_fallback(self):
+        assert canonical_join_key("cd", "법정동코드 앞 5자리") == "시군구코드"
+        assert canonical_join_key("cd", "조회 코드") is None
+        assert canonical_join_key("code", "법정동코드를 입력") == "시군구코드"
+        assert canonical_join_key("jobCd", "일자리 분류 코드") is None
+
+
+class TestJoinGraph:
+    def test_build_stats_and_availability(self, db):
+        stats = rebuild_join_graph(db.writer)
+        assert stats["apis"] == 5  # LONE 제외
+        assert JoinGraph(db).available()
+
+    def test_analyze_pairs_from_graph(self, db):
+        pairs = JoinGraph(db).analyze_api_pairs([
+            {"api_id": "BLD", "params": []}, {"api_id": "APT", "params": []}, {"api_id": "WTH", "params": []},
+        ])
+        assert pairs == [{"api_pair": ["BLD", "APT"], "join_keys": ["시군구코드"]}]
+
+    def test_inline_params_override_graph(self, db):
+        pairs = JoinGraph(db).analyze_api_pairs([
+            {"api_id": "X", "params": [{"param_name": "기준일자"}]}, {"api_id": "WTH", "params": []},
+        ])
+        assert pairs == [{"api_pair": ["X", "WTH"], "join_keys": ["날짜"]}]
+
+    def test_neighbors(self, db):
+        assert JoinGraph(db).neighbors("SALES") == [
+            {"api_id": "APT", "join_keys": ["연월"]},
+            {"api_id": "BIZ", "join_keys": ["사업자번호"]},
+        ]
+
+    def test_multi_hop_path(self, db):
+        # BLD —시군구코드— APT —연월— SALES —사업자번호— BIZ
+        path = JoinGraph(db).find_path("BLD", "BIZ")
+        assert [(h["from"], h["to"], h["join_key"]) for h in path] == [
+            ("BLD", "APT", "시군구코드"), ("APT", "SALES", "연월"), ("SALES", "BIZ", "사업자번호"),
+        ]
+        assert JoinGraph(db).find_path("BLD", "BIZ", max_hops=2) is None
+        assert JoinGraph(db).find_path("BLD", "BIZ", via=["APT"]) is None
+        assert JoinGraph(db).find_path("BLD", "LONE") is None
+
+    def test_join_groups(self, db):
+        assert JoinGraph(db).join_groups(["BLD", "APT", "SALES", "WTH"]) == [["BLD", "APT", "SALES"], ["WTH"]]
+
+    def test_incremental_update(self, db):
+        conn = db.writer
+        catalog_db.upsert_parameters_many(conn, [("WTH", [{"param_name": "sigunguCd"}])])
+        assert JoinGraph(db).keys_for(["WTH"])["WTH"] == {"날짜"}
+        update_join_graph(conn, ["WTH"])
+        assert JoinGraph(db).keys_for(["WTH"])["WTH"] == {"날짜", "시군구코드"}
+
+    def test_unavailable_without_catalog(self, tmp_path):
+        assert not JoinGraph(catalog_db.CatalogConnections(tmp_path / "missing.sqlite3")).available()
@@ -110,6 +110,46 @@ class TestJsonExtraction:
         assert isinstance(result, list)
         assert len(result) == 2
 
+    def test_text_after_json(self):
+        raw = '{"key": "value"}\n\n위 결과는 {요약} 입니다.'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == {"key": "value"}
+
+    def test_prose_brackets_before_json_skipped(self):
+        raw = '결과 [참고] 및 {설명}:\n[{"id": "H-001", "N": 4}]'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == [{"id": "H-001", "N": 4}]
+
+    def test_fenced_block_preferred(self):
+        raw = '예시 [1]\n```json\n{"key": "fenced"}\n```\n'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == {"key": "fenced"}
+
+    def test_trailing_commas_repaired(self):
+        raw = '```json\n{"items": [{"id": "H-001", "N": 3,}, {"id": "H-002"},],}\n```'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == {"items": [{"id": "H-001", "N": 3}, {"id": "H-002"}]}
+
+    def test_comma_inside_string_preserved(self):
+        raw = '[{"name": "a,]", "x": 1,}]'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == [{"name": "a,]", "x": 1}]
+
+    def test_truncated_array_keeps_complete_items(self):
+        raw = '[{"id": "H-001", "N": 4}, {"id": "H-002", "N": 3}, {"id": "H-003", "N'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == [{"id": "H-001", "N": 4}, {"id": "H-002", "N": 3}]
+
+    def test_truncated_scalar_array_closed(self):
+        raw = '{"keywords": ["교통", "의료",'
+        result = ClaudeCLIInvoker._extract_json(raw)
+        assert result == {"keywords": ["교통", "의료"]}
+
+    def test_unrepairable_raises(self):
+        raw = "{'key': 'single quotes'}"
+        with pytest.raises(ValueError):
+            ClaudeCLIInvoker._extract_json(raw)
+
 
 class TestPhase2PydanticValidation:
     """테스트 #7: Phase 2 출력 Pydantic 검증 통과/실패."""
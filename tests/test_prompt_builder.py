@@ -0,0 +1,149 @@
+"""프롬프트 빌더 테스트 — 템플릿 레지스트리, 토큰 추정, 컴팩트 직렬화, 예산 초과 절삭."""
+
+import os
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from prompt_builder import (
+    PromptBuilder,
+    PromptTemplateRegistry,
+    compact_json,
+    estimate_tokens,
+    shorten,
+)
+
+
+class TestPromptTemplateRegistry:
+    def test_loads_all_templates_once(self, tmp_path):
+        (tmp_path / "phase2_hypothesis.md").write_text("가설 지침", encoding="utf-8")
+        (tmp_path / "phase5_scoring.md").write_text("채점 지침", encoding="utf-8")
+        registry = PromptTemplateRegistry(tmp_path)
+
+        assert set(registry.versions()) == {"phase2_hypothesis.md", "phase5_scoring.md"}
+        assert registry.get("phase2_hypothesis.md") == "가설 지침"
+
+    def test_cached_until_mtime_changes(self, tmp_path):
+        path = tmp_path / "phase4_validation.md"
+        path.write_text("v1", encoding="utf-8")
+        registry = PromptTemplateRegistry(tmp_path)
+        v1 = registry.version("phase4_validation.md")
+
+        # 같은 mtime이면 디스크를 다시 읽지 않는다
+        stat = path.stat()
+        path.write_text("v2", encoding="utf-8")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert registry.get("phase4_validation.md") == "v1"
+
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert registry.get("phase4_validation.md") == "v2"
+        assert registry.version("phase4_validation.md") != v1
+
+    def test_version_is_content_hash(self, tmp_path):
+        (tmp_path / "a.md").write_text("같은 내용", encoding="utf-8")
+        (tmp_path / "b.md").write_text("같은 내용", encoding="utf-8")
+        registry = PromptTemplateRegistry(tmp_path)
+        assert registry.version("a.md") == registry.version("b.md")
+        assert len(registry.version("a.md")) == 12
+
+    def test_missing_template_is_empty(self, tmp_path):
+        registry = PromptTemplateRegistry(tmp_path / "nope")
+        assert registry.get("phase2_hypothesis.md") == ""
+        assert registry.version("phase2_hypothesis.md") == "missing"
+
+
+class TestEstimateTokens:
+    def test_ascii_four_chars_per_token(self):
+        assert estimate_tokens("abcdefgh") == 2
+
+    def test_korean_one_token_per_char(self):
+        assert estimate_tokens("교통량") == 3
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+
+class TestCompaction:
+    def test_compact_json_no_whitespace(self):
+        assert compact_json({"a": [1, 2], "b": "값"}) == '{"a":[1,2],"b":"값"}'
+
+    def test_shorten_keys_drops_empty_and_clips(self):
+        rec = {"service_name": "서비스", "problem": "가" * 10, "url": "", "solution": None}
+        out = shorten(rec, ["service_name", "problem", "url", "solution"], max_chars=5)
+        assert out == {"name": "서비스", "prob": "가가가가가…"}
+
+
+class TestPromptBuilderBudget:
+    def test_within_budget_keeps_everything(self):
+        prompt = (
+            PromptBuilder(2, budget_tokens=1000)
+            .add_text("템플릿")
+            .add_section("신호", [{"t": "a"}, {"t": "b"}], priority=1)
+            .build()
+        )
+        assert '[{"t":"a"},{"t":"b"}]' in prompt
+        assert "### 신호" in prompt
+
+    def test_lowest_priority_trimmed_first_from_tail(self):
+        signals = [{"t": f"신호{i}"} for i in range(5)]
+        domains = [{"cat": f"도메인{i}" * 10} for i in range(5)]
+        builder = (
+            PromptBuilder(2, budget_tokens=120)
+            .add_text("템플릿")
+            .add_section("신호", signals, priority=3)
+            .add_section("도메인", domains, priority=1)
+        )
+        prompt = builder.build()
+        # 도메인(저우선) 뒤쪽부터 잘리고 신호는 유지
+        assert "신호4" in prompt
+        assert "도메인4" not in prompt
+        assert estimate_tokens(prompt) <= 130
+
+    def test_required_sections_never_trimmed(self):
+        items = [{"id": f"H-{i:03d}", "name": "서비스" * 20} for i in range(10)]
+        prompt = (
+            PromptBuilder(5, budget_tokens=10)
+            .add_section("배치", items, priority=None)
+            .build()
+        )
+        assert all(f"H-{i:03d}" in prompt for i in range(10))
+
+    def test_shrink_section_clips_fields_but_keeps_items(self):
+        items = [{"id": f"H-{i:03d}", "prob": "문제" * 100} for i in range(10)]
+        full = PromptBuilder(5, budget_tokens=None).add_section("배치", items).build()
+        prompt = (
+            PromptBuilder(5, budget_tokens=estimate_tokens(full) // 3)
+            .add_section("배치", items, priority=0, shrink_to=20)
+            .build()
+        )
+        assert all(f"H-{i:03d}" in prompt for i in range(10))
+        assert "문제" * 100 not in prompt
+        assert estimate_tokens(prompt) <= estimate_tokens(full) // 3
+        # 원본 항목은 건드리지 않는다
+        assert items[0]["prob"] == "문제" * 100
+
+    def test_shrink_stops_at_floor(self):
+        items = [{"id": "H-001", "prob": "가" * 100}]
+        prompt = (
+            PromptBuilder(5, budget_tokens=1)
+            .add_section("배치", items, priority=0, shrink_to=30)
+            .build()
+        )
+        assert "H-001" in prompt
+        assert "가" * 30 + "…" in prompt
+
+    def test_string_section_dropped_to_empty_marker(self):
+        prompt = (
+            PromptBuilder(2, budget_tokens=5)
+            .add_section("피드백", "가" * 100, priority=0, fence=False)
+            .build()
+        )
+        assert "### 피드백\n없음" in prompt
+
+    def test_default_budget_from_config(self):
+        from config import PROMPT_TOKEN_BUDGET
+
+        assert PromptBuilder(2).budget_tokens == PROMPT_TOKEN_BUDGET[2]
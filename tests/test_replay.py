@@ -0,0 +1,214 @@
+"""리플레이 테스트 — 기록된 Phase 출력/Claude 응답으로 결정적 단계만 재계산, 설정 비교."""
+
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import config
+from scripts.replay import (
+    RecordedBatch,
+    ReplayConfig,
+    ReplayTools,
+    compare_configs,
+    config_overrides,
+    load_recorded_batches,
+    parse_overrides,
+    replay_batch,
+)
+from scripts.run_engine import RunCheckpoint, TimeBudget
+
+
+# ── 설정을 호출 시점에 읽는 가짜 스코어러 (실제 모듈처럼 임포트 시 바인딩) ──
+
+def _fake_modules():
+    feas = types.ModuleType("feasibility")
+    feas.FEASIBILITY_PASS_THRESHOLD = config.FEASIBILITY_PASS_THRESHOLD
+
+    class FeasibilityCalculator:
+        def calculate(self, total_data_needs, matched_data_needs, matched_api_count, join_key_count):
+            pct = 100 * matched_data_needs / max(total_data_needs, 1)
+            return {"feasibility_pct": pct, "passed": pct >= feas.FEASIBILITY_PASS_THRESHOLD * 100}
+
+    feas.FeasibilityCalculator = FeasibilityCalculator
+
+    val = types.ModuleType("validation_scorer")
+    val.VALIDATION_PASS_THRESHOLD = config.VALIDATION_PASS_THRESHOLD
+
+    class ValidationScorer:
+        def calculate(self, hypothesis_data, competitors, proxy_score):
+            total = 100 * hypothesis_data["timing_fit"]
+            return {"total_score": total, "passed": total >= val.VALIDATION_PASS_THRESHOLD,
+                    "breakdown": {}}
+
+    val.ValidationScorer = ValidationScorer
+
+    numrv = types.ModuleType("numrv_scorer")
+    numrv.NUMRV_WEIGHTS = config.NUMRV_WEIGHTS
+
+    class NUMRVScorer:
+        def score_batch(self, ideas):
+            for idea in ideas:
+                idea["weighted_score"] = sum(
+                    numrv.NUMRV_WEIGHTS[k] * idea["scores"][k] for k in numrv.NUMRV_WEIGHTS
+                )
+            return ideas
+
+    numrv.NUMRVScorer = NUMRVScorer
+
+    grade = types.ModuleType("grade_classifier")
+    grade.GRADE_ABSOLUTE = config.GRADE_ABSOLUTE
+
+    class GradeClassifier:
+        def classify(self, ideas):
+            for idea in ideas:
+                idea["grade"] = next(
+                    (g for g, floor in grade.GRADE_ABSOLUTE.items() if idea["weighted_score"] >= floor),
+                    "D",
+                )
+            return ideas
+
+    grade.GradeClassifier = GradeClassifier
+
+    dedup = types.ModuleType("dedup_engine")
+
+    class DedupEngine:
+        def __init__(self, threshold=0.85):
+            self.threshold = threshold
+
+        def check_duplicates(self, ideas):
+            return ideas
+
+    dedup.DedupEngine = DedupEngine
+    return {m.__name__: m for m in (feas, val, numrv, grade, dedup)}
+
+
+@pytest.fixture
+def fake_scorers(monkeypatch):
+    modules = _fake_modules()
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    return modules
+
+
+@pytest.fixture
+def tools(fake_scorers):
+    return ReplayTools(
+        feasibility=fake_scorers["feasibility"].FeasibilityCalculator(),
+        validation=fake_scorers["validation_scorer"].ValidationScorer(),
+        numrv=fake_scorers["numrv_scorer"].NUMRVScorer(),
+        grader=fake_scorers["grade_classifier"].GradeClassifier(),
+    )
+
+
+def _batch(batch_id="B-1"):
+    """H-001: 적합도 75%/검증 80, H-002: 적합도 50%/검증 45, H-003: 적합도 25% (미검증)."""
+    hyps = [{"id": f"H-00{i}", "service_name": f"서비스 {i}"} for i in (1, 2, 3)]
+    needs = {"H-001": 3, "H-002": 2, "H-003": 1}
+    matches = [
+        {"hypothesis_id": hid, "matched_apis": [], "feasibility_pct": n * 25, "passed": n >= 2,
+         "feasibility_inputs": {"total_data_needs": 4, "matched_data_needs": n,
+                                "matched_api_count": n, "join_key_count": 0}}
+        for hid, n in needs.items()
+    ]
+    inputs = {
+        hid: {"hypothesis_data": {"timing_fit": tf, "revenue_reference": 0.5, "mvp_difficulty": 0.5},
+              "competitors": [{"name": "x"}], "proxy_score": 10}
+        for hid, tf in (("H-001", 0.8), ("H-002", 0.45))
+    }
+    return RecordedBatch(batch_id, {
+        2: {"hypotheses": hyps},
+        3: {"matches": matches, "passed_hypotheses": hyps[:2]},
+        4: {"validations": [{"id": "H-001", "validation_score": 80.0}], "skipped": False,
+            "validation_inputs": inputs},
+        5: {"numr_scores": {"H-001": {"N": 5, "U": 5, "M": 4, "R": 4},
+                            "H-002": {"N": 3, "U": 3, "M": 3, "R": 3}},
+            "duplicate_ids": [], "scored_ideas": []},
+    })
+
+
+class TestReplayBatch:
+    def test_reproduces_recorded_run(self, tools):
+        result = replay_batch(_batch(), tools)
+        assert result["phase3_passed"] == 2
+        assert result["phase4_passed"] == 1
+        assert [i["id"] for i in result["ideas"]] == ["H-001"]
+        # V = 80/20 = 4.0 → 0.1*5 + 0.2*5 + 0.2*4 + 0.25*4 + 0.25*4 = 4.3
+        assert result["ideas"][0]["weighted_score"] == pytest.approx(4.3)
+        assert result["grades"] == {"S": 1}
+
+    def test_lower_validation_threshold_admits_more(self, tools, fake_scorers):
+        with config_overrides({"VALIDATION_PASS_THRESHOLD": 40}):
+            result = replay_batch(_batch(), tools)
+        assert result["phase4_passed"] == 2
+        assert fake_scorers["validation_scorer"].VALIDATION_PASS_THRESHOLD == config.VALIDATION_PASS_THRESHOLD
+
+    def test_newly_feasible_hypothesis_counted_unvalidated(self, tools):
+        with config_overrides({"FEASIBILITY_PASS_THRESHOLD": 0.2}):
+            result = replay_batch(_batch(), tools)
+        assert result["phase3_passed"] == 3
+        assert result["unvalidated"] == 1
+
+    def test_recorded_duplicates_excluded(self, tools):
+        batch = _batch()
+        batch.phases[5]["duplicate_ids"] = ["H-001"]
+        assert replay_batch(batch, tools)["ideas"] == []
+
+    def test_missing_numr_falls_back_to_heuristic(self, tools):
+        batch = _batch()
+        batch.phases[5]["numr_scores"] = {}
+        result = replay_batch(batch, tools)
+        assert len(result["ideas"]) == 1
+
+    def test_skipped_phase4_uses_default_v(self, tools):
+        batch = _batch()
+        batch.phases[4] = {"validations": [], "skipped": True, "default_v": 3}
+        result = replay_batch(batch, tools)
+        assert result["phase4_passed"] == 2
+
+
+class TestConfigOverrides:
+    def test_patches_bound_globals_and_restores(self, fake_scorers):
+        numrv = fake_scorers["numrv_scorer"]
+        flat = {k: 0.2 for k in "NUMRV"}
+        with config_overrides({"NUMRV_WEIGHTS": flat}):
+            assert config.NUMRV_WEIGHTS == flat
+            assert numrv.NUMRV_WEIGHTS == flat
+        assert numrv.NUMRV_WEIGHTS is config.NUMRV_WEIGHTS
+        assert config.NUMRV_WEIGHTS["N"] == 0.10
+
+    def test_unknown_setting_rejected(self):
+        with pytest.raises(ValueError):
+            ReplayConfig("bad", {"TOTAL_BUDGET_SEC": 10})
+
+    def test_parse_overrides(self):
+        assert parse_overrides(["VALIDATION_PASS_THRESHOLD=45", 'GRADE_ABSOLUTE={"S":4.2}']) == {
+            "VALIDATION_PASS_THRESHOLD": 45, "GRADE_ABSOLUTE": {"S": 4.2},
+        }
+
+
+class TestCompareConfigs:
+    def test_grade_delta_report(self, fake_scorers, tmp_path):
+        for bid in ("B-1", "B-2"):
+            cp = RunCheckpoint(bid, tmp_path)
+            for phase, out in _batch(bid).phases.items():
+                cp.save(phase, out, TimeBudget())
+        RunCheckpoint("B-3", tmp_path).save(2, {"hypotheses": []}, TimeBudget())  # 미완료
+
+        batches = load_recorded_batches(tmp_path)
+        assert [b.batch_id for b in batches] == ["B-1", "B-2"]
+
+        strict = ReplayConfig("strict", {"GRADE_ABSOLUTE": {"S": 4.5, "A": 3.2, "B": 2.5, "C": 1.5}})
+        report = compare_configs(batches, [strict])
+
+        assert report["baseline"]["grades"]["S"] == 2
+        cand = report["candidates"][0]
+        assert cand["grades"]["A"] == 2
+        assert cand["delta"]["S"] == -2 and cand["delta"]["A"] == 2
+        assert cand["grade_changes"] == 2
+        assert cand["sa_count"] == 2
@@ -0,0 +1,71 @@
+"""자원 입장 제어 테스트 — 파일 락 카운팅 세마포어, 다중 단위 예약, 프로세스 간 공유."""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from resource_guard import ResourceBusyError, ResourceSemaphore
+
+
+class TestResourceSemaphore:
+    def test_capacity_enforced_and_release_frees(self, tmp_path):
+        sem = ResourceSemaphore("cli", 2, tmp_path)
+        a, b = sem.try_acquire(), sem.try_acquire()
+        assert a and b
+        assert sem.try_acquire() is None
+        assert sem.in_use() == 2
+        a.release()
+        c = sem.try_acquire()
+        assert c is not None
+        b.release()
+        c.release()
+        assert sem.in_use() == 0
+
+    def test_multi_unit_all_or_nothing(self, tmp_path):
+        sem = ResourceSemaphore("ram", 4, tmp_path)
+        first = sem.try_acquire(3)
+        assert first.units == 3
+        assert sem.try_acquire(2) is None
+        assert sem.in_use() == 3  # 실패한 예약이 잡았던 슬롯은 반납
+        first.release()
+        assert sem.try_acquire(4).units == 4
+
+    def test_acquire_times_out(self, tmp_path):
+        sem = ResourceSemaphore("browser", 1, tmp_path)
+        with sem.acquire():
+            with pytest.raises(ResourceBusyError):
+                sem.acquire(timeout=0.05, poll=0.01)
+        with sem.acquire(timeout=0.05):
+            pass
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="flock 기반 프로세스 간 검증")
+    def test_shared_across_processes(self, tmp_path):
+        holder = subprocess.Popen(
+            [sys.executable, "-c", textwrap.dedent(f"""
+                import sys, time
+                sys.path.insert(0, {str(_PROJECT_ROOT)!r})
+                from resource_guard import ResourceSemaphore
+                lease = ResourceSemaphore("cli", 1, {str(tmp_path)!r}).acquire(timeout=5)
+                print("held", flush=True)
+                sys.stdin.readline()
+            """)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        )
+        try:
+            assert holder.stdout.readline().strip() == "held"
+            sem = ResourceSemaphore("cli", 1, tmp_path)
+            assert sem.try_acquire() is None
+            holder.stdin.write("\n")
+            holder.stdin.flush()
+            holder.wait(timeout=10)
+            # 프로세스가 끝나면 OS가 락을 푼다
+            assert sem.acquire(timeout=2, poll=0.05) is not None
+        finally:
+            holder.kill()
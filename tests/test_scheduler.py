@@ -1,4 +1,4 @@
-"""2차 확장 테스트 — 스케줄러: 정각 대기, 카탈로그 갱신 모드 판단."""
+"""2차 확장 테스트 — 스케줄러: 정각 실행, 카탈로그 갱신 모드 판단."""
 
 import sys
 from datetime import datetime, timedelta
@@ -15,18 +15,124 @@ _SCRIPTS_DIR = _PROJECT_ROOT / "scripts"
 if str(_SCRIPTS_DIR) not in sys.path:
     sys.path.insert(0, str(_SCRIPTS_DIR))
 
-from _loop_runner import _next_hour_wait
+from _loop_runner import EXIT_NO_SLOT, POLL_SEC, HourlyScheduler
+from utils import read_jsonl
 from catalog_refresh import determine_mode
 
 
-class TestNextHourWait:
-    def test_next_hour_wait_calculates_correctly(self):
-        """_next_hour_wait()는 다음 정각까지 양수 초를 반환해야 한다."""
-        wait = _next_hour_wait()
-        assert isinstance(wait, float)
-        assert wait > 0
-        # 최대 3600초(1시간)를 넘을 수 없다
-        assert wait <= 3600
+class _FakeProc:
+    def __init__(self):
+        self.code = None
+
+    def poll(self):
+        return self.code
+
+
+class TestHourlyScheduler:
+    """정각 스케줄러 — 이전 실행과 겹쳐 실행, 슬롯 부족 시 기록, 따라잡기."""
+
+    @staticmethod
+    def _scheduler(tmp_path, **kwargs):
+        procs: dict[datetime, _FakeProc] = {}
+
+        def launcher(slot):
+            procs[slot] = _FakeProc()
+            return procs[slot]
+
+        sched = HourlyScheduler(
+            skip_log=tmp_path / "skip_runs.jsonl", jitter_sec=0, launcher=launcher, **kwargs,
+        )
+        return sched, procs
+
+    def test_overlapping_runs_use_second_slot(self, tmp_path):
+        sched, procs = self._scheduler(tmp_path)
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        assert sched.tick(t0) == [datetime(2026, 3, 2, 9)]
+        # 09시 실행이 아직 진행 중이어도 10시 정각에 두 번째 슬롯으로 시작
+        assert sched.tick(t0 + timedelta(hours=1)) == [datetime(2026, 3, 2, 10)]
+        assert len(sched.running) == 2
+
+    def test_missed_slot_recorded_and_caught_up(self, tmp_path):
+        sched, procs = self._scheduler(tmp_path)
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        sched.tick(t0)
+        sched.tick(t0 + timedelta(hours=1))
+        assert sched.tick(t0 + timedelta(hours=2)) == []  # 두 슬롯 모두 사용 중
+
+        skipped = read_jsonl(tmp_path / "skip_runs.jsonl")
+        assert skipped[0]["slot"] == "2026-03-02T11:00:00"
+        assert skipped[0]["status"] == "missed" and skipped[0]["reason"] == "capacity"
+        assert sched.backlog == [datetime(2026, 3, 2, 11)]
+
+        procs[datetime(2026, 3, 2, 9)].code = 0
+        assert sched.tick(t0 + timedelta(hours=2, minutes=10)) == [datetime(2026, 3, 2, 11)]
+        assert read_jsonl(tmp_path / "skip_runs.jsonl")[-1]["status"] == "caught_up"
+        assert sched.backlog == []
+
+    def test_sleep_overrun_records_skipped_hours(self, tmp_path):
+        sched, _ = self._scheduler(tmp_path, max_concurrent=1)
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        sched.tick(t0)
+        sched.tick(t0 + timedelta(hours=2))  # 10시 틱을 놓침, 11시도 슬롯 부족
+        slots = [r["slot"] for r in read_jsonl(tmp_path / "skip_runs.jsonl")]
+        assert slots == ["2026-03-02T10:00:00", "2026-03-02T11:00:00"]
+
+    def test_lock_busy_child_caught_up_next_hour(self, tmp_path):
+        sched, procs = self._scheduler(tmp_path)
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        sched.tick(t0)
+        procs[datetime(2026, 3, 2, 9)].code = EXIT_NO_SLOT
+        assert sched.tick(t0 + timedelta(minutes=1)) == []
+        assert sched.backlog == [datetime(2026, 3, 2, 9)]
+        assert read_jsonl(tmp_path / "skip_runs.jsonl")[0]["reason"] == "lock_busy"
+        launched = sched.tick(t0 + timedelta(hours=1))
+        assert launched == [datetime(2026, 3, 2, 10), datetime(2026, 3, 2, 9)]
+
+    def test_lock_held_across_ticks_launches_once(self, tmp_path):
+        launches = []
+
+        def launcher(slot):
+            launches.append(slot)
+            proc = _FakeProc()
+            proc.code = EXIT_NO_SLOT  # 다른 프로세스가 락을 계속 쥐고 있음
+            return proc
+
+        sched = HourlyScheduler(
+            skip_log=tmp_path / "skip_runs.jsonl", jitter_sec=0, launcher=launcher,
+        )
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        for i in range(120):  # 10분 동안 POLL_SEC 간격
+            now = t0 + timedelta(seconds=POLL_SEC * i)
+            sched.tick(now)
+            assert sched.seconds_until_next_event(now) > POLL_SEC or i == 0
+        assert launches == [datetime(2026, 3, 2, 9)]
+        assert len(read_jsonl(tmp_path / "skip_runs.jsonl")) == 1
+
+        # 다음 정각: 새 정각 + 따라잡기 1회, 여전히 막히면 새 정각만 기록하고 09시는 버림
+        sched.tick(t0 + timedelta(hours=1))
+        sched.tick(t0 + timedelta(hours=1, seconds=POLL_SEC))
+        assert launches[1:] == [datetime(2026, 3, 2, 10), datetime(2026, 3, 2, 9)]
+        assert sched.backlog == [datetime(2026, 3, 2, 10)]
+        records = read_jsonl(tmp_path / "skip_runs.jsonl")
+        assert [r["slot"][11:13] for r in records if r["status"] == "missed"] == ["09", "10"]
+
+    def test_old_backlog_expires(self, tmp_path):
+        sched, procs = self._scheduler(tmp_path, max_concurrent=1, catchup_window_hours=1)
+        t0 = datetime(2026, 3, 2, 9, 0, 1)
+        sched.tick(t0)
+        sched.tick(t0 + timedelta(hours=1))   # 10시 놓침
+        sched.tick(t0 + timedelta(hours=3))   # 11시, 12시 놓침 → 10시는 창 밖으로 폐기
+        assert datetime(2026, 3, 2, 10) not in sched.backlog
+        statuses = [(r["slot"][11:13], r["status"]) for r in read_jsonl(tmp_path / "skip_runs.jsonl")]
+        assert ("10", "expired") in statuses
+
+    def test_jitter_delays_launch(self, tmp_path):
+        sched, _ = self._scheduler(tmp_path)
+        sched.jitter_sec = 30
+        t0 = datetime(2026, 3, 2, 9, 0, 0)
+        launched = sched.tick(t0)
+        wait = sched.seconds_until_next_event(t0)
+        assert launched or 0 <= wait <= 30
 
 
 class TestCatalogRefreshMode:
@@ -0,0 +1,298 @@
+"""스트리밍 모드 테스트 — Phase 2→3→4 가설 단위 파이프라인, 단계별 시간 예산 차감,
+Claude CLI 스트리밍 출력의 가설 단위 파싱."""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import BASE_BUDGET_SEC, VARIABLE_POOL_SEC
+from scripts.run_engine import (
+    ClaudeCLIInvoker,
+    IdeationEngine,
+    TimeBudget,
+    _IncrementalItemParser,
+    _stream_event_text,
+)
+
+HYPOTHESES = [{"id": f"H-{i:03d}", "service_name": f"서비스 {i}"} for i in range(1, 7)]
+
+
+def _make_engine(match_delay: float = 0.0, validate_delay: float = 0.0):
+    engine = IdeationEngine(dry_run=True, streaming=True)
+    engine._phase2 = MagicMock(return_value={
+        "batch_id": engine.batch_id,
+        "hypotheses": [dict(h) for h in HYPOTHESES],
+        "duration_sec": 0.0,
+    })
+    engine._phase3_tools = MagicMock(return_value=(None, None, None))
+    engine._phase4_tools = MagicMock(return_value=(None, None, None))
+
+    def match_one(hyp, *tools):
+        time.sleep(match_delay)
+        passed = int(hyp["id"][-1]) % 2 == 1  # 홀수 ID만 통과
+        if passed:
+            hyp["feasibility_pct"] = 60.0
+        return {"hypothesis_id": hyp["id"], "feasibility_pct": 60.0 if passed else 10.0,
+                "passed": passed, "matched_apis": [], "join_pairs": []}
+
+    def score_validation(hyp, *tools):
+        time.sleep(validate_delay)
+        hyp["validation_score"] = 70.0
+        hyp["validation_passed"] = hyp["id"] != "H-005"
+
+    engine._match_one = match_one
+    engine._claude_validate_one = MagicMock()
+    engine._score_validation = score_validation
+    return engine
+
+
+class TestStreamingPipeline:
+    def test_results_in_hypothesis_order(self):
+        engine = _make_engine()
+        p2, p3, p4 = asyncio.run(engine._run_streaming({"signals": []}))
+
+        assert len(p2["hypotheses"]) == 6
+        assert [m["hypothesis_id"] for m in p3["matches"]] == [h["id"] for h in HYPOTHESES]
+        assert [h["id"] for h in p3["passed_hypotheses"]] == ["H-001", "H-003", "H-005"]
+        assert p4["total_validated"] == 3
+        assert [v["id"] for v in p4["validations"]] == ["H-001", "H-003"]
+        assert p4["streaming"] is True
+        assert p4["skipped"] is False
+        assert engine._claude_validate_one.call_count == 3
+
+    def test_stages_overlap(self):
+        """Phase 3·4가 겹쳐 실행 — 전체 시간이 단계 합계보다 짧다."""
+        engine = _make_engine(match_delay=0.05, validate_delay=0.1)
+        active = {"max": 0, "now": 0}
+        lock = threading.Lock()
+        original = engine._match_one
+
+        def tracked_match(hyp, *tools):
+            with lock:
+                active["now"] += 1
+                active["max"] = max(active["max"], active["now"])
+            try:
+                return original(hyp, *tools)
+            finally:
+                with lock:
+                    active["now"] -= 1
+
+        engine._match_one = tracked_match
+        t0 = time.monotonic()
+        asyncio.run(engine._run_streaming({"signals": []}))
+        wall = time.monotonic() - t0
+
+        sequential = 6 * 0.05 + 3 * 0.1
+        assert wall < sequential
+        assert active["max"] >= 2  # Phase 3 워커 동시 실행
+
+    def test_late_hypotheses_skipped_when_time_runs_out(self):
+        engine = _make_engine()
+        start = time.monotonic()
+        with patch("time.monotonic", return_value=start + 57 * 60):
+            engine.budget._started_at = start
+            _, _, p4 = asyncio.run(engine._run_streaming({"signals": []}))
+
+        assert p4["skipped"] is True
+        assert p4["default_v"] == 3
+        assert all(v["validation_score"] is None for v in p4["validations"])
+        engine._claude_validate_one.assert_not_called()
+
+    def test_phase2_failure_propagates(self):
+        engine = _make_engine()
+        engine._phase2 = MagicMock(side_effect=RuntimeError("Claude CLI failed"))
+        try:
+            asyncio.run(engine._run_streaming({"signals": []}))
+        except RuntimeError as e:
+            assert "Claude CLI failed" in str(e)
+        else:
+            raise AssertionError("expected RuntimeError")
+
+
+class TestOverlapAccounting:
+    def test_overlap_excluded_from_pool_deduction(self):
+        """겹친 시간은 앞 단계가 이미 차감 — 이번 단계 초과분에서 제외."""
+        tb = TimeBudget()
+        start = 1000.0  # 정수 초 — int() 절삭 오차 방지
+        base = BASE_BUDGET_SEC[3]
+        with patch("time.monotonic", return_value=start):
+            tb.start_phase(3)
+        with patch("time.monotonic", return_value=start + base + 120):
+            elapsed = tb.end_phase(3, overlap_sec=120)
+
+        assert elapsed == pytest.approx(base + 120)
+        assert tb.variable_pool_remaining == pytest.approx(VARIABLE_POOL_SEC)
+
+    def test_without_overlap_deducts(self):
+        tb = TimeBudget()
+        start = 1000.0  # 정수 초 — int() 절삭 오차 방지
+        base = BASE_BUDGET_SEC[3]
+        with patch("time.monotonic", return_value=start):
+            tb.start_phase(3)
+        with patch("time.monotonic", return_value=start + base + 120):
+            tb.end_phase(3)
+
+        assert tb.variable_pool_remaining == pytest.approx(VARIABLE_POOL_SEC - 120)
+
+
+# ──────────────────────────── Claude CLI 스트리밍 출력 파싱 ────────────────────────────
+
+
+def _feed_all(parser, chunks):
+    out = []
+    for chunk in chunks:
+        out.extend(parser.feed(chunk))
+    return out
+
+
+class TestIncrementalItemParser:
+    def test_wrapper_items_emitted_as_they_close(self):
+        text = '```json\n{"hypotheses": [{"id": "H-001", "data_needs": [{"f": "a"}]}, {"id": "H-002"}]}\n```'
+        parser = _IncrementalItemParser()
+        first = parser.feed(text[:text.index("}]}") + 3])
+        assert [h["id"] for h in first] == ["H-001"]
+        assert first[0]["data_needs"] == [{"f": "a"}]
+        rest = parser.feed(text[len(text[:text.index("}]}") + 3]):])
+        assert [h["id"] for h in rest] == ["H-002"]
+
+    def test_char_by_char_top_level_array(self):
+        text = '설명 [참고] 입니다.\n[{"id": "H-001", "t": "괄호 } 포함 \\"문자열\\""}, {"id": "H-002"}]'
+        items = _feed_all(_IncrementalItemParser(), list(text))
+        assert [h["id"] for h in items] == ["H-001", "H-002"]
+        assert items[0]["t"] == '괄호 } 포함 "문자열"'
+
+    def test_line_delimited_objects(self):
+        text = '{"id": "H-001"}\n{"id": "H-002"}\n'
+        items = _feed_all(_IncrementalItemParser(), [text])
+        assert [h["id"] for h in items] == ["H-001", "H-002"]
+
+    def test_truncated_tail_not_emitted(self):
+        items = _IncrementalItemParser().feed('{"hypotheses": [{"id": "H-001"}, {"id": "H-0')
+        assert [h["id"] for h in items] == ["H-001"]
+
+
+class TestStreamEventText:
+    def test_text_delta(self):
+        line = json.dumps({"type": "stream_event", "event": {
+            "type": "content_block_delta", "delta": {"type": "text_delta", "text": "[{"}}})
+        assert _stream_event_text(line) == ("delta", "[{")
+
+    def test_result_event(self):
+        assert _stream_event_text(json.dumps({"type": "result", "result": "[]"})) == ("final", "[]")
+
+    def test_non_event_line_passed_through(self):
+        assert _stream_event_text('{"id": "H-001"}') == ("raw", '{"id": "H-001"}\n')
+
+    def test_event_without_text(self):
+        assert _stream_event_text(json.dumps({"type": "system", "subtype": "init"})) == ("", "")
+
+
+def _fake_cli(tmp_path, lines, *, delay=0.0, exit_code=0):
+    """stream-json 줄을 delay 간격으로 출력하는 가짜 claude 실행 파일."""
+    script = tmp_path / "fake_claude"
+    script.write_text(
+        "#!" + sys.executable + "\n"
+        "import sys, time\n"
+        "sys.stdin.read()\n"
+        f"for line in {lines!r}:\n"
+        "    print(line, flush=True)\n"
+        f"    time.sleep({delay})\n"
+        f"sys.exit({exit_code})\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    return str(script)
+
+
+def _delta_lines(text, size=7):
+    return [
+        json.dumps({"type": "stream_event", "event": {
+            "type": "content_block_delta", "delta": {"type": "text_delta", "text": text[i:i + size]}}},
+            ensure_ascii=False)
+        for i in range(0, len(text), size)
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shebang 실행 파일 필요")
+class TestInvokeStream:
+    TEXT = '{"hypotheses": [{"id": "H-001"}, {"id": "H-002"}, {"id": "H-003"}]}'
+
+    def test_items_delivered_before_process_exits(self, tmp_path):
+        cmd = _fake_cli(tmp_path, _delta_lines(self.TEXT), delay=0.02)
+        invoker = ClaudeCLIInvoker(cmd=cmd, timeout=30, max_retries=0)
+        arrivals = []
+        items, complete = invoker.invoke_stream("p", lambda h: arrivals.append((h["id"], time.monotonic())))
+        done = time.monotonic()
+
+        assert complete is True
+        assert [h["id"] for h in items] == ["H-001", "H-002", "H-003"]
+        assert done - arrivals[0][1] > 0.1  # 첫 가설은 출력 종료 전에 도착
+
+    def test_result_only_stream(self, tmp_path):
+        lines = [json.dumps({"type": "system"}), json.dumps({"type": "result", "result": self.TEXT})]
+        invoker = ClaudeCLIInvoker(cmd=_fake_cli(tmp_path, lines), timeout=30, max_retries=0)
+        items, complete = invoker.invoke_stream("p", lambda h: None)
+        assert len(items) == 3 and complete
+
+    def test_timeout_keeps_arrived_items(self, tmp_path):
+        lines = _delta_lines('[{"id": "H-001"}, ', size=100) + _delta_lines('{"id": "H-0', size=100) * 50
+        invoker = ClaudeCLIInvoker(cmd=_fake_cli(tmp_path, lines, delay=0.1), timeout=1, max_retries=2)
+        got = []
+        items, complete = invoker.invoke_stream("p", got.append)
+        assert complete is False
+        assert [h["id"] for h in got] == ["H-001"] == [h["id"] for h in items]
+
+    def test_failure_before_items_raises(self, tmp_path):
+        invoker = ClaudeCLIInvoker(cmd=_fake_cli(tmp_path, [], exit_code=3), timeout=30, max_retries=0)
+        with pytest.raises(RuntimeError):
+            invoker.invoke_stream("p", lambda h: None)
+
+
+class TestPhase2Overlap:
+    def test_matching_starts_while_generation_continues(self):
+        engine = _make_engine()
+        del engine._phase2  # 실제 Phase 2 사용
+        events = []
+
+        def fake_stream(prompt, on_item, *, phase=None):
+            items = []
+            for i in range(1, 4):
+                time.sleep(0.05)
+                item = {"service_name": f"서비스 {i}"}
+                items.append(item)
+                on_item(item)
+            events.append(("generated", time.monotonic()))
+            return items, True
+
+        engine.claude = MagicMock()
+        engine.claude.invoke_stream.side_effect = fake_stream
+        original = engine._match_one
+
+        def tracked(hyp, *tools):
+            events.append(("matched", time.monotonic()))
+            return original(hyp, *tools)
+
+        engine._match_one = tracked
+        p2, p3, _ = asyncio.run(engine._run_streaming({"signals": []}))
+
+        assert [h["id"] for h in p2["hypotheses"]] == ["H-001", "H-002", "H-003"]
+        assert len(p3["matches"]) == 3
+        generated_at = next(t for kind, t in events if kind == "generated")
+        assert min(t for kind, t in events if kind == "matched") < generated_at
+
+    def test_partial_stream_flagged(self):
+        engine = IdeationEngine(dry_run=True)
+        engine.claude = MagicMock()
+        engine.claude.invoke_stream.return_value = ([{"id": "H-001"}], False)
+        p2 = engine._phase2({"signals": []}, on_hypothesis=lambda h: None)
+        assert p2["partial"] is True
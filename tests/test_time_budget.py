@@ -1,5 +1,6 @@
 """MVP 게이트 테스트 #3~5 — 시간 예산 공유 풀 계산, 적응형 깊이, Phase 4 스킵."""
 
+import json
 import time
 from unittest.mock import patch
 
@@ -12,10 +13,12 @@ _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
-from scripts.run_engine import TimeBudget
+from scripts.run_engine import PhaseDurationHistory, TimeBudget
 from config import (
     BASE_BUDGET_SEC,
+    BUDGET_HISTORY_MIN_SAMPLES,
     TOTAL_BUDGET_SEC,
+    VARIABLE_MAX_SEC,
     VARIABLE_POOL_SEC,
     PHASE4_SIMPLIFY_THRESHOLD_SEC,
     PHASE4_SKIP_THRESHOLD_SEC,
@@ -126,3 +129,106 @@ class TestPhase4SkipInEngine:
 
         assert result.get("skipped") is True
         assert result.get("default_v") == 3
+
+
+class TestPredictiveBudget:
+    """이력 기반 예측 예산 — 롤링 백분위, 가변 풀 선배정, 예상 종료, 시작 시점 깊이 상한."""
+
+    @staticmethod
+    def _history(**durations):
+        n = BUDGET_HISTORY_MIN_SAMPLES
+        return PhaseDurationHistory({int(k[1:]): [v] * n for k, v in durations.items()})
+
+    def test_reads_only_end_phase_records(self, tmp_path):
+        lines = [
+            {"msg": "Phase 2 completed in 100s (within base 600s)", "phase": 2, "duration_sec": 100.0},
+            {"msg": "Phase 2 used 700s (+100s over base), pool deducted 100s → 1340s left",
+             "phase": 2, "duration_sec": 700.0},
+            {"msg": "Claude CLI OK", "phase": 2, "duration_sec": 9999.0},  # CLI 호출 지연 — 제외
+            {"msg": "Phase 3 started — budget 600s", "phase": 3},
+        ]
+        (tmp_path / "2026-03-01.jsonl").write_text(
+            "\n".join(json.dumps(l, ensure_ascii=False) for l in lines), encoding="utf-8"
+        )
+        history = PhaseDurationHistory.from_logs(tmp_path)
+        assert history.count(2) == 2
+        assert history.count(3) == 0
+        assert history.summary()[2]["p50"] == 400.0
+
+    def test_percentile_needs_min_samples(self):
+        history = PhaseDurationHistory({4: [100.0] * (BUDGET_HISTORY_MIN_SAMPLES - 1)})
+        assert history.percentile(4) is None
+        history.add(4, 500.0)
+        assert history.percentile(4, 100) == 500.0
+
+    def test_rolling_window_drops_old_samples(self):
+        history = PhaseDurationHistory({1: [1000.0] * 3 + [10.0] * 5}, window=5)
+        assert history.percentile(1, 100) == 10.0
+
+    def test_no_history_matches_static_budget(self):
+        tb = TimeBudget()
+        plan = tb.plan()
+        assert plan["reserved_sec"] == {}
+        assert plan["depth_cap"] is None
+        assert tb.phase_budget(2) == BASE_BUDGET_SEC[2] + VARIABLE_MAX_SEC[2]
+
+    def test_reserves_phase4_overshoot_from_earlier_phases(self):
+        # Phase 4가 평소 기본 시간보다 10분 길다 → 풀 10분을 Phase 4 몫으로 선배정
+        tb = TimeBudget(history=self._history(p2=60.0, p4=BASE_BUDGET_SEC[4] + 600))
+        plan = tb.plan()
+        assert plan["reserved_sec"] == {4: 600}
+        assert tb.phase_budget(2) == BASE_BUDGET_SEC[2] + min(VARIABLE_MAX_SEC[2], VARIABLE_POOL_SEC - 600)
+        assert tb.phase_budget(4) == BASE_BUDGET_SEC[4] + VARIABLE_MAX_SEC[4]
+
+    def test_pool_held_for_phase4_even_when_phase1_overshoots(self):
+        tb = TimeBudget(history=self._history(p4=BASE_BUDGET_SEC[4] + VARIABLE_MAX_SEC[4]))
+        tb.plan()
+        tb.variable_pool_remaining = VARIABLE_MAX_SEC[4]  # 앞 Phase가 풀을 거의 소진
+        assert tb.phase_budget(1) == BASE_BUDGET_SEC[1]
+        assert tb.phase_budget(4) == BASE_BUDGET_SEC[4] + VARIABLE_MAX_SEC[4]
+
+    def test_predicted_finish_uses_history(self):
+        fast = TimeBudget(history=self._history(p1=10.0, p2=20.0, p3=30.0, p4=40.0, p5=50.0, p6=60.0))
+        assert fast.plan()["predicted_finish_sec"] == pytest.approx(210.0, abs=1.0)
+        assert TimeBudget().predicted_finish_sec() == pytest.approx(sum(BASE_BUDGET_SEC.values()), abs=1.0)
+
+    def test_depth_cap_decided_at_run_start(self):
+        # Phase 1~3이 평소 55분 걸린다 → Phase 4 시작 시 남는 5분 미만 예상 → 처음부터 simplified 이상 불가
+        slow = TimeBudget(history=self._history(p1=20 * 60.0, p2=20 * 60.0, p3=16 * 60.0))
+        plan = slow.plan()
+        assert plan["depth_cap"] == "skipped"
+        assert slow.adaptive_depth(3) == "skipped"
+
+        mid = TimeBudget(history=self._history(p1=20 * 60.0, p2=20 * 60.0, p3=12 * 60.0))
+        assert mid.plan()["depth_cap"] == "simplified"
+        assert mid.adaptive_depth(3) == "simplified"
+
+    def test_completed_phases_excluded_on_resume(self):
+        tb = TimeBudget(history=self._history(p1=20 * 60.0, p2=20 * 60.0, p3=16 * 60.0))
+        plan = tb.plan(completed_phases=[1, 2, 3])
+        assert plan["depth_cap"] is None
+
+
+class TestHistoryRecords:
+    """end_phase가 남기는 이력 표본 — 스트리밍 겹침 제외, 드라이런 제외."""
+
+    def test_overlap_not_counted_in_sample(self, log_dir):
+        tb = TimeBudget()
+        start = time.monotonic()
+        with patch("time.monotonic", return_value=start):
+            tb.start_phase(3)
+        with patch("time.monotonic", return_value=start + 400):
+            assert tb.end_phase(3, overlap_sec=300) == pytest.approx(400)
+        history = PhaseDurationHistory.from_logs(log_dir)
+        assert history.summary()[3]["p50"] == pytest.approx(100, abs=1)
+
+    def test_dry_run_leaves_no_sample(self, log_dir):
+        tb = TimeBudget(record_history=False)
+        tb.start_phase(2)
+        tb.end_phase(2)
+        assert PhaseDurationHistory.from_logs(log_dir).count(2) == 0
+
+    def test_dry_run_engine_does_not_record(self):
+        from scripts.run_engine import IdeationEngine
+
+        assert IdeationEngine(dry_run=True).budget.record_history is False
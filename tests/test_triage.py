@@ -0,0 +1,101 @@
+"""Phase 4 트리아지 테스트 — 사전 점수 순위, deep 예산 배정, 상위 개별/하위 배치 라우팅."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from config import ADAPTIVE_DEPTH
+from scripts.run_engine import IdeationEngine, TimeBudget, _bigrams, _novelty, _triage_score
+
+
+def _hyp(hid, feasibility, api_scores=(), name=None):
+    return {
+        "id": hid,
+        "service_name": name or f"서비스 {hid}",
+        "feasibility_pct": feasibility,
+        "matched_apis": [{"api_id": f"A{i}", "score": s} for i, s in enumerate(api_scores)],
+    }
+
+
+class TestTriageScore:
+    def test_higher_feasibility_and_api_quality_rank_first(self):
+        strong = _triage_score(_hyp("H-001", 90, (0.9, 0.8, 0.7)), [])
+        weak = _triage_score(_hyp("H-002", 40, (0.3,)), [])
+        assert strong > weak
+
+    def test_archive_overlap_lowers_novelty(self):
+        archive = [_bigrams("소상공인 상권 분석 대시보드")]
+        assert _novelty("소상공인 상권 분석 대시보드", archive) == pytest.approx(0.0)
+        assert _novelty("전세사기 위험 조회", archive) == pytest.approx(1.0)
+        assert _novelty("아무 이름", []) == 1.0
+
+    def test_archive_without_bigrams_counts_as_novel(self):
+        archive = [_bigrams(""), _bigrams("!!! ---")]  # 빈 이름·기호만 있는 이름
+        assert archive == [set(), set()]
+        assert _novelty("전세사기 위험 조회", archive) == 1.0
+        assert _triage_score({"service_name": "전세사기 위험 조회"}, archive) > 0
+
+
+class TestDeepQuota:
+    def test_quota_fits_phase_budget(self):
+        tb = TimeBudget()
+        deep = ADAPTIVE_DEPTH["deep"]["per_hypothesis_sec"]
+        light = ADAPTIVE_DEPTH["light"]["per_hypothesis_sec"]
+        for n in (1, 4, 8):
+            quota = tb.deep_quota(n)
+            assert 0 <= quota <= n
+            assert quota * deep + (n - quota) * light <= tb.phase_budget(4)
+
+    def test_no_deep_when_light_alone_exhausts_budget(self):
+        tb = TimeBudget()
+        n = int(tb.phase_budget(4) // ADAPTIVE_DEPTH["light"]["per_hypothesis_sec"]) + 1
+        assert tb.deep_quota(n) == 0
+
+
+class TestPhase4Routing:
+    def test_top_ranked_deep_tail_batched(self):
+        engine = IdeationEngine(dry_run=True)
+        hyps = [
+            _hyp("H-001", 40, (0.2,)),
+            _hyp("H-002", 95, (0.9, 0.9)),
+            _hyp("H-003", 70, (0.6,)),
+        ]
+        deep_ids: list[str] = []
+        batch_ids: list[list[str]] = []
+
+        def score(hyp, *tools):
+            hyp["validation_passed"] = True
+            return {}
+
+        with patch.object(engine, "_phase4_tools", return_value=(None, None, None)), \
+             patch.object(engine, "_score_validation", side_effect=score), \
+             patch.object(engine.budget, "adaptive_depth", return_value="standard"), \
+             patch.object(engine.budget, "deep_quota", return_value=1), \
+             patch.object(engine, "_claude_validate_one",
+                          side_effect=lambda h, t: deep_ids.append(h["id"])), \
+             patch.object(engine, "_claude_validate_batch",
+                          side_effect=lambda hs, t: batch_ids.append([h["id"] for h in hs])):
+            result = engine._phase4({"passed_hypotheses": hyps})
+
+        assert deep_ids == ["H-002"]
+        assert batch_ids == [["H-003", "H-001"]]
+        assert [t["route"] for t in result["triage"]] == ["deep", "light", "light"]
+        assert result["passed_count"] == 3
+
+    def test_simplified_skips_triage(self):
+        engine = IdeationEngine(dry_run=True)
+        with patch.object(engine, "_phase4_tools", return_value=(None, None, None)), \
+             patch.object(engine, "_score_validation", return_value={}), \
+             patch.object(engine.budget, "adaptive_depth", return_value="simplified"), \
+             patch.object(engine, "_claude_validate_one") as one, \
+             patch.object(engine, "_claude_validate_batch") as batch:
+            result = engine._phase4({"passed_hypotheses": [_hyp("H-001", 50)]})
+        one.assert_not_called()
+        batch.assert_not_called()
+        assert result["triage"] == []
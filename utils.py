@@ -1,13 +1,15 @@
-"""공통 유틸리티 — 원자적 JSON 쓰기, JSONL 읽기/쓰기, 배치ID 생성, KST 시간."""
+"""공통 유틸리티 — 원자적 JSON 쓰기, JSONL 읽기/쓰기, 배치ID 생성, KST 시간, 토큰 버킷."""
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 KST = timezone(timedelta(hours=9))
 
@@ -27,14 +29,17 @@ def generate_batch_id() -> str:
 # ──────────────────────────── 원자적 JSON 쓰기 ────────────────────────────
 
 
-def atomic_json_write(path: Path | str, data: Any) -> None:
-    """원자적으로 JSON 파일을 작성한다 (.tmp → os.replace)."""
+def atomic_json_write(path: Path | str, data: Any, *, default: Callable[[Any], Any] | None = None) -> None:
+    """원자적으로 JSON 파일을 작성한다 (.tmp → os.replace).
+
+    default: json.dump에 넘길 직렬화 불가 객체 변환 함수 (예: numpy 스칼라).
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = path.with_suffix(".tmp")
     try:
         with open(tmp_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            json.dump(data, f, ensure_ascii=False, indent=2, default=default)
         os.replace(tmp_path, path)
     except BaseException:
         if tmp_path.exists():
@@ -81,3 +86,33 @@ def write_jsonl(path: Path | str, records: list[dict]) -> None:
         if tmp_path.exists():
             tmp_path.unlink(missing_ok=True)
         raise
+
+
+class TokenBucket:
+    """asyncio 토큰 버킷 레이트 리미터 — 초당 rate개, 최대 burst개까지 몰아 쓰기 허용.
+
+    여러 워커 코루틴이 하나를 공유하면 전체 요청률이 rate를 넘지 않는다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 기다린다 (대기 순서는 도착 순)."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1